@@ -0,0 +1,85 @@
+"""실시간 경기 러너 벤치마크
+
+LiveMatchRunner 하나로 여러 실시간 경기를 동시에 진행하고, 경기마다 구독자 하나가
+모든 이벤트를 받는다. 이벤트 전달 지연(예정 시각 대비)과 CPU 사용률을 출력한다.
+
+경기 진행에 필요한 CPU 시간은 `경기 수 x 경기당 시뮬레이션 시간`이므로 duration이
+그보다 짧으면 러너가 따라가지 못해 지연이 커진다.
+
+사용법:
+    python -m benchmarks.bench_live_runner [--matches N] [--duration SEC] [--slot SEC]
+"""
+
+import argparse
+import asyncio
+import copy
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.io.team_loader import load_team
+from sim_soccer.live.runner import LiveMatchRunner
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+async def count_events(subscription, counts, index):
+    """구독한 이벤트 수 세기"""
+    async for _ in subscription:
+        counts[index] += 1
+
+
+async def run(home_team, away_team, matches: int, duration: float, slot: float):
+    """경기를 동시에 진행하고 (러너, 구독자별 이벤트 수) 반환"""
+    runner = LiveMatchRunner(slot=slot)
+    counts = [0] * matches
+    consumers = []
+    for seed in range(matches):
+        match = runner.add_match(
+            copy.deepcopy(home_team),
+            copy.deepcopy(away_team),
+            random_seed=seed,
+            duration=duration,
+        )
+        consumers.append(count_events(match.subscribe(), counts, seed))
+    await asyncio.gather(runner.run(), *consumers)
+    return runner, counts
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="실시간 경기 러너 벤치마크")
+    parser.add_argument("--matches", "-n", type=int, default=1000, help="동시 경기 수")
+    parser.add_argument("--duration", "-d", type=float, default=300.0, help="경기 진행 시간 (초)")
+    parser.add_argument("--slot", type=float, default=0.25, help="스케줄링 슬롯 (초)")
+    parser.add_argument("--home", type=str, default=str(EXAMPLES_DIR / "a.json"))
+    parser.add_argument("--away", type=str, default=str(EXAMPLES_DIR / "b.json"))
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외하고 시뮬레이션 작업만 측정
+    logger.remove()
+
+    home_team = load_team(args.home)
+    away_team = load_team(args.away)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    runner, counts = asyncio.run(run(home_team, away_team, args.matches, args.duration, args.slot))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    stats = runner.stats
+
+    print(f"matches          : {args.matches} (duration {args.duration:.0f}s, slot {args.slot}s)")
+    print(f"wall time        : {wall:.1f} s ({wall / args.duration:.2f}x duration)")
+    print(f"cpu time         : {cpu:.1f} s ({cpu / wall:.0%} of one core)")
+    print(f"events delivered : {stats.events} ({stats.events / wall:.0f}/s)")
+    print(f"wakeups          : {stats.wakeups}")
+    print(f"mean lag         : {stats.mean_lag * 1000:.1f} ms")
+    print(f"max lag          : {stats.max_lag * 1000:.1f} ms")
+    print(f"late (> slot)    : {stats.late_events / max(stats.events, 1):.2%}")
+    print(f"all received     : {sum(counts) == stats.events}")
+
+
+if __name__ == "__main__":
+    main()
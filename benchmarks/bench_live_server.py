@@ -0,0 +1,132 @@
+"""실시간 스트리밍 서버 부하 생성기
+
+같은 프로세스에서 LiveMatchServer를 띄우고 경기 여러 개를 시작한 뒤, 경기마다 여러
+SSE 클라이언트를 실제 소켓으로 연결해 끝까지 읽는다. 일부 클라이언트는 일부러 천천히
+읽어(수신 버퍼를 작게 잡고 읽기 사이에 대기) 밀린 델타를 버리는 동작을 확인한다.
+
+인코딩된 프레임 수 대비 구독자에게 전달된 프레임 수(팬아웃), 수신 처리량, 버린 프레임
+수, CPU 사용률을 출력한다. 클라이언트도 같은 프로세스에서 돌기 때문에 처리량은 서버
+단독 성능의 하한이다.
+
+사용법:
+    python -m benchmarks.bench_live_server [--matches N] [--clients N] [--duration SEC]
+"""
+
+import argparse
+import asyncio
+import socket
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.live.runner import LiveMatchRunner
+from sim_soccer.live.server import LiveMatchServer, load_teams
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+@dataclass
+class ClientResult:
+    """클라이언트 하나의 수신 결과"""
+
+    bytes_received: int = 0
+    frames: int = 0
+    keyframes: int = 0
+    finished: bool = False
+
+
+async def watch(port: int, channel_id: str, slow: bool) -> ClientResult:
+    """SSE 스트림을 끝까지 읽기 (slow이면 작은 수신 버퍼로 천천히 읽음)"""
+    result = ClientResult()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if slow:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    writer.write(f"GET /matches/{channel_id}/stream HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    tail = b""  # 청크 경계에 걸친 구분자를 세기 위해 이전 청크 끝을 보관
+    while True:
+        chunk = await reader.read(2048 if slow else 65536)
+        if not chunk:
+            break
+        result.bytes_received += len(chunk)
+        data = tail + chunk
+        result.frames += data.count(b"\n\n") - tail.count(b"\n\n")
+        result.keyframes += data.count(b"event: keyframe") - tail.count(b"event: keyframe")
+        if b"event: end" in data:
+            result.finished = True
+        tail = data[-15:]
+        if slow:
+            await asyncio.sleep(0.05)
+    writer.close()
+    return result
+
+
+async def run(args):
+    """서버와 클라이언트를 실행하고 (채널 목록, 클라이언트 결과 목록) 반환"""
+    server = LiveMatchServer(
+        load_teams(args.teams), LiveMatchRunner(slot=args.slot), max_pending=args.max_pending
+    )
+    http = await server.start(port=0)
+    port = http.sockets[0].getsockname()[1]
+    names = sorted(server.teams)
+    channels, watchers = [], []
+    slow_every = max(1, round(1 / args.slow_fraction)) if args.slow_fraction > 0 else 0
+    for seed in range(args.matches):
+        channel = server.start_match(
+            names[seed % len(names)], names[(seed + 1) % len(names)], seed, args.duration
+        )
+        channels.append(channel)
+        for index in range(args.clients):
+            slow = bool(slow_every) and index % slow_every == 0
+            watchers.append(watch(port, channel.channel_id, slow))
+    results = await asyncio.gather(*watchers)
+    http.close()
+    await http.wait_closed()
+    # 끝난 경기의 채널은 서버 목록에서 제거되므로 직접 보관한 채널로 집계
+    return channels, results
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="실시간 스트리밍 서버 부하 생성기")
+    parser.add_argument("--matches", "-n", type=int, default=20, help="동시 경기 수")
+    parser.add_argument("--clients", "-c", type=int, default=50, help="경기당 클라이언트 수")
+    parser.add_argument("--duration", "-d", type=float, default=30.0, help="경기 진행 시간 (초)")
+    parser.add_argument("--slot", type=float, default=0.25, help="스케줄링 슬롯 (초)")
+    parser.add_argument("--max-pending", type=int, default=8, help="구독자별 최대 대기 프레임")
+    parser.add_argument("--slow-fraction", type=float, default=0.1, help="느린 클라이언트 비율")
+    parser.add_argument("--teams", type=str, default=str(EXAMPLES_DIR))
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외
+    logger.remove()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    channels, results = asyncio.run(run(args))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    encoded = sum(c.encoder.encoded_frames for c in channels)
+    delivered = sum(c.delivered_frames for c in channels)
+    dropped = sum(c.dropped_frames for c in channels)
+    received = sum(r.bytes_received for r in results)
+    frames = sum(r.frames for r in results)
+
+    print(f"matches x clients : {args.matches} x {args.clients} (duration {args.duration:.0f}s)")
+    print(f"wall / cpu        : {wall:.1f} s / {cpu:.1f} s ({cpu / wall:.0%} of one core)")
+    print(f"frames encoded    : {encoded}")
+    print(f"frames fanned out : {delivered} ({delivered / max(encoded, 1):.1f} per encoded frame)")
+    print(f"frames received   : {frames} ({frames / wall:.0f}/s)")
+    print(f"bytes received    : {received / 1e6:.1f} MB ({received / 1e6 / wall:.1f} MB/s)")
+    print(f"dropped (stale)   : {dropped} frames, {sum(r.keyframes for r in results)} keyframes")
+    print(f"all finished      : {all(r.finished for r in results)}")
+
+
+if __name__ == "__main__":
+    main()
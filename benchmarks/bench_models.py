@@ -0,0 +1,126 @@
+"""선수/팀 모델 메모리 및 속도 벤치마크
+
+리그 진행처럼 많은 팀을 메모리에 올려 둘 때의 팀당 메모리와, 모델을 많이 사용하는 작업
+(팀 생성, 스탯/전술 조회, 경기 시뮬레이션)의 속도를 측정한다. 스탯 조회는 딕셔너리 방식
+(`stats.get("STA", 5)`)과, 배열 모델이면 배열 인덱스 방식(`stats.data[Stat.STA]`)을 함께
+측정한다. 변경 전후의 모델을 비교하려면 각 버전에서 같은 인자로 실행한다.
+
+사용법:
+    python -m benchmarks.bench_models [--teams N] [--matches N]
+"""
+
+import argparse
+import copy
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_loader import create_team_from_data
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def measure_team_memory(text: str, count: int) -> float:
+    """팀 count개를 메모리에 올려 두었을 때 팀당 메모리 (바이트)
+
+    리그처럼 팀마다 다른 데이터를 읽는 경우를 재현하도록 팀마다 JSON을 새로 파싱한다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    teams = [create_team_from_data(json.loads(text)) for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del teams
+    return used / count
+
+
+def time_team_build(data, count: int) -> float:
+    """검증된 데이터로 팀 하나를 만드는 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(count):
+        create_team_from_data(data)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def time_stat_reads(team, rounds: int) -> float:
+    """딕셔너리 방식의 선수 스탯/팀 전술 조회 1회당 시간 (나노초)"""
+    players = team.players
+    tactics = team.tactics
+    start = time.perf_counter()
+    total = 0
+    for _ in range(rounds):
+        for player in players:
+            total += player.stats.get("STA", 5)
+            total += player.stats["PAS"]
+        total += tactics.get("pressing", 5)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * (len(players) * 2 + 1)) * 1e9
+
+
+def time_indexed_reads(team, rounds: int) -> Optional[float]:
+    """배열 인덱스로 선수 스탯/팀 전술을 조회하는 1회당 시간 (나노초, 배열 모델만)"""
+    if not hasattr(team.tactics, "data"):
+        return None
+    from sim_soccer.core.ids import Stat, Tactic
+
+    sta, pas, pressing = Stat.STA, Stat.PAS, Tactic.PRESSING
+    players = team.players
+    tactics = team.tactics.data
+    start = time.perf_counter()
+    total = 0
+    for _ in range(rounds):
+        for player in players:
+            stats = player.stats.data
+            total += stats[sta]
+            total += stats[pas]
+        total += tactics[pressing]
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * (len(players) * 2 + 1)) * 1e9
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="선수/팀 모델 메모리 및 속도 벤치마크")
+    parser.add_argument("--teams", "-t", type=int, default=20000, help="메모리에 올릴 팀 수")
+    parser.add_argument("--matches", "-n", type=int, default=20, help="시뮬레이션할 경기 수")
+    parser.add_argument("--home", type=str, default=str(EXAMPLES_DIR / "a.json"))
+    parser.add_argument("--away", type=str, default=str(EXAMPLES_DIR / "b.json"))
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외
+    logger.remove()
+
+    home_text = Path(args.home).read_text(encoding="utf-8")
+    away_text = Path(args.away).read_text(encoding="utf-8")
+
+    per_team = measure_team_memory(home_text, args.teams)
+    build_us = time_team_build(json.loads(home_text), args.teams)
+    home_team = create_team_from_data(json.loads(home_text))
+    away_team = create_team_from_data(json.loads(away_text))
+    read_ns = time_stat_reads(home_team, 20000)
+    indexed_ns = time_indexed_reads(home_team, 20000)
+
+    simulator = MatchSimulator()
+    start = time.perf_counter()
+    for seed in range(args.matches):
+        simulator.simulate_match(
+            copy.deepcopy(home_team), copy.deepcopy(away_team), random_seed=seed
+        )
+    per_match = (time.perf_counter() - start) / args.matches
+
+    print(f"memory per team : {per_team / 1024:.1f} KiB ({args.teams} teams)")
+    print(f"team build      : {build_us:.1f} us")
+    print(f"stat read (dict): {read_ns:.0f} ns")
+    if indexed_ns is not None:
+        print(f"stat read (idx) : {indexed_ns:.0f} ns")
+    print(f"match (full)    : {per_match * 1000:.1f} ms ({args.matches} matches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""난수 스트림 벤치마크
+
+난수 하나를 뽑는 비용(Mersenne Twister `random.Random`, 카운터 기반 `CounterRandom`,
+블록 버퍼 `UniformBuffer`)과, 각 방식으로 점수 전용 경기를 실행한 경기당 시간을 출력한다.
+버퍼를 쓴 경기와 쓰지 않은 경기의 점수가 모두 같은지도 확인한다.
+
+사용법:
+    python -m benchmarks.bench_rng [--matches N] [--draws N]
+"""
+
+import argparse
+import copy
+import random
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.core.rng import CounterRandom, MatchStreams, UniformBuffer
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_loader import load_team
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def time_draws(rng: random.Random, draws: int) -> float:
+    """난수 draws개를 뽑는 데 걸린 시간의 1개당 평균 (ns)"""
+    draw = rng.random
+    start = time.perf_counter()
+    for _ in range(draws):
+        draw()
+    return (time.perf_counter() - start) / draws * 1e9
+
+
+def run_match(simulator, home_team, away_team, seed: int, rng: str):
+    """난수 방식 하나로 경기를 실행하고 (점수, 소요 시간) 반환"""
+    home = copy.deepcopy(home_team)
+    away = copy.deepcopy(away_team)
+    start = time.perf_counter()
+    if rng == "mersenne":
+        simulator.simulate_match(home, away, random_seed=seed, mode="score_only")
+    else:
+        streams = MatchStreams.for_match(0, 0, seed, buffered=rng == "buffered")
+        simulator.simulate_match(home, away, mode="score_only", streams=streams)
+    return (home.score, away.score), time.perf_counter() - start
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="난수 스트림 벤치마크")
+    parser.add_argument("--matches", "-n", type=int, default=30, help="방식별 경기 수")
+    parser.add_argument("--draws", "-d", type=int, default=1_000_000, help="방식별 난수 수")
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외
+    logger.remove()
+
+    draws = {
+        "mersenne": time_draws(random.Random(0), args.draws),
+        "counter": time_draws(CounterRandom(0), args.draws),
+        "buffered": time_draws(UniformBuffer(CounterRandom(0)), args.draws),
+    }
+
+    home_team = load_team(str(EXAMPLES_DIR / "a.json"))
+    away_team = load_team(str(EXAMPLES_DIR / "b.json"))
+    # 부하 변화의 영향을 줄이기 위해 시드마다 세 방식을 번갈아 실행
+    simulator = MatchSimulator()
+    results = {rng: ([], 0.0) for rng in draws}
+    for seed in range(args.matches):
+        for rng in draws:
+            score, elapsed = run_match(simulator, home_team, away_team, seed, rng)
+            scores, total = results[rng]
+            scores.append(score)
+            results[rng] = (scores, total + elapsed)
+
+    print(f"draws per rng    : {args.draws}")
+    for rng, cost in draws.items():
+        print(f"{rng + ' draw':<17}: {cost:.0f} ns")
+    print(f"matches per rng  : {args.matches}")
+    for rng, (_, elapsed) in results.items():
+        print(f"{rng + ' match':<17}: {elapsed / args.matches * 1000:.1f} ms/match")
+    print(f"scores identical : {results['counter'][0] == results['buffered'][0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""점수 전용 모드 벤치마크
+
+같은 시드로 전체 모드와 점수 전용 모드(`mode="score_only"`)를 실행하여 경기당 시간과
+속도 향상을 출력하고, 두 모드의 점수가 모두 같은지 확인한다.
+
+사용법:
+    python -m benchmarks.bench_score_only [--matches N] [--home FILE] [--away FILE]
+"""
+
+import argparse
+import copy
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_loader import load_team
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def run(home_team, away_team, seeds, mode: str):
+    """모드별로 경기를 실행하고 (점수 목록, 총 소요 시간) 반환"""
+    scores = []
+    simulator = MatchSimulator()
+    start = time.perf_counter()
+    for seed in seeds:
+        home = copy.deepcopy(home_team)
+        away = copy.deepcopy(away_team)
+        simulator.simulate_match(home, away, random_seed=seed, mode=mode)
+        scores.append((home.score, away.score))
+    return scores, time.perf_counter() - start
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="점수 전용 모드 벤치마크")
+    parser.add_argument("--matches", "-n", type=int, default=50, help="모드별 경기 수")
+    parser.add_argument("--home", type=str, default=str(EXAMPLES_DIR / "a.json"))
+    parser.add_argument("--away", type=str, default=str(EXAMPLES_DIR / "b.json"))
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외하고 시뮬레이션 작업만 비교
+    logger.remove()
+
+    home_team = load_team(args.home)
+    away_team = load_team(args.away)
+    seeds = range(args.matches)
+
+    full_scores, full_time = run(home_team, away_team, seeds, "full")
+    fast_scores, fast_time = run(home_team, away_team, seeds, "score_only")
+
+    print(f"matches per mode : {args.matches}")
+    print(f"full             : {full_time / args.matches * 1000:.1f} ms/match")
+    print(f"score_only       : {fast_time / args.matches * 1000:.1f} ms/match")
+    print(f"speedup          : {full_time / fast_time:.2f}x")
+    print(f"scores identical : {full_scores == fast_scores}")
+
+
+if __name__ == "__main__":
+    main()
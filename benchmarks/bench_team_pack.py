@@ -0,0 +1,113 @@
+"""팀 묶음 (공유 메모리) 벤치마크
+
+리그 규모의 팀을 워커에 전달하는 비용을 비교한다. 팀 목록을 피클로 직렬화/역직렬화하는
+경우와, TeamPack으로 묶어 공유 메모리에 공개하고 연결해 팀 템플릿을 만드는 경우의 크기와
+시간을 출력한 뒤, 두 방식으로 만든 팀이 같은지 확인한다. `--matches`를 주면 같은 팀들로
+워커 프로세스 배치(`simulate_pairings`)를 실행한 시간도 출력한다.
+
+사용법:
+    python -m benchmarks.bench_team_pack [--teams N] [--matches N] [--workers N]
+"""
+
+import argparse
+import json
+import pickle
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.core.batch import simulate_pairings
+from sim_soccer.io.team_loader import create_team_from_data
+from sim_soccer.io.team_pack import TeamPack, pack_teams
+from sim_soccer.models.team_template import TeamTemplate
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def make_league(count: int):
+    """예제 팀을 바탕으로 이름과 전술이 다른 팀 count개 생성"""
+    bases = [
+        json.loads((EXAMPLES_DIR / name).read_text(encoding="utf-8"))
+        for name in ("a.json", "b.json")
+    ]
+    teams = []
+    for index in range(count):
+        data = json.loads(json.dumps(bases[index % len(bases)]))
+        data["team_name"] = f"Team {index}"
+        data["team_id"] = f"team_{index}"
+        for player in data["players"]:
+            player["name"] = f"{player['name']} {index}"
+        data["tactics"]["pressing"] = 1 + index % 10
+        teams.append(create_team_from_data(data))
+    return teams
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="팀 묶음 (공유 메모리) 벤치마크")
+    parser.add_argument("--teams", "-t", type=int, default=10000, help="리그 팀 수")
+    parser.add_argument("--matches", "-n", type=int, default=0, help="배치로 실행할 대진 수")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="배치 워커 프로세스 수")
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외
+    logger.remove()
+
+    teams = make_league(args.teams)
+
+    start = time.perf_counter()
+    pickled = pickle.dumps(teams)
+    dump_time = time.perf_counter() - start
+    start = time.perf_counter()
+    unpickled = pickle.loads(pickled)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pack_size = len(pack_teams(teams))
+    publisher = TeamPack.publish(teams)
+    publish_time = time.perf_counter() - start
+    try:
+        start = time.perf_counter()
+        attached = TeamPack.attach(publisher.name)
+        attach_time = time.perf_counter() - start
+        start = time.perf_counter()
+        templates = [attached.template(index) for index in range(len(attached))]
+        template_time = time.perf_counter() - start
+        identical = templates == [TeamTemplate.from_team(team) for team in unpickled]
+        attached.close()
+    finally:
+        publisher.close()
+        publisher.unlink()
+
+    print(f"teams            : {args.teams}")
+    print(
+        f"pickle           : {len(pickled) / 1e6:.2f} MB, dump {dump_time * 1000:.0f} ms, "
+        f"load {load_time * 1000:.0f} ms"
+    )
+    print(
+        f"team pack        : {pack_size / 1e6:.2f} MB, publish {publish_time * 1000:.0f} ms, "
+        f"attach {attach_time * 1000:.0f} ms"
+    )
+    print(
+        f"templates (all)  : {template_time * 1000:.0f} ms "
+        f"({template_time / args.teams * 1e6:.1f} us/team)"
+    )
+    print(f"teams identical  : {identical}")
+
+    if args.matches:
+        pairings = [
+            (teams[(2 * i) % len(teams)], teams[(2 * i + 1) % len(teams)])
+            for i in range(args.matches)
+        ]
+        start = time.perf_counter()
+        simulate_pairings(pairings, seeds=[0], workers=args.workers, mode="score_only")
+        elapsed = time.perf_counter() - start
+        print(
+            f"batch            : {args.matches} matches, {args.workers} workers, "
+            f"{elapsed:.1f} s ({elapsed / args.matches * 1000:.1f} ms/match)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""팀 템플릿 벤치마크
+
+경기마다 시작 상태의 팀을 준비하는 비용을 깊은 복사(`copy.deepcopy`), 템플릿의 새 팀
+생성(`instantiate`), 템플릿 풀(`acquire`/`release`)로 비교하고, 점수 전용 모드 경기에서
+준비 방식별 경기당 시간과 점수가 모두 같은지 출력한다.
+
+사용법:
+    python -m benchmarks.bench_team_template [--matches N] [--home FILE] [--away FILE]
+"""
+
+import argparse
+import copy
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_loader import load_team
+from sim_soccer.models.team_template import TeamTemplate
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def time_per_call(func, count: int) -> float:
+    """함수 1회 호출 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def run(prepare, release, seeds):
+    """준비 방식별로 점수 전용 경기를 실행하고 (점수 목록, 경기당 시간(초)) 반환"""
+    simulator = MatchSimulator()
+    scores = []
+    start = time.perf_counter()
+    for seed in seeds:
+        home, away = prepare()
+        simulator.simulate_match(home, away, random_seed=seed, mode="score_only")
+        scores.append((home.score, away.score))
+        release(home, away)
+    return scores, (time.perf_counter() - start) / len(seeds)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="팀 템플릿 벤치마크")
+    parser.add_argument("--matches", "-n", type=int, default=50, help="준비 방식별 경기 수")
+    parser.add_argument("--home", type=str, default=str(EXAMPLES_DIR / "a.json"))
+    parser.add_argument("--away", type=str, default=str(EXAMPLES_DIR / "b.json"))
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외
+    logger.remove()
+
+    home_team = load_team(args.home)
+    away_team = load_team(args.away)
+    home_template = TeamTemplate.from_team(home_team)
+    away_template = TeamTemplate.from_team(away_team)
+
+    def pooled():
+        home_template.release(home_template.acquire())
+
+    print(f"deepcopy         : {time_per_call(lambda: copy.deepcopy(home_team), 2000):.1f} us/team")
+    print(f"instantiate      : {time_per_call(home_template.instantiate, 2000):.1f} us/team")
+    print(f"acquire/release  : {time_per_call(pooled, 2000):.1f} us/team")
+
+    seeds = range(args.matches)
+    copied_scores, copied_time = run(
+        lambda: (copy.deepcopy(home_team), copy.deepcopy(away_team)),
+        lambda home, away: None,
+        seeds,
+    )
+    pooled_scores, pooled_time = run(
+        lambda: (home_template.acquire(), away_template.acquire()),
+        lambda home, away: (home_template.release(home), away_template.release(away)),
+        seeds,
+    )
+
+    print(f"match (deepcopy) : {copied_time * 1000:.2f} ms/match (score_only)")
+    print(f"match (pooled)   : {pooled_time * 1000:.2f} ms/match (score_only)")
+    print(f"scores identical : {copied_scores == pooled_scores}")
+
+
+if __name__ == "__main__":
+    main()
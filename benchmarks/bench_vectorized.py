@@ -0,0 +1,80 @@
+"""벡터화 엔진 벤치마크
+
+같은 대진을 스칼라 엔진(전체 모드, 점수 전용 모드)과 벡터화 엔진(`VectorizedMatchEngine`)으로
+실행하여 경기당 시간과 스칼라 엔진 대비 처리량 배수를 출력한다. 벡터화 엔진은 배치 크기가
+클수록 Tick당 고정 비용이 나뉘므로 `--batch`에 여러 크기를 지정해 비교할 수 있다.
+numpy가 필요하다 (`fast` 선택 의존성).
+
+사용법:
+    python -m benchmarks.bench_vectorized [--matches N] [--batch N ...] [--home FILE] [--away FILE]
+"""
+
+import argparse
+import copy
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.core.vectorized import VectorizedMatchEngine
+from sim_soccer.io.team_loader import load_team
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def time_scalar(home_team, away_team, matches: int, mode: str) -> float:
+    """스칼라 엔진의 경기당 평균 시간 (초)"""
+    simulator = MatchSimulator()
+    elapsed = 0.0
+    for seed in range(matches):
+        home = copy.deepcopy(home_team)
+        away = copy.deepcopy(away_team)
+        start = time.perf_counter()
+        simulator.simulate_match(home, away, random_seed=seed, mode=mode)
+        elapsed += time.perf_counter() - start
+    return elapsed / matches
+
+
+def time_vectorized(engine, home_team, away_team, batch: int) -> float:
+    """벡터화 엔진으로 batch개 경기를 한 번에 실행한 경기당 평균 시간 (초)"""
+    start = time.perf_counter()
+    engine.simulate([(home_team, away_team)], matches_per_pairing=batch, seed=0)
+    return (time.perf_counter() - start) / batch
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="벡터화 엔진 벤치마크")
+    parser.add_argument("--matches", "-n", type=int, default=30, help="스칼라 엔진 경기 수")
+    parser.add_argument(
+        "--batch", "-b", type=int, nargs="+", default=[100, 500, 2000], help="벡터화 배치 크기"
+    )
+    parser.add_argument("--home", type=str, default=str(EXAMPLES_DIR / "a.json"))
+    parser.add_argument("--away", type=str, default=str(EXAMPLES_DIR / "b.json"))
+    args = parser.parse_args()
+
+    # 로그 출력 자체의 비용은 제외
+    logger.remove()
+
+    home_team = load_team(args.home)
+    away_team = load_team(args.away)
+
+    full = time_scalar(home_team, away_team, args.matches, "full")
+    score_only = time_scalar(home_team, away_team, args.matches, "score_only")
+    engine = VectorizedMatchEngine()
+    engine.simulate([(home_team, away_team)], matches_per_pairing=1, seed=0)  # 준비 비용 제외
+
+    print(f"scalar matches   : {args.matches}")
+    print(f"scalar full      : {full * 1000:.2f} ms/match")
+    print(f"scalar score_only: {score_only * 1000:.2f} ms/match")
+    for batch in args.batch:
+        per_match = time_vectorized(engine, home_team, away_team, batch)
+        print(
+            f"{f'vectorized {batch}':<17}: {per_match * 1000:.2f} ms/match "
+            f"({full / per_match:.1f}x full, {score_only / per_match:.1f}x score_only)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from pathlib import Path
 from loguru import logger
 
 from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.replay import record_match
 from sim_soccer.io.reporter import print_match_report
 from sim_soccer.io.team_loader import (
     PointSumError,
@@ -64,6 +65,12 @@ def main():
         default=60.0,
         help="경기 진행 시간 (초 단위, 기본값: 60초)",
     )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        help="리플레이 파일 저장 경로 (지정하면 실시간 출력 없이 진행)",
+    )
     
     args = parser.parse_args()
     
@@ -86,9 +93,14 @@ def main():
         # 시뮬레이션 실행
         logger.info("Starting match simulation...")
         simulator = MatchSimulator(random_seed=args.seed, live_output=args.live)
-        match_result = simulator.simulate_match(
-            home_team, away_team, args.seed, live_output=args.live, duration=args.duration
-        )
+        if args.replay:
+            match_result, replay = record_match(simulator, home_team, away_team, args.seed)
+            Path(args.replay).write_bytes(replay)
+            logger.info(f"Replay saved to {args.replay} ({len(replay)} bytes)")
+        else:
+            match_result = simulator.simulate_match(
+                home_team, away_team, args.seed, live_output=args.live, duration=args.duration
+            )
         
         # 리포트 출력
         print_match_report(match_result)
@@ -0,0 +1,270 @@
+"""행동 결과 핸들러 레지스트리
+
+판정이 끝난 행동 계획(ActionPlan)의 결과(통계, 볼 이동, 공수 전환, 이벤트 로그)를
+행동 ID(Action)별 핸들러로 적용한다. 시뮬레이터는 `registry.handlers[plan.action]`
+한 번의 인덱싱으로 핸들러를 찾으므로, 새 행동은 `register`로 핸들러를 추가하기만
+하면 되고 Tick 루프는 바뀌지 않는다.
+
+체력 소모는 모든 행동에 공통이므로 시뮬레이터가 핸들러 호출 전에 처리한다.
+핸들러는 `sim.observe`가 False(점수 전용 모드)이면 통계, 이벤트 로그 같은 관찰용 작업을
+건너뛰고 경기 상태 변경과 난수 사용만 수행한다. 실시간 출력은 핸들러가 아니라
+`simulate_match`가 스트리밍 이벤트(ActionEvent)를 받아 처리한다.
+"""
+
+from typing import TYPE_CHECKING, Callable, List
+
+from loguru import logger
+
+from sim_soccer.core.action_plan import ActionPlan
+from sim_soccer.core.ids import PASS_ACTIONS, Action, TeamStat
+from sim_soccer.field.positioning import find_nearest_player
+from sim_soccer.models.match import MatchState
+from sim_soccer.models.team import TeamState
+from sim_soccer.systems.momentum import update_momentum
+
+if TYPE_CHECKING:  # pragma: no cover - 순환 import 방지
+    from sim_soccer.core.simulator import MatchSimulator
+
+# (시뮬레이터, 행동 계획, 공격 팀, 수비 팀, 경기 상태) -> None
+ActionHandler = Callable[["MatchSimulator", ActionPlan, TeamState, TeamState, MatchState], None]
+
+# 드리블 실패 시 공수 전환 확률
+DRIBBLE_TURNOVER_PROB = 0.4
+
+
+def _record_attempt(team: TeamState, attempted: TeamStat, successful: TeamStat, success: bool):
+    """시도/성공 통계 기록"""
+    stats = team.stats.data
+    stats[attempted] += 1
+    if success:
+        stats[successful] += 1
+
+
+def _give_ball(match_state: MatchState, receiving_team: TeamState, losing_team: TeamState, player):
+    """상대 팀 선수에게 볼 소유권 이전 (공격 팀 전환은 호출자가 처리)"""
+    receiving_team.set_ball_holder(player.player_id)
+    match_state.ball_holder = player.player_id
+    match_state.ball_zone = player.zone
+    losing_team.set_ball_holder(None)
+
+
+def _goal_kick(match_state: MatchState, attacking_team: TeamState, defending_team: TeamState):
+    """수비 팀 골키퍼에서 빌드업 재시작 (골 후 킥오프, 슈팅 실패 후 골킥)"""
+    match_state.switch_attacking_team()
+    match_state.current_phase = "build_up"
+    defending_gk = defending_team.get_players_by_position("GK")[0]
+    match_state.ball_zone = defending_gk.zone
+    match_state.ball_holder = defending_gk.player_id
+    defending_team.set_ball_holder(defending_gk.player_id)
+    attacking_team.set_ball_holder(None)
+
+
+def _start_turnover(match_state: MatchState, attacking_team: TeamState):
+    """공격 실수로 인한 공수 전환 시작"""
+    match_state.switch_attacking_team()
+    match_state.current_phase = "transition"
+    attacking_team.momentum = update_momentum(attacking_team.momentum, "mistake")
+
+
+def handle_shoot(
+    sim: "MatchSimulator",
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """슈팅: 성공하면 골 판정, 골이면 킥오프, 실패하면 골킥"""
+    attacker = plan.attacker
+    observe = sim.observe
+    if observe:
+        _record_attempt(attacking_team, TeamStat.SHOTS, TeamStat.SHOTS_ON_TARGET, plan.success)
+
+    if plan.success:
+        # 슈팅 성공 시 골 확률 계산
+        plan.is_goal = sim._calculate_goal_probability(attacker, plan.defender, attacking_team)
+        if plan.is_goal:
+            attacking_team.score += 1
+            attacking_team.momentum = update_momentum(attacking_team.momentum, "goal_scored")
+            defending_team.momentum = update_momentum(defending_team.momentum, "goal_conceded")
+            if observe:
+                scorer = attacker.name if attacker else "Unknown"
+                logger.info(
+                    f"GOAL! {attacking_team.team_name} scores! "
+                    f"(tick: {match_state.tick}, player: {scorer})"
+                )
+                # 골 이벤트 로깅
+                match_state.event_log.record(
+                    tick=match_state.tick,
+                    phase=match_state.current_phase,
+                    event_type="goal",
+                    team="home" if attacking_team is match_state.home_team else "away",
+                    player_id=attacker.player_id if attacker else None,
+                    action="shoot",
+                    result="success",
+                    description=f"Goal scored by {attacker.name if attacker else 'Unknown'}",
+                )
+            # 골 후 킥오프 (수비 팀이 공격 시작)
+            _goal_kick(match_state, attacking_team, defending_team)
+    else:
+        # 슈팅 실패 시 골킥
+        _goal_kick(match_state, attacking_team, defending_team)
+
+
+def handle_pass(
+    sim: "MatchSimulator",
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """패스: 성공하면 대상 선수에게 볼 이동, 실패하면 가장 가까운 상대 선수가 볼 획득"""
+    attacker = plan.attacker
+    if plan.action == Action.PASS and sim.observe:
+        _record_attempt(
+            attacking_team, TeamStat.PASSES_ATTEMPTED, TeamStat.PASSES_COMPLETED, plan.success
+        )
+
+    if plan.success:
+        if attacker:
+            target_player = plan.target_player
+            if target_player:
+                # 자기 자신에게 패스하면 팀에 볼 소유자가 없어짐
+                attacking_team.set_ball_holder(
+                    target_player.player_id if target_player is not attacker else None
+                )
+                match_state.ball_holder = target_player.player_id
+                match_state.ball_zone = target_player.zone
+            else:
+                # 대상 선수를 찾지 못한 경우 공격자가 계속 공을 가짐
+                logger.warning("Could not find target player for pass")
+    else:
+        _start_turnover(match_state, attacking_team)
+        # 상대 팀의 가장 가까운 선수에게 볼 전달
+        defending_player = find_nearest_player(defending_team, match_state.ball_zone, grid=sim.grid)
+        if defending_player:
+            _give_ball(match_state, defending_team, attacking_team, defending_player)
+        else:
+            # 수비 선수를 찾지 못한 경우 수비 팀 골키퍼에게
+            defending_gk = defending_team.get_players_by_position("GK")[0]
+            _give_ball(match_state, defending_team, attacking_team, defending_gk)
+
+
+def handle_dribble(
+    sim: "MatchSimulator",
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """드리블: 성공하면 한 행 전진, 실패하면 일정 확률로 공수 전환"""
+    attacker = plan.attacker
+    if sim.observe:
+        _record_attempt(
+            attacking_team, TeamStat.DRIBBLES_ATTEMPTED, TeamStat.DRIBBLES_SUCCESSFUL, plan.success
+        )
+
+    if plan.success:
+        # 드리블 성공 시 전방으로 이동 가능
+        if attacker and match_state.current_phase != "final_third":
+            forward_zone = sim.grid.forward[attacker.zone]
+            if forward_zone != attacker.zone:
+                attacking_team.move_player(attacker, forward_zone)  # 한 행 앞으로
+                match_state.ball_zone = attacker.zone
+    elif sim.streams.turnover.random() < DRIBBLE_TURNOVER_PROB:
+        _start_turnover(match_state, attacking_team)
+        # 상대 팀의 가장 가까운 선수에게 볼 전달
+        defending_player = find_nearest_player(defending_team, match_state.ball_zone, grid=sim.grid)
+        if defending_player:
+            _give_ball(match_state, defending_team, attacking_team, defending_player)
+
+
+def _win_ball(
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """태클/인터셉트 성공 시 수비자가 볼을 얻고 공수 전환"""
+    if plan.success and plan.defender:
+        match_state.switch_attacking_team()
+        match_state.current_phase = "transition"
+        _give_ball(match_state, defending_team, attacking_team, plan.defender)
+
+
+def handle_tackle(
+    sim: "MatchSimulator",
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """태클: 수비 팀 통계 기록, 성공하면 수비자가 볼 획득"""
+    _win_ball(plan, attacking_team, defending_team, match_state)
+    if sim.observe:
+        _record_attempt(
+            defending_team, TeamStat.TACKLES_ATTEMPTED, TeamStat.TACKLES_SUCCESSFUL, plan.success
+        )
+
+
+def handle_intercept(
+    sim: "MatchSimulator",
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """인터셉트: 성공하면 수비자가 볼 획득"""
+    _win_ball(plan, attacking_team, defending_team, match_state)
+
+
+def handle_no_effect(
+    sim: "MatchSimulator",
+    plan: ActionPlan,
+    attacking_team: TeamState,
+    defending_team: TeamState,
+    match_state: MatchState,
+):
+    """체력 소모 외의 결과가 없는 행동 (전환/수비 Phase의 전술 행동, 중거리 슛, 크로스 등)"""
+
+
+class ActionHandlerRegistry:
+    """행동 ID -> 결과 핸들러 테이블"""
+
+    def __init__(self):
+        """모든 행동이 결과 없음 핸들러로 등록된 레지스트리 생성"""
+        # Action 값으로 바로 인덱싱하는 핸들러 목록
+        self.handlers: List[ActionHandler] = [handle_no_effect] * len(Action)
+
+    def register(self, action: Action, handler: ActionHandler):
+        """행동의 결과 핸들러 등록 (기존 핸들러 대체)
+
+        Args:
+            action: 행동 ID
+            handler: (시뮬레이터, 행동 계획, 공격 팀, 수비 팀, 경기 상태)를 받는 함수
+        """
+        self.handlers[Action(action)] = handler
+
+    def get(self, action: Action) -> ActionHandler:
+        """행동의 결과 핸들러 반환"""
+        return self.handlers[action]
+
+    def copy(self) -> "ActionHandlerRegistry":
+        """같은 핸들러를 가진 새 레지스트리 반환 (기본 레지스트리를 바꾸지 않고 확장할 때 사용)"""
+        registry = ActionHandlerRegistry()
+        registry.handlers = list(self.handlers)
+        return registry
+
+
+def create_default_registry() -> ActionHandlerRegistry:
+    """기본 규칙의 행동 핸들러 레지스트리 생성"""
+    registry = ActionHandlerRegistry()
+    registry.register(Action.SHOOT, handle_shoot)
+    for action in PASS_ACTIONS:
+        registry.register(action, handle_pass)
+    registry.register(Action.DRIBBLE, handle_dribble)
+    registry.register(Action.TACKLE, handle_tackle)
+    registry.register(Action.INTERCEPT, handle_intercept)
+    return registry
+
+
+DEFAULT_ACTION_HANDLERS = create_default_registry()
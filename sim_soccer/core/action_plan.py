@@ -0,0 +1,43 @@
+"""Tick별 행동 계획"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from sim_soccer.core.ids import ACTION_IDS, Action
+from sim_soccer.models.player import PlayerState
+
+
+@dataclass
+class ActionPlan:
+    """한 Tick의 행동 계획
+
+    행동 선택(ActionSelector) -> 컨테스트 판정 -> 결과 적용(MatchSimulator)까지
+    선택된 행동과 관련 선수, 패스 대상, 상황 변수를 전달한다. 시뮬레이터는 하나의
+    계획 슬롯을 재사용하므로 Tick마다 새 객체를 만들지 않는다.
+    """
+
+    action_type: str = ""
+    action: Action = Action.PASS  # action_type의 정수 ID (핸들러 테이블 인덱스)
+    attacker: Optional[PlayerState] = None
+    defender: Optional[PlayerState] = None
+    target_player: Optional[PlayerState] = None  # 패스 대상 선수 (패스가 아니면 None)
+    target_zone: Optional[int] = None  # 패스 대상 Zone (패스가 아니면 None)
+    situation: Dict = field(default_factory=dict)
+    success_rate: float = 0.0
+    roll: float = 0.0  # 성공 판정에 사용한 난수 (success_rate보다 작으면 성공)
+    success: bool = False
+    is_goal: bool = False  # 슈팅이 골로 이어졌는지 (슈팅 핸들러가 설정)
+
+    def reset(self, action_type: str):
+        """새 행동을 위해 슬롯 초기화 (상황 변수 딕셔너리는 재사용)"""
+        self.action_type = action_type
+        self.action = ACTION_IDS[action_type]
+        self.attacker = None
+        self.defender = None
+        self.target_player = None
+        self.target_zone = None
+        self.situation.clear()
+        self.success_rate = 0.0
+        self.roll = 0.0
+        self.success = False
+        self.is_goal = False
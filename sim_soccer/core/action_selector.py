@@ -5,11 +5,22 @@ from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from sim_soccer.core.action_plan import ActionPlan
+from sim_soccer.core.engine_log import EngineLog
+from sim_soccer.core.ids import Tactic
+from sim_soccer.core.sampling import AliasTable, CumulativeDistribution
+from sim_soccer.field.grid import DEFAULT_GRID, FieldGrid
 from sim_soccer.field.positioning import get_players_by_phase, get_players_in_zone
 from sim_soccer.models.match import MatchState
 from sim_soccer.models.player import PlayerState
+from sim_soccer.models.stat_block import Tactics
 from sim_soccer.models.team import TeamState
 
+# 핫 패스에서 읽는 전술 배열 인덱스 (IntEnum 속성 조회를 피하기 위해 정수로 고정)
+_ATTACK = int(Tactic.ATTACK)
+_PASS_STYLE = int(Tactic.PASS_STYLE)
+_PRESSING = int(Tactic.PRESSING)
+
 
 class ActionSelector:
     """행동 선택을 담당하는 클래스"""
@@ -46,6 +57,74 @@ class ActionSelector:
         ],
     }
 
+    # 수비자가 컨테스트에 참여하는 행동
+    DEFENDED_ACTIONS: Tuple[str, ...] = ("pass", "dribble", "shoot")
+
+    # 패스 상황 변수(거리) 계산에 사용하는 기준 Zone (기준 5x3 격자의 중앙 중앙)
+    SITUATION_TARGET_ZONE = 8
+
+    # 수비자 포지셔닝 상황 변수 기본값
+    DEFAULT_POSITIONING = 5
+
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        grid: Optional[FieldGrid] = None,
+        log: Optional[EngineLog] = None,
+    ):
+        """행동 선택기 초기화
+        
+        Args:
+            rng: 행동/선수 선택에 사용할 난수 생성기 (None이면 새로 생성)
+            grid: 필드 격자 (None이면 기본 5x3 격자)
+            log: 디버그 로그 게이트 (None이면 새로 생성)
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.log = log if log is not None else EngineLog()
+        self.grid = grid or DEFAULT_GRID
+        # 기준 격자의 Zone 번호를 현재 격자의 Zone으로 변환해 둠
+        self.situation_target_zone = self.grid.map_base_zone(self.SITUATION_TARGET_ZONE)
+        self._forward_target_zone = self.grid.map_base_zone(14)  # 중앙 전방
+        self._midfield_target_zone = self.grid.map_base_zone(8)  # 중앙 중앙
+        self._back_target_zone = self.grid.map_base_zone(5)  # 중앙 후중앙
+        # (phase, attack, pass_style) -> 행동 분포 (처음 요청될 때 계산)
+        self._action_distributions: Dict[Tuple[str, int, int], CumulativeDistribution] = {}
+        self._action_alias_tables: Dict[Tuple[str, int, int], AliasTable] = {}
+        # plan_action이 재사용하는 행동 계획 슬롯
+        self.plan = ActionPlan()
+
+    def plan_action(
+        self,
+        phase: str,
+        team: TeamState,
+        match_state: MatchState,
+        plan: Optional[ActionPlan] = None,
+    ) -> ActionPlan:
+        """행동, 주체/수비자, 패스 대상, 상황 변수를 선택해 행동 계획에 채움
+        
+        난수 사용 순서는 select_action -> select_players와 같다.
+        
+        Args:
+            phase: 현재 Phase
+            team: 공격 팀 상태
+            match_state: 경기 상태
+            plan: 채울 행동 계획 (None이면 선택기의 재사용 슬롯)
+        
+        Returns:
+            채워진 행동 계획
+        """
+        if plan is None:
+            plan = self.plan
+        action_type = self.get_action_distribution(phase, team.tactics).sample(self.rng.random())
+        plan.reset(action_type)
+        self._create_situation(action_type, team, match_state, plan.situation)
+        
+        if self.log.debug_enabled:
+            logger.debug(f"Action selected: {action_type} (phase: {phase}, team: {team.team_name})")
+        
+        self._fill_players(plan, team, match_state)
+        return plan
+
     def select_action(
         self, phase: str, team: TeamState, match_state: MatchState
     ) -> Tuple[str, Dict]:
@@ -59,26 +138,65 @@ class ActionSelector:
         Returns:
             (action_type, situation) 튜플
         """
-        # Phase별 가능한 행동 가져오기
-        possible_actions = self.PHASE_ACTIONS.get(phase, [("pass", 1.0)])
-        
-        # 전술에 따른 확률 조정
-        adjusted_actions = self._adjust_action_probabilities(
-            possible_actions, team.tactics, phase
-        )
-        
-        # 행동 선택
-        action_type = self._select_by_probability(adjusted_actions)
+        # 전술에 따라 조정된 행동 분포에서 선택 (누적 확률 이분 탐색)
+        action_type = self.get_action_distribution(phase, team.tactics).sample(self.rng.random())
         
         # 상황 변수 생성
         situation = self._create_situation(action_type, team, match_state)
         
-        logger.debug(
-            f"Action selected: {action_type} (phase: {phase}, team: {team.team_name})"
-        )
+        if self.log.debug_enabled:
+            logger.debug(f"Action selected: {action_type} (phase: {phase}, team: {team.team_name})")
         
         return action_type, situation
 
+    def get_adjusted_actions(self, phase: str, tactics: Dict[str, int]) -> List[Tuple[str, float]]:
+        """Phase와 전술에 따라 조정된 (행동, 확률) 목록 반환"""
+        possible_actions = self.PHASE_ACTIONS.get(phase, [("pass", 1.0)])
+        return self._adjust_action_probabilities(possible_actions, tactics, phase)
+
+    def get_action_distribution(
+        self, phase: str, tactics: Dict[str, int]
+    ) -> CumulativeDistribution:
+        """Phase와 전술에 대한 행동 누적 분포 반환
+        
+        분포는 (Phase, 공격성, 패스 스타일)만으로 결정되므로 조합마다 한 번만 계산한다.
+        선형 누적 탐색과 같은 난수를 같은 행동으로 매핑한다.
+        
+        Args:
+            phase: 현재 Phase
+            tactics: 팀 전술
+        
+        Returns:
+            행동 누적 분포
+        """
+        data = tactics.data if type(tactics) is Tactics else Tactics(tactics).data
+        key = (phase, data[_ATTACK], data[_PASS_STYLE])
+        distribution = self._action_distributions.get(key)
+        if distribution is None:
+            distribution = CumulativeDistribution.from_weights(
+                self.get_adjusted_actions(phase, tactics)
+            )
+            self._action_distributions[key] = distribution
+        return distribution
+
+    def get_action_alias_table(self, phase: str, tactics: Dict[str, int]) -> AliasTable:
+        """Phase와 전술에 대한 행동 별칭 테이블 반환 (여러 행동을 한 번에 뽑을 때 사용)
+        
+        Args:
+            phase: 현재 Phase
+            tactics: 팀 전술
+        
+        Returns:
+            행동 별칭 테이블
+        """
+        data = tactics.data if type(tactics) is Tactics else Tactics(tactics).data
+        key = (phase, data[_ATTACK], data[_PASS_STYLE])
+        table = self._action_alias_tables.get(key)
+        if table is None:
+            table = AliasTable.from_weights(self.get_adjusted_actions(phase, tactics))
+            self._action_alias_tables[key] = table
+        return table
+
     def _adjust_action_probabilities(
         self,
         actions: List[Tuple[str, float]],
@@ -86,8 +204,9 @@ class ActionSelector:
         phase: str,
     ) -> List[Tuple[str, float]]:
         """전술에 따른 행동 확률 조정"""
-        attack = tactics.get("attack", 5)
-        pass_style = tactics.get("pass_style", 5)
+        data = tactics.data if type(tactics) is Tactics else Tactics(tactics).data
+        attack = data[_ATTACK]
+        pass_style = data[_PASS_STYLE]
         
         adjusted = []
         total_prob = 0.0
@@ -116,45 +235,46 @@ class ActionSelector:
         
         return adjusted
 
-    def _select_by_probability(
-        self, actions: List[Tuple[str, float]]
-    ) -> str:
-        """확률에 따라 행동 선택"""
-        r = random.random()
-        cumulative = 0.0
-        
-        for action_type, prob in actions:
-            cumulative += prob
-            if r < cumulative:
-                return action_type
-        
-        # 기본값: 마지막 행동
-        return actions[-1][0]
-
     def _create_situation(
-        self, action_type: str, team: TeamState, match_state: MatchState
+        self,
+        action_type: str,
+        team: TeamState,
+        match_state: MatchState,
+        situation: Optional[Dict] = None,
     ) -> Dict:
-        """행동에 대한 상황 변수 생성"""
-        from sim_soccer.field.zone import calculate_distance
-        
-        situation = {}
+        """행동에 대한 상황 변수 생성 (situation이 주어지면 그 딕셔너리를 채움)"""
+        if situation is None:
+            situation = {}
         
         # 거리 계산 (볼 위치와 대상 Zone 간)
         ball_zone = match_state.ball_zone
         if action_type in ["pass", "pass_long", "pass_to_midfield", "pass_to_forward"]:
             # 패스의 경우 대상 Zone 추정 (임시로 중앙 중앙으로 설정)
-            target_zone = 8
-            situation["distance"] = calculate_distance(ball_zone, target_zone)
+            target_zone = self.situation_target_zone
+            situation["distance"] = self.grid.distance[ball_zone][target_zone]
         
         # 압박 강도
         defending_team = match_state.get_defending_team()
-        situation["pressing"] = defending_team.tactics.get("pressing", 5)
+        situation["pressing"] = defending_team.tactics.data[_PRESSING]
         
         # 포지셔닝 (수비자용)
-        situation["positioning"] = 5  # 기본값
+        situation["positioning"] = self.DEFAULT_POSITIONING
         
         return situation
 
+    def get_pass_target_zone(self, action_type: str, phase: str) -> int:
+        """패스 행동과 Phase에 따른 패스 대상 Zone 반환"""
+        if action_type == "pass_to_forward":
+            return self._forward_target_zone
+        elif action_type == "pass_to_midfield":
+            return self._midfield_target_zone
+        elif phase == "final_third":
+            return self._forward_target_zone
+        elif phase == "midfield":
+            return self._midfield_target_zone
+        else:
+            return self._back_target_zone
+
     def select_players(
         self,
         action_type: str,
@@ -169,39 +289,37 @@ class ActionSelector:
             match_state: 경기 상태
         
         Returns:
-            (attacker, defender) 튜플
+            (attacker, defender) 튜플 (패스 대상까지 필요하면 plan_action 사용)
         """
+        plan = ActionPlan(action_type=action_type)
+        self._fill_players(plan, team, match_state)
+        return plan.attacker, plan.defender
+
+    def _fill_players(self, plan: ActionPlan, team: TeamState, match_state: MatchState):
+        """행동 계획에 주체, 수비자, 패스 대상 선수/Zone을 채움"""
+        action_type = plan.action_type
+
         # 공을 가진 선수 찾기
         attacker = team.get_ball_holder()
         if not attacker:
             # 공을 가진 선수가 없으면 볼 위치의 선수 선택
-            players_in_zone = get_players_in_zone(team, match_state.ball_zone)
-            if players_in_zone:
-                attacker = players_in_zone[0]
-            else:
+            attacker = team.get_first_player_in_zone(match_state.ball_zone)
+            if not attacker:
                 # 볼 위치에 선수가 없으면 Phase에 맞는 선수 선택
-                phase_players = get_players_by_phase(team, match_state.current_phase)
+                phase_players = get_players_by_phase(team, match_state.current_phase, self.grid)
                 if phase_players:
                     attacker = phase_players[0]
                 else:
                     # 그래도 없으면 임의의 선수 선택
                     if team.players:
                         attacker = team.players[0]
+        plan.attacker = attacker
         
         # 패스의 경우 대상 선수도 선택 (패스 성공 시 사용)
-        pass_target = None
         if action_type in ["pass", "pass_long", "pass_to_midfield", "pass_to_forward"]:
             # Phase와 행동 타입에 따라 대상 Zone 결정
-            if action_type == "pass_to_forward":
-                target_zone = 14  # 중앙 전방
-            elif action_type == "pass_to_midfield":
-                target_zone = 8  # 중앙 중앙
-            elif match_state.current_phase == "final_third":
-                target_zone = 14
-            elif match_state.current_phase == "midfield":
-                target_zone = 8
-            else:
-                target_zone = 5
+            target_zone = self.get_pass_target_zone(action_type, match_state.current_phase)
+            plan.target_zone = target_zone
             
             # 대상 Zone의 선수 선택 (공격자가 아닌 선수)
             target_players = get_players_in_zone(team, target_zone)
@@ -209,35 +327,28 @@ class ActionSelector:
                 # 공격자가 아닌 선수 중 선택
                 candidates = [p for p in target_players if p.player_id != (attacker.player_id if attacker else -1)]
                 if candidates:
-                    pass_target = random.choice(candidates)
+                    plan.target_player = self.rng.choice(candidates)
                 else:
-                    pass_target = target_players[0]
+                    plan.target_player = target_players[0]
             else:
                 # Zone에 선수가 없으면 가장 가까운 선수 선택
                 from sim_soccer.field.positioning import find_nearest_player
-                pass_target = find_nearest_player(
-                    team, target_zone, exclude_player_id=attacker.player_id if attacker else None
+                plan.target_player = find_nearest_player(
+                    team,
+                    target_zone,
+                    exclude_player_id=attacker.player_id if attacker else None,
+                    grid=self.grid,
                 )
         
         # 수비자 선택 (필요한 경우)
-        defender = None
-        if action_type in ["pass", "dribble", "shoot"]:
+        if action_type in self.DEFENDED_ACTIONS:
             defending_team = match_state.get_defending_team()
             # 볼 위치 근처의 수비자 선택
-            defenders_in_zone = get_players_in_zone(
-                defending_team, match_state.ball_zone
-            )
-            if defenders_in_zone:
-                defender = defenders_in_zone[0]
-            else:
+            defender = defending_team.get_first_player_in_zone(match_state.ball_zone)
+            if not defender:
                 # 가장 가까운 수비자 선택
                 from sim_soccer.field.positioning import find_nearest_player
                 defender = find_nearest_player(
-                    defending_team, match_state.ball_zone
+                    defending_team, match_state.ball_zone, grid=self.grid
                 )
-        
-        # 패스 대상 정보를 match_state에 저장 (나중에 사용)
-        if pass_target and action_type in ["pass", "pass_long", "pass_to_midfield", "pass_to_forward"]:
-            match_state._pass_target = pass_target  # 임시 저장
-        
-        return attacker, defender
+            plan.defender = defender
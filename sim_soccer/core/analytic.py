@@ -0,0 +1,464 @@
+"""마르코프 체인 기반 경기 결과 해석적 계산
+
+경기를 (Phase, 공격 팀, 볼 소유자) 상태 위의 마르코프 체인으로 보고, 5400 Tick에 걸쳐
+상태 분포와 골 분포를 동적 계획법으로 전파하여 승/무/패 확률과 기대 득점을 계산한다.
+몬테카를로 시뮬레이션처럼 표본 잡음이 없으므로 랭킹/매치메이킹에 바로 쓸 수 있다.
+
+전이 커널은 `PhaseManager`, `ActionSelector`, `ContestResolver`(CompiledMatchup)와
+체력/모멘텀 모듈을 직접 호출하여 만든다. 상태 공간을 작게 유지하기 위해 다음과 같이
+근사한다.
+
+- 선수 Zone, 체력, 모멘텀은 상태에 포함하지 않고 평균장(mean-field)으로 추적한다.
+  커널은 한 epoch(기본 100 Tick) 동안 고정되며, epoch가 끝나면 그 동안의 상태 점유율로
+  기대 체력 소모, 드리블 전진 횟수, 모멘텀 변화를 반영한다.
+- 볼 소유자가 없는 상태(자기 자신에게 패스)는 다음 Tick에 선택되는 선수(볼 Zone의 첫
+  선수)가 볼을 가진 상태로 본다.
+- 득점은 팀별 max_goals, 골 득실차는 ±max_goals에서 잘린다 (초과 확률은 끝 칸에 누적).
+
+근사 오차는 `compare_with_monte_carlo`로 실제 시뮬레이션과 비교하여 확인할 수 있다.
+numpy가 필요하다 (`pip install sim-soccer[fast]`).
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy는 선택 의존성
+    np = None
+
+from sim_soccer.core.action_selector import ActionSelector
+from sim_soccer.core.batch import BatchResult, simulate_many
+from sim_soccer.core.contest_resolver import ContestResolver
+from sim_soccer.core.ids import ACTION_IDS, PASS_ACTIONS, Action, Phase, Stat
+from sim_soccer.core.matchup import CompiledMatchup
+from sim_soccer.core.phase_manager import PhaseManager
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.field.positioning import (
+    find_nearest_player,
+    get_players_in_zone,
+    initialize_player_positions,
+)
+from sim_soccer.field.zone import ZONE_COLS, ZONE_DISTANCE, ZONE_ROW, ZONE_ROWS
+from sim_soccer.models.team import TeamState
+from sim_soccer.systems.momentum import MOMENTUM_CHANGES
+from sim_soccer.systems.stamina import apply_half_time_rest, calculate_stamina_cost
+
+SIDES: Tuple[str, str] = ("home", "away")
+
+# 드리블 실패 시 공수 전환 확률 (MatchSimulator._apply_action_result와 동일)
+DRIBBLE_TURNOVER_PROBABILITY = 0.4
+
+
+def _require_numpy():
+    """numpy가 설치되어 있는지 확인"""
+    if np is None:
+        raise ImportError(
+            "AnalyticMatchSolver requires numpy (install with `pip install sim-soccer[fast]`)"
+        )
+
+
+@dataclass
+class AnalyticResult:
+    """한 대진에 대한 해석적 경기 결과"""
+
+    home_team_name: str
+    away_team_name: str
+    home_win_prob: float
+    draw_prob: float
+    away_win_prob: float
+    expected_home_goals: float
+    expected_away_goals: float
+    home_goals: List[float] = field(default_factory=list)  # 득점 수 -> 확률
+    away_goals: List[float] = field(default_factory=list)
+    goal_difference: Dict[int, float] = field(default_factory=dict)  # 홈 - 원정 -> 확률
+
+
+@dataclass
+class MonteCarloComparison:
+    """해석적 결과와 몬테카를로 결과의 비교"""
+
+    analytic: AnalyticResult
+    monte_carlo: BatchResult
+    errors: Dict[str, float] = field(default_factory=dict)  # 항목 -> 해석적 - 몬테카를로
+    standard_errors: Dict[str, float] = field(default_factory=dict)  # 몬테카를로 표준오차
+
+    @property
+    def max_abs_error(self) -> float:
+        """가장 큰 절대 오차"""
+        return max(abs(e) for e in self.errors.values()) if self.errors else 0.0
+
+
+@dataclass
+class _Kernel:
+    """한 epoch 동안 고정되는 전이 커널과 평균장 갱신량
+
+    전이 행렬은 [도착 상태, 출발 상태] 순서이다.
+    """
+
+    no_goal: "np.ndarray"  # 골이 없는 전이
+    home_goal: "np.ndarray"  # 홈 팀 골과 함께 일어나는 전이
+    away_goal: "np.ndarray"  # 원정 팀 골과 함께 일어나는 전이
+    stamina_cost: "np.ndarray"  # [상태, side, 선수] 방문당 기대 체력 소모
+    forward_moves: "np.ndarray"  # [상태, side, 선수] 방문당 기대 드리블 전진 횟수
+    mistakes: "np.ndarray"  # [상태, side] 방문당 기대 실수 횟수
+
+
+class AnalyticMatchSolver:
+    """마르코프 체인 동적 계획법으로 경기 결과 분포를 계산하는 클래스"""
+
+    def __init__(
+        self,
+        resolver: Optional[ContestResolver] = None,
+        phase_manager: Optional[PhaseManager] = None,
+        action_selector: Optional[ActionSelector] = None,
+        epoch_ticks: int = 100,
+        max_goals: int = 20,
+    ):
+        """해석적 솔버 초기화
+
+        Args:
+            resolver: 컨테스트 규칙으로 사용할 판정기
+            phase_manager: Phase 전환 규칙으로 사용할 관리자
+            action_selector: 행동 선택 규칙으로 사용할 선택기
+            epoch_ticks: 커널을 고정하는 Tick 수 (작을수록 정확하고 느림)
+            max_goals: 추적할 팀별 최대 득점
+        """
+        _require_numpy()
+        self.resolver = resolver or ContestResolver()
+        self.phase_manager = phase_manager or PhaseManager()
+        self.action_selector = action_selector or ActionSelector()
+        self.epoch_ticks = epoch_ticks
+        self.max_goals = max_goals
+
+    def solve(self, home_team: TeamState, away_team: TeamState) -> AnalyticResult:
+        """한 대진의 결과 분포 계산
+
+        Args:
+            home_team: 홈 팀 (변경되지 않음)
+            away_team: 원정 팀 (변경되지 않음)
+
+        Returns:
+            AnalyticResult
+        """
+        # 평균장 상태(Zone, 체력)는 복사본 선수에 기록
+        teams = [copy.deepcopy(home_team), copy.deepcopy(away_team)]
+        initialize_player_positions(teams[0], "build_up", True)
+        initialize_player_positions(teams[1], "defense", False)
+        matchup = CompiledMatchup(teams[0], teams[1], resolver=self.resolver)
+
+        n_players = max(len(team.players) for team in teams)
+        n_states = len(Phase) * 2 * n_players
+        rows = [np.array([ZONE_ROW[p.zone] for p in team.players], dtype=float) for team in teams]
+        staminas = [np.array([p.stamina for p in team.players]) for team in teams]
+        momentum = np.array([float(team.momentum) for team in teams])
+
+        # 상태 분포: [상태, 골 득실차 | 홈 득점 | 원정 득점] 열을 한 행렬로 전파
+        max_goals = self.max_goals
+        n_diff = 2 * max_goals + 1
+        n_goals = max_goals + 1
+        dist = np.zeros((n_states, n_diff + 2 * n_goals))
+        start = self._state_index(Phase.BUILD_UP, 0, self._goalkeeper(teams[0]), n_players)
+        dist[start, [max_goals, n_diff, n_diff + n_goals]] = 1.0
+        diff_cols = slice(0, n_diff)
+        home_cols = slice(n_diff, n_diff + n_goals)
+        away_cols = slice(n_diff + n_goals, n_diff + 2 * n_goals)
+
+        expected_goals = np.zeros(2)
+        for start_tick, end_tick in self._epochs():
+            is_second_half = start_tick >= MatchSimulator.HALF_TIME_TICK
+            if start_tick == MatchSimulator.HALF_TIME_TICK:
+                for side in range(2):
+                    staminas[side] = np.array([apply_half_time_rest(s) for s in staminas[side]])
+
+            # 평균장 상태를 선수에 반영하고 커널 생성
+            for side, team in enumerate(teams):
+                for p, player in enumerate(team.players):
+                    row = min(int(rows[side][p] + 0.5), ZONE_ROWS - 1)
+                    team.move_player(player, row * ZONE_COLS + (player.zone - 1) % ZONE_COLS + 1)
+                    player.stamina = float(staminas[side][p])
+            kernel = self._build_kernel(teams, matchup, n_players, momentum, is_second_half)
+            home_goal_rate = kernel.home_goal.sum(axis=0)
+            away_goal_rate = kernel.away_goal.sum(axis=0)
+
+            occupancy = np.zeros(n_states)
+            for _ in range(start_tick, end_tick):
+                occupancy += dist[:, home_cols].sum(axis=1)
+                stay = kernel.no_goal @ dist
+                home = kernel.home_goal @ dist
+                away = kernel.away_goal @ dist
+                dist = stay
+                dist[:, diff_cols] += self._shift(home[:, diff_cols], 1)
+                dist[:, diff_cols] += self._shift(away[:, diff_cols], -1)
+                dist[:, home_cols] += self._shift(home[:, home_cols], 1) + away[:, home_cols]
+                dist[:, away_cols] += self._shift(away[:, away_cols], 1) + home[:, away_cols]
+
+            # epoch 동안의 점유율로 평균장 갱신
+            goals = np.array([occupancy @ home_goal_rate, occupancy @ away_goal_rate])
+            expected_goals += goals
+            mistakes = occupancy @ kernel.mistakes
+            momentum += (
+                goals * MOMENTUM_CHANGES["goal_scored"]
+                + goals[::-1] * MOMENTUM_CHANGES["goal_conceded"]
+                + mistakes * MOMENTUM_CHANGES["mistake"]
+            )
+            momentum = np.clip(momentum, -10, 10)
+            cost = np.tensordot(occupancy, kernel.stamina_cost, axes=1)
+            moves = np.tensordot(occupancy, kernel.forward_moves, axes=1)
+            for side, team in enumerate(teams):
+                n = len(team.players)
+                staminas[side] = np.maximum(staminas[side] - cost[side, :n], 0.0)
+                rows[side] = np.minimum(rows[side] + moves[side, :n], ZONE_ROWS - 1)
+
+        diff = dist[:, diff_cols].sum(axis=0)
+        return AnalyticResult(
+            home_team_name=home_team.team_name,
+            away_team_name=away_team.team_name,
+            home_win_prob=float(diff[max_goals + 1 :].sum()),
+            draw_prob=float(diff[max_goals]),
+            away_win_prob=float(diff[:max_goals].sum()),
+            expected_home_goals=float(expected_goals[0]),
+            expected_away_goals=float(expected_goals[1]),
+            home_goals=dist[:, home_cols].sum(axis=0).tolist(),
+            away_goals=dist[:, away_cols].sum(axis=0).tolist(),
+            goal_difference={d - max_goals: float(p) for d, p in enumerate(diff)},
+        )
+
+    def _epochs(self) -> List[Tuple[int, int]]:
+        """커널을 고정할 Tick 구간 목록 (하프타임 경계에서 분할)"""
+        epochs = []
+        for half_start, half_end in (
+            (0, MatchSimulator.HALF_TIME_TICK),
+            (MatchSimulator.HALF_TIME_TICK, MatchSimulator.TOTAL_TICKS),
+        ):
+            for start in range(half_start, half_end, self.epoch_ticks):
+                epochs.append((start, min(start + self.epoch_ticks, half_end)))
+        return epochs
+
+    @staticmethod
+    def _shift(values: "np.ndarray", offset: int) -> "np.ndarray":
+        """골 열을 offset만큼 이동 (범위를 넘는 확률은 끝 칸에 누적)"""
+        shifted = np.zeros_like(values)
+        if offset > 0:
+            shifted[:, offset:] = values[:, :-offset]
+            shifted[:, -1] += values[:, -offset:].sum(axis=1)
+        else:
+            shifted[:, :offset] = values[:, -offset:]
+            shifted[:, 0] += values[:, :-offset].sum(axis=1)
+        return shifted
+
+    @staticmethod
+    def _state_index(phase: int, side: int, holder: int, n_players: int) -> int:
+        """(Phase, 공격 팀, 볼 소유자) 상태 번호"""
+        return (phase * 2 + side) * n_players + holder
+
+    @staticmethod
+    def _goalkeeper(team: TeamState) -> int:
+        """팀의 첫 골키퍼 인덱스"""
+        for p, player in enumerate(team.players):
+            if player.position == "GK":
+                return p
+        return 0
+
+    def _build_kernel(
+        self,
+        teams: List[TeamState],
+        matchup: CompiledMatchup,
+        n_players: int,
+        momentum: "np.ndarray",
+        is_second_half: bool,
+    ) -> _Kernel:
+        """현재 평균장 상태(선수 Zone/체력, 모멘텀)에서 한 Tick 전이 커널 생성"""
+        n_states = len(Phase) * 2 * n_players
+        no_goal = np.zeros((n_states, n_states))
+        goal = [np.zeros((n_states, n_states)), np.zeros((n_states, n_states))]
+        stamina_cost = np.zeros((n_states, 2, n_players))
+        forward_moves = np.zeros((n_states, 2, n_players))
+        mistakes = np.zeros((n_states, 2))
+        momenta = [int(round(m)) for m in momentum]
+        target_zone = self.action_selector.SITUATION_TARGET_ZONE
+
+        for side, team in enumerate(teams):
+            opponent_side = 1 - side
+            opponent = teams[opponent_side]
+            index = {player.player_id: p for p, player in enumerate(team.players)}
+            opponent_index = {player.player_id: p for p, player in enumerate(opponent.players)}
+            kickoff = self._goalkeeper(opponent)
+
+            for phase in Phase:
+                transition_prob = self.phase_manager.calculate_transition_probability(
+                    phase.label, team, None
+                )
+                next_phase = self.phase_manager.transition_targets[phase]
+                for holder, attacker in enumerate(team.players):
+                    source = self._state_index(phase, side, holder, n_players)
+                    ball_zone = attacker.zone
+                    nearest = find_nearest_player(opponent, ball_zone)
+                    turnover = self._state_index(
+                        Phase.TRANSITION,
+                        opponent_side,
+                        opponent_index[nearest.player_id],
+                        n_players,
+                    )
+                    goal_kick = self._state_index(Phase.BUILD_UP, opponent_side, kickoff, n_players)
+
+                    for action_phase, phase_weight in (
+                        (next_phase, transition_prob),
+                        (phase, 1.0 - transition_prob),
+                    ):
+                        stay = self._state_index(action_phase, side, holder, n_players)
+                        actions = self.action_selector.get_adjusted_actions(
+                            action_phase.label, team.tactics
+                        )
+                        for action_type, action_prob in actions:
+                            weight = phase_weight * action_prob
+                            action = ACTION_IDS[action_type]
+                            defender = None
+                            if action_type in self.action_selector.DEFENDED_ACTIONS:
+                                defender = nearest
+                            distance = 0
+                            if action in PASS_ACTIONS:
+                                distance = ZONE_DISTANCE[ball_zone][target_zone]
+                            success = matchup.success_rate(
+                                SIDES[side],
+                                attacker,
+                                defender,
+                                action_type,
+                                distance,
+                                momenta[side],
+                                momenta[opponent_side],
+                                is_second_half,
+                            )
+                            failure = 1.0 - success
+
+                            # 체력 소모 (공격자, 수비자)
+                            stamina_cost[source, side, holder] += weight * calculate_stamina_cost(
+                                action_type, team.tactics, attacker.stats.data[Stat.STA]
+                            )
+                            if defender is not None:
+                                stamina_cost[
+                                    source, opponent_side, opponent_index[defender.player_id]
+                                ] += weight * calculate_stamina_cost(
+                                    action_type, opponent.tactics, defender.stats.data[Stat.STA]
+                                )
+
+                            if action == Action.SHOOT:
+                                goal_prob = self.resolver.calculate_goal_probability(
+                                    attacker, defender
+                                )
+                                goal[side][goal_kick, source] += weight * success * goal_prob
+                                no_goal[stay, source] += weight * success * (1.0 - goal_prob)
+                                no_goal[goal_kick, source] += weight * failure
+                            elif action in PASS_ACTIONS:
+                                for receiver, receiver_prob in self._pass_receivers(
+                                    team, attacker, action_type, action_phase.label
+                                ):
+                                    target = self._state_index(
+                                        action_phase, side, index[receiver.player_id], n_players
+                                    )
+                                    no_goal[target, source] += weight * success * receiver_prob
+                                no_goal[turnover, source] += weight * failure
+                                mistakes[source, side] += weight * failure
+                            elif action == Action.DRIBBLE:
+                                if (
+                                    action_phase != Phase.FINAL_THIRD
+                                    and ZONE_ROW[ball_zone] < ZONE_ROWS - 1
+                                ):
+                                    forward_moves[source, side, holder] += weight * success
+                                lost = failure * DRIBBLE_TURNOVER_PROBABILITY
+                                no_goal[stay, source] += weight * (1.0 - lost)
+                                no_goal[turnover, source] += weight * lost
+                                mistakes[source, side] += weight * lost
+                            else:
+                                # 태클/인터셉트 등은 수비자가 없으므로 상태 변화 없음
+                                no_goal[stay, source] += weight
+
+        return _Kernel(
+            no_goal=no_goal,
+            home_goal=goal[0],
+            away_goal=goal[1],
+            stamina_cost=stamina_cost,
+            forward_moves=forward_moves,
+            mistakes=mistakes,
+        )
+
+    def _pass_receivers(self, team: TeamState, attacker, action_type: str, phase: str):
+        """패스 성공 시 볼을 갖게 되는 선수와 확률 목록 (ActionSelector.select_players와 동일한 규칙)"""
+        target_zone = self.action_selector.get_pass_target_zone(action_type, phase)
+        target_players = get_players_in_zone(team, target_zone)
+        if target_players:
+            candidates = [p for p in target_players if p.player_id != attacker.player_id]
+            if candidates:
+                return [(p, 1.0 / len(candidates)) for p in candidates]
+            # 자기 자신에게 패스하면 볼 소유자가 없어지고 다음 Tick에 볼 Zone의 첫 선수가 공격자가 됨
+            return [(get_players_in_zone(team, attacker.zone)[0], 1.0)]
+        receiver = find_nearest_player(team, target_zone, exclude_player_id=attacker.player_id)
+        return [(receiver or attacker, 1.0)]
+
+
+def solve_match(
+    home_team: TeamState, away_team: TeamState, epoch_ticks: int = 100, max_goals: int = 20
+) -> AnalyticResult:
+    """한 대진의 승/무/패 확률과 기대 득점을 해석적으로 계산
+
+    Args:
+        home_team: 홈 팀 (변경되지 않음)
+        away_team: 원정 팀 (변경되지 않음)
+        epoch_ticks: 커널을 고정하는 Tick 수
+        max_goals: 추적할 팀별 최대 득점
+
+    Returns:
+        AnalyticResult
+    """
+    solver = AnalyticMatchSolver(epoch_ticks=epoch_ticks, max_goals=max_goals)
+    return solver.solve(home_team, away_team)
+
+
+def compare_with_monte_carlo(
+    home_team: TeamState,
+    away_team: TeamState,
+    seeds: Iterable[int] = range(200),
+    workers: Optional[int] = 1,
+    solver: Optional[AnalyticMatchSolver] = None,
+) -> MonteCarloComparison:
+    """해석적 결과를 몬테카를로 시뮬레이션 결과와 비교
+
+    Args:
+        home_team: 홈 팀 (변경되지 않음)
+        away_team: 원정 팀 (변경되지 않음)
+        seeds: 몬테카를로 시뮬레이션에 사용할 시드들
+        workers: 몬테카를로 워커 프로세스 수
+        solver: 사용할 해석적 솔버 (None이면 기본 설정)
+
+    Returns:
+        항목별 오차(해석적 - 몬테카를로)와 몬테카를로 표준오차를 담은 MonteCarloComparison
+    """
+    solver = solver or AnalyticMatchSolver()
+    analytic = solver.solve(home_team, away_team)
+    mc = simulate_many(home_team, away_team, seeds=seeds, workers=workers)
+    n = max(mc.matches, 1)
+
+    def goal_sd(distribution: Dict[int, int], mean: float) -> float:
+        variance = sum(count * (goals - mean) ** 2 for goals, count in distribution.items()) / n
+        return (variance / n) ** 0.5
+
+    def rate_se(rate: float) -> float:
+        return (rate * (1.0 - rate) / n) ** 0.5
+
+    comparison = MonteCarloComparison(analytic=analytic, monte_carlo=mc)
+    comparison.errors = {
+        "home_win_prob": analytic.home_win_prob - mc.home_win_rate,
+        "draw_prob": analytic.draw_prob - mc.draw_rate,
+        "away_win_prob": analytic.away_win_prob - mc.away_win_rate,
+        "expected_home_goals": analytic.expected_home_goals - mc.mean_home_goals,
+        "expected_away_goals": analytic.expected_away_goals - mc.mean_away_goals,
+    }
+    comparison.standard_errors = {
+        "home_win_prob": rate_se(mc.home_win_rate),
+        "draw_prob": rate_se(mc.draw_rate),
+        "away_win_prob": rate_se(mc.away_win_rate),
+        "expected_home_goals": goal_sd(mc.home_goals, mc.mean_home_goals),
+        "expected_away_goals": goal_sd(mc.away_goals, mc.mean_away_goals),
+    }
+    return comparison
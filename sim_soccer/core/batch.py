@@ -0,0 +1,305 @@
+"""배치 몬테카를로 시뮬레이션
+
+여러 시드(및 여러 대진)에 대한 경기를 프로세스 풀에 분산 실행하고
+승/무/패, 득점 분포, 평균 팀 통계를 집계한다.
+
+각 경기는 (대진, 시드)만으로 결정되므로 결과는 워커 수와 무관하게 항상 동일하다.
+대진의 팀은 TeamTemplate으로 한 번 고정하고, 경기마다 템플릿 풀의 팀을 시작 상태로
+되돌려 사용하므로 경기마다 팀을 깊은 복사하지 않는다.
+
+워커 프로세스를 사용하면 대진에 나오는 팀(같은 객체는 한 번)과 대진을 TeamPack으로
+묶어 공유 메모리에 한 번 공개한다. 워커는 블록 이름만 받아 연결하고, 작업으로는
+(대진 인덱스, 시드)만 받아 필요한 팀의 템플릿을 공유 메모리에서 직접 만든다.
+
+`master_seed`를 지정하면 각 경기는 시드로 초기화한 단일 난수 스트림 대신
+(마스터 시드, 대진 인덱스, 시드) 경로에서 파생한 하위 시스템별 카운터 기반 스트림
+(core.rng.MatchStreams)을 사용한다. 대진끼리 난수가 겹치지 않고, 시드를 나눠 여러
+노드에서 실행해도 각 경기의 결과는 한 프로세스에서 실행한 것과 같다.
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sim_soccer.core.rng import MatchStreams
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_pack import Fixture, TeamPack
+from sim_soccer.models.team import TeamState
+from sim_soccer.models.team_template import TeamTemplate
+
+Pairing = Tuple[TeamState, TeamState]
+TemplatePairing = Tuple[TeamTemplate, TeamTemplate]
+
+
+@dataclass
+class MatchSummary:
+    """배치 실행에서 워커가 반환하는 단일 경기 요약"""
+
+    pairing_index: int
+    seed: int
+    home_score: int
+    away_score: int
+    home_stats: Dict[str, int]
+    away_stats: Dict[str, int]
+
+
+@dataclass
+class BatchResult:
+    """한 대진에 대한 배치 시뮬레이션 집계 결과"""
+
+    home_team_name: str
+    away_team_name: str
+    matches: int = 0
+    home_wins: int = 0
+    draws: int = 0
+    away_wins: int = 0
+    home_goals: Dict[int, int] = field(default_factory=dict)  # 득점 수 -> 경기 수
+    away_goals: Dict[int, int] = field(default_factory=dict)
+    scorelines: Dict[Tuple[int, int], int] = field(default_factory=dict)  # (홈, 원정) -> 경기 수
+    mean_home_stats: Dict[str, float] = field(default_factory=dict)
+    mean_away_stats: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def home_win_rate(self) -> float:
+        """홈 팀 승률"""
+        return self.home_wins / self.matches if self.matches else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        """무승부 비율"""
+        return self.draws / self.matches if self.matches else 0.0
+
+    @property
+    def away_win_rate(self) -> float:
+        """원정 팀 승률"""
+        return self.away_wins / self.matches if self.matches else 0.0
+
+    @property
+    def mean_home_goals(self) -> float:
+        """홈 팀 평균 득점"""
+        return _mean_of_distribution(self.home_goals, self.matches)
+
+    @property
+    def mean_away_goals(self) -> float:
+        """원정 팀 평균 득점"""
+        return _mean_of_distribution(self.away_goals, self.matches)
+
+
+def _mean_of_distribution(distribution: Dict[int, int], matches: int) -> float:
+    """득점 분포의 평균 반환"""
+    if not matches:
+        return 0.0
+    return sum(goals * count for goals, count in distribution.items()) / matches
+
+
+def _summarize(
+    pairing_index: int,
+    pairing: TemplatePairing,
+    seed: int,
+    mode: str = "full",
+    master_seed: Optional[int] = None,
+) -> MatchSummary:
+    """템플릿 풀의 팀으로 한 경기를 실행하고 요약 반환"""
+    home_template, away_template = pairing
+    home = home_template.acquire()
+    away = away_template.acquire()
+    try:
+        if master_seed is None:
+            MatchSimulator().simulate_match(home, away, random_seed=seed, mode=mode)
+        else:
+            streams = MatchStreams.for_match(master_seed, pairing_index, seed)
+            MatchSimulator().simulate_match(home, away, mode=mode, streams=streams)
+        return MatchSummary(
+            pairing_index=pairing_index,
+            seed=seed,
+            home_score=home.score,
+            away_score=away.score,
+            home_stats=dict(home.stats),
+            away_stats=dict(away.stats),
+        )
+    finally:
+        home_template.release(home)
+        away_template.release(away)
+
+
+# 워커 프로세스별 팀 묶음 (initializer에서 공유 메모리에 연결)
+_worker_pack: Optional[TeamPack] = None
+
+
+def _init_worker(pack_name: str):
+    """워커 프로세스 초기화 (공유 메모리의 팀 묶음에 연결)"""
+    global _worker_pack
+    _worker_pack = TeamPack.attach(pack_name)
+
+
+def _run_chunk(
+    tasks: List[Tuple[int, int]], mode: str = "full", master_seed: Optional[int] = None
+) -> List[MatchSummary]:
+    """워커에서 (대진 인덱스, 시드) 묶음 실행"""
+    pack = _worker_pack
+    summaries = []
+    for index, seed in tasks:
+        home, away = pack.fixture(index)
+        summaries.append(
+            _summarize(index, (pack.template(home), pack.template(away)), seed, mode, master_seed)
+        )
+    return summaries
+
+
+def _index_pairings(pairings: Sequence[Pairing]) -> Tuple[List[TeamState], List[Fixture]]:
+    """대진에 나오는 팀 목록(같은 객체는 한 번)과 팀 인덱스 대진 목록 반환"""
+    teams: List[TeamState] = []
+    indices: Dict[int, int] = {}
+    fixtures = []
+    for pairing in pairings:
+        fixture = []
+        for team in pairing:
+            index = indices.get(id(team))
+            if index is None:
+                index = indices[id(team)] = len(teams)
+                teams.append(team)
+            fixture.append(index)
+        fixtures.append((fixture[0], fixture[1]))
+    return teams, fixtures
+
+
+def _chunk(tasks: List[Tuple[int, int]], size: int) -> List[List[Tuple[int, int]]]:
+    """작업 목록을 size 단위로 분할"""
+    return [tasks[i : i + size] for i in range(0, len(tasks), size)]
+
+
+def aggregate_summaries(pairing: Pairing, summaries: Iterable[MatchSummary]) -> BatchResult:
+    """경기 요약들을 하나의 BatchResult로 집계
+
+    요약은 시드 순서대로 전달되어야 결과가 결정적이다.
+    """
+    result = BatchResult(home_team_name=pairing[0].team_name, away_team_name=pairing[1].team_name)
+    home_goals: Counter = Counter()
+    away_goals: Counter = Counter()
+    scorelines: Counter = Counter()
+    home_totals: Counter = Counter()
+    away_totals: Counter = Counter()
+
+    for summary in summaries:
+        result.matches += 1
+        if summary.home_score > summary.away_score:
+            result.home_wins += 1
+        elif summary.away_score > summary.home_score:
+            result.away_wins += 1
+        else:
+            result.draws += 1
+        home_goals[summary.home_score] += 1
+        away_goals[summary.away_score] += 1
+        scorelines[(summary.home_score, summary.away_score)] += 1
+        home_totals.update(summary.home_stats)
+        away_totals.update(summary.away_stats)
+
+    result.home_goals = dict(sorted(home_goals.items()))
+    result.away_goals = dict(sorted(away_goals.items()))
+    result.scorelines = dict(sorted(scorelines.items()))
+    if result.matches:
+        result.mean_home_stats = {k: v / result.matches for k, v in sorted(home_totals.items())}
+        result.mean_away_stats = {k: v / result.matches for k, v in sorted(away_totals.items())}
+    return result
+
+
+def simulate_pairings(
+    pairings: Sequence[Pairing],
+    seeds: Iterable[int] = range(100),
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+    mode: str = "full",
+    master_seed: Optional[int] = None,
+) -> List[BatchResult]:
+    """여러 대진을 각 시드마다 시뮬레이션하고 대진별 집계 결과 반환
+
+    Args:
+        pairings: (홈 팀, 원정 팀) 튜플 목록. 원본 팀 상태는 변경되지 않으며, 팀의 현재
+            경기 상태(점수, 통계, 체력)와 무관하게 모든 경기가 경기 시작 상태에서 진행됨
+        seeds: 각 대진에 사용할 랜덤 시드들
+        workers: 워커 프로세스 수 (1이면 현재 프로세스에서 실행, None이면 CPU 수)
+        chunksize: 워커에 한 번에 전달할 경기 수 (None이면 자동)
+        mode: 경기 실행 모드 ("score_only"이면 점수만 계산하고 평균 통계는 0)
+        master_seed: 지정하면 (마스터 시드, 대진 인덱스, 시드)별 독립 스트림 사용
+
+    Returns:
+        pairings와 같은 순서의 BatchResult 목록
+    """
+    pairings = list(pairings)
+    seeds = list(seeds)
+    tasks = [(index, seed) for index in range(len(pairings)) for seed in seeds]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(tasks) <= 1:
+        templates = [
+            (TeamTemplate.from_team(home), TeamTemplate.from_team(away)) for home, away in pairings
+        ]
+        summaries = [
+            _summarize(index, templates[index], seed, mode, master_seed) for index, seed in tasks
+        ]
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(tasks) // (workers * 4))
+        pack = TeamPack.publish(*_index_pairings(pairings))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(pack.name,)
+            ) as executor:
+                summaries = [
+                    summary
+                    for chunk in executor.map(
+                        partial(_run_chunk, mode=mode, master_seed=master_seed),
+                        _chunk(tasks, chunksize),
+                    )
+                    for summary in chunk
+                ]
+        finally:
+            pack.close()
+            pack.unlink()
+
+    # executor.map은 입력 순서를 보존하므로 대진별로 시드 순서 그대로 집계됨
+    by_pairing: List[List[MatchSummary]] = [[] for _ in pairings]
+    for summary in summaries:
+        by_pairing[summary.pairing_index].append(summary)
+
+    return [
+        aggregate_summaries(pairing, by_pairing[index]) for index, pairing in enumerate(pairings)
+    ]
+
+
+def simulate_many(
+    home_team: TeamState,
+    away_team: TeamState,
+    seeds: Iterable[int] = range(100),
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+    mode: str = "full",
+    master_seed: Optional[int] = None,
+) -> BatchResult:
+    """한 대진을 여러 시드로 시뮬레이션하고 집계 결과 반환
+
+    Args:
+        home_team: 홈 팀 (변경되지 않음)
+        away_team: 원정 팀 (변경되지 않음)
+        seeds: 사용할 랜덤 시드들
+        workers: 워커 프로세스 수 (1이면 현재 프로세스에서 실행, None이면 CPU 수)
+        chunksize: 워커에 한 번에 전달할 경기 수 (None이면 자동)
+        mode: 경기 실행 모드 ("score_only"이면 점수만 계산하고 평균 통계는 0)
+        master_seed: 지정하면 (마스터 시드, 0, 시드)별 독립 스트림 사용
+
+    Returns:
+        BatchResult
+    """
+    return simulate_pairings(
+        [(home_team, away_team)],
+        seeds=seeds,
+        workers=workers,
+        chunksize=chunksize,
+        mode=mode,
+        master_seed=master_seed,
+    )[0]
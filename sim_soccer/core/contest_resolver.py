@@ -5,6 +5,7 @@ from typing import Dict, Optional
 
 from loguru import logger
 
+from sim_soccer.core.engine_log import EngineLog
 from sim_soccer.field.zone import calculate_distance
 from sim_soccer.models.player import PlayerState
 from sim_soccer.systems.momentum import calculate_momentum_bonus
@@ -15,6 +16,16 @@ from sim_soccer.systems.tactics import calculate_tactics_bonus
 class ContestResolver:
     """컨테스트(행동 판정)를 계산하는 클래스"""
 
+    def __init__(self, rng: Optional[random.Random] = None, log: Optional[EngineLog] = None):
+        """컨테스트 판정기 초기화
+        
+        Args:
+            rng: 판정에 사용할 난수 생성기 (None이면 새로 생성)
+            log: 디버그 로그 게이트 (None이면 새로 생성)
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.log = log if log is not None else EngineLog()
+
     def calculate_contest_score(
         self,
         attacker: PlayerState,
@@ -67,10 +78,11 @@ class ContestResolver:
         
         contest_score = attacker_score - defender_score
         
-        logger.debug(
-            f"Contest: {action_type}, Attacker: {attacker_score:.2f}, "
-            f"Defender: {defender_score:.2f}, Score: {contest_score:.2f}"
-        )
+        if self.log.debug_enabled:
+            logger.debug(
+                f"Contest: {action_type}, Attacker: {attacker_score:.2f}, "
+                f"Defender: {defender_score:.2f}, Score: {contest_score:.2f}"
+            )
         
         return contest_score
 
@@ -205,21 +217,42 @@ class ContestResolver:
         
         return bonus
 
-    def resolve_contest(
-        self, contest_score: float, random_value: Optional[float] = None
-    ) -> bool:
-        """컨테스트 점수를 기반으로 성공/실패 판정
+    def calculate_goal_probability(
+        self, attacker: PlayerState, defender: Optional[PlayerState]
+    ) -> float:
+        """성공한 슈팅이 골로 연결될 확률 계산
         
         Args:
-            contest_score: 컨테스트 점수
-            random_value: 랜덤 값 (0.0-1.0), None이면 자동 생성
+            attacker: 슈팅한 선수
+            defender: 슈팅을 막는 선수 (골키퍼면 방어 보정 적용)
         
         Returns:
-            True if success, False if failure
+            골 확률 (0.1-0.6)
         """
-        if random_value is None:
-            random_value = random.random()
+        # 슈팅 정확도 기반 골 확률
+        sho_stat = attacker.get_weighted_stat("SHO")
+        base_goal_prob = 0.3 + (sho_stat - 5) * 0.05  # 기본 30% + 스탯 보정
+        
+        # 골키퍼 방어 고려
+        if defender and defender.position == "GK":
+            gk_tac = defender.get_weighted_stat("TAC")
+            gk_defense = gk_tac * 1.5  # 골키퍼 가중치
+            goal_prob = base_goal_prob - (gk_defense - 5) * 0.03
+        else:
+            goal_prob = base_goal_prob
         
+        # 범위 제한 (10%-60%)
+        return max(0.1, min(0.6, goal_prob))
+
+    def calculate_success_rate(self, contest_score: float) -> float:
+        """컨테스트 점수에 따른 성공 확률 계산
+        
+        Args:
+            contest_score: 컨테스트 점수
+        
+        Returns:
+            성공 확률 (0.2-0.8)
+        """
         # 기본 성공 확률
         base_success_rate = 0.5
         
@@ -228,13 +261,28 @@ class ContestResolver:
         
         # 최종 성공 확률 (20%-80% 범위)
         success_rate = base_success_rate + score_bonus
-        success_rate = min(max(success_rate, 0.2), 0.8)
+        return min(max(success_rate, 0.2), 0.8)
+
+    def resolve_contest(self, contest_score: float, random_value: Optional[float] = None) -> bool:
+        """컨테스트 점수를 기반으로 성공/실패 판정
+        
+        Args:
+            contest_score: 컨테스트 점수
+            random_value: 랜덤 값 (0.0-1.0), None이면 자동 생성
+        
+        Returns:
+            True if success, False if failure
+        """
+        if random_value is None:
+            random_value = self.rng.random()
         
+        success_rate = self.calculate_success_rate(contest_score)
         success = random_value < success_rate
         
-        logger.debug(
-            f"Contest resolution: score={contest_score:.2f}, "
-            f"success_rate={success_rate:.2%}, result={'SUCCESS' if success else 'FAILURE'}"
-        )
+        if self.log.debug_enabled:
+            logger.debug(
+                f"Contest resolution: score={contest_score:.2f}, "
+                f"success_rate={success_rate:.2%}, result={'SUCCESS' if success else 'FAILURE'}"
+            )
         
         return success
@@ -0,0 +1,78 @@
+"""엔진 로깅 파사드
+
+Tick 루프의 `logger.debug(f"...")`는 DEBUG가 꺼져 있어도 f-string 포맷팅 비용을 매번
+치른다. EngineLog는 DEBUG 활성 여부를 경기 시작 시 한 번만 확인해 `debug_enabled`에
+저장하므로, 핫 패스에서는 속성 하나만 확인하고 메시지를 만들지 않는다.
+
+DEBUG 활성 여부는 loguru에 직접 묻는다. loguru는 지연(lazy) 인자를 메시지가 핸들러
+최소 레벨과 `logger.disable` 검사를 통과한 뒤에만 평가하므로, 평가될 때 예외를 던지는
+인자로 DEBUG 메시지를 보내 보면 아무것도 출력하지 않고 결과를 알 수 있다. 따라서
+`logger.add`/`logger.remove`로 자유롭게 설정해도 다음 경기 시작부터 반영된다.
+
+컨테스트 상세 로그는 기본으로 꺼져 있고, `contest_sample_every`를 지정하면 N번째
+컨테스트마다 하나씩만 남긴다(샘플링 추적).
+
+    log = EngineLog(contest_sample_every=100)
+    if log.debug_enabled:
+        logger.debug(f"...")
+    if log.sample_contest():
+        logger.debug(f"...상세 정보...")
+"""
+
+from typing import Optional
+
+from loguru import logger
+
+
+class _DebugProbe(Exception):
+    """DEBUG 메시지가 핸들러까지 전달될 때 지연 인자에서 던지는 신호"""
+
+
+def _probe():
+    raise _DebugProbe
+
+
+def is_debug_enabled() -> bool:
+    """loguru가 이 패키지의 DEBUG 메시지를 처리하는지 확인 (메시지는 출력하지 않음)"""
+    try:
+        logger.opt(lazy=True).debug("{}", _probe)
+    except _DebugProbe:
+        return True
+    return False
+
+
+class EngineLog:
+    """엔진 구성 요소가 공유하는 디버그 로그 게이트"""
+
+    def __init__(self, contest_sample_every: Optional[int] = None, enabled: bool = True):
+        """로그 게이트 생성
+
+        Args:
+            contest_sample_every: 컨테스트 상세 로그를 남길 간격 (N번째 컨테스트마다 1개,
+                None 또는 0이면 남기지 않음)
+            enabled: False이면 loguru 설정과 무관하게 디버그 로그를 끔
+        """
+        if contest_sample_every is not None and contest_sample_every < 0:
+            raise ValueError(
+                f"contest_sample_every must not be negative, got {contest_sample_every}"
+            )
+        self.contest_sample_every = contest_sample_every or 0
+        self.debug_enabled = False
+        self._contest_count = 0
+        self.refresh(enabled)
+
+    def refresh(self, enabled: bool = True):
+        """DEBUG 활성 여부를 다시 확인하고 컨테스트 샘플링 카운터 초기화 (경기 시작 시 호출)
+
+        Args:
+            enabled: False이면 loguru 설정과 무관하게 디버그 로그를 끔
+        """
+        self.debug_enabled = enabled and is_debug_enabled()
+        self._contest_count = 0
+
+    def sample_contest(self) -> bool:
+        """이번 컨테스트의 상세 로그를 남길지 여부 (디버그나 샘플링이 꺼져 있으면 항상 False)"""
+        if not (self.debug_enabled and self.contest_sample_every):
+            return False
+        self._contest_count += 1
+        return self._contest_count % self.contest_sample_every == 0
@@ -0,0 +1,100 @@
+"""Phase/행동/스탯/전술의 정수 ID 정의
+
+엔진 내부 테이블(벡터화 엔진, 컴파일된 매치업 등)은 문자열 대신 아래 정수 ID로
+Phase와 행동을 인덱싱한다. 공개 API는 계속 문자열을 사용한다.
+"""
+
+from enum import IntEnum
+from typing import Dict, Tuple
+
+
+class Phase(IntEnum):
+    """경기 Phase ID"""
+
+    BUILD_UP = 0
+    MIDFIELD = 1
+    FINAL_THIRD = 2
+    TRANSITION = 3
+    DEFENSE = 4
+
+    @property
+    def label(self) -> str:
+        """엔진에서 사용하는 Phase 문자열"""
+        return PHASE_NAMES[self]
+
+
+class Action(IntEnum):
+    """행동 ID"""
+
+    PASS = 0
+    PASS_LONG = 1
+    PASS_TO_MIDFIELD = 2
+    PASS_TO_FORWARD = 3
+    DRIBBLE = 4
+    SHOOT = 5
+    SHOOT_LONG = 6
+    CROSS = 7
+    QUICK_ATTACK = 8
+    STABLE_BUILD = 9
+    DEFENSE_SETUP = 10
+    TACKLE = 11
+    INTERCEPT = 12
+    POSITIONING = 13
+
+    @property
+    def label(self) -> str:
+        """엔진에서 사용하는 행동 문자열"""
+        return ACTION_NAMES[self]
+
+
+PHASE_NAMES: Tuple[str, ...] = tuple(p.name.lower() for p in Phase)
+ACTION_NAMES: Tuple[str, ...] = tuple(a.name.lower() for a in Action)
+
+PHASE_IDS: Dict[str, Phase] = {name: Phase(i) for i, name in enumerate(PHASE_NAMES)}
+ACTION_IDS: Dict[str, Action] = {name: Action(i) for i, name in enumerate(ACTION_NAMES)}
+
+# 볼 이동이 패스로 처리되는 행동
+PASS_ACTIONS = frozenset(
+    {Action.PASS, Action.PASS_LONG, Action.PASS_TO_MIDFIELD, Action.PASS_TO_FORWARD}
+)
+
+
+class Stat(IntEnum):
+    """선수 스탯 ID (PlayerState.stats 배열의 인덱스)"""
+
+    PAS = 0
+    DRI = 1
+    SHO = 2
+    SPA = 3
+    TAC = 4
+    INT = 5
+    STA = 6
+
+
+class Tactic(IntEnum):
+    """팀 전술 ID (TeamState.tactics 배열의 인덱스)"""
+
+    ATTACK = 0
+    PASS_STYLE = 1
+    PRESSING = 2
+    DEFENSE_LINE = 3
+    TRANSITION_SPEED = 4
+    WIDTH = 5
+
+
+class TeamStat(IntEnum):
+    """팀 통계 ID (TeamState.stats 배열의 인덱스)"""
+
+    SHOTS = 0
+    SHOTS_ON_TARGET = 1
+    PASSES_ATTEMPTED = 2
+    PASSES_COMPLETED = 3
+    TACKLES_ATTEMPTED = 4
+    TACKLES_SUCCESSFUL = 5
+    DRIBBLES_ATTEMPTED = 6
+    DRIBBLES_SUCCESSFUL = 7
+
+
+STAT_NAMES: Tuple[str, ...] = tuple(s.name for s in Stat)
+TACTIC_NAMES: Tuple[str, ...] = tuple(t.name.lower() for t in Tactic)
+TEAM_STAT_NAMES: Tuple[str, ...] = tuple(s.name.lower() for s in TeamStat)
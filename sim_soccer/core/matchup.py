@@ -0,0 +1,308 @@
+"""컴파일된 매치업 (컨테스트 테이블)
+
+컨테스트 점수는 작은 이산 도메인(선수, 행동, 체력 페널티 구간, 모멘텀, 전/후반,
+패스 거리)만으로 결정된다. CompiledMatchup은 한 (홈, 원정) 대진에 대해
+ContestResolver의 규칙을 미리 테이블로 만들어 두고, 경기 중에는 테이블 조회만으로
+성공 확률을 구한다.
+
+- 요인 테이블(가중 스탯 - 체력 페널티, 전술 보정, 모멘텀 보정, 상황 보정)은
+  생성 시 모두 계산한다.
+- 성공 확률 테이블은 전체 조합이 수억 개이므로 처음 등장한 조합만 요인 테이블로
+  계산하여 채운다.
+
+부동소수점 연산 순서는 ContestResolver와 같으므로 결과는 비트 단위로 동일하다.
+상황 변수는 ActionSelector._create_situation과 같은 구성(수비 팀 압박, 기본
+포지셔닝, 패스 거리)을 가정한다. 경기 중 스탯이나 전술이 바뀌면(팀 revision 증가)
+`refresh`가 테이블을 다시 컴파일한다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sim_soccer.core.action_selector import ActionSelector
+from sim_soccer.core.contest_resolver import ContestResolver
+from sim_soccer.core.ids import ACTION_IDS, PASS_ACTIONS, Action, Tactic
+from sim_soccer.field.grid import DEFAULT_GRID, FieldGrid
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.team import TeamState
+from sim_soccer.systems.momentum import calculate_momentum_bonus
+from sim_soccer.systems.stamina import apply_stamina_penalty
+from sim_soccer.systems.tactics import calculate_tactics_bonus
+
+SIDES: Tuple[str, str] = ("home", "away")
+STAMINA_BUCKETS = 5  # apply_stamina_penalty 반환값 0-4
+MOMENTUM_RANGE = range(-10, 11)
+
+
+class CompiledMatchup:
+    """한 대진에 대한 컨테스트 성공 확률 테이블"""
+
+    def __init__(
+        self,
+        home_team: TeamState,
+        away_team: TeamState,
+        resolver: Optional[ContestResolver] = None,
+        grid: Optional[FieldGrid] = None,
+    ):
+        """매치업 컴파일
+
+        Args:
+            home_team: 홈 팀
+            away_team: 원정 팀
+            resolver: 규칙으로 사용할 컨테스트 판정기 (None이면 기본 판정기)
+            grid: 필드 격자 (None이면 기본 5x3 격자)
+        """
+        self.resolver = resolver or ContestResolver()
+        self.teams: Dict[str, TeamState] = {"home": home_team, "away": away_team}
+        self.positioning = ActionSelector.DEFAULT_POSITIONING
+        grid = grid or DEFAULT_GRID
+        target_zone = grid.map_base_zone(ActionSelector.SITUATION_TARGET_ZONE)
+        self.max_distance = max(grid.distance[zone][target_zone] for zone in grid.all_zones)
+
+        self._compile()
+
+    @property
+    def revisions(self) -> Tuple[int, int]:
+        """컴파일 시점의 (홈, 원정) 팀 revision"""
+        return self._revisions
+
+    def refresh(self) -> bool:
+        """팀 스탯/전술이 바뀌었으면 테이블을 다시 컴파일
+
+        Returns:
+            다시 컴파일했으면 True
+        """
+        if self._revisions == (self.teams["home"].revision, self.teams["away"].revision):
+            return False
+        self._compile()
+        return True
+
+    def _compile(self):
+        """현재 팀 스탯/전술로 요인 테이블을 만들고 성공 확률 캐시를 비움"""
+        self._revisions = (self.teams["home"].revision, self.teams["away"].revision)
+
+        # (side, player_id) -> [action][bucket] 가중 스탯 - 체력 페널티
+        self._attack_base: Dict[Tuple[str, int], List[List[float]]] = {}
+        self._defense_base: Dict[Tuple[str, int], List[List[float]]] = {}
+        for side, team in self.teams.items():
+            for player in team.players:
+                self._attack_base[(side, player.player_id)] = self._compile_base(
+                    player, self.resolver._get_relevant_stats
+                )
+                self._defense_base[(side, player.player_id)] = self._compile_base(
+                    player, self.resolver._get_relevant_stats_for_defense
+                )
+
+        # side -> [action][distance] 전술 보정 / 상황 페널티(공격) 또는 보너스(수비)
+        self._attack_tactics: Dict[str, List[List[float]]] = {}
+        self._defense_tactics: Dict[str, List[List[float]]] = {}
+        self._attack_situation: Dict[str, List[List[float]]] = {}
+        self._defense_situation: Dict[str, List[List[float]]] = {}
+        for side in SIDES:
+            opponent = self.teams[self._opponent(side)]
+            # side가 공격할 때의 상황 변수 (압박은 상대 팀 전술)
+            attack_situations = self._situations(opponent.tactics.data[Tactic.PRESSING])
+            # side가 수비할 때의 상황 변수 (압박은 자기 팀 전술)
+            defense_situations = self._situations(self.teams[side].tactics.data[Tactic.PRESSING])
+            self._attack_tactics[side] = self._compile_tactics(
+                self.teams[side].tactics, attack_situations
+            )
+            self._defense_tactics[side] = self._compile_tactics(
+                self.teams[side].tactics, defense_situations
+            )
+            self._attack_situation[side] = [
+                [
+                    self.resolver._calculate_situation_penalty(action.label, situation)
+                    for situation in attack_situations[action]
+                ]
+                for action in Action
+            ]
+            self._defense_situation[side] = [
+                [
+                    self.resolver._calculate_situation_bonus(action.label, situation)
+                    for situation in defense_situations[action]
+                ]
+                for action in Action
+            ]
+
+        # [half(0/1)][momentum + 10] 모멘텀 보정
+        self._momentum = [
+            [calculate_momentum_bonus(m, is_second_half) for m in MOMENTUM_RANGE]
+            for is_second_half in (False, True)
+        ]
+
+        # 컨테스트 키 -> 성공 확률 (처음 등장한 조합만 채움)
+        self._success_rates: Dict[Tuple, float] = {}
+
+    @staticmethod
+    def _opponent(side: str) -> str:
+        """상대 팀 side 반환"""
+        return "away" if side == "home" else "home"
+
+    def _situations(self, pressing: int) -> List[List[Dict]]:
+        """[action][distance]별 상황 변수 (ActionSelector._create_situation과 동일한 구성)"""
+        situations = []
+        for action in Action:
+            row = []
+            for distance in range(self.max_distance + 1):
+                situation = {}
+                if action in PASS_ACTIONS:
+                    situation["distance"] = distance
+                situation["pressing"] = pressing
+                situation["positioning"] = self.positioning
+                row.append(situation)
+            situations.append(row)
+        return situations
+
+    def _compile_base(self, player: PlayerState, relevant_stats_for) -> List[List[float]]:
+        """[action][bucket]별 (가중 스탯 합 - 체력 페널티) 계산"""
+        table = []
+        for action in Action:
+            relevant_stats = relevant_stats_for(action.label)
+            stat_value = 0.0
+            for stat_name in relevant_stats:
+                base_stat = player.stats.get(stat_name, 0)
+                weight = player.position_weights.get(stat_name, 1.0)
+                stat_value += base_stat * weight
+            table.append(
+                [
+                    stat_value - penalty * len(relevant_stats) * 0.5
+                    for penalty in range(STAMINA_BUCKETS)
+                ]
+            )
+        return table
+
+    def _compile_tactics(
+        self, tactics: Dict[str, int], situations: List[List[Dict]]
+    ) -> List[List[float]]:
+        """[action][distance]별 전술 보정"""
+        return [
+            [
+                calculate_tactics_bonus(tactics, action.label, situation)
+                for situation in situations[action]
+            ]
+            for action in Action
+        ]
+
+    def attacker_score(
+        self,
+        side: str,
+        player_id: int,
+        action: Action,
+        stamina_bucket: int,
+        momentum: int,
+        is_second_half: bool,
+        distance: int = 0,
+    ) -> float:
+        """공격자 점수 (ContestResolver._calculate_attacker_score와 동일)"""
+        stat_value = self._attack_base[(side, player_id)][action][stamina_bucket]
+        stat_value *= self._attack_tactics[side][action][distance]
+        stat_value *= self._momentum[is_second_half][momentum + 10]
+        stat_value -= self._attack_situation[side][action][distance]
+        return max(0, stat_value)
+
+    def defender_score(
+        self,
+        side: str,
+        player_id: int,
+        action: Action,
+        stamina_bucket: int,
+        momentum: int,
+        is_second_half: bool,
+        distance: int = 0,
+    ) -> float:
+        """수비자 점수 (ContestResolver._calculate_defender_score와 동일)"""
+        stat_value = self._defense_base[(side, player_id)][action][stamina_bucket]
+        stat_value *= self._defense_tactics[side][action][distance]
+        stat_value *= self._momentum[is_second_half][momentum + 10]
+        stat_value += self._defense_situation[side][action][distance]
+        return max(0, stat_value)
+
+    def success_rate(
+        self,
+        attacking_side: str,
+        attacker: PlayerState,
+        defender: Optional[PlayerState],
+        action_type: str,
+        distance: int,
+        attacker_momentum: int,
+        defender_momentum: int,
+        is_second_half: bool,
+    ) -> float:
+        """컨테스트 성공 확률 조회
+
+        Args:
+            attacking_side: 공격 팀 ("home" 또는 "away")
+            attacker: 공격자
+            defender: 수비자 (None 가능)
+            action_type: 행동 타입
+            distance: 상황 변수의 패스 거리 (패스가 아니면 0)
+            attacker_momentum: 공격 팀 모멘텀
+            defender_momentum: 수비 팀 모멘텀
+            is_second_half: 후반인지 여부
+
+        Returns:
+            성공 확률 (0.2-0.8), ContestResolver와 비트 단위로 동일
+        """
+        attacker_bucket = apply_stamina_penalty(attacker.stamina)
+        if defender is None:
+            key = (
+                attacking_side,
+                attacker.player_id,
+                None,
+                action_type,
+                attacker_bucket,
+                0,
+                attacker_momentum,
+                0,
+                is_second_half,
+                distance,
+            )
+        else:
+            key = (
+                attacking_side,
+                attacker.player_id,
+                defender.player_id,
+                action_type,
+                attacker_bucket,
+                apply_stamina_penalty(defender.stamina),
+                attacker_momentum,
+                defender_momentum,
+                is_second_half,
+                distance,
+            )
+        rate = self._success_rates.get(key)
+        if rate is None:
+            rate = self._compute_success_rate(key)
+            self._success_rates[key] = rate
+        return rate
+
+    def _compute_success_rate(self, key: Tuple) -> float:
+        """요인 테이블로 한 컨테스트 키의 성공 확률 계산"""
+        (
+            side,
+            attacker_id,
+            defender_id,
+            action_type,
+            attacker_bucket,
+            defender_bucket,
+            attacker_momentum,
+            defender_momentum,
+            is_second_half,
+            distance,
+        ) = key
+        action = ACTION_IDS[action_type]
+        attacker_score = self.attacker_score(
+            side, attacker_id, action, attacker_bucket, attacker_momentum, is_second_half, distance
+        )
+        defender_score = 0.0
+        if defender_id is not None:
+            defender_score = self.defender_score(
+                self._opponent(side),
+                defender_id,
+                action,
+                defender_bucket,
+                defender_momentum,
+                is_second_half,
+                distance,
+            )
+        return self.resolver.calculate_success_rate(attacker_score - defender_score)
@@ -1,13 +1,22 @@
 """Phase 전환 관리"""
 
-from typing import Dict, List, Optional
+import random
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from sim_soccer.core.engine_log import EngineLog
+from sim_soccer.core.ids import ACTION_IDS, PHASE_IDS, Action, Phase
 from sim_soccer.models.match import MatchState
 from sim_soccer.models.team import TeamState
 from sim_soccer.systems.tactics import get_phase_transition_probability
 
+# 전환 테이블의 "행동 없음" 열 (action_type이 None이거나 Action에 없는 행동)
+NO_ACTION = len(Action)
+
+# PhaseManager 클래스 -> 컴파일된 전환 테이블 (규칙은 클래스에 고정)
+_COMPILED_TABLES: Dict[type, Tuple[Tuple[Tuple[Phase, Phase], ...], ...]] = {}
+
 
 class PhaseManager:
     """Phase 전환을 관리하는 클래스"""
@@ -21,6 +30,20 @@ class PhaseManager:
         "defense": ["transition", "build_up"],
     }
 
+    def __init__(self, rng: Optional[random.Random] = None, log: Optional[EngineLog] = None):
+        """Phase 관리자 초기화
+        
+        Args:
+            rng: 전환 판정에 사용할 난수 생성기 (None이면 새로 생성)
+            log: 디버그 로그 게이트 (None이면 새로 생성)
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.log = log if log is not None else EngineLog()
+        # [phase][action][result] -> 다음 Phase (action이 NO_ACTION이면 행동 없음)
+        self.next_phase_table = self.compile_transition_table()
+        # id(team) -> (team, revision, Phase -> 전환 확률), 경기마다 clear_cache로 비움
+        self._transition_tables: Dict[int, Tuple[TeamState, int, Dict[str, float]]] = {}
+
     def determine_next_phase(
         self,
         current_phase: str,
@@ -30,6 +53,8 @@ class PhaseManager:
     ) -> str:
         """현재 Phase와 행동 결과를 기반으로 다음 Phase 결정
         
+        컴파일된 전환 테이블(`next_phase_table`)을 조회한다.
+        
         Args:
             current_phase: 현재 Phase
             action_result: 행동 결과 (성공/실패)
@@ -39,7 +64,49 @@ class PhaseManager:
         Returns:
             다음 Phase
         """
-        possible_phases = self.PHASE_TRANSITIONS.get(current_phase, [current_phase])
+        phase = PHASE_IDS.get(current_phase)
+        if phase is None:
+            # 테이블에 없는 Phase는 규칙을 직접 적용
+            return self._apply_transition_rules(current_phase, action_result, action_type)
+        action = ACTION_IDS.get(action_type, NO_ACTION) if action_type is not None else NO_ACTION
+        return self.next_phase_table[phase][action][1 if action_result else 0].label
+
+    @property
+    def transition_targets(self) -> Tuple[Phase, ...]:
+        """Phase별 전환 판정 성공 시 다음 Phase (행동 없음, 성공으로 가정)"""
+        return tuple(row[NO_ACTION][1] for row in self.next_phase_table)
+
+    @classmethod
+    def compile_transition_table(cls) -> Tuple[Tuple[Tuple[Phase, Phase], ...], ...]:
+        """전환 규칙을 정수 인덱스 테이블로 컴파일
+        
+        모든 (Phase, 행동 또는 NO_ACTION, 결과) 조합에 `_apply_transition_rules`를 적용한다.
+        
+        Returns:
+            [phase][action][result(0=실패, 1=성공)] -> 다음 Phase 테이블
+        """
+        table = _COMPILED_TABLES.get(cls)
+        if table is None:
+            action_labels: List[Optional[str]] = [action.label for action in Action] + [None]
+            table = tuple(
+                tuple(
+                    tuple(
+                        PHASE_IDS[cls._apply_transition_rules(phase.label, result, action_type)]
+                        for result in (False, True)
+                    )
+                    for action_type in action_labels
+                )
+                for phase in Phase
+            )
+            _COMPILED_TABLES[cls] = table
+        return table
+
+    @classmethod
+    def _apply_transition_rules(
+        cls, current_phase: str, action_result: bool, action_type: Optional[str]
+    ) -> str:
+        """Phase 전환 규칙 (전환 테이블 컴파일의 원본)"""
+        possible_phases = cls.PHASE_TRANSITIONS.get(current_phase, [current_phase])
         
         # Phase별 전환 규칙 적용
         if current_phase == "build_up":
@@ -96,6 +163,51 @@ class PhaseManager:
         Returns:
             전환 확률 (0.0-1.0)
         """
+        transition_prob = self.get_transition_probability(current_phase, team)
+        
+        if self.log.debug_enabled:
+            logger.debug(
+                f"Phase transition probability: {current_phase} -> "
+                f"{transition_prob:.2%} (team: {team.team_name})"
+            )
+        
+        return transition_prob
+
+    def get_transition_probability(self, current_phase: str, team: TeamState) -> float:
+        """캐시된 테이블에서 Phase 전환 확률 조회 (로그 없음)"""
+        transition_prob = self.get_transition_table(team).get(current_phase)
+        if transition_prob is None:
+            transition_prob = self._compute_transition_probability(current_phase, team)
+        return transition_prob
+
+    def clear_cache(self):
+        """팀별 전환 확률 테이블 캐시 비우기 (경기 시작 시 호출, 지난 경기 팀의 참조 해제)"""
+        self._transition_tables.clear()
+
+    def get_transition_table(self, team: TeamState) -> Dict[str, float]:
+        """팀의 Phase별 전환 확률 테이블 반환
+        
+        스탯과 전술은 경기 중 거의 바뀌지 않으므로 팀마다 한 번 계산해 두고,
+        팀의 `revision`이 바뀌었을 때만 다시 계산한다.
+        
+        Args:
+            team: 팀 상태
+        
+        Returns:
+            Phase -> 전환 확률 딕셔너리
+        """
+        entry = self._transition_tables.get(id(team))
+        if entry is None or entry[0] is not team or entry[1] != team.revision:
+            table = {
+                phase: self._compute_transition_probability(phase, team)
+                for phase in self.PHASE_TRANSITIONS
+            }
+            entry = (team, team.revision, table)
+            self._transition_tables[id(team)] = entry
+        return entry[2]
+
+    def _compute_transition_probability(self, current_phase: str, team: TeamState) -> float:
+        """팀 스탯 평균과 전술로 Phase 전환 확률 계산"""
         # 관련 스탯 평균 계산
         if current_phase == "build_up":
             relevant_stat_avg = team.get_average_stat("PAS")
@@ -107,23 +219,14 @@ class PhaseManager:
             relevant_stat_avg = 5.0  # 기본값
         
         # 전술 기반 전환 확률 계산
-        transition_prob = get_phase_transition_probability(
-            team.tactics, current_phase, relevant_stat_avg
-        )
-        
-        logger.debug(
-            f"Phase transition probability: {current_phase} -> "
-            f"{transition_prob:.2%} (team: {team.team_name})"
-        )
-        
-        return transition_prob
+        return get_phase_transition_probability(team.tactics, current_phase, relevant_stat_avg)
 
     def should_transition_phase(
         self,
         current_phase: str,
         team: TeamState,
         match_state: MatchState,
-        random_value: float,
+        random_value: Optional[float] = None,
     ) -> bool:
         """Phase 전환 여부 판정
         
@@ -131,7 +234,7 @@ class PhaseManager:
             current_phase: 현재 Phase
             team: 팀 상태
             match_state: 경기 상태
-            random_value: 랜덤 값 (0.0-1.0)
+            random_value: 랜덤 값 (0.0-1.0), None이면 자동 생성
         
         Returns:
             True if should transition, False otherwise
@@ -139,4 +242,6 @@ class PhaseManager:
         transition_prob = self.calculate_transition_probability(
             current_phase, team, match_state
         )
+        if random_value is None:
+            random_value = self.rng.random()
         return random_value < transition_prob
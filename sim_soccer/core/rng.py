@@ -0,0 +1,339 @@
+"""카운터 기반 결정적 난수 스트림
+
+병렬 실행에서 경기마다(대진, 시드, 경기 번호) 독립적이고, 실행 순서나 워커/노드 수와
+무관한 난수가 필요하다. 여기서는 스트림을 64비트 키로 식별하고, 스트림의 i번째 난수를
+(키, i)만으로 계산한다(SplitMix64 변환). 키는 마스터 시드와 경로(대진, 시드, 하위 시스템
+이름 등)를 해시해 만들므로(SeedSequence 방식) 부모 스트림에서 자식 스트림을 얼마든지
+파생할 수 있고, 같은 경로는 어느 프로세스에서 만들어도 같은 스트림이 된다.
+
+i번째 값이 앞선 값에 의존하지 않으므로 임의 구간을 한 번에 만들 수 있으며, NumPy가 있으면
+여러 스트림의 구간을 배열 연산으로 만든다(`counter_uniforms`). 순수 파이썬 계산과 결과가
+비트 단위로 같다.
+
+경기 엔진은 Tick마다 여러 번 난수를 뽑으므로, `MatchStreams.for_match`는 스트림마다
+`UniformBuffer`를 만든다. 버퍼는 경기 시작 시 한 경기 분량의 난수를 블록으로 만들어 두고
+C 반복자로 하나씩 꺼내며, 다 쓰면 다음 블록을 만든다. 카운터 기반이므로 버퍼를 쓰든
+쓰지 않든 같은 값이 나온다. 기록을 켜면 만든 블록을 보관해 두었다가
+`MatchStreams.replay`로 같은 경기를 키 없이 다시 실행할 수 있다.
+
+    streams = MatchStreams.for_match(master_seed, pairing_index, seed)
+    simulator.simulate_match(home, away, streams=streams)
+"""
+
+import hashlib
+import os
+import random
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy가 없으면 순수 파이썬으로 계산
+    np = None
+
+MASK64 = (1 << 64) - 1
+GAMMA = 0x9E3779B97F4A7C15  # 카운터 간격 (홀수)
+_GAMMA_INVERSE = pow(GAMMA, -1, 1 << 64)
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+_UNIT = 2.0**-53
+
+# 경기 엔진의 하위 시스템별 스트림 이름
+STREAM_NAMES: Tuple[str, ...] = ("phase", "action", "contest", "goal", "turnover")
+
+# 하위 시스템별 버퍼 블록 크기 (한 경기 5400 Tick에 필요한 난수 수 기준)
+BUFFER_SIZES: Dict[str, int] = {
+    "phase": 5400,  # Tick마다 1개
+    "action": 8192,  # Tick마다 1개 + 패스 대상 선택
+    "contest": 5400,  # Tick마다 1개
+    "goal": 256,  # 슈팅마다 1개
+    "turnover": 1024,  # 드리블 실패마다 1개
+}
+
+PathItem = Union[int, str]
+
+
+def derive_key(*path: PathItem) -> int:
+    """경로(마스터 시드, 대진, 시드, 이름 등)에서 64비트 스트림 키 파생
+
+    같은 경로는 플랫폼/프로세스와 무관하게 같은 키가 되고, 다른 경로는 서로 독립적인
+    키가 된다. 정수와 문자열은 구분된다 (1과 "1"은 다른 경로).
+    """
+    digest = hashlib.blake2b(digest_size=8, person=b"sim_soccer_rng")
+    for item in path:
+        if isinstance(item, str):
+            digest.update(b"s" + item.encode("utf-8") + b"\x00")
+        else:
+            digest.update(b"i" + str(int(item)).encode("ascii") + b"\x00")
+    return int.from_bytes(digest.digest(), "little")
+
+
+def counter_uniform(key: int, counter: int) -> float:
+    """스트림 key의 counter번째 [0, 1) 난수"""
+    z = (key + (counter + 1) * GAMMA) & MASK64
+    z = ((z ^ (z >> 30)) * _MIX1) & MASK64
+    z = ((z ^ (z >> 27)) * _MIX2) & MASK64
+    return ((z ^ (z >> 31)) >> 11) * _UNIT
+
+
+def counter_uniforms(keys, counters):
+    """키 배열과 카운터 배열(브로드캐스트)의 [0, 1) 난수 배열 (NumPy 필요)
+
+    `counter_uniform(key, counter)`를 원소별로 계산한 것과 같다. 예를 들어
+    `counter_uniforms(keys[None, :], np.arange(k)[:, None])`는 경기별 스트림의 처음
+    k개 난수를 (k, 경기 수) 배열로 만든다.
+    """
+    if np is None:  # pragma: no cover - 설치 환경에 따라 다름
+        raise ImportError("counter_uniforms requires numpy")
+    keys = np.asarray(keys, dtype=np.uint64)
+    counters = np.asarray(counters, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        z = keys + (counters + np.uint64(1)) * np.uint64(GAMMA)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * _UNIT
+
+
+class CounterRandom(random.Random):
+    """카운터 기반 스트림을 random.Random 인터페이스로 제공
+
+    `random()`은 스트림의 다음 난수를 반환하고 카운터를 1 증가시킨다. `choice`, `randrange`
+    같은 나머지 메서드도 이 스트림만 사용한다. `seed(a)`는 키를 `derive_key(a)`로 바꾸고
+    카운터를 0으로 되돌린다.
+    """
+
+    def __init__(self, seed=None, *, key: int = None):
+        """스트림 생성
+
+        Args:
+            seed: 시드 (None이고 key도 없으면 OS 난수로 키 생성)
+            key: 스트림 키 (지정하면 seed 대신 사용)
+        """
+        self._key = 0
+        self._state = 0
+        super().__init__(seed)
+        if key is not None:
+            self._key = self._state = key & MASK64
+
+    def seed(self, a=None, version=2):
+        """시드로 키를 다시 정하고 카운터를 0으로 되돌림"""
+        if a is None:
+            key = int.from_bytes(os.urandom(8), "little")
+        else:
+            key = derive_key(a)
+        self._key = self._state = key
+        self.gauss_next = None
+
+    @property
+    def key(self) -> int:
+        """스트림 키"""
+        return self._key
+
+    @property
+    def counter(self) -> int:
+        """지금까지 만든 64비트 값의 수 (다음 난수의 카운터)"""
+        return ((self._state - self._key) * _GAMMA_INVERSE) & MASK64
+
+    def _next64(self) -> int:
+        """스트림의 다음 64비트 값"""
+        z = self._state = (self._state + GAMMA) & MASK64
+        z = ((z ^ (z >> 30)) * _MIX1) & MASK64
+        z = ((z ^ (z >> 27)) * _MIX2) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        """다음 [0, 1) 난수"""
+        z = self._state = (self._state + GAMMA) & MASK64
+        z = ((z ^ (z >> 30)) * _MIX1) & MASK64
+        z = ((z ^ (z >> 27)) * _MIX2) & MASK64
+        return ((z ^ (z >> 31)) >> 11) * _UNIT
+
+    def choice(self, seq: Sequence):
+        """난수 하나로 seq의 원소 선택"""
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self.random() * len(seq))]
+
+    def getrandbits(self, k: int) -> int:
+        """다음 k비트 정수 (64비트 값을 필요한 만큼 이어 붙임)"""
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value = 0
+        bits = 0
+        while bits < k:
+            value |= self._next64() << bits
+            bits += 64
+        return value & ((1 << k) - 1)
+
+    def getstate(self) -> Tuple[int, int]:
+        """(키, 카운터)"""
+        return self._key, self.counter
+
+    def setstate(self, state: Tuple[int, int]):
+        """getstate로 얻은 상태 복원"""
+        key, counter = state
+        self._key = key & MASK64
+        self._state = (self._key + counter * GAMMA) & MASK64
+        self.gauss_next = None
+
+    def spawn(self, *path: PathItem) -> "CounterRandom":
+        """이 스트림의 키와 경로로 파생한 독립 자식 스트림 (이 스트림은 변하지 않음)"""
+        return CounterRandom(key=derive_key(self._key, *path))
+
+    def block(self, count: int) -> List[float]:
+        """다음 count개의 난수를 한 번에 생성 (`random()`을 count번 호출한 것과 같음)"""
+        start = self.counter
+        if np is not None:
+            values = counter_uniforms(
+                self._key, np.arange(start, start + count, dtype=np.uint64)
+            ).tolist()
+        else:  # pragma: no cover - 설치 환경에 따라 다름
+            values = [counter_uniform(self._key, start + i) for i in range(count)]
+        self._state = (self._state + count * GAMMA) & MASK64
+        return values
+
+
+class UniformBuffer(random.Random):
+    """미리 만든 난수 블록에서 하나씩 꺼내는 스트림
+
+    `random`은 블록들을 이어 붙인 C 반복자의 `__next__`이므로 호출마다 파이썬 함수를
+    거치지 않는다. 블록을 다 쓰면 원본 스트림에서 다음 블록을 만든다 (원본의 `random()`을
+    차례로 호출한 것과 같은 값). 원본 없이 기록된 값으로 만든 버퍼는 값을 다 쓰면
+    ValueError를 발생시킨다.
+    """
+
+    _randbelow = random.Random._randbelow_without_getrandbits
+
+    def __init__(
+        self,
+        source: Optional[CounterRandom] = None,
+        size: int = 5400,
+        record: bool = False,
+        values: Optional[Sequence[float]] = None,
+    ):
+        """버퍼 생성
+
+        Args:
+            source: 블록을 만들 원본 스트림 (None이면 values만 사용)
+            size: 블록 크기
+            record: True이면 만든 블록을 `recorded`에 보관
+            values: 원본보다 먼저 꺼낼 값 (기록된 난수 재생용)
+        """
+        self._source = None
+        super().__init__()
+        self._source = source
+        self._size = size
+        self.recorded: Optional[List[float]] = [] if record else None
+        self.random = chain.from_iterable(self._blocks(values)).__next__
+
+    def _blocks(self, values: Optional[Sequence[float]]) -> Iterator[List[float]]:
+        """꺼낼 블록을 차례로 생성 (반복자가 블록을 다 썼을 때만 실행됨)"""
+        if values is not None:
+            values = list(values)
+            if self.recorded is not None:
+                self.recorded += values
+            yield values
+        if self._source is None:
+            raise ValueError("recorded uniforms exhausted")
+        while True:
+            block = self._source.block(self._size)
+            if self.recorded is not None:
+                self.recorded += block
+            yield block
+
+    def seed(self, a=None, version=2):
+        """원본 스트림이 있으면 원본을 다시 시드하고 남은 블록을 버림"""
+        if self._source is not None:
+            self._source.seed(a, version)
+            self.random = chain.from_iterable(self._blocks(None)).__next__
+        self.gauss_next = None
+
+    def choice(self, seq: Sequence):
+        """난수 하나로 seq의 원소 선택 (CounterRandom.choice와 같은 방식)"""
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self.random() * len(seq))]
+
+    def getrandbits(self, k: int) -> int:
+        """다음 k비트 정수 (난수 하나당 32비트)"""
+        value = 0
+        for shift in range(0, k, 32):
+            value |= int(self.random() * 4294967296.0) << shift
+        return value & ((1 << k) - 1)
+
+    def getstate(self):
+        raise TypeError("UniformBuffer state cannot be saved; record the uniforms instead")
+
+    def setstate(self, state):
+        raise TypeError("UniformBuffer state cannot be restored; replay the uniforms instead")
+
+
+@dataclass
+class MatchStreams:
+    """경기 엔진의 하위 시스템별 난수 스트림
+
+    Phase 전환, 행동/패스 대상 선택, 컨테스트 판정, 골 판정, 드리블 실패 후 공수 전환이
+    각자의 스트림을 사용하므로 한 하위 시스템의 난수 사용량이 바뀌어도 다른 하위 시스템의
+    난수는 바뀌지 않는다.
+    """
+
+    phase: random.Random
+    action: random.Random
+    contest: random.Random
+    goal: random.Random
+    turnover: random.Random
+
+    @classmethod
+    def for_match(
+        cls, master_seed: int, *path: PathItem, buffered: bool = True, record: bool = False
+    ) -> "MatchStreams":
+        """마스터 시드와 경기 경로(예: 대진 인덱스, 시드)에서 파생한 스트림
+
+        같은 (마스터 시드, 경로)는 실행 순서, 워커 수, 노드 수와 무관하게 같은 스트림이다.
+
+        Args:
+            master_seed: 마스터 시드
+            *path: 경기 경로
+            buffered: True이면 스트림마다 UniformBuffer로 블록 단위 생성 (값은 같음)
+            record: True이면 버퍼가 만든 난수를 보관 (`recorded`로 꺼냄)
+
+        Returns:
+            MatchStreams
+        """
+        match = CounterRandom(key=derive_key(master_seed, *path))
+        sources = [match.spawn(name) for name in STREAM_NAMES]
+        if not (buffered or record):
+            return cls(*sources)
+        return cls(
+            *(
+                UniformBuffer(source, BUFFER_SIZES[name], record=record)
+                for name, source in zip(STREAM_NAMES, sources)
+            )
+        )
+
+    @classmethod
+    def replay(cls, recorded: Dict[str, Sequence[float]]) -> "MatchStreams":
+        """`recorded`로 꺼낸 난수를 그대로 다시 사용하는 스트림 (경기 재현/디버깅용)"""
+        return cls(*(UniformBuffer(values=recorded[name]) for name in STREAM_NAMES))
+
+    def recorded(self) -> Dict[str, List[float]]:
+        """하위 시스템별로 기록된 난수 (record=True로 만든 버퍼만, 사용한 값 이상 포함)"""
+        result = {}
+        for name in STREAM_NAMES:
+            values = getattr(getattr(self, name), "recorded", None)
+            if values is None:
+                raise ValueError(f"stream {name!r} was not recorded")
+            result[name] = list(values)
+        return result
+
+    @classmethod
+    def shared(cls, rng: random.Random) -> "MatchStreams":
+        """모든 하위 시스템이 하나의 생성기를 공유 (기존 단일 스트림 방식)
+
+        버퍼로 감싸지 않는다. `random.Random.random()`은 C 함수라 버퍼에서 꺼내는 것보다
+        빠르고, `choice`가 같은 생성기에서 가변 개수의 비트를 꺼내므로 미리 만든 블록으로는
+        같은 시드의 결과를 재현할 수 없다.
+        """
+        return cls(rng, rng, rng, rng, rng)
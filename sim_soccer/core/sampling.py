@@ -0,0 +1,136 @@
+"""이산 분포 샘플러
+
+행동 확률은 (Phase, 공격성, 패스 스타일)만으로 결정되므로 경기 중 변하지 않는다.
+이 모듈은 미리 계산해 두고 균등 난수 하나로 결과를 뽑는 두 가지 샘플러를 제공한다.
+
+- `CumulativeDistribution`: 누적 확률 배열 + 이분 탐색. 선형 누적 탐색과 같은 난수를
+  같은 결과로 매핑하므로 스칼라 엔진의 시드별 결과가 그대로 유지된다.
+- `AliasTable`: Walker/Vose 별칭 테이블. 난수 하나로 O(1)에 뽑으며, NumPy 배열을
+  받아 K개를 한 번에 뽑을 수 있다(벡터화 엔진용). 난수 -> 결과 매핑은 누적 방식과
+  다르므로 분포만 같다.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy는 선택 의존성
+    np = None
+
+
+def _require_numpy():
+    """NumPy가 없으면 설치 안내와 함께 예외 발생"""
+    if np is None:
+        raise ImportError(
+            "Batched sampling requires numpy (install with `pip install sim-soccer[fast]`)"
+        )
+
+
+@dataclass(frozen=True)
+class CumulativeDistribution:
+    """누적 확률 배열로 표현한 이산 분포"""
+
+    outcomes: Tuple[str, ...]
+    cumulative: Tuple[float, ...]
+
+    @classmethod
+    def from_weights(cls, weighted: Sequence[Tuple[str, float]]) -> "CumulativeDistribution":
+        """(결과, 확률) 목록으로 누적 분포 생성
+
+        Args:
+            weighted: (결과, 확률) 목록 (합이 1이 되도록 정규화된 값)
+
+        Returns:
+            누적 분포
+        """
+        if not weighted:
+            raise ValueError("Distribution needs at least one outcome")
+        cumulative = []
+        total = 0.0
+        for _, prob in weighted:
+            total += prob  # 선형 탐색과 같은 순서로 더해야 경계가 비트 단위로 같다
+            cumulative.append(total)
+        return cls(tuple(o for o, _ in weighted), tuple(cumulative))
+
+    def sample(self, u: float) -> str:
+        """균등 난수 u(0.0-1.0)에 대응하는 결과 반환
+
+        u < cumulative[i]를 만족하는 첫 결과를 반환하며, 누적 합을 넘는 난수는
+        마지막 결과로 처리한다.
+        """
+        index = bisect_right(self.cumulative, u)
+        if index >= len(self.outcomes):
+            return self.outcomes[-1]
+        return self.outcomes[index]
+
+
+@dataclass(frozen=True)
+class AliasTable:
+    """Walker 별칭 방법으로 표현한 이산 분포"""
+
+    outcomes: Tuple[str, ...]
+    prob: Tuple[float, ...]  # 칸 i에서 i를 선택할 확률
+    alias: Tuple[int, ...]  # 칸 i에서 i를 선택하지 않을 때의 결과
+
+    @classmethod
+    def from_weights(cls, weighted: Sequence[Tuple[str, float]]) -> "AliasTable":
+        """(결과, 확률) 목록으로 별칭 테이블 생성 (Vose 방법)
+
+        Args:
+            weighted: (결과, 확률) 목록 (합이 1일 필요는 없음)
+
+        Returns:
+            별칭 테이블
+        """
+        if not weighted:
+            raise ValueError("Distribution needs at least one outcome")
+        n = len(weighted)
+        total = sum(p for _, p in weighted)
+        if total <= 0:
+            raise ValueError("Distribution needs a positive total probability")
+        scaled: List[float] = [p * n / total for _, p in weighted]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = scaled[g] + scaled[s] - 1.0
+            if scaled[g] < 1.0:
+                small.append(g)
+            else:
+                large.append(g)
+        # 남은 칸은 반올림 오차를 무시하고 자기 자신을 선택
+        return cls(tuple(o for o, _ in weighted), tuple(prob), tuple(alias))
+
+    def sample_index(self, u: float) -> int:
+        """균등 난수 u(0.0-1.0) 하나로 결과 인덱스 선택"""
+        n = len(self.prob)
+        x = u * n
+        index = min(int(x), n - 1)
+        return index if x - index < self.prob[index] else self.alias[index]
+
+    def sample(self, u: float) -> str:
+        """균등 난수 u(0.0-1.0) 하나로 결과 선택"""
+        return self.outcomes[self.sample_index(u)]
+
+    def sample_indices(self, u: "np.ndarray") -> "np.ndarray":
+        """균등 난수 배열로 결과 인덱스 K개를 한 번에 선택
+
+        Args:
+            u: 균등 난수 배열 (임의의 shape)
+
+        Returns:
+            u와 같은 shape의 결과 인덱스 배열
+        """
+        _require_numpy()
+        n = len(self.prob)
+        x = np.asarray(u) * n
+        index = np.minimum(x.astype(np.int64), n - 1)
+        keep = (x - index) < np.asarray(self.prob)[index]
+        return np.where(keep, index, np.asarray(self.alias)[index])
@@ -2,48 +2,115 @@
 
 import random
 import time
-from typing import Optional
+from typing import Generator, Iterable, Optional, Type
 from uuid import uuid4
 
 from loguru import logger
 
+from sim_soccer.core.action_handlers import DEFAULT_ACTION_HANDLERS, ActionHandlerRegistry
+from sim_soccer.core.action_plan import ActionPlan
 from sim_soccer.core.action_selector import ActionSelector
 from sim_soccer.core.contest_resolver import ContestResolver
+from sim_soccer.core.engine_log import EngineLog
+from sim_soccer.core.ids import Stat
+from sim_soccer.core.matchup import CompiledMatchup
 from sim_soccer.core.phase_manager import PhaseManager
+from sim_soccer.core.rng import MatchStreams
+from sim_soccer.field.grid import DEFAULT_GRID, FieldGrid
 from sim_soccer.field.positioning import initialize_player_positions
 from sim_soccer.io.event_printer import EventPrinter
-from sim_soccer.models.events import EventLog
+from sim_soccer.models.events import (
+    MATCH_EVENT_TYPES,
+    ActionEvent,
+    FullTimeEvent,
+    GoalEvent,
+    HalfTimeEvent,
+    KickOffEvent,
+    MatchEvent,
+    PhaseChangeEvent,
+    TickEndEvent,
+)
 from sim_soccer.models.match import MatchState
 from sim_soccer.models.team import TeamState
-from sim_soccer.systems.momentum import update_momentum
 from sim_soccer.systems.stamina import (
     apply_half_time_rest,
     calculate_stamina_cost,
 )
 
 
+def run_to_completion(events: Generator[MatchEvent, None, MatchState]) -> MatchState:
+    """이벤트 제너레이터를 끝까지 실행하고 반환값(완료된 MatchState) 반환
+    
+    Args:
+        events: simulate_match_iter가 반환한 제너레이터
+    
+    Returns:
+        시뮬레이션 완료된 MatchState
+    """
+    while True:
+        try:
+            next(events)
+        except StopIteration as stop:
+            return stop.value
+
+
 class MatchSimulator:
     """경기 시뮬레이션을 실행하는 메인 클래스"""
 
     TOTAL_TICKS = 5400  # 90분 = 5400초
     HALF_TIME_TICK = 2700  # 전반 종료 시점
     REAL_TIME_DURATION = 60.0  # 실제 시간으로 60초 (1분)
+    MODES = ("full", "score_only")  # simulate_match의 실행 모드
+    IMPORTANT_ACTIONS = frozenset({"shoot", "tackle", "intercept"})  # 이벤트 로그에 남기는 행동
 
-    def __init__(self, random_seed: Optional[int] = None, live_output: bool = False):
+    def __init__(
+        self,
+        random_seed: Optional[int] = None,
+        live_output: bool = False,
+        rng: Optional[random.Random] = None,
+        grid: Optional[FieldGrid] = None,
+        action_handlers: Optional[ActionHandlerRegistry] = None,
+        log: Optional[EngineLog] = None,
+    ):
         """시뮬레이터 초기화
         
+        시뮬레이터는 전역 `random` 모듈 대신 자신만의 난수 스트림을 가지며,
+        같은 스트림을 행동 선택기, 컨테스트 판정기, Phase 관리자에 전달한다.
+        따라서 시뮬레이터 인스턴스마다 독립적으로 (스레드별로) 경기를 실행할 수 있다.
+        디버그 로그 게이트(EngineLog)도 같은 방식으로 공유하며, 경기 시작 시 한 번만
+        DEBUG 활성 여부를 확인한다.
+        
+        경기마다 `streams`(MatchStreams)를 전달하면 Phase 전환, 행동 선택, 컨테스트 판정,
+        골 판정, 드리블 공수 전환이 각자의 카운터 기반 스트림을 사용한다 (core.rng 참조).
+        전달하지 않으면 모든 하위 시스템이 self.rng를 버퍼 없이 공유한다
+        (`MatchStreams.shared` 참조).
+        
         Args:
             random_seed: 랜덤 시드 (재현 가능성을 위해)
             live_output: 실시간 이벤트 출력 활성화 여부
+            rng: 사용할 난수 생성기 (None이면 random_seed로 새로 생성)
+            grid: 필드 격자 (None이면 기본 5x3 격자)
+            action_handlers: 행동 결과 핸들러 레지스트리 (None이면 기본 규칙)
+            log: 디버그 로그 게이트 (None이면 새로 생성, 컨테스트 샘플링 간격 설정에 사용)
         """
-        self.resolver = ContestResolver()
-        self.phase_manager = PhaseManager()
-        self.action_selector = ActionSelector()
         self.random_seed = random_seed
+        self.rng = rng if rng is not None else random.Random(random_seed)
+        self.log = log if log is not None else EngineLog()
+        self.resolver = ContestResolver(rng=self.rng, log=self.log)
+        self.phase_manager = PhaseManager(rng=self.rng, log=self.log)
+        self.grid = grid or DEFAULT_GRID
+        self.action_selector = ActionSelector(rng=self.rng, grid=self.grid, log=self.log)
+        # 하위 시스템별 난수 스트림 (기본은 모두 self.rng를 공유)
+        self.shared_streams = MatchStreams.shared(self.rng)
+        self.streams = self.shared_streams
+        self.matchup: Optional[CompiledMatchup] = None  # 경기마다 simulate_match에서 생성
+        self.match_state: Optional[MatchState] = None  # 진행 중이거나 마지막으로 진행한 경기
+        self.action_handlers = action_handlers or DEFAULT_ACTION_HANDLERS
+        # False이면 통계/이벤트 로그/출력/디버그 로그 같은 관찰용 작업을 건너뜀 (점수 전용 모드)
+        self.observe = True
         self.event_printer = EventPrinter(enabled=live_output)
         
         if random_seed is not None:
-            random.seed(random_seed)
             logger.info(f"Random seed set to {random_seed}")
 
     def simulate_match(
@@ -53,26 +120,115 @@ class MatchSimulator:
         random_seed: Optional[int] = None,
         live_output: Optional[bool] = None,
         duration: float = 60.0,
+        mode: str = "full",
+        streams: Optional[MatchStreams] = None,
     ) -> MatchState:
         """경기 시뮬레이션 실행
         
+        simulate_match_iter를 끝까지 실행한다. 실시간 출력이 켜져 있으면 이벤트를 받아
+        Tick 시간에 맞춰 기다린 뒤 출력하고, 꺼져 있으면 이벤트를 만들지 않는다.
+        
+        `mode="score_only"`이면 통계, 이벤트 로그, 실시간 출력, Tick별 로그를 모두 건너뛰고
+        점수만 계산한다. 난수는 전체 모드와 똑같이 사용하므로 같은 시드의 점수는 항상 같다
+        (팀 통계와 event_log는 비어 있다).
+        
         Args:
             home_team: 홈 팀 상태
             away_team: 원정 팀 상태
             random_seed: 랜덤 시드 (재현 가능성을 위해)
             live_output: 실시간 출력 활성화 여부 (None이면 초기화 시 설정값 사용)
             duration: 경기 진행 시간 (초 단위, 기본값: 60초)
+            mode: 실행 모드 ("full" 또는 "score_only")
+            streams: 이 경기에서 사용할 하위 시스템별 난수 스트림 (random_seed와 함께 사용 불가)
         
         Returns:
             시뮬레이션 완료된 MatchState
         """
-        if random_seed is not None:
-            random.seed(random_seed)
-            self.random_seed = random_seed
-        
         # live_output이 명시적으로 전달되면 업데이트
         if live_output is not None:
             self.event_printer.enabled = live_output
+        live = mode == "full" and self.event_printer.enabled
+        
+        events = self.simulate_match_iter(
+            home_team,
+            away_team,
+            random_seed,
+            mode=mode,
+            events=None if live else (),
+            streams=streams,
+        )
+        if not live:
+            return run_to_completion(events)
+        
+        # 시간 제어: 각 이벤트를 해당 Tick의 예정 시각에 출력
+        start_time = time.time()
+        tick_duration = duration / self.TOTAL_TICKS  # 각 tick당 실제 시간
+        while True:
+            try:
+                event = next(events)
+            except StopIteration as stop:
+                return stop.value
+            sleep_time = start_time + (event.tick * tick_duration) - time.time()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            self.event_printer.print_event(event, self.match_state)
+
+    def simulate_match_iter(
+        self,
+        home_team: TeamState,
+        away_team: TeamState,
+        random_seed: Optional[int] = None,
+        mode: str = "full",
+        events: Optional[Iterable[Type[MatchEvent]]] = None,
+        streams: Optional[MatchStreams] = None,
+    ) -> Generator[MatchEvent, None, MatchState]:
+        """경기를 진행하며 이벤트를 발생 순서대로 yield하는 제너레이터
+        
+        기다리거나 출력하지 않으므로 속도 조절, 필터링, 저장, 전달은 소비자가 맡는다.
+        `events`에 없는 타입의 이벤트는 만들지 않으므로, 버리는 이벤트에는 비용이 없다.
+        진행 중인 경기 상태는 `self.match_state`로 볼 수 있으며, 제너레이터의 반환값
+        (StopIteration.value)은 완료된 MatchState다.
+        
+            for event in simulator.simulate_match_iter(home, away, events={GoalEvent}):
+                print(event.tick, event.home_score, event.away_score)
+        
+        Args:
+            home_team: 홈 팀 상태
+            away_team: 원정 팀 상태
+            random_seed: 랜덤 시드 (재현 가능성을 위해)
+            mode: 실행 모드 ("full" 또는 "score_only")
+            events: yield할 이벤트 타입 (None이면 MATCH_EVENT_TYPES, TickEndEvent는 명시)
+            streams: 이 경기에서 사용할 하위 시스템별 난수 스트림 (None이면 self.rng 공유)
+        
+        Yields:
+            MatchEvent 하위 타입의 이벤트
+        
+        Returns:
+            시뮬레이션 완료된 MatchState
+        
+        Raises:
+            ValueError: 알 수 없는 모드이거나 random_seed와 streams를 함께 전달했을 때
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown simulation mode: {mode!r} (expected one of {self.MODES})")
+        if streams is not None and random_seed is not None:
+            raise ValueError("random_seed and streams cannot be used together")
+        self.observe = mode == "full"
+        # DEBUG 활성 여부는 경기마다 한 번만 확인 (점수 전용 모드는 항상 끔)
+        self.log.refresh(self.observe)
+        
+        wanted = frozenset(MATCH_EVENT_TYPES if events is None else events)
+        emit_action = ActionEvent in wanted
+        emit_goal = GoalEvent in wanted
+        emit_phase = PhaseChangeEvent in wanted
+        emit_tick_end = TickEndEvent in wanted
+        
+        self._bind_streams(streams if streams is not None else self.shared_streams)
+        # 재사용하는 시뮬레이터가 지난 경기의 팀을 계속 참조하지 않도록 캐시를 비움
+        self.phase_manager.clear_cache()
+        if random_seed is not None:
+            self.rng.seed(random_seed)
+            self.random_seed = random_seed
         
         # 초기 상태 설정
         match_state = MatchState(
@@ -83,21 +239,21 @@ class MatchSimulator:
             away_team=away_team,
             current_phase="build_up",
             attacking_team="home",
-            ball_zone=2,  # 중앙 후방
+            ball_zone=self.grid.map_base_zone(2),  # 중앙 후방
             ball_holder=None,
         )
+        self.match_state = match_state
+        
+        # 대진별 컨테스트 테이블 컴파일
+        self.matchup = CompiledMatchup(home_team, away_team, resolver=self.resolver, grid=self.grid)
         
         # 초기 선수 위치 설정
-        initialize_player_positions(
-            home_team, match_state.current_phase, True
-        )
-        initialize_player_positions(
-            away_team, "defense", False
-        )
+        initialize_player_positions(home_team, match_state.current_phase, True, self.grid)
+        initialize_player_positions(away_team, "defense", False, self.grid)
         
         # 초기 볼 소유자 설정 (홈 팀 골키퍼)
         home_gk = home_team.get_players_by_position("GK")[0]
-        home_gk.has_ball = True
+        home_team.set_ball_holder(home_gk.player_id)
         match_state.ball_holder = home_gk.player_id
         match_state.ball_zone = home_gk.zone
         
@@ -105,40 +261,68 @@ class MatchSimulator:
             f"Match simulation started: {home_team.team_name} vs {away_team.team_name}"
         )
         
-        # 경기 시작 출력
-        self.event_printer.print_match_start(match_state)
-        
-        # 시간 제어를 위한 시작 시간 기록
-        start_time = time.time()
-        tick_duration = duration / self.TOTAL_TICKS  # 각 tick당 실제 시간
+        if KickOffEvent in wanted:
+            yield KickOffEvent(tick=0, match_id=match_state.match_id)
         
         # Tick 단위 시뮬레이션
         for tick in range(self.TOTAL_TICKS):
             match_state.tick = tick
             
-            # 시간 제어: 각 tick이 일정 시간에 걸쳐 진행되도록
-            if self.event_printer.enabled:  # live_output이 활성화된 경우만 시간 제어
-                expected_time = start_time + (tick * tick_duration)
-                current_time = time.time()
-                sleep_time = expected_time - current_time
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-            
             # 전반/후반 구분
             if tick == self.HALF_TIME_TICK:
                 match_state.half = 2
                 self._apply_half_time_rest(match_state)
-                self.event_printer.print_half_time(match_state)
-                logger.info("Half time - Second half started")
+                if self.observe:
+                    logger.info("Half time - Second half started")
+                if HalfTimeEvent in wanted:
+                    yield HalfTimeEvent(
+                        tick=tick, home_score=home_team.score, away_score=away_team.score
+                    )
             
             # Phase 처리 및 전환
+            phase = match_state.current_phase
             self._process_phase(match_state)
+            if emit_phase and match_state.current_phase != phase:
+                yield PhaseChangeEvent(
+                    tick=tick, old_phase=phase, new_phase=match_state.current_phase
+                )
+                phase = match_state.current_phase
             
             # 행동 선택 및 실행
-            self._process_action(match_state)
+            side = match_state.attacking_team
+            plan = self._process_action(match_state)
+            if plan is not None:
+                if emit_action:
+                    yield ActionEvent(
+                        tick=tick,
+                        phase=phase,
+                        team=side,
+                        action_type=plan.action_type,
+                        success=plan.success,
+                        success_rate=plan.success_rate,
+                        player=plan.attacker,
+                        defender=plan.defender,
+                        target_player=plan.target_player,
+                        is_goal=plan.is_goal,
+                        roll=plan.roll,
+                    )
+                if emit_goal and plan.is_goal:
+                    yield GoalEvent(
+                        tick=tick,
+                        team=side,
+                        player=plan.attacker,
+                        home_score=home_team.score,
+                        away_score=away_team.score,
+                    )
+                if emit_phase and match_state.current_phase != phase:
+                    yield PhaseChangeEvent(
+                        tick=tick, old_phase=phase, new_phase=match_state.current_phase
+                    )
             
             # 상태 업데이트
             self._update_state(match_state)
+            if emit_tick_end:
+                yield TickEndEvent(tick=tick)
             
             # 경기 종료 조건 확인 (조기 종료는 없음, 항상 90분 진행)
         
@@ -150,339 +334,133 @@ class MatchSimulator:
             f"{away_team.score} {away_team.team_name}"
         )
         
+        if FullTimeEvent in wanted:
+            yield FullTimeEvent(
+                tick=self.TOTAL_TICKS - 1,
+                home_score=home_team.score,
+                away_score=away_team.score,
+                winner=match_state.winner,
+            )
+        
         return match_state
 
+    def _bind_streams(self, streams: MatchStreams):
+        """하위 시스템에 경기에서 사용할 난수 스트림 연결"""
+        self.streams = streams
+        self.phase_manager.rng = streams.phase
+        self.action_selector.rng = streams.action
+        self.resolver.rng = streams.contest
+
     def _process_phase(self, match_state: MatchState):
         """Phase 처리 및 전환 판정"""
         current_phase = match_state.current_phase
         attacking_team = match_state.get_attacking_team()
         
-        # Phase 전환 확률 계산
-        transition_prob = self.phase_manager.calculate_transition_probability(
-            current_phase, attacking_team, match_state
-        )
-        
-        # 전환 판정
-        if random.random() < transition_prob:
+        # 전환 판정 (전환 확률 계산 및 난수 판정은 PhaseManager가 담당)
+        if self.phase_manager.should_transition_phase(current_phase, attacking_team, match_state):
             # 전환 시 다음 Phase 결정 (임시로 성공으로 가정)
             next_phase = self.phase_manager.determine_next_phase(
                 current_phase, True, None, match_state
             )
             
             if next_phase != current_phase:
-                logger.debug(
-                    f"Phase transition: {current_phase} -> {next_phase} "
-                    f"(tick: {match_state.tick})"
-                )
+                if self.log.debug_enabled:
+                    logger.debug(
+                        f"Phase transition: {current_phase} -> {next_phase} "
+                        f"(tick: {match_state.tick})"
+                    )
                 match_state.current_phase = next_phase
 
-    def _process_action(self, match_state: MatchState):
-        """행동 선택 및 실행"""
+    def _process_action(self, match_state: MatchState) -> Optional[ActionPlan]:
+        """행동 선택 및 실행 (실행한 행동 계획 반환, 공격자가 없으면 None)"""
         attacking_team = match_state.get_attacking_team()
         defending_team = match_state.get_defending_team()
         
-        # 행동 선택
-        action_type, situation = self.action_selector.select_action(
+        # 행동, 주체/수비자, 패스 대상 선택 (재사용 슬롯에 채움)
+        plan = self.action_selector.plan_action(
             match_state.current_phase, attacking_team, match_state
         )
-        
-        # 행동의 주체와 대상 선정
-        attacker, defender = self.action_selector.select_players(
-            action_type, attacking_team, match_state
-        )
+        attacker = plan.attacker
         
         if not attacker:
             logger.warning("No attacker found, skipping action")
-            return
-        
-        # 컨테스트 계산
-        contest_score = self.resolver.calculate_contest_score(
-            attacker=attacker,
-            defender=defender,
-            action_type=action_type,
-            situation=situation,
-            attacker_team_tactics=attacking_team.tactics,
-            defender_team_tactics=defending_team.tactics,
-            attacker_momentum=attacking_team.momentum,
-            defender_momentum=defending_team.momentum,
-            is_second_half=match_state.half == 2,
+            return None
+        
+        # 컨테스트 성공 확률 조회 (ContestResolver와 동일한 결과의 테이블 조회)
+        self.matchup.refresh()  # 경기 중 전술 변경 시에만 다시 컴파일
+        plan.success_rate = self.matchup.success_rate(
+            match_state.attacking_team,
+            attacker,
+            plan.defender,
+            plan.action_type,
+            plan.situation.get("distance", 0),
+            attacking_team.momentum,
+            defending_team.momentum,
+            match_state.half == 2,
         )
         
         # 성공/실패 판정
-        success = self.resolver.resolve_contest(contest_score)
+        plan.roll = self.streams.contest.random()
+        plan.success = plan.roll < plan.success_rate
+        
+        # 샘플링된 컨테스트 상세 추적 (켜져 있으면 N번째 컨테스트마다 1개)
+        if self.log.sample_contest():
+            defender = plan.defender
+            logger.debug(
+                f"Contest trace (tick: {match_state.tick}, phase: {match_state.current_phase}): "
+                f"{plan.action_type} by {attacker.name} (zone {attacker.zone}, "
+                f"stamina {attacker.stamina:.1f}) vs "
+                f"{defender.name if defender else 'no defender'}, "
+                f"distance={plan.situation.get('distance', 0)}, "
+                f"momentum={attacking_team.momentum}/{defending_team.momentum}, "
+                f"success_rate={plan.success_rate:.2%}, "
+                f"result={'SUCCESS' if plan.success else 'FAILURE'}"
+            )
         
         # 결과 적용
-        self._apply_action_result(
-            action_type, success, attacker, defender, attacking_team, defending_team, match_state
-        )
+        self._apply_action_result(plan, attacking_team, defending_team, match_state)
         
         # 이벤트 로그 기록 (중요 이벤트만, 골은 별도로 로깅됨)
-        if self._is_important_event(action_type, success) and action_type != "shoot":
+        if (
+            self.observe
+            and plan.action_type != "shoot"
+            and self._is_important_event(plan.action_type, plan.success)
+        ):
             self._log_event(
-                action_type, success, attacker, defender, attacking_team, match_state
+                plan.action_type, plan.success, attacker, plan.defender, attacking_team, match_state
             )
+        
+        return plan
 
     def _apply_action_result(
         self,
-        action_type: str,
-        success: bool,
-        attacker: Optional,
-        defender: Optional,
+        plan: ActionPlan,
         attacking_team: TeamState,
         defending_team: TeamState,
         match_state: MatchState,
     ):
-        """행동 결과 적용"""
-        # 패스 대상 선수 정보 저장 (패스 출력 시 사용)
-        pass_target = getattr(match_state, '_pass_target', None)
-        from sim_soccer.field.zone import FINAL_THIRD_ZONES
+        """판정이 끝난 행동 계획의 결과 적용"""
+        action_type = plan.action_type
+        attacker = plan.attacker
+        defender = plan.defender
         
         # 체력 소모
         if attacker:
             stamina_cost = calculate_stamina_cost(
-                action_type, attacking_team.tactics, attacker.stats.get("STA", 5)
+                action_type, attacking_team.tactics, attacker.stats.data[Stat.STA]
             )
             attacker.stamina = max(0, attacker.stamina - stamina_cost)
         
         if defender:
             stamina_cost = calculate_stamina_cost(
-                action_type, defending_team.tactics, defender.stats.get("STA", 5)
+                action_type, defending_team.tactics, defender.stats.data[Stat.STA]
             )
             defender.stamina = max(0, defender.stamina - stamina_cost)
         
-        # 통계 업데이트
-        if action_type == "shoot":
-            attacking_team.stats["shots"] += 1
-            if success:
-                attacking_team.stats["shots_on_target"] += 1
-        elif action_type == "pass":
-            attacking_team.stats["passes_attempted"] += 1
-            if success:
-                attacking_team.stats["passes_completed"] += 1
-        elif action_type == "dribble":
-            attacking_team.stats["dribbles_attempted"] += 1
-            if success:
-                attacking_team.stats["dribbles_successful"] += 1
-        elif action_type == "tackle":
-            defending_team.stats["tackles_attempted"] += 1
-            if success:
-                defending_team.stats["tackles_successful"] += 1
-        
-        # 성공 시 상태 업데이트
-        is_goal = False
-        if success:
-            if action_type == "shoot":
-                # 슈팅 성공 시 골 확률 계산
-                is_goal = self._calculate_goal_probability(attacker, defender, attacking_team)
-                if is_goal:
-                    attacking_team.score += 1
-                    attacking_team.momentum = update_momentum(
-                        attacking_team.momentum, "goal_scored"
-                    )
-                    defending_team.momentum = update_momentum(
-                        defending_team.momentum, "goal_conceded"
-                    )
-                    logger.info(
-                        f"GOAL! {attacking_team.team_name} scores! "
-                        f"(tick: {match_state.tick}, player: {attacker.name if attacker else 'Unknown'})"
-                    )
-                    # 골 이벤트 로깅
-                    event = EventLog(
-                        tick=match_state.tick,
-                        phase=match_state.current_phase,
-                        event_type="goal",
-                        team="home" if attacking_team == match_state.home_team else "away",
-                        player_id=attacker.player_id if attacker else None,
-                        action="shoot",
-                        result="success",
-                        description=f"Goal scored by {attacker.name if attacker else 'Unknown'}",
-                    )
-                    match_state.add_event(event)
-                    # 골 후 킥오프 (수비 팀이 공격 시작)
-                    match_state.switch_attacking_team()
-                    match_state.current_phase = "build_up"
-                    # 볼 위치를 수비 팀 후방으로 이동
-                    defending_gk = defending_team.get_players_by_position("GK")[0]
-                    match_state.ball_zone = defending_gk.zone
-                    match_state.ball_holder = defending_gk.player_id
-                    defending_gk.has_ball = True
-                    attacking_team.set_ball_holder(None)
-            
-            elif action_type in ["pass", "pass_long", "pass_to_midfield", "pass_to_forward"]:
-                # 패스 성공 시 볼 이동
-                if attacker:
-                    # action_selector에서 선택된 패스 대상 선수 사용
-                    target_player = getattr(match_state, '_pass_target', None)
-                    
-                    if not target_player:
-                        # 패스 대상이 없으면 Phase와 행동 타입에 따라 대상 Zone 결정
-                        if action_type == "pass_to_forward":
-                            target_zone = 14  # 중앙 전방 (공격수에게)
-                        elif action_type == "pass_to_midfield":
-                            target_zone = 8  # 중앙 중앙 (미드필더에게)
-                        elif match_state.current_phase == "final_third":
-                            target_zone = 14  # 중앙 전방
-                        elif match_state.current_phase == "midfield":
-                            target_zone = 8  # 중앙 중앙
-                        else:
-                            target_zone = 5  # 중앙 후중앙
-                        
-                        # 해당 Zone의 선수에게 볼 전달
-                        from sim_soccer.field.positioning import get_players_in_zone, find_nearest_player
-                        target_players = get_players_in_zone(attacking_team, target_zone)
-                        
-                        if target_players:
-                            # Zone에 선수가 있으면 그 중 하나 선택 (공격자가 아닌 선수 우선)
-                            for p in target_players:
-                                if p.player_id != attacker.player_id:
-                                    target_player = p
-                                    break
-                            if not target_player:
-                                target_player = target_players[0]  # 없으면 첫 번째 선수
-                        else:
-                            # Zone에 선수가 없으면 가장 가까운 선수 선택
-                            target_player = find_nearest_player(
-                                attacking_team, target_zone, exclude_player_id=attacker.player_id
-                            )
-                            if target_player:
-                                # 선수 위치를 target_zone으로 업데이트
-                                target_player.zone = target_zone
-                    
-                    if target_player:
-                        # 패스 대상 선수의 위치를 target_zone으로 업데이트 (패스로 이동)
-                        if not hasattr(match_state, '_pass_target') or match_state._pass_target != target_player:
-                            # action_selector에서 선택된 대상이 아니면 위치 업데이트
-                            if action_type == "pass_to_forward":
-                                target_zone = 14
-                            elif action_type == "pass_to_midfield":
-                                target_zone = 8
-                            elif match_state.current_phase == "final_third":
-                                target_zone = 14
-                            elif match_state.current_phase == "midfield":
-                                target_zone = 8
-                            else:
-                                target_zone = 5
-                            target_player.zone = target_zone
-                        
-                        target_player.has_ball = True
-                        match_state.ball_holder = target_player.player_id
-                        match_state.ball_zone = target_player.zone
-                        attacker.has_ball = False
-                    else:
-                        # 대상 선수를 찾지 못한 경우 공격자가 계속 공을 가짐
-                        logger.warning("Could not find target player for pass")
-                    
-                    # 임시 저장된 패스 대상 정보 제거
-                    if hasattr(match_state, '_pass_target'):
-                        delattr(match_state, '_pass_target')
-            
-            elif action_type == "dribble":
-                # 드리블 성공 시 전방으로 이동 가능
-                if attacker and match_state.current_phase != "final_third":
-                    # 전방 Zone으로 이동
-                    from sim_soccer.field.zone import get_zone_row
-                    current_row = get_zone_row(attacker.zone)
-                    if current_row < 4:
-                        attacker.zone += 3  # 한 행 앞으로
-                        match_state.ball_zone = attacker.zone
-            
-            elif action_type in ["tackle", "intercept"]:
-                # 태클/인터셉트 성공 시 공수 전환
-                if defender:
-                    match_state.switch_attacking_team()
-                    match_state.current_phase = "transition"
-                    defender.has_ball = True
-                    match_state.ball_holder = defender.player_id
-                    match_state.ball_zone = defender.zone
-                    attacking_team.set_ball_holder(None)
-        
-        else:
-            # 실패 시
-            if action_type in ["pass", "pass_long", "pass_to_midfield", "pass_to_forward"]:
-                # 패스 실패 시 공수 전환 (상대가 공을 획득)
-                match_state.switch_attacking_team()
-                match_state.current_phase = "transition"
-                attacking_team.momentum = update_momentum(
-                    attacking_team.momentum, "mistake"
-                )
-                # 상대 팀의 가장 가까운 선수에게 볼 전달
-                from sim_soccer.field.positioning import find_nearest_player
-                defending_player = find_nearest_player(
-                    defending_team, match_state.ball_zone
-                )
-                if defending_player:
-                    defending_player.has_ball = True
-                    match_state.ball_holder = defending_player.player_id
-                    match_state.ball_zone = defending_player.zone
-                    attacking_team.set_ball_holder(None)
-                else:
-                    # 수비 선수를 찾지 못한 경우 수비 팀 골키퍼에게
-                    defending_gk = defending_team.get_players_by_position("GK")[0]
-                    defending_gk.has_ball = True
-                    match_state.ball_holder = defending_gk.player_id
-                    match_state.ball_zone = defending_gk.zone
-                    attacking_team.set_ball_holder(None)
-            
-            elif action_type == "dribble":
-                # 드리블 실패 시 공수 전환 가능성
-                if random.random() < 0.4:  # 40% 확률로 전환
-                    match_state.switch_attacking_team()
-                    match_state.current_phase = "transition"
-                    attacking_team.momentum = update_momentum(
-                        attacking_team.momentum, "mistake"
-                    )
-                    # 상대 팀의 가장 가까운 선수에게 볼 전달
-                    from sim_soccer.field.positioning import find_nearest_player
-                    defending_player = find_nearest_player(
-                        defending_team, match_state.ball_zone
-                    )
-                    if defending_player:
-                        defending_player.has_ball = True
-                        match_state.ball_holder = defending_player.player_id
-                        match_state.ball_zone = defending_player.zone
-                        attacking_team.set_ball_holder(None)
-            
-            elif action_type == "shoot":
-                # 슈팅 실패 시 골킥
-                match_state.switch_attacking_team()
-                match_state.current_phase = "build_up"
-                defending_gk = defending_team.get_players_by_position("GK")[0]
-                match_state.ball_zone = defending_gk.zone
-                match_state.ball_holder = defending_gk.player_id
-                defending_gk.has_ball = True
-                attacking_team.set_ball_holder(None)
-        
-        # 실시간 이벤트 출력 (중요한 이벤트만)
-        if action_type == "shoot":
-            self.event_printer.print_action(
-                match_state.tick,
-                action_type,
-                attacker,
-                attacking_team,
-                success,
-                match_state,
-                is_goal=is_goal,
-            )
-        elif action_type in ["dribble", "tackle", "intercept"]:
-            self.event_printer.print_action(
-                match_state.tick,
-                action_type,
-                attacker if action_type != "tackle" else defender,
-                attacking_team if action_type != "tackle" else defending_team,
-                success,
-                match_state,
-            )
-        elif action_type in ["pass", "pass_long", "pass_to_midfield", "pass_to_forward"]:
-            # 패스 이벤트 출력 (모든 패스 출력)
-            self.event_printer.print_action(
-                match_state.tick,
-                action_type,
-                attacker,
-                attacking_team,
-                success,
-                match_state,
-                target_player=pass_target,
-            )
+        # 행동별 결과 적용 (통계, 볼 이동, 공수 전환, 실시간 출력)
+        self.action_handlers.handlers[plan.action](
+            self, plan, attacking_team, defending_team, match_state
+        )
 
     def _calculate_goal_probability(
         self,
@@ -494,27 +472,12 @@ class MatchSimulator:
         if not attacker:
             return False
         
-        # 슈팅 정확도 기반 골 확률
-        sho_stat = attacker.get_weighted_stat("SHO")
-        base_goal_prob = 0.3 + (sho_stat - 5) * 0.05  # 기본 30% + 스탯 보정
-        
-        # 골키퍼 방어 고려
-        if defender and defender.position == "GK":
-            gk_tac = defender.get_weighted_stat("TAC")
-            gk_defense = gk_tac * 1.5  # 골키퍼 가중치
-            goal_prob = base_goal_prob - (gk_defense - 5) * 0.03
-        else:
-            goal_prob = base_goal_prob
-        
-        # 범위 제한 (10%-60%)
-        goal_prob = max(0.1, min(0.6, goal_prob))
-        
-        return random.random() < goal_prob
+        goal_prob = self.resolver.calculate_goal_probability(attacker, defender)
+        return self.streams.goal.random() < goal_prob
 
     def _is_important_event(self, action_type: str, success: bool) -> bool:
         """중요한 이벤트인지 판정"""
-        important_actions = ["shoot", "tackle", "intercept"]
-        return action_type in important_actions
+        return action_type in self.IMPORTANT_ACTIONS
 
     def _log_event(
         self,
@@ -528,18 +491,16 @@ class MatchSimulator:
         """이벤트 로그 기록"""
         event_type = "goal" if action_type == "shoot" and success else action_type
         
-        event = EventLog(
+        # 설명("tackle success")은 이벤트 로그를 읽을 때 만들어짐
+        match_state.event_log.record(
             tick=match_state.tick,
             phase=match_state.current_phase,
             event_type=event_type,
-            team="home" if team == match_state.home_team else "away",
+            team="home" if team is match_state.home_team else "away",
             player_id=attacker.player_id if attacker else None,
             action=action_type,
             result="success" if success else "failure",
-            description=f"{action_type} {'success' if success else 'failure'}",
         )
-        
-        match_state.add_event(event)
 
     def _apply_half_time_rest(self, match_state: MatchState):
         """후반 시작 시 체력 회복"""
@@ -0,0 +1,669 @@
+"""NumPy 기반 lockstep 벡터화 경기 엔진
+
+N개 경기의 상태(Phase, 공격 팀, 볼 Zone, 볼 소유자, 선수별 Zone/체력, 모멘텀)를
+NumPy 배열로 보관하고, 모든 경기를 한 Tick씩 동시에 진행한다.
+
+규칙은 스칼라 엔진(`MatchSimulator`)과 동일하다. 스탯 가중합, 전술/모멘텀 보정,
+체력 소모량, Phase 전환 확률, 행동 확률, 골 확률은 모두 경기 시작 전에
+`ContestResolver`, `PhaseManager`, `ActionSelector` 및 체력/전술 모듈을 직접 호출하여
+테이블로 만들고, Tick 루프는 그 테이블을 인덱싱만 한다.
+
+난수 스트림은 스칼라 엔진과 다르므로 개별 경기 결과는 일치하지 않고,
+결과 분포가 통계적으로 일치한다.
+
+기본 난수(`seed`)는 Tick마다 (6, 경기 수) 블록을 하나의 NumPy 생성기에서 뽑으므로 경기
+결과가 배치 구성에 따라 달라진다. `master_seed`를 지정하면 경기마다 (마스터 시드, 대진
+인덱스, 경기 번호)에서 파생한 카운터 기반 스트림의 Tick별 구간을 한 번에 계산하므로
+(core.rng.counter_uniforms), 각 경기의 결과는 함께 실행한 경기나 배치 분할과 무관하다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy는 선택 의존성
+    np = None
+
+from sim_soccer.core.action_selector import ActionSelector
+from sim_soccer.core.batch import BatchResult, MatchSummary, Pairing, aggregate_summaries
+from sim_soccer.core.contest_resolver import ContestResolver
+from sim_soccer.core.ids import (
+    ACTION_IDS,
+    PASS_ACTIONS,
+    TEAM_STAT_NAMES,
+    Action,
+    Phase,
+    Stat,
+)
+from sim_soccer.core.phase_manager import PhaseManager
+from sim_soccer.core.rng import counter_uniforms, derive_key
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.field.positioning import get_default_zone_for_position, get_zones_for_phase
+from sim_soccer.field.zone import TOTAL_ZONES, ZONE_COLS, ZONE_DISTANCE, ZONE_ROW, ZONE_ROWS
+from sim_soccer.models.team import TeamState
+from sim_soccer.systems.momentum import MOMENTUM_CHANGES, calculate_momentum_bonus
+from sim_soccer.systems.stamina import apply_half_time_rest, calculate_stamina_cost
+from sim_soccer.systems.tactics import calculate_tactics_bonus
+
+# 팀 통계 항목 (TeamState.stats와 같은 순서)
+STAT_KEYS: Tuple[str, ...] = TEAM_STAT_NAMES
+
+# 행동별 (통계를 기록하는 팀, 시도 통계, 성공 통계). 팀은 0=공격 팀, 1=수비 팀
+_ACTION_STAT_COLUMNS: Dict[Action, Tuple[int, str, str]] = {
+    Action.SHOOT: (0, "shots", "shots_on_target"),
+    Action.PASS: (0, "passes_attempted", "passes_completed"),
+    Action.DRIBBLE: (0, "dribbles_attempted", "dribbles_successful"),
+    Action.TACKLE: (1, "tackles_attempted", "tackles_successful"),
+}
+
+# 체력 페널티 구간 경계 (apply_stamina_penalty와 동일)
+_STAMINA_PENALTY_EDGES = (10.0, 30.0, 50.0, 70.0)
+
+_MOMENTUM_MIN = -10
+_MOMENTUM_MAX = 10
+_DRIBBLE_TURNOVER_PROB = 0.4
+_FAR = 1 << 20  # 존재하지 않는 선수(패딩)까지의 거리
+_DRAWS_PER_TICK = 6  # Tick마다 경기별로 사용하는 난수 수
+
+NO_PLAYER = -1
+
+
+def _require_numpy():
+    """numpy가 설치되어 있는지 확인"""
+    if np is None:
+        raise ImportError(
+            "VectorizedMatchEngine requires numpy (install with `pip install sim-soccer[fast]`)"
+        )
+
+
+@dataclass
+class VectorizedResult:
+    """벡터화 엔진 실행 결과 (경기 단위 배열)"""
+
+    pairing_index: "np.ndarray"  # (N,) 각 경기의 대진 인덱스
+    home_score: "np.ndarray"  # (N,)
+    away_score: "np.ndarray"  # (N,)
+    home_stats: "np.ndarray"  # (N, len(STAT_KEYS))
+    away_stats: "np.ndarray"  # (N, len(STAT_KEYS))
+
+    @property
+    def matches(self) -> int:
+        """경기 수"""
+        return len(self.pairing_index)
+
+    def to_summaries(self) -> List[MatchSummary]:
+        """배치 API와 같은 경기 요약 목록으로 변환 (seed는 경기 인덱스)"""
+        return [
+            MatchSummary(
+                pairing_index=int(self.pairing_index[m]),
+                seed=m,
+                home_score=int(self.home_score[m]),
+                away_score=int(self.away_score[m]),
+                home_stats=dict(zip(STAT_KEYS, self.home_stats[m].tolist())),
+                away_stats=dict(zip(STAT_KEYS, self.away_stats[m].tolist())),
+            )
+            for m in range(self.matches)
+        ]
+
+    def to_batch_results(self, pairings: Sequence[Pairing]) -> List[BatchResult]:
+        """대진별 BatchResult 목록으로 집계"""
+        by_pairing: List[List[MatchSummary]] = [[] for _ in pairings]
+        for summary in self.to_summaries():
+            by_pairing[summary.pairing_index].append(summary)
+        return [
+            aggregate_summaries(pairing, by_pairing[index])
+            for index, pairing in enumerate(pairings)
+        ]
+
+
+class VectorizedMatchEngine:
+    """여러 경기를 NumPy 배열로 동시에 진행하는 lockstep 엔진"""
+
+    TOTAL_TICKS = MatchSimulator.TOTAL_TICKS
+    HALF_TIME_TICK = MatchSimulator.HALF_TIME_TICK
+
+    def __init__(
+        self,
+        resolver: Optional[ContestResolver] = None,
+        phase_manager: Optional[PhaseManager] = None,
+        action_selector: Optional[ActionSelector] = None,
+    ):
+        """엔진 초기화
+
+        Args:
+            resolver: 규칙 테이블 생성에 사용할 컨테스트 판정기
+            phase_manager: 규칙 테이블 생성에 사용할 Phase 관리자
+            action_selector: 규칙 테이블 생성에 사용할 행동 선택기
+        """
+        _require_numpy()
+        self.resolver = resolver or ContestResolver()
+        self.phase_manager = phase_manager or PhaseManager()
+        self.action_selector = action_selector or ActionSelector()
+        self._build_rule_tables()
+
+    # ------------------------------------------------------------------
+    # 팀과 무관한 규칙 테이블
+    # ------------------------------------------------------------------
+
+    def _build_rule_tables(self):
+        """Zone/Phase/행동 규칙 테이블 생성"""
+        n_actions = len(Action)
+        n_phases = len(Phase)
+
+        # Zone 거리/행 테이블 (인덱스 0은 패딩 선수용)
+        self.distance = np.array(ZONE_DISTANCE, dtype=np.int64)
+        self.distance[0, :] = _FAR
+        self.distance[:, 0] = _FAR
+        self.zone_row = np.array(ZONE_ROW, dtype=np.int64)
+        self.max_distance = int(self.distance[1:, 1:].max())
+
+        # Phase별 Zone 밴드 (공을 가진 선수가 없을 때 공격자 선택에 사용)
+        self.phase_band = np.zeros((n_phases, TOTAL_ZONES + 1), dtype=bool)
+        for phase in Phase:
+            for zone in get_zones_for_phase(phase.label):
+                self.phase_band[phase, zone] = True
+
+        # Phase 전환 (전환 판정 성공 시 다음 Phase)
+        self.next_phase = np.array(self.phase_manager.transition_targets, dtype=np.int64)
+
+        # 행동 분류
+        self.is_pass = np.array([a in PASS_ACTIONS for a in Action])
+        self.is_defended = np.array(
+            [a.label in self.action_selector.DEFENDED_ACTIONS for a in Action]
+        )
+        self.pass_target_zone = np.zeros((n_actions, n_phases), dtype=np.int64)
+        for action in PASS_ACTIONS:
+            for phase in Phase:
+                self.pass_target_zone[action, phase] = self.action_selector.get_pass_target_zone(
+                    action.label, phase.label
+                )
+
+        # 관련 스탯 수 (체력 페널티 계산용)
+        self.att_stat_count = np.array(
+            [len(self.resolver._get_relevant_stats(a.label)) for a in Action], dtype=np.int64
+        )
+        self.def_stat_count = np.array(
+            [len(self.resolver._get_relevant_stats_for_defense(a.label)) for a in Action],
+            dtype=np.int64,
+        )
+
+        # 모멘텀 보정 [half, momentum + 10]
+        momenta = range(_MOMENTUM_MIN, _MOMENTUM_MAX + 1)
+        self.momentum_bonus = np.array(
+            [[calculate_momentum_bonus(m, half == 1) for m in momenta] for half in (0, 1)]
+        )
+
+        # 수비자 상황 보너스 (포지셔닝은 항상 기본값)
+        situation = {"positioning": self.action_selector.DEFAULT_POSITIONING}
+        self.situation_bonus = np.array(
+            [self.resolver._calculate_situation_bonus(a.label, situation) for a in Action]
+        )
+
+        # 통계 기록 위치: (팀 구분, 시도 열, 성공 열), 없으면 열 = len(STAT_KEYS)
+        dummy = len(STAT_KEYS)
+        self.stat_side = np.zeros(n_actions, dtype=np.int64)
+        self.stat_attempt_col = np.full(n_actions, dummy, dtype=np.int64)
+        self.stat_success_col = np.full(n_actions, dummy, dtype=np.int64)
+        for action, (side, attempt, success) in _ACTION_STAT_COLUMNS.items():
+            self.stat_side[action] = side
+            self.stat_attempt_col[action] = STAT_KEYS.index(attempt)
+            self.stat_success_col[action] = STAT_KEYS.index(success)
+
+        self.situation_zone = self.action_selector.SITUATION_TARGET_ZONE
+
+    # ------------------------------------------------------------------
+    # 팀별 테이블
+    # ------------------------------------------------------------------
+
+    def _build_team_tables(self, teams: List[TeamState], n_players: int):
+        """팀별 스탯/전술 테이블 생성"""
+        n_teams = len(teams)
+        n_actions = len(Action)
+        n_phases = len(Phase)
+        n_dist = self.max_distance + 1
+        resolver = self.resolver
+
+        att_weighted = np.zeros((n_teams, n_players, n_actions))
+        def_weighted = np.zeros((n_teams, n_players, n_actions))
+        stamina_cost = np.zeros((n_teams, n_players, n_actions))
+        init_zone = np.zeros((n_teams, 2, n_players), dtype=np.int64)
+        tactics_bonus = np.zeros((n_teams, n_actions, n_dist))
+        situation_penalty = np.zeros((n_teams, n_actions, n_dist))
+        transition_prob = np.zeros((n_teams, n_phases))
+        # 행동 별칭 테이블 (Phase별 행동 수가 4보다 작으면 뒤쪽 칸은 사용하지 않음)
+        action_alias_prob = np.ones((n_teams, n_phases, 4))
+        action_alias = np.zeros((n_teams, n_phases, 4), dtype=np.int64)
+        action_count = np.ones(n_phases, dtype=np.int64)
+        gk_index = np.zeros(n_teams, dtype=np.int64)
+        phase_actions = np.zeros((n_phases, 4), dtype=np.int64)
+
+        for t, team in enumerate(teams):
+            for p, player in enumerate(team.players):
+                for action in Action:
+                    att_weighted[t, p, action] = self._weighted_sum(
+                        player, resolver._get_relevant_stats(action.label)
+                    )
+                    def_weighted[t, p, action] = self._weighted_sum(
+                        player, resolver._get_relevant_stats_for_defense(action.label)
+                    )
+                    stamina_cost[t, p, action] = calculate_stamina_cost(
+                        action.label, team.tactics, player.stats.data[Stat.STA]
+                    )
+                init_zone[t, 0, p] = get_default_zone_for_position(
+                    player.position, "build_up", True
+                )
+                init_zone[t, 1, p] = get_default_zone_for_position(
+                    player.position, "defense", False
+                )
+
+            gks = [p for p, player in enumerate(team.players) if player.position == "GK"]
+            gk_index[t] = gks[0] if gks else 0
+
+            # 상황 변수는 ActionSelector._create_situation과 동일한 구성
+            pressing = team.tactics.get("pressing", 5)
+            positioning = self.action_selector.DEFAULT_POSITIONING
+            for action in Action:
+                for d in range(n_dist):
+                    situation = {"pressing": pressing, "positioning": positioning}
+                    if action in PASS_ACTIONS:
+                        situation["distance"] = d
+                    tactics_bonus[t, action, d] = calculate_tactics_bonus(
+                        team.tactics, action.label, situation
+                    )
+                    situation_penalty[t, action, d] = resolver._calculate_situation_penalty(
+                        action.label, situation
+                    )
+
+            for phase in Phase:
+                transition_prob[t, phase] = self.phase_manager.calculate_transition_probability(
+                    phase.label, team, None
+                )
+                table = self.action_selector.get_action_alias_table(phase.label, team.tactics)
+                n_choices = len(table.outcomes)
+                action_count[phase] = n_choices
+                action_alias_prob[t, phase, :n_choices] = table.prob
+                action_alias[t, phase, :n_choices] = table.alias
+                for k, action_name in enumerate(table.outcomes):
+                    phase_actions[phase, k] = ACTION_IDS[action_name]
+
+        self.att_weighted = att_weighted
+        self.def_weighted = def_weighted
+        self.stamina_cost = stamina_cost
+        self.init_zone = init_zone
+        self.tactics_bonus = tactics_bonus
+        self.situation_penalty = situation_penalty
+        self.transition_prob = transition_prob
+        self.action_alias_prob = action_alias_prob
+        self.action_alias = action_alias
+        self.action_count = action_count
+        self.gk_index = gk_index
+        self.phase_actions = phase_actions
+
+    def _build_goal_tables(self, pairings: Sequence[Pairing], n_players: int):
+        """대진별 골 확률 테이블 [대진, 공격 측, 공격자, 수비자(마지막=없음)]"""
+        goal = np.zeros((len(pairings), 2, n_players, n_players + 1))
+        for k, (home, away) in enumerate(pairings):
+            for side, (attacking, defending) in enumerate(((home, away), (away, home))):
+                for a, attacker in enumerate(attacking.players):
+                    for d in range(n_players + 1):
+                        defender = defending.players[d] if d < len(defending.players) else None
+                        goal[k, side, a, d] = self.resolver.calculate_goal_probability(
+                            attacker, defender
+                        )
+        self.goal_prob = goal
+
+    @staticmethod
+    def _weighted_sum(player, stat_names: List[str]) -> float:
+        """ContestResolver와 같은 순서로 포지션 가중 스탯 합 계산"""
+        stat_value = 0.0
+        for stat_name in stat_names:
+            base_stat = player.stats.get(stat_name, 0)
+            weight = player.position_weights.get(stat_name, 1.0)
+            stat_value += base_stat * weight
+        return stat_value
+
+    # ------------------------------------------------------------------
+    # 시뮬레이션
+    # ------------------------------------------------------------------
+
+    def simulate(
+        self,
+        pairings: Sequence[Pairing],
+        matches_per_pairing: int = 1,
+        seed: Optional[int] = None,
+        master_seed: Optional[int] = None,
+        first_match: int = 0,
+    ) -> VectorizedResult:
+        """대진별로 matches_per_pairing개의 경기를 동시에 시뮬레이션
+
+        입력 팀 상태는 변경되지 않으며, 모든 경기는 점수 0, 모멘텀 0, 체력 100에서 시작한다.
+
+        Args:
+            pairings: (홈 팀, 원정 팀) 튜플 목록
+            matches_per_pairing: 대진별 경기 수
+            seed: NumPy 난수 시드 (같은 입력과 시드면 결과 동일)
+            master_seed: 지정하면 seed 대신 경기별 카운터 기반 스트림 사용
+            first_match: master_seed 사용 시 대진별 첫 경기 번호 (경기를 나눠 실행할 때 사용)
+
+        Returns:
+            VectorizedResult
+
+        Raises:
+            ValueError: seed와 master_seed를 함께 전달했을 때
+        """
+        if seed is not None and master_seed is not None:
+            raise ValueError("seed and master_seed cannot be used together")
+        pairings = list(pairings)
+        teams: List[TeamState] = []
+        team_slot: Dict[int, int] = {}
+        for pairing in pairings:
+            for team in pairing:
+                if id(team) not in team_slot:
+                    team_slot[id(team)] = len(teams)
+                    teams.append(team)
+
+        n_players = max(len(team.players) for team in teams)
+        self._build_team_tables(teams, n_players)
+        self._build_goal_tables(pairings, n_players)
+
+        pairing_index = np.repeat(np.arange(len(pairings)), matches_per_pairing)
+        team_of = np.array(
+            [[team_slot[id(home)], team_slot[id(away)]] for home, away in pairings],
+            dtype=np.int64,
+        )[pairing_index]
+        roster = np.array(
+            [[len(home.players), len(away.players)] for home, away in pairings], dtype=np.int64
+        )[pairing_index]
+
+        if master_seed is None:
+            rng = np.random.default_rng(seed)
+            n = len(pairing_index)
+
+            def uniforms(tick: int) -> "np.ndarray":
+                return rng.random((_DRAWS_PER_TICK, n))
+
+        else:
+            match_number = first_match + np.tile(np.arange(matches_per_pairing), len(pairings))
+            keys = np.array(
+                [
+                    derive_key(master_seed, int(index), int(number))
+                    for index, number in zip(pairing_index, match_number)
+                ],
+                dtype=np.uint64,
+            )[None, :]
+            draws = np.arange(_DRAWS_PER_TICK, dtype=np.uint64)[:, None]
+
+            def uniforms(tick: int) -> "np.ndarray":
+                return counter_uniforms(keys, draws + np.uint64(tick * _DRAWS_PER_TICK))
+
+        state = self._run(team_of, roster, pairing_index, n_players, uniforms)
+
+        return VectorizedResult(
+            pairing_index=pairing_index,
+            home_score=state["score"][:, 0].copy(),
+            away_score=state["score"][:, 1].copy(),
+            home_stats=state["stats"][:, 0, : len(STAT_KEYS)].copy(),
+            away_stats=state["stats"][:, 1, : len(STAT_KEYS)].copy(),
+        )
+
+    def _run(self, team_of, roster, pairing_index, n_players, uniforms) -> Dict[str, "np.ndarray"]:
+        """Tick 루프 실행 (uniforms(tick)은 그 Tick에 사용할 (6, 경기 수) 난수 배열)"""
+        n = len(team_of)
+        ar = np.arange(n)
+        players = np.arange(n_players)
+        n_stat_cols = len(STAT_KEYS) + 1  # 마지막 열은 통계가 없는 행동용 더미
+        shoot_id = int(Action.SHOOT)
+        dribble_id = int(Action.DRIBBLE)
+        build_up_id = int(Phase.BUILD_UP)
+        transition_id = int(Phase.TRANSITION)
+        final_third_id = int(Phase.FINAL_THIRD)
+        goal_scored = MOMENTUM_CHANGES["goal_scored"]
+        goal_conceded = MOMENTUM_CHANGES["goal_conceded"]
+        mistake = MOMENTUM_CHANGES["mistake"]
+
+        transition_prob = self.transition_prob
+        next_phase = self.next_phase
+        action_alias_prob = self.action_alias_prob
+        action_alias = self.action_alias
+        action_count = self.action_count
+        phase_actions = self.phase_actions
+        is_pass_table = self.is_pass
+        is_defended = self.is_defended
+        situation_distance = self.distance[:, self.situation_zone]
+        goal_prob = self.goal_prob
+
+        # 초기 상태 (홈 팀 build_up 공격, 원정 팀 defense 위치, 홈 GK가 볼 소유)
+        zone = np.stack(
+            [self.init_zone[team_of[:, 0], 0], self.init_zone[team_of[:, 1], 1]], axis=1
+        )
+        zone[players[None, None, :] >= roster[:, :, None]] = 0  # 패딩 선수
+        stamina = np.full((n, 2, n_players), 100.0)
+        momentum = np.zeros((n, 2), dtype=np.int64)
+        score = np.zeros((n, 2), dtype=np.int64)
+        stats = np.zeros((n, 2, n_stat_cols), dtype=np.int64)
+        holder = np.full((n, 2), NO_PLAYER, dtype=np.int64)
+        holder[:, 0] = self.gk_index[team_of[:, 0]]
+        ball_zone = zone[ar, 0, holder[:, 0]]
+        phase = np.full(n, build_up_id, dtype=np.int64)
+        att = np.zeros(n, dtype=np.int64)
+        half = 0
+        penalty_edges = np.array(_STAMINA_PENALTY_EDGES)
+
+        # 각 경기/팀의 Zone별 최근접 선수 (볼 Zone의 첫 선수 우선, 없으면 최근접 첫 선수)
+        # 선수 Zone은 드리블 전진 시에만 바뀌므로 바뀐 경기만 다시 계산한다
+        nearest = self._nearest_players(zone.reshape(n * 2, n_players)).reshape(n, 2, -1)
+
+        stats_flat = stats.reshape(-1)
+        stamina_flat = stamina.reshape(-1)
+        zone_flat = zone.reshape(-1)
+        home_team, away_team = team_of[:, 0], team_of[:, 1]
+
+        for tick in range(self.TOTAL_TICKS):
+            if tick == self.HALF_TIME_TICK:
+                half = 1
+                stamina[...] = np.vectorize(apply_half_time_rest)(stamina)
+
+            u = uniforms(tick)
+            dfn = 1 - att
+            att_home = att == 0
+            t_att = np.where(att_home, home_team, away_team)
+            t_def = np.where(att_home, away_team, home_team)
+
+            # Phase 전환
+            transition = u[0] < transition_prob[t_att, phase]
+            phase = np.where(transition, next_phase[phase], phase)
+
+            # 행동 선택 (별칭 테이블, 경기당 난수 하나)
+            x = u[1] * action_count[phase]
+            slot = np.minimum(x.astype(np.int64), action_count[phase] - 1)
+            k = np.where(
+                x - slot < action_alias_prob[t_att, phase, slot],
+                slot,
+                action_alias[t_att, phase, slot],
+            )
+            action = phase_actions[phase, k]
+            is_pass = is_pass_table[action]
+            has_defender = is_defended[action]
+
+            # 공격자: 볼 소유자, 없으면 대체 규칙 (소유자가 없는 경기만 계산)
+            own = holder[ar, att]
+            attacker = own.copy()
+            lost = np.flatnonzero(own < 0)
+            if lost.size:
+                attacker[lost] = self._fallback_attacker(
+                    zone[lost, att[lost]], ball_zone[lost], phase[lost]
+                )
+
+            # 수비자: 볼 Zone의 첫 선수, 없으면 최근접 선수
+            # 같은 선수가 공을 잃었을 때 공을 받는 최근접 선수이기도 하다
+            defender = nearest[ar, dfn, ball_zone]
+
+            # 컨테스트
+            distance = np.where(is_pass, situation_distance[ball_zone], 0)
+            att_slot = (ar * 2 + att) * n_players + attacker
+            def_slot = (ar * 2 + dfn) * n_players + defender
+            att_stamina = stamina_flat[att_slot]
+            def_stamina = stamina_flat[def_slot]
+            att_penalty = 4 - np.searchsorted(penalty_edges, att_stamina, side="right")
+            def_penalty = 4 - np.searchsorted(penalty_edges, def_stamina, side="right")
+
+            att_score = self.att_weighted[t_att, attacker, action]
+            att_score = att_score - att_penalty * self.att_stat_count[action] * 0.5
+            att_score = att_score * self.tactics_bonus[t_att, action, distance]
+            att_score = att_score * self.momentum_bonus[half, momentum[ar, att] - _MOMENTUM_MIN]
+            att_score = att_score - self.situation_penalty[t_def, action, distance]
+            att_score = np.maximum(att_score, 0.0)
+
+            def_score = self.def_weighted[t_def, defender, action]
+            def_score = def_score - def_penalty * self.def_stat_count[action] * 0.5
+            def_score = def_score * self.tactics_bonus[t_def, action, distance]
+            def_score = def_score * self.momentum_bonus[half, momentum[ar, dfn] - _MOMENTUM_MIN]
+            def_score = def_score + self.situation_bonus[action]
+            def_score = np.where(has_defender, np.maximum(def_score, 0.0), 0.0)
+
+            contest = att_score - def_score
+            success_rate = 0.5 + np.minimum(np.maximum(contest * 0.03, -0.3), 0.3)
+            success_rate = np.minimum(np.maximum(success_rate, 0.2), 0.8)
+            success = u[3] < success_rate
+
+            # 체력 소모
+            stamina_flat[att_slot] = np.maximum(
+                0, att_stamina - self.stamina_cost[t_att, attacker, action]
+            )
+            stamina_flat[def_slot] = np.where(
+                has_defender,
+                np.maximum(0, def_stamina - self.stamina_cost[t_def, defender, action]),
+                def_stamina,
+            )
+
+            # 통계
+            stat_team = np.where(self.stat_side[action] == 0, att, dfn)
+            stat_base = (ar * 2 + stat_team) * n_stat_cols
+            stats_flat[stat_base + self.stat_attempt_col[action]] += 1
+            stats_flat[
+                stat_base + np.where(success, self.stat_success_col[action], n_stat_cols - 1)
+            ] += 1
+
+            # 결과 판정
+            shoot = action == shoot_id
+            dribble = action == dribble_id
+            goal_defender = np.where(has_defender, defender, n_players)
+            goal = success & shoot & (u[4] < goal_prob[pairing_index, att, attacker, goal_defender])
+            kickoff = goal | (shoot & ~success)
+            turnover = ~success & (is_pass | (dribble & (u[5] < _DRIBBLE_TURNOVER_PROB)))
+            switch = kickoff | turnover
+            attacker_zone = zone_flat[att_slot]
+            dribble_forward = (
+                success
+                & dribble
+                & (phase != final_third_id)
+                & (self.zone_row[attacker_zone] < ZONE_ROWS - 1)
+            )
+
+            # 드리블 전진
+            moved = np.flatnonzero(dribble_forward)
+            if moved.size:
+                zone_flat[att_slot[moved]] += ZONE_COLS
+                ball_zone[moved] += ZONE_COLS
+                moved_rows = moved * 2 + att[moved]
+                nearest.reshape(n * 2, -1)[moved_rows] = self._nearest_players(
+                    zone.reshape(n * 2, n_players)[moved_rows]
+                )
+
+            # 패스 성공: 대상 선수에게 볼 이동 (패스가 성공한 경기만 대상 선택)
+            new_own = own
+            passed = np.flatnonzero(success & is_pass)
+            if passed.size:
+                zone_att = zone[passed, att[passed]]
+                target = self._pass_target(
+                    zone_att,
+                    attacker[passed],
+                    self.pass_target_zone[action[passed], phase[passed]],
+                    u[2][passed],
+                )
+                new_own = own.copy()
+                new_own[passed] = np.where(target != attacker[passed], target, NO_PLAYER)
+                ball_zone[passed] = zone_att[np.arange(passed.size), target]
+
+            holder[ar, att] = new_own
+
+            # 공수 전환: 킥오프는 수비 팀 GK, 실수는 볼 위치 최근접 수비 선수가 볼 획득
+            switched = np.flatnonzero(switch)
+            if switched.size:
+                s_att, s_def = att[switched], dfn[switched]
+                s_goal, s_kickoff = goal[switched], kickoff[switched]
+
+                # 점수/모멘텀 (한 Tick에 한 이벤트만 발생하므로 변화량을 합쳐 한 번에 제한)
+                score[switched, s_att] += s_goal
+                momentum[switched, s_att] = np.clip(
+                    momentum[switched, s_att]
+                    + np.where(s_goal, goal_scored, 0)
+                    + turnover[switched] * mistake,
+                    _MOMENTUM_MIN,
+                    _MOMENTUM_MAX,
+                )
+                momentum[switched, s_def] = np.clip(
+                    momentum[switched, s_def] + np.where(s_goal, goal_conceded, 0),
+                    _MOMENTUM_MIN,
+                    _MOMENTUM_MAX,
+                )
+
+                receiver = np.where(s_kickoff, self.gk_index[t_def[switched]], defender[switched])
+                ball_zone[switched] = zone[switched, s_def, receiver]
+                holder[switched, s_att] = NO_PLAYER
+                holder[switched, s_def] = receiver
+                phase[switched] = np.where(s_kickoff, build_up_id, transition_id)
+                att[switched] = s_def
+
+        return {"score": score, "stats": stats, "momentum": momentum, "stamina": stamina}
+
+    def _nearest_players(self, zones):
+        """(행, 선수) Zone 배열에서 각 Zone별 최근접 첫 선수 인덱스 (행, Zone) 반환
+
+        거리 0인 선수가 해당 Zone의 선수이므로 Zone의 첫 선수가 우선 선택된다.
+        """
+        return self.distance[zones].argmin(axis=1)
+
+    def _fallback_attacker(self, zone_att, ball_zone, phase):
+        """볼 소유자가 없을 때의 공격자: 볼 Zone 첫 선수 > Phase Zone 첫 선수 > 첫 선수"""
+        in_ball_zone = zone_att == ball_zone[:, None]
+        in_band = self.phase_band[phase[:, None], zone_att]
+        return np.where(
+            in_ball_zone.any(axis=1),
+            in_ball_zone.argmax(axis=1),
+            np.where(in_band.any(axis=1), in_band.argmax(axis=1), 0),
+        )
+
+    def _pass_target(self, zone_att, attacker, target_zone, u):
+        """패스 대상: 대상 Zone의 (공격자 제외) 선수 중 무작위 > 대상 Zone 첫 선수 > 최근접 선수"""
+        rows = np.arange(len(attacker))
+        in_target = zone_att == target_zone[:, None]
+        candidates = in_target.copy()
+        candidates[rows, attacker] = False
+        n_candidates = candidates.sum(axis=1)
+        pick = (u * n_candidates).astype(np.int64)
+        chosen = (candidates.cumsum(axis=1) > pick[:, None]).argmax(axis=1)
+        target_distance = self.distance[zone_att, target_zone[:, None]]
+        target_distance[rows, attacker] = _FAR + 1
+        return np.where(
+            n_candidates > 0,
+            chosen,
+            np.where(
+                in_target.any(axis=1), in_target.argmax(axis=1), target_distance.argmin(axis=1)
+            ),
+        )
+
+
+def simulate_vectorized(
+    home_team: TeamState,
+    away_team: TeamState,
+    n_matches: int,
+    seed: Optional[int] = None,
+    master_seed: Optional[int] = None,
+) -> BatchResult:
+    """한 대진을 n_matches번 벡터화 엔진으로 시뮬레이션하고 집계 결과 반환"""
+    result = VectorizedMatchEngine().simulate(
+        [(home_team, away_team)], n_matches, seed, master_seed=master_seed
+    )
+    return result.to_batch_results([(home_team, away_team)])[0]
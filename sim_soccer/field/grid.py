@@ -0,0 +1,105 @@
+"""설정 가능한 필드 격자
+
+설계 문서의 5x3(15 Zone) 격자 외에 더 세밀한 격자(예: 10x6)로 실험할 수 있도록
+행/열 수와 Phase별 Zone 밴드를 매개변수로 받는다. 거리/인접/거리순 테이블(ZoneGeometry)에
+더해 Phase 밴드, 한 행 전진 Zone 테이블을 생성 시 한 번만 계산하므로 Tick당 조회 비용은
+격자 크기와 무관하다.
+
+규칙 코드에 등장하는 Zone 번호(2, 5, 8, 11, 14 등)는 기준 5x3 격자의 Zone으로 보고
+`map_base_zone`으로 현재 격자의 Zone으로 변환한다. 기본 격자에서는 항등 변환이다.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from sim_soccer.field.zone import ZONE_COLS, ZONE_ROWS, ZoneGeometry
+
+# Zone 밴드를 갖는 Phase (나머지 Phase는 전체 Zone)
+BANDED_PHASES = ("build_up", "midfield", "final_third")
+
+
+class FieldGrid(ZoneGeometry):
+    """행/열 수와 Phase Zone 밴드를 매개변수로 하는 필드 격자"""
+
+    # 규칙의 Zone 번호가 기준으로 하는 격자
+    BASE_ROWS = ZONE_ROWS
+    BASE_COLS = ZONE_COLS
+
+    def __init__(
+        self,
+        rows: int = ZONE_ROWS,
+        cols: int = ZONE_COLS,
+        phase_rows: Optional[Dict[str, Sequence[int]]] = None,
+    ):
+        """필드 격자 생성
+
+        Args:
+            rows: 세로 칸 수 (3 이상)
+            cols: 가로 칸 수
+            phase_rows: Phase별 밴드에 속하는 행 목록 (None이면 후방 2/5, 중앙 1/5, 전방 2/5)
+        """
+        if rows < 3:
+            raise ValueError(f"Grid needs at least 3 rows for phase bands, got {rows}")
+        super().__init__(rows, cols)
+        if phase_rows is None:
+            phase_rows = self._default_phase_rows(rows)
+        self.phase_rows: Dict[str, List[int]] = {}
+        for phase in BANDED_PHASES:
+            band = sorted(set(phase_rows.get(phase, ())))
+            if not band or not all(0 <= row < rows for row in band):
+                raise ValueError(f"Invalid rows for phase {phase!r}: {band}")
+            self.phase_rows[phase] = band
+
+        zones = list(range(1, self.total_zones + 1))
+        # Phase -> 밴드 Zone 목록 (Zone 번호 순)
+        self.phase_zones: Dict[str, List[int]] = {
+            phase: [z for z in zones if self.row[z] in band]
+            for phase, band in self.phase_rows.items()
+        }
+        self.all_zones: List[int] = zones
+        # Phase -> [zone] 밴드 포함 여부
+        self.in_band: Dict[str, List[bool]] = {
+            phase: [False] + [self.row[z] in band for z in zones]
+            for phase, band in self.phase_rows.items()
+        }
+        # Zone -> 한 행 전진한 Zone (마지막 행이면 그대로)
+        self.forward: List[int] = [0] + [z + cols if self.row[z] < rows - 1 else z for z in zones]
+        # 기준 격자 Zone -> 현재 격자 Zone
+        self._base_zone_map: List[int] = [0] + [
+            self._scale_base_zone(z) for z in range(1, self.BASE_ROWS * self.BASE_COLS + 1)
+        ]
+
+    @staticmethod
+    def _default_phase_rows(rows: int) -> Dict[str, List[int]]:
+        """기본 Phase 밴드 (5행이면 후방 0-1행, 중앙 2행, 전방 3-4행)"""
+        back = int(rows * 2 / 5 + 0.5)
+        return {
+            "build_up": list(range(0, back)),
+            "midfield": list(range(back, rows - back)),
+            "final_third": list(range(rows - back, rows)),
+        }
+
+    def _scale_base_zone(self, base_zone: int) -> int:
+        """기준 격자 Zone의 상대 위치에 해당하는 현재 격자 Zone 계산"""
+        base_row = (base_zone - 1) // self.BASE_COLS
+        base_col = (base_zone - 1) % self.BASE_COLS
+        row = int(base_row * (self.rows - 1) / (self.BASE_ROWS - 1) + 0.5)
+        col = int(base_col * (self.cols - 1) / (self.BASE_COLS - 1) + 0.5)
+        return row * self.cols + col + 1
+
+    def map_base_zone(self, base_zone: int) -> int:
+        """기준 5x3 격자의 Zone 번호를 현재 격자의 Zone 번호로 변환"""
+        return self._base_zone_map[base_zone]
+
+    def zones_for_phase(self, phase: str) -> List[int]:
+        """Phase에 해당하는 Zone 목록 (밴드가 없는 Phase는 전체 Zone)"""
+        return self.phase_zones.get(phase, self.all_zones)
+
+    def is_default(self) -> bool:
+        """기본 5x3 격자인지 확인"""
+        return (self.rows, self.cols) == (self.BASE_ROWS, self.BASE_COLS) and self.phase_rows == (
+            self._default_phase_rows(self.BASE_ROWS)
+        )
+
+
+# 설계 문서의 기본 5x3 격자
+DEFAULT_GRID = FieldGrid()
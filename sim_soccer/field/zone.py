@@ -1,7 +1,6 @@
 """Zone 시스템"""
 
-from typing import Tuple
-
+from typing import List, Tuple
 
 # Zone 번호 체계 (설계 문서 참조)
 # 후방:     [1] [2] [3]
@@ -19,6 +18,74 @@ ZONE_COLS = 3  # 가로 3등분
 TOTAL_ZONES = ZONE_ROWS * ZONE_COLS  # 15개
 
 
+class ZoneGeometry:
+    """격자 크기별 Zone 기하 테이블
+    
+    Zone 좌표, 거리, 인접 Zone, 거리순 Zone 목록을 생성 시 한 번만 계산한다.
+    모든 테이블은 Zone 번호(1부터)로 바로 인덱싱할 수 있도록 0번 칸을 비워 둔다.
+    테이블 조회는 범위 검사를 하지 않으므로 외부 입력은 공개 함수로 검증해야 한다.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        """격자 기하 테이블 생성
+        
+        Args:
+            rows: 세로 칸 수
+            cols: 가로 칸 수
+        """
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Grid must have at least one row and column, got {rows}x{cols}")
+        self.rows = rows
+        self.cols = cols
+        self.total_zones = rows * cols
+        zones = range(1, self.total_zones + 1)
+
+        # Zone -> row / col / (row, col)
+        self.row: List[int] = [0] + [(z - 1) // cols for z in zones]
+        self.col: List[int] = [0] + [(z - 1) % cols for z in zones]
+        self.coords: List[Tuple[int, int]] = [(0, 0)] + [(self.row[z], self.col[z]) for z in zones]
+
+        # [zone1][zone2] -> 맨해튼 거리
+        self.distance: List[List[int]] = [[0] * (self.total_zones + 1)]
+        for z1 in zones:
+            self.distance.append(
+                [0]
+                + [
+                    abs(self.row[z1] - self.row[z2]) + abs(self.col[z1] - self.col[z2])
+                    for z2 in zones
+                ]
+            )
+
+        # Zone -> 상하좌우 인접 Zone (Zone 번호 순)
+        self.adjacent: List[Tuple[int, ...]] = [()] + [
+            tuple(z2 for z2 in zones if self.distance[z1][z2] == 1) for z1 in zones
+        ]
+
+        # Zone -> 거리순 Zone 목록 (거리가 같으면 Zone 번호 순, 자기 자신이 첫 번째)
+        self.zones_by_distance: List[Tuple[int, ...]] = [()] + [
+            tuple(sorted(zones, key=lambda z2, z1=z1: (self.distance[z1][z2], z2))) for z1 in zones
+        ]
+
+    def is_valid(self, zone: int) -> bool:
+        """격자 안의 Zone 번호인지 확인"""
+        return 1 <= zone <= self.total_zones
+
+
+# 기본 5x3 격자 테이블
+GEOMETRY = ZoneGeometry(ZONE_ROWS, ZONE_COLS)
+ZONE_ROW = GEOMETRY.row
+ZONE_COL = GEOMETRY.col
+ZONE_DISTANCE = GEOMETRY.distance
+ADJACENT_ZONES = GEOMETRY.adjacent
+ZONES_BY_DISTANCE = GEOMETRY.zones_by_distance
+
+
+def _validate_zone(zone: int):
+    """Zone 번호 범위 검사"""
+    if not (1 <= zone <= TOTAL_ZONES):
+        raise ValueError(f"Zone must be between 1 and {TOTAL_ZONES}, got {zone}")
+
+
 def zone_to_coords(zone: int) -> Tuple[int, int]:
     """Zone 번호를 좌표(row, col)로 변환
     
@@ -28,13 +95,8 @@ def zone_to_coords(zone: int) -> Tuple[int, int]:
     Returns:
         (row, col) 튜플 (0-based)
     """
-    if not (1 <= zone <= TOTAL_ZONES):
-        raise ValueError(f"Zone must be between 1 and {TOTAL_ZONES}, got {zone}")
-    
-    zone_idx = zone - 1  # 0-based로 변환
-    row = zone_idx // ZONE_COLS
-    col = zone_idx % ZONE_COLS
-    return (row, col)
+    _validate_zone(zone)
+    return GEOMETRY.coords[zone]
 
 
 def coords_to_zone(row: int, col: int) -> int:
@@ -68,11 +130,9 @@ def calculate_distance(zone1: int, zone2: int) -> int:
     Returns:
         거리 (정수)
     """
-    row1, col1 = zone_to_coords(zone1)
-    row2, col2 = zone_to_coords(zone2)
-    
-    distance = abs(row1 - row2) + abs(col1 - col2)
-    return distance
+    _validate_zone(zone1)
+    _validate_zone(zone2)
+    return ZONE_DISTANCE[zone1][zone2]
 
 
 def get_zone_row(zone: int) -> int:
@@ -81,8 +141,8 @@ def get_zone_row(zone: int) -> int:
     Returns:
         0 (후방) ~ 4 (전방)
     """
-    row, _ = zone_to_coords(zone)
-    return row
+    _validate_zone(zone)
+    return ZONE_ROW[zone]
 
 
 def get_zone_col(zone: int) -> int:
@@ -91,8 +151,20 @@ def get_zone_col(zone: int) -> int:
     Returns:
         0 (좌측) ~ 2 (우측)
     """
-    _, col = zone_to_coords(zone)
-    return col
+    _validate_zone(zone)
+    return ZONE_COL[zone]
+
+
+def get_adjacent_zones(zone: int) -> Tuple[int, ...]:
+    """상하좌우로 인접한 Zone 목록 반환"""
+    _validate_zone(zone)
+    return ADJACENT_ZONES[zone]
+
+
+def get_zones_by_distance(zone: int) -> Tuple[int, ...]:
+    """Zone에서 가까운 순서로 정렬된 모든 Zone 반환 (거리가 같으면 Zone 번호 순)"""
+    _validate_zone(zone)
+    return ZONES_BY_DISTANCE[zone]
 
 
 def is_forward_zone(zone: int) -> bool:
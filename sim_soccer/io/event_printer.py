@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from sim_soccer.models.events import ActionEvent, HalfTimeEvent, KickOffEvent, MatchEvent
 from sim_soccer.models.match import MatchState
 from sim_soccer.models.player import PlayerState
 from sim_soccer.models.team import TeamState
@@ -230,3 +231,37 @@ class EventPrinter:
         print(f"전반 종료: {home_name} {home_score} - {away_score} {away_name}")
         print("=" * 60)
         print()
+
+    def print_event(self, event: MatchEvent, match_state: MatchState):
+        """스트리밍 이벤트 출력 (simulate_match_iter가 yield한 이벤트)
+        
+        Args:
+            event: 출력할 이벤트 (출력 형식이 없는 이벤트는 무시)
+            match_state: 이벤트가 발생한 경기 상태
+        """
+        if not self.enabled:
+            return
+        
+        if isinstance(event, ActionEvent):
+            if event.team == "home":
+                team, opponent = match_state.home_team, match_state.away_team
+            else:
+                team, opponent = match_state.away_team, match_state.home_team
+            if event.action_type == "tackle":
+                # 태클은 수비 팀 선수 기준으로 출력
+                self.print_tackle(event.tick, event.defender, opponent, event.success, match_state)
+            else:
+                self.print_action(
+                    event.tick,
+                    event.action_type,
+                    event.player,
+                    team,
+                    event.success,
+                    match_state,
+                    is_goal=event.is_goal,
+                    target_player=event.target_player,
+                )
+        elif isinstance(event, KickOffEvent):
+            self.print_match_start(match_state)
+        elif isinstance(event, HalfTimeEvent):
+            self.print_half_time(match_state)
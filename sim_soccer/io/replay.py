@@ -0,0 +1,524 @@
+"""경기 리플레이 (바이너리 형식)
+
+경기를 다시 시뮬레이션하지 않고 임의의 Tick 상태를 복원할 수 있도록, Tick마다의 결정과
+결과를 고정 크기 레코드로, 일정 간격의 경기 상태를 키프레임으로 저장한다.
+
+파일 구조 (리틀 엔디언):
+
+    magic "SSRP" | 형식 버전 (u16) | 헤더 길이 (u32) | 헤더 (UTF-8 JSON)
+    | Tick 레코드 x total_ticks | 키프레임 x len(keyframe_ticks)
+
+헤더에는 팀 구성(선수, 스탯, 전술), 시드, 키프레임 Tick 목록, 최종 결과가 들어간다.
+레코드와 키프레임은 크기가 고정되어 있어 오프셋 계산만으로 읽을 수 있으므로 파일을
+mmap으로 열면 헤더 외에는 필요한 부분만 읽는다.
+
+Tick 레코드는 그 Tick의 행동(Phase, 팀, 행동 ID, 선수 슬롯, 성공 확률, 판정 난수, 성공/골)과
+행동 후 바뀔 수 있는 상태(Phase, 공격 팀, 볼 위치/소유자, 점수, 모멘텀, 행동 선수의 Zone과
+체력, 통계 증가분)를 담는다. 선수는 로스터 순서의 인덱스(슬롯)로 표시한다.
+레코드와 키프레임은 모두 해당 Tick이 끝난 뒤(TickEndEvent)의 상태로, 행동이 없던 Tick도
+마찬가지다. 후반 시작 체력 회복처럼 레코드로 표현하지 않는 변화는 키프레임으로 넘기므로,
+첫 Tick과 전반 종료 Tick에는 항상 키프레임이 있다. 성공 확률과 판정 난수는 엔진과 같은
+float64로 저장하므로 `roll < success_rate`가 엔진의 판정과 항상 일치한다.
+
+Tick t의 상태는 t 이하의 가장 가까운 키프레임에 그 뒤의 레코드를 적용해 만들므로
+비용은 키프레임 간격에 비례한다. 이벤트 로그는 복원하지 않는다.
+"""
+
+import bisect
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sim_soccer.core.ids import ACTION_IDS, ACTION_NAMES, PHASE_IDS, PHASE_NAMES
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.models.events import ActionEvent, PhaseChangeEvent, TickEndEvent
+from sim_soccer.models.match import MatchState
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.team import TeamState
+
+MAGIC = b"SSRP"
+FORMAT_VERSION = 2
+DEFAULT_KEYFRAME_INTERVAL = 300  # 5분마다 키프레임
+
+_PREFIX = struct.Struct("<4sHI")
+# phase, 팀, 행동, 플래그, 공격자/수비자/패스 대상 슬롯, 행동 후 phase/공격 팀/볼 Zone,
+# 볼 소유자 ID, 홈/원정 볼 소유 슬롯, 홈/원정 모멘텀, 홈/원정 점수, 공격자 Zone,
+# 홈/원정 통계 증가 비트마스크, 성공 확률, 판정 난수, 공격자/수비자 체력
+_RECORD = struct.Struct("<BBBBBBBBBBhBBbbBBBBBdddd")
+_KEYFRAME_HEAD = struct.Struct("<HBBBBh")  # tick, half, phase, 공격 팀, 볼 Zone, 볼 소유자 ID
+
+NO_SLOT = 0xFF  # 선수 없음
+NO_HOLDER = -1  # 볼 소유자 없음 (ball_holder가 None)
+SIDES = ("home", "away")
+
+# 레코드 플래그
+FLAG_SUCCESS = 1
+FLAG_GOAL = 2
+FLAG_NO_ACTION = 4  # 공격자가 없어 행동이 없던 Tick
+
+
+@dataclass
+class TickRecord:
+    """한 Tick의 결정과 결과"""
+
+    tick: int
+    phase: str  # 행동이 선택된 Phase
+    team: str  # 행동한 팀 ("home" 또는 "away")
+    action_type: Optional[str]  # 행동이 없던 Tick이면 None
+    success: bool
+    is_goal: bool
+    attacker_slot: Optional[int]  # 행동 팀 로스터 인덱스
+    defender_slot: Optional[int]  # 상대 팀 로스터 인덱스
+    target_slot: Optional[int]  # 행동 팀 로스터 인덱스 (패스 대상)
+    success_rate: float
+    roll: float  # 판정 난수 (roll < success_rate이면 성공)
+    score: Tuple[int, int]  # 행동 후 (홈, 원정) 점수
+
+
+def _slot(slots: Dict[int, int], player: Optional[PlayerState]) -> int:
+    """선수의 로스터 슬롯 (선수가 없으면 NO_SLOT)"""
+    return NO_SLOT if player is None else slots[player.player_id]
+
+
+def _holder_slot(slots: Dict[int, int], team: TeamState) -> int:
+    """팀 볼 소유자의 로스터 슬롯"""
+    return _slot(slots, team.get_ball_holder())
+
+
+def _team_header(team: TeamState) -> Dict:
+    """헤더에 저장할 팀 구성 (경기 시작 시점)"""
+    return {
+        "team_id": team.team_id,
+        "team_name": team.team_name,
+        "formation": team.formation,
+        "tactics": dict(team.tactics),
+        "players": [
+            {
+                "player_id": p.player_id,
+                "name": p.name,
+                "position": p.position,
+                "stats": dict(p.stats),
+            }
+            for p in team.players
+        ],
+    }
+
+
+class _ReplayWriter:
+    """simulate_match_iter 이벤트를 받아 Tick이 끝날 때마다 레코드와 키프레임을 쌓는 기록기"""
+
+    def __init__(self, simulator: MatchSimulator, keyframe_interval: int):
+        """기록기 생성
+
+        Args:
+            simulator: 경기를 진행하는 시뮬레이터 (진행 중인 상태를 읽음)
+            keyframe_interval: 키프레임 간격 (Tick)
+        """
+        self.simulator = simulator
+        self.keyframe_interval = keyframe_interval
+        self.records = bytearray()
+        self.keyframes = bytearray()
+        self.keyframe_ticks: List[int] = []
+        self.action: Optional[ActionEvent] = None  # 진행 중인 Tick의 행동
+        self.phase = "build_up"  # 마지막으로 알려진 Phase (행동이 없던 Tick에 사용)
+        self.force_keyframe = False
+
+    def start(self, match_state: MatchState):
+        """경기 시작 시 슬롯 테이블과 통계 기준값 준비"""
+        self.teams = (match_state.home_team, match_state.away_team)
+        self.slots = tuple(
+            {p.player_id: i for i, p in reversed(list(enumerate(team.players)))}
+            for team in self.teams
+        )
+        self.stat_keys = list(match_state.home_team.stats)
+        self.stats = tuple(tuple(team.stats.data) for team in self.teams)
+        self.keyframe_struct = _keyframe_struct(
+            [len(team.players) for team in self.teams], len(self.stat_keys)
+        )
+
+    def on_event(self, event):
+        """이벤트 하나 처리 (TickEndEvent에서 그 Tick의 레코드 기록)"""
+        if isinstance(event, TickEndEvent):
+            self._write_record(event.tick, self.action)
+            self.action = None
+        elif isinstance(event, ActionEvent):
+            self.action = event
+        else:
+            self.phase = event.new_phase
+
+    def _write_record(self, tick: int, event: Optional[ActionEvent]):
+        """Tick 레코드 (와 필요하면 키프레임) 기록"""
+        state = self.simulator.match_state
+        home, away = self.teams
+        home_slots, away_slots = self.slots
+
+        stats = (tuple(home.stats.data), tuple(away.stats.data))
+        masks = [0, 0]
+        if stats != self.stats:
+            for side in (0, 1):
+                for index, (old, new) in enumerate(zip(self.stats[side], stats[side])):
+                    if new == old + 1:
+                        masks[side] |= 1 << index
+                    elif new != old:
+                        # 한 Tick에 2 이상 증가한 통계는 키프레임으로 넘김
+                        self.force_keyframe = True
+            self.stats = stats
+
+        if event is None:
+            flags = FLAG_NO_ACTION
+            phase, side, action = self.phase, state.attacking_team, 0
+            attacker = defender = target = None
+            success_rate = roll = 0.0
+        else:
+            flags = (FLAG_SUCCESS if event.success else 0) | (FLAG_GOAL if event.is_goal else 0)
+            phase, side = event.phase, event.team
+            action = ACTION_IDS[event.action_type]
+            attacker, defender, target = event.player, event.defender, event.target_player
+            success_rate, roll = event.success_rate, event.roll
+        if side == "home":
+            own_slots, other_slots = home_slots, away_slots
+        else:
+            own_slots, other_slots = away_slots, home_slots
+
+        self.records += _RECORD.pack(
+            PHASE_IDS[phase],
+            SIDES.index(side),
+            action,
+            flags,
+            _slot(own_slots, attacker),
+            _slot(other_slots, defender),
+            _slot(own_slots, target),
+            PHASE_IDS[state.current_phase],
+            SIDES.index(state.attacking_team),
+            state.ball_zone,
+            NO_HOLDER if state.ball_holder is None else state.ball_holder,
+            _holder_slot(home_slots, home),
+            _holder_slot(away_slots, away),
+            home.momentum,
+            away.momentum,
+            home.score,
+            away.score,
+            attacker.zone if attacker is not None else 0,
+            masks[0],
+            masks[1],
+            success_rate,
+            roll,
+            attacker.stamina if attacker is not None else 0.0,
+            defender.stamina if defender is not None else 0.0,
+        )
+        self.phase = state.current_phase
+
+        if (
+            self.force_keyframe
+            or tick % self.keyframe_interval == 0
+            or tick == self.simulator.HALF_TIME_TICK
+        ):
+            self._write_keyframe(state)
+            self.force_keyframe = False
+
+    def _write_keyframe(self, state: MatchState):
+        """Tick이 끝난 뒤의 전체 상태를 키프레임으로 기록"""
+        values = [
+            state.tick,
+            state.half,
+            PHASE_IDS[state.current_phase],
+            SIDES.index(state.attacking_team),
+            state.ball_zone,
+            NO_HOLDER if state.ball_holder is None else state.ball_holder,
+        ]
+        for team, slots in zip(self.teams, self.slots):
+            values += [team.score, team.momentum, _holder_slot(slots, team)]
+            values += team.stats.data
+            for player in team.players:
+                values += [player.zone, player.stamina]
+        self.keyframes += self.keyframe_struct.pack(*values)
+        self.keyframe_ticks.append(state.tick)
+
+
+def _keyframe_struct(player_counts: List[int], stat_count: int) -> struct.Struct:
+    """팀별 선수 수와 통계 개수에 맞는 키프레임 구조체"""
+    layout = _KEYFRAME_HEAD.format
+    for player_count in player_counts:
+        # 점수, 모멘텀, 볼 소유 슬롯, 통계, 선수별 (Zone, 체력)
+        layout += "BbB" + "I" * stat_count + "Bd" * player_count
+    return struct.Struct(layout)
+
+
+def record_match(
+    simulator: MatchSimulator,
+    home_team: TeamState,
+    away_team: TeamState,
+    random_seed: Optional[int] = None,
+    keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+) -> Tuple[MatchState, bytes]:
+    """경기를 진행하며 리플레이 기록
+
+    Args:
+        simulator: 경기를 진행할 시뮬레이터
+        home_team: 홈 팀 상태
+        away_team: 원정 팀 상태
+        random_seed: 랜덤 시드
+        keyframe_interval: 키프레임 간격 (Tick, 1 이상)
+
+    Returns:
+        (완료된 MatchState, 리플레이 바이트)
+    """
+    if keyframe_interval < 1:
+        raise ValueError(f"keyframe_interval must be at least 1, got {keyframe_interval}")
+    teams = [_team_header(home_team), _team_header(away_team)]
+    writer = _ReplayWriter(simulator, keyframe_interval)
+    events = simulator.simulate_match_iter(
+        home_team, away_team, random_seed, events=(ActionEvent, PhaseChangeEvent, TickEndEvent)
+    )
+    started = False
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            match_state = stop.value
+            break
+        if not started:
+            writer.start(simulator.match_state)
+            started = True
+        writer.on_event(event)
+
+    header = {
+        "match_id": match_state.match_id,
+        "seed": simulator.random_seed,
+        "total_ticks": simulator.TOTAL_TICKS,
+        "half_time_tick": simulator.HALF_TIME_TICK,
+        "keyframe_interval": keyframe_interval,
+        "keyframe_ticks": writer.keyframe_ticks,
+        "stat_keys": writer.stat_keys,
+        "teams": teams,
+        "result": {
+            "home_score": match_state.home_team.score,
+            "away_score": match_state.away_team.score,
+            "winner": match_state.winner,
+        },
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    data = b"".join(
+        (
+            _PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_bytes)),
+            header_bytes,
+            bytes(writer.records),
+            bytes(writer.keyframes),
+        )
+    )
+    return match_state, data
+
+
+class Replay:
+    """리플레이 읽기 (bytes 또는 mmap 위에서 필요한 레코드만 해석)
+
+    with Replay.open("match.ssrp") as replay:
+        state = replay.state_at(4200)  # 70분
+    """
+
+    def __init__(self, buffer, _mapped: Optional[mmap.mmap] = None):
+        """리플레이 버퍼 해석 (헤더만 읽음)
+
+        Args:
+            buffer: 리플레이 바이트 (bytes, memoryview, mmap 등)
+
+        Raises:
+            ValueError: 리플레이 형식이 아니거나 지원하지 않는 버전일 때
+        """
+        self._buffer = buffer
+        self._mapped = _mapped
+        magic, version, header_length = _PREFIX.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("not a sim_soccer replay")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported replay version: {version}")
+        start = _PREFIX.size
+        self.header: Dict = json.loads(bytes(buffer[start : start + header_length]))
+        self.total_ticks: int = self.header["total_ticks"]
+        self.keyframe_ticks: List[int] = self.header["keyframe_ticks"]
+        self._records_offset = start + header_length
+        self._keyframes_offset = self._records_offset + _RECORD.size * self.total_ticks
+        self._keyframe = _keyframe_struct(
+            [len(team["players"]) for team in self.header["teams"]], len(self.header["stat_keys"])
+        )
+
+    @classmethod
+    def open(cls, path: str) -> "Replay":
+        """리플레이 파일을 mmap으로 열기 (close 또는 with 블록으로 닫음)"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, _mapped=mapped)
+
+    def close(self):
+        """mmap으로 연 파일 닫기"""
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    def __enter__(self) -> "Replay":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        """Tick 레코드 수"""
+        return self.total_ticks
+
+    def record(self, tick: int) -> TickRecord:
+        """Tick 레코드 읽기"""
+        fields = self._unpack_record(tick)
+        flags = fields[3]
+        return TickRecord(
+            tick=tick,
+            phase=PHASE_NAMES[fields[0]],
+            team=SIDES[fields[1]],
+            action_type=None if flags & FLAG_NO_ACTION else ACTION_NAMES[fields[2]],
+            success=bool(flags & FLAG_SUCCESS),
+            is_goal=bool(flags & FLAG_GOAL),
+            attacker_slot=None if fields[4] == NO_SLOT else fields[4],
+            defender_slot=None if fields[5] == NO_SLOT else fields[5],
+            target_slot=None if fields[6] == NO_SLOT else fields[6],
+            success_rate=fields[20],
+            roll=fields[21],
+            score=(fields[15], fields[16]),
+        )
+
+    def state_at(self, tick: int) -> MatchState:
+        """Tick이 끝난 뒤의 경기 상태 복원 (가까운 키프레임 + 이후 레코드)
+
+        Args:
+            tick: 0 이상 total_ticks 미만의 Tick
+
+        Returns:
+            새로 만든 MatchState (이벤트 로그는 비어 있음)
+        """
+        if not 0 <= tick < self.total_ticks:
+            raise ValueError(f"tick must be between 0 and {self.total_ticks - 1}, got {tick}")
+        index = bisect.bisect_right(self.keyframe_ticks, tick) - 1
+        if index < 0:
+            raise ValueError(f"no keyframe at or before tick {tick}")
+        match_state = self._load_keyframe(index)
+        for t in range(self.keyframe_ticks[index] + 1, tick + 1):
+            self._apply_record(match_state, t)
+        if tick == self.total_ticks - 1:
+            match_state.finish_match()
+        return match_state
+
+    def _unpack_record(self, tick: int) -> tuple:
+        """Tick 레코드의 원시 필드"""
+        if not 0 <= tick < self.total_ticks:
+            raise ValueError(f"tick must be between 0 and {self.total_ticks - 1}, got {tick}")
+        return _RECORD.unpack_from(self._buffer, self._records_offset + _RECORD.size * tick)
+
+    def _load_keyframe(self, index: int) -> MatchState:
+        """키프레임으로 MatchState 생성"""
+        values = self._keyframe.unpack_from(
+            self._buffer, self._keyframes_offset + self._keyframe.size * index
+        )
+        tick, half, phase, attacking, ball_zone, ball_holder = values[:6]
+        position = 6
+        stat_keys = self.header["stat_keys"]
+        teams = []
+        for team_data in self.header["teams"]:
+            score, momentum, holder = values[position : position + 3]
+            position += 3
+            stats = dict(zip(stat_keys, values[position : position + len(stat_keys)]))
+            position += len(stat_keys)
+            players = []
+            for slot, player_data in enumerate(team_data["players"]):
+                zone, stamina = values[position : position + 2]
+                position += 2
+                players.append(
+                    PlayerState(
+                        player_id=player_data["player_id"],
+                        name=player_data["name"],
+                        position=player_data["position"],
+                        zone=zone,
+                        stats=dict(player_data["stats"]),
+                        stamina=stamina,
+                        has_ball=slot == holder,
+                    )
+                )
+            teams.append(
+                TeamState(
+                    team_id=team_data["team_id"],
+                    team_name=team_data["team_name"],
+                    formation=team_data["formation"],
+                    players=players,
+                    tactics=dict(team_data["tactics"]),
+                    score=score,
+                    momentum=momentum,
+                    stats=stats,
+                )
+            )
+        return MatchState(
+            match_id=self.header["match_id"],
+            tick=tick,
+            half=half,
+            home_team=teams[0],
+            away_team=teams[1],
+            current_phase=PHASE_NAMES[phase],
+            attacking_team=SIDES[attacking],
+            ball_zone=ball_zone,
+            ball_holder=None if ball_holder == NO_HOLDER else ball_holder,
+        )
+
+    def _apply_record(self, match_state: MatchState, tick: int):
+        """Tick 레코드의 결과를 경기 상태에 적용"""
+        (
+            _,
+            side,
+            _,
+            flags,
+            attacker_slot,
+            defender_slot,
+            _,
+            phase,
+            attacking,
+            ball_zone,
+            ball_holder,
+            home_holder,
+            away_holder,
+            home_momentum,
+            away_momentum,
+            home_score,
+            away_score,
+            attacker_zone,
+            home_mask,
+            away_mask,
+            _,
+            _,
+            attacker_stamina,
+            defender_stamina,
+        ) = self._unpack_record(tick)
+        home, away = match_state.home_team, match_state.away_team
+        own, other = (home, away) if side == 0 else (away, home)
+
+        match_state.tick = tick
+        match_state.half = 2 if tick >= self.header["half_time_tick"] else 1
+        match_state.current_phase = PHASE_NAMES[phase]
+        match_state.attacking_team = SIDES[attacking]
+        match_state.ball_zone = ball_zone
+        match_state.ball_holder = None if ball_holder == NO_HOLDER else ball_holder
+
+        if attacker_slot != NO_SLOT:
+            attacker = own.players[attacker_slot]
+            attacker.stamina = attacker_stamina
+            own.move_player(attacker, attacker_zone)
+        if defender_slot != NO_SLOT:
+            other.players[defender_slot].stamina = defender_stamina
+
+        for team, holder, momentum, score, mask in (
+            (home, home_holder, home_momentum, home_score, home_mask),
+            (away, away_holder, away_momentum, away_score, away_mask),
+        ):
+            team.set_ball_holder(None if holder == NO_SLOT else team.players[holder].player_id)
+            team.momentum = momentum
+            team.score = score
+            if mask:
+                for index, key in enumerate(self.header["stat_keys"]):
+                    if mask & (1 << index):
+                        team.stats[key] += 1
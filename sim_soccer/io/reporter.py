@@ -97,11 +97,7 @@ def generate_match_report(match_state: MatchState) -> str:
     report_lines.append("")
     
     # 주요 이벤트
-    important_events = [
-        e
-        for e in match_state.event_log
-        if e.event_type in ["goal", "shoot", "tackle", "intercept"]
-    ]
+    important_events = match_state.event_log.by_types(["goal", "shoot", "tackle", "intercept"])
     
     if important_events:
         report_lines.append("주요 이벤트:")
@@ -0,0 +1,261 @@
+"""팀 묶음 바이너리 형식 (프로세스 간 공유용)
+
+여러 팀과 대진(팀 인덱스 쌍)을 팀마다 고정 크기 숫자 레코드로 한 버퍼에 묶는다. 버퍼를
+`multiprocessing.shared_memory`나 mmap 파일로 한 번 공개하면, 워커는 TeamState를 피클로
+받지 않고 팀/대진 인덱스만으로 필요한 팀을 버퍼에서 직접 읽어 TeamTemplate을 만든다.
+
+파일 구조 (리틀 엔디언):
+
+    magic "SSTP" | 형식 버전 (u16) | 팀 수 (u32) | 팀당 최대 선수 수 (u16) | 대진 수 (u32)
+    | 문자열 테이블 길이 (u32) | 팀 레코드 x 팀 수 | 대진 (홈, 원정 팀 인덱스 u32) x 대진 수
+    | 문자열 테이블 (UTF-8 JSON 목록)
+
+팀 레코드는 팀 ID/이름/포메이션의 문자열 번호, 선수 수, 전술(Tactic 순서)과 최대 선수 수만큼의
+선수 칸(선수 ID, 이름 문자열 번호, 포지션, 스탯(Stat 순서))으로 이루어진다. 선수가 적은 팀의
+남는 칸은 0이다. 문자열은 묶음 전체에서 한 번씩만 저장하고, 열 때 한 번 읽는다.
+
+묶음에는 팀 구성만 저장하고 점수, 모멘텀, 통계, 선수 Zone/체력 같은 경기 상태는 저장하지
+않는다. 묶음에서 읽은 팀은 `TeamTemplate.from_team`처럼 항상 경기 시작 상태다.
+"""
+
+import json
+import mmap
+import struct
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sim_soccer.core.ids import STAT_NAMES, TACTIC_NAMES
+from sim_soccer.models.player import POSITION_WEIGHTS
+from sim_soccer.models.team import TeamState
+from sim_soccer.models.team_template import PlayerTemplate, TeamTemplate
+
+MAGIC = b"SSTP"
+FORMAT_VERSION = 2
+
+POSITIONS: Tuple[str, ...] = tuple(POSITION_WEIGHTS)  # 포지션 코드 -> 포지션
+
+_PREFIX = struct.Struct("<4sHIHII")
+# 팀 ID/이름/포메이션 문자열 번호, 선수 수, 전술
+_TEAM_FORMAT = f"IIIB{len(TACTIC_NAMES)}b"
+# 선수 ID, 이름 문자열 번호, 포지션 코드, 스탯
+_PLAYER_FORMAT = f"iIB{len(STAT_NAMES)}b"
+_PLAYER_FIELDS = 3 + len(STAT_NAMES)
+_TEAM_FIELDS = 4 + len(TACTIC_NAMES)
+_FIXTURE = struct.Struct("<II")
+
+Fixture = Tuple[int, int]
+
+
+def _record_struct(max_players: int) -> struct.Struct:
+    """팀 레코드 구조 (최대 선수 수에 따라 크기 결정)"""
+    return struct.Struct("<" + _TEAM_FORMAT + _PLAYER_FORMAT * max_players)
+
+
+def pack_teams(teams: Sequence[TeamState], fixtures: Sequence[Fixture] = ()) -> bytes:
+    """팀 목록과 대진을 바이너리로 묶음
+
+    Args:
+        teams: 팀 목록 (구성만 저장, 팀은 변경되지 않음)
+        fixtures: (홈 팀 인덱스, 원정 팀 인덱스) 목록
+
+    Returns:
+        묶음 바이트
+
+    Raises:
+        ValueError: 대진의 팀 인덱스가 범위를 벗어날 때
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def string_id(value: str) -> int:
+        value_id = string_ids.get(value)
+        if value_id is None:
+            value_id = string_ids[value] = len(strings)
+            strings.append(value)
+        return value_id
+
+    max_players = max((len(team.players) for team in teams), default=0)
+    record = _record_struct(max_players)
+    empty_player = (0,) * _PLAYER_FIELDS
+    records_offset = _PREFIX.size
+    fixtures_offset = records_offset + record.size * len(teams)
+    strings_offset = fixtures_offset + _FIXTURE.size * len(fixtures)
+    buffer = bytearray(strings_offset)
+
+    for index, team in enumerate(teams):
+        values = [
+            string_id(team.team_id),
+            string_id(team.team_name),
+            string_id(team.formation),
+            len(team.players),
+        ]
+        values += team.tactics.data
+        for player in team.players:
+            values += [player.player_id, string_id(player.name), POSITIONS.index(player.position)]
+            values += player.stats.data
+        for _ in range(max_players - len(team.players)):
+            values += empty_player
+        record.pack_into(buffer, records_offset + record.size * index, *values)
+
+    for index, (home, away) in enumerate(fixtures):
+        if not (0 <= home < len(teams) and 0 <= away < len(teams)):
+            raise ValueError(f"fixture {index} refers to a missing team: {(home, away)}")
+        _FIXTURE.pack_into(buffer, fixtures_offset + _FIXTURE.size * index, home, away)
+
+    string_table = json.dumps(strings, ensure_ascii=False).encode("utf-8")
+    _PREFIX.pack_into(
+        buffer,
+        0,
+        MAGIC,
+        FORMAT_VERSION,
+        len(teams),
+        max_players,
+        len(fixtures),
+        len(string_table),
+    )
+    return bytes(buffer) + string_table
+
+
+class TeamPack:
+    """팀 묶음 읽기 (bytes, mmap, 공유 메모리 위에서 필요한 레코드만 해석)
+
+    pack = TeamPack.publish(teams, fixtures)  # 부모 프로세스
+    worker_pack = TeamPack.attach(pack.name)  # 워커 프로세스
+    home, away = worker_pack.fixture(0)
+    home_team = worker_pack.template(home).acquire()
+    """
+
+    def __init__(
+        self,
+        buffer,
+        _mapped: Optional[mmap.mmap] = None,
+        _shared: Optional[shared_memory.SharedMemory] = None,
+    ):
+        """묶음 버퍼 해석 (문자열 테이블만 읽음)
+
+        Args:
+            buffer: 묶음 바이트 (bytes, memoryview, mmap 등)
+
+        Raises:
+            ValueError: 팀 묶음 형식이 아니거나 지원하지 않는 버전일 때
+        """
+        self._buffer = buffer
+        self._mapped = _mapped
+        self._shared = _shared
+        magic, version, team_count, max_players, fixture_count, strings_length = (
+            _PREFIX.unpack_from(buffer, 0)
+        )
+        if magic != MAGIC:
+            raise ValueError("not a sim_soccer team pack")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported team pack version: {version}")
+        self.team_count: int = team_count
+        self.fixture_count: int = fixture_count
+        self._record = _record_struct(max_players)
+        self._records_offset = _PREFIX.size
+        self._fixtures_offset = self._records_offset + self._record.size * team_count
+        strings_offset = self._fixtures_offset + _FIXTURE.size * fixture_count
+        self._strings: List[str] = json.loads(
+            bytes(buffer[strings_offset : strings_offset + strings_length])
+        )
+        self._templates: Dict[int, TeamTemplate] = {}
+
+    @classmethod
+    def open(cls, path: str) -> "TeamPack":
+        """묶음 파일을 mmap으로 열기 (close 또는 with 블록으로 닫음)"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, _mapped=mapped)
+
+    @classmethod
+    def publish(cls, teams: Sequence[TeamState], fixtures: Sequence[Fixture] = ()) -> "TeamPack":
+        """팀과 대진을 묶어 새 공유 메모리 블록으로 공개
+
+        다른 프로세스는 `name`으로 `attach`한다. 공개한 프로세스는 사용이 끝나면
+        `close` 후 `unlink`로 블록을 삭제해야 한다.
+        """
+        data = pack_teams(teams, fixtures)
+        shared = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        shared.buf[: len(data)] = data
+        return cls(shared.buf, _shared=shared)
+
+    @classmethod
+    def attach(cls, name: str) -> "TeamPack":
+        """공개된 공유 메모리 블록에 연결 (복사하지 않음)"""
+        shared = shared_memory.SharedMemory(name=name)
+        return cls(shared.buf, _shared=shared)
+
+    @property
+    def name(self) -> Optional[str]:
+        """공유 메모리 블록 이름 (공유 메모리가 아니면 None)"""
+        return self._shared.name if self._shared is not None else None
+
+    def close(self):
+        """mmap 파일 또는 공유 메모리 연결 닫기 (만든 템플릿은 계속 사용 가능)"""
+        self._buffer = None
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self._shared is not None:
+            self._shared.close()
+
+    def unlink(self):
+        """공유 메모리 블록 삭제 (공개한 프로세스에서 한 번 호출)"""
+        if self._shared is not None:
+            self._shared.unlink()
+            self._shared = None
+
+    def __enter__(self) -> "TeamPack":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        """팀 수"""
+        return self.team_count
+
+    def fixture(self, index: int) -> Fixture:
+        """대진의 (홈 팀 인덱스, 원정 팀 인덱스)"""
+        if not 0 <= index < self.fixture_count:
+            raise IndexError(f"fixture index out of range: {index}")
+        return _FIXTURE.unpack_from(self._buffer, self._fixtures_offset + _FIXTURE.size * index)
+
+    def template(self, index: int) -> TeamTemplate:
+        """팀 레코드의 템플릿 (팀마다 한 번만 만들어 재사용)"""
+        template = self._templates.get(index)
+        if template is None:
+            template = self._templates[index] = self._read_template(index)
+        return template
+
+    def team(self, index: int) -> TeamState:
+        """팀 레코드로 새 TeamState 생성"""
+        return self.template(index).instantiate()
+
+    def _read_template(self, index: int) -> TeamTemplate:
+        """팀 레코드 하나를 읽어 템플릿 생성"""
+        if not 0 <= index < self.team_count:
+            raise IndexError(f"team index out of range: {index}")
+        fields = self._record.unpack_from(
+            self._buffer, self._records_offset + self._record.size * index
+        )
+        strings = self._strings
+        players = []
+        for slot in range(fields[3]):
+            start = _TEAM_FIELDS + _PLAYER_FIELDS * slot
+            player_id, name_id, position = fields[start : start + 3]
+            players.append(
+                PlayerTemplate(
+                    player_id=player_id,
+                    name=strings[name_id],
+                    position=POSITIONS[position],
+                    stats=fields[start + 3 : start + _PLAYER_FIELDS],
+                )
+            )
+        return TeamTemplate(
+            team_id=strings[fields[0]],
+            team_name=strings[fields[1]],
+            formation=strings[fields[2]],
+            players=tuple(players),
+            tactics=fields[4:_TEAM_FIELDS],
+        )
@@ -0,0 +1 @@
+"""실시간 경기 진행 모듈"""
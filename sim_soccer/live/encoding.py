@@ -0,0 +1,195 @@
+"""실시간 스트리밍용 이벤트/상태 인코딩
+
+관전 클라이언트에 보내는 메시지는 두 종류다.
+
+- 키프레임: 경기 상태 전체 (`snapshot_state`). 처음 접속했을 때와 밀린 메시지를 버리고
+  다시 맞출 때 보낸다.
+- 업데이트: 슬롯 동안 발생한 이벤트 목록과 직전 업데이트 이후 바뀐 상태 필드(델타).
+
+상태 필드:
+
+    tick, half, phase, attacking, ball_zone  값 그대로
+    score, momentum                          [홈, 원정]
+    stamina_home, stamina_away               선수 순서대로 정수 체력 목록
+
+델타에서 체력 목록은 바뀐 선수만 `{"인덱스": 값}`으로 보낸다. 나머지 필드는 바뀐 값
+그대로 보낸다.
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from sim_soccer.models.events import (
+    ActionEvent,
+    FullTimeEvent,
+    GoalEvent,
+    HalfTimeEvent,
+    KickOffEvent,
+    MatchEvent,
+    PhaseChangeEvent,
+)
+from sim_soccer.models.match import MatchState
+
+# 델타에서 바뀐 선수만 보내는 목록 필드
+SPARSE_FIELDS = ("stamina_home", "stamina_away")
+
+
+def _player_id(player) -> Optional[int]:
+    """선수 ID (선수가 없으면 None)"""
+    return player.player_id if player is not None else None
+
+
+def event_to_dict(event: MatchEvent) -> Dict:
+    """스트리밍 이벤트를 JSON으로 보낼 수 있는 딕셔너리로 변환 (선수는 ID로 표시)
+
+    Args:
+        event: simulate_match_iter가 yield한 이벤트
+
+    Returns:
+        "type"과 "tick"을 포함한 딕셔너리
+    """
+    if isinstance(event, ActionEvent):
+        return {
+            "type": "action",
+            "tick": event.tick,
+            "team": event.team,
+            "action": event.action_type,
+            "success": event.success,
+            "player": _player_id(event.player),
+            "defender": _player_id(event.defender),
+            "target": _player_id(event.target_player),
+            "goal": event.is_goal,
+        }
+    if isinstance(event, GoalEvent):
+        return {
+            "type": "goal",
+            "tick": event.tick,
+            "team": event.team,
+            "player": _player_id(event.player),
+            "score": [event.home_score, event.away_score],
+        }
+    if isinstance(event, PhaseChangeEvent):
+        return {
+            "type": "phase",
+            "tick": event.tick,
+            "from": event.old_phase,
+            "to": event.new_phase,
+        }
+    if isinstance(event, HalfTimeEvent):
+        return {
+            "type": "half_time",
+            "tick": event.tick,
+            "score": [event.home_score, event.away_score],
+        }
+    if isinstance(event, FullTimeEvent):
+        return {
+            "type": "full_time",
+            "tick": event.tick,
+            "score": [event.home_score, event.away_score],
+            "winner": event.winner,
+        }
+    if isinstance(event, KickOffEvent):
+        return {"type": "kickoff", "tick": event.tick}
+    raise TypeError(f"Unknown match event: {type(event).__name__}")
+
+
+def snapshot_state(match_state: MatchState) -> Dict:
+    """관전용 경기 상태 스냅샷 (키프레임)
+
+    Args:
+        match_state: 경기 상태
+
+    Returns:
+        상태 필드 딕셔너리
+    """
+    home = match_state.home_team
+    away = match_state.away_team
+    return {
+        "tick": match_state.tick,
+        "half": match_state.half,
+        "phase": match_state.current_phase,
+        "attacking": match_state.attacking_team,
+        "ball_zone": match_state.ball_zone,
+        "score": [home.score, away.score],
+        "momentum": [home.momentum, away.momentum],
+        "stamina_home": [round(p.stamina) for p in home.players],
+        "stamina_away": [round(p.stamina) for p in away.players],
+    }
+
+
+def diff_state(previous: Dict, current: Dict) -> Dict:
+    """두 스냅샷 사이의 델타 (바뀐 필드만, 체력 목록은 바뀐 선수만)"""
+    delta = {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if value == old:
+            continue
+        if key in SPARSE_FIELDS and old is not None and len(old) == len(value):
+            delta[key] = {str(i): v for i, (o, v) in enumerate(zip(old, value)) if o != v}
+        else:
+            delta[key] = value
+    return delta
+
+
+def apply_delta(state: Dict, delta: Dict) -> Dict:
+    """키프레임에 델타를 적용한 새 상태 반환 (클라이언트 쪽 복원 규칙)"""
+    result = dict(state)
+    for key, value in delta.items():
+        if key in SPARSE_FIELDS and isinstance(value, dict):
+            values = list(result[key])
+            for index, v in value.items():
+                values[int(index)] = v
+            result[key] = values
+        else:
+            result[key] = value
+    return result
+
+
+def encode_sse(event_name: str, payload: Dict) -> bytes:
+    """Server-Sent Events 프레임으로 인코딩"""
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event_name}\ndata: {data}\n\n".encode("utf-8")
+
+
+class StateDeltaEncoder:
+    """한 경기의 방송 메시지 인코더
+
+    업데이트마다 상태를 한 번만 스냅샷/인코딩하고, 만든 프레임은 모든 구독자가 공유한다.
+    키프레임도 업데이트 번호(seq)마다 한 번만 인코딩한다.
+    """
+
+    def __init__(self):
+        """빈 상태로 인코더 생성"""
+        self.seq = 0  # 마지막 업데이트 번호
+        self.state: Dict = {}  # 마지막 업데이트 시점의 전체 상태
+        self.events: List[Dict] = []  # 마지막 업데이트의 이벤트
+        self.encoded_frames = 0
+        self._keyframe: Optional[bytes] = None  # 현재 seq의 키프레임 (필요할 때 인코딩)
+
+    def update(self, match_state: MatchState, events: List[MatchEvent]) -> bytes:
+        """이벤트 목록과 상태 델타를 업데이트 프레임으로 인코딩
+
+        Args:
+            match_state: 현재 경기 상태
+            events: 이번 슬롯의 이벤트
+
+        Returns:
+            SSE "update" 프레임
+        """
+        current = snapshot_state(match_state)
+        delta = diff_state(self.state, current)
+        self.state = current
+        self.events = [event_to_dict(event) for event in events]
+        self.seq += 1
+        self._keyframe = None
+        self.encoded_frames += 1
+        return encode_sse("update", {"seq": self.seq, "events": self.events, "delta": delta})
+
+    def keyframe(self) -> bytes:
+        """마지막 업데이트 시점의 전체 상태(와 그 업데이트의 이벤트)를 키프레임으로 인코딩"""
+        if self._keyframe is None:
+            self._keyframe = encode_sse(
+                "keyframe", {"seq": self.seq, "events": self.events, "state": self.state}
+            )
+            self.encoded_frames += 1
+        return self._keyframe
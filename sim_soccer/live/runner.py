@@ -0,0 +1,292 @@
+"""asyncio 실시간 경기 러너
+
+실시간 모드의 simulate_match는 Tick마다 `time.sleep`으로 속도를 맞추므로 경기 하나가
+스레드 하나를 경기 시간 내내 점유한다. LiveMatchRunner는 여러 경기의
+`simulate_match_iter`를 하나의 이벤트 루프에서 번갈아 진행한다.
+
+- 마감 시각 스케줄링: 경기마다 다음 이벤트의 예정 시각을 힙에 넣고, 가장 이른 예정
+  시각까지만 잠든다. Tick마다 잠들지 않는다.
+- 슬롯 배치: 깨어났을 때 `now + slot` 안에 예정된 이벤트는 모든 경기에서 한 번에
+  처리한다. 이벤트는 예정 시각보다 최대 `slot`만큼 일찍 전달될 수 있다.
+- 과부하: 처리가 밀리면 다음 깨어남에서 밀린 이벤트를 한 번에 따라잡는다(배치가 커져
+  경기당 비용은 줄어듦). 한 번 깨어나 처리하는 시간이 슬롯보다 길어지면 중간에 이벤트
+  루프에 양보해 구독자가 이벤트를 받게 한다.
+- 구독: 경기마다 여러 비동기 구독자가 `async for`로 이벤트를 받는다. 한 슬롯의 이벤트는
+  목록 하나로 묶어 구독자 큐에 넣으므로 큐 연산은 이벤트가 아니라 슬롯마다 한 번이다.
+
+    runner = LiveMatchRunner(slot=0.1)
+    match = runner.add_match(home_team, away_team, random_seed=42, duration=60.0)
+    subscription = match.subscribe()
+
+    async def watch():
+        async for event in subscription:
+            ...
+
+    await asyncio.gather(runner.run(), watch())
+"""
+
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple, Type
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.models.events import MatchEvent
+from sim_soccer.models.match import MatchState
+from sim_soccer.models.team import TeamState
+
+
+class Subscription:
+    """경기 이벤트 비동기 구독 (경기가 끝나면 반복 종료)"""
+
+    def __init__(self):
+        """빈 이벤트 큐로 구독 생성"""
+        # 슬롯별 이벤트 목록 (모든 구독자가 같은 목록을 공유하므로 수정하지 않음)
+        # 경기가 끝나면 None이 들어감
+        self.queue: "asyncio.Queue[Optional[List[MatchEvent]]]" = asyncio.Queue()
+        self._batch: List[MatchEvent] = []
+        self._index = 0
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> MatchEvent:
+        if self._index >= len(self._batch):
+            batch = await self.queue.get()
+            if batch is None:
+                self.queue.put_nowait(None)  # 다시 호출해도 종료 상태 유지
+                raise StopAsyncIteration
+            self._batch = batch
+            self._index = 0
+        event = self._batch[self._index]
+        self._index += 1
+        return event
+
+    async def batches(self):
+        """슬롯별 이벤트 목록을 그대로 받는 비동기 반복자 (이벤트 단위 반복보다 가벼움)"""
+        if self._index < len(self._batch):
+            yield self._batch[self._index :]
+            self._batch = []
+        while True:
+            batch = await self.queue.get()
+            if batch is None:
+                self.queue.put_nowait(None)
+                return
+            yield batch
+
+
+class LiveMatch:
+    """러너가 진행하는 실시간 경기
+
+    시뮬레이터는 다음 이벤트를 미리 계산해 두므로, `state`는 마지막으로 전달된 이벤트보다
+    최대 한 이벤트 앞선 상태일 수 있다.
+    """
+
+    def __init__(self, simulator: MatchSimulator, events, duration: float):
+        """실시간 경기 생성
+
+        Args:
+            simulator: 경기를 진행할 시뮬레이터 (경기마다 별도 인스턴스)
+            events: simulator.simulate_match_iter가 반환한 제너레이터
+            duration: 경기 진행 시간 (초 단위)
+        """
+        self.simulator = simulator
+        self.duration = duration
+        self.tick_duration = duration / MatchSimulator.TOTAL_TICKS
+        self.start_time: Optional[float] = None  # 러너가 처음 진행할 때 설정
+        self.subscribers: List[Subscription] = []
+        self.result: Optional[MatchState] = None  # 경기가 끝나면 설정
+        self._events = events
+        self._pending: Optional[MatchEvent] = None  # 계산했지만 아직 전달하지 않은 이벤트
+
+    @property
+    def state(self) -> Optional[MatchState]:
+        """진행 중인 경기 상태"""
+        return self.simulator.match_state
+
+    @property
+    def finished(self) -> bool:
+        """경기가 끝났는지 여부"""
+        return self.result is not None
+
+    def subscribe(self) -> Subscription:
+        """이후 전달되는 이벤트를 받을 구독 추가"""
+        subscription = Subscription()
+        if self.finished:
+            subscription.queue.put_nowait(None)
+        else:
+            self.subscribers.append(subscription)
+        return subscription
+
+    def due_time(self, event: MatchEvent) -> float:
+        """이벤트의 전달 예정 시각 (러너 시계 기준)"""
+        return self.start_time + event.tick * self.tick_duration
+
+
+@dataclass
+class PacingStats:
+    """이벤트 전달 시각 정확도 통계
+
+    지연(lag)은 실제 전달 시각 - 예정 시각이며, 슬롯 배치로 일찍 전달된 이벤트는 0으로 센다.
+    """
+
+    events: int = 0  # 전달한 이벤트 수
+    wakeups: int = 0  # 스케줄러가 깨어난 횟수
+    total_lag: float = 0.0
+    max_lag: float = 0.0
+    late_events: int = 0  # 한 슬롯보다 늦게 전달된 이벤트 수
+
+    @property
+    def mean_lag(self) -> float:
+        """평균 지연 (초)"""
+        return self.total_lag / self.events if self.events else 0.0
+
+
+class LiveMatchRunner:
+    """여러 실시간 경기를 하나의 이벤트 루프에서 진행하는 러너"""
+
+    def __init__(self, slot: float = 0.1, clock: Optional[Callable[[], float]] = None):
+        """러너 초기화
+
+        Args:
+            slot: 한 번에 처리하는 시간 폭 (초). 클수록 깨어나는 횟수가 줄고 전달이 일러짐
+            clock: 현재 시각 함수 (None이면 이벤트 루프의 시계)
+        """
+        if slot <= 0:
+            raise ValueError(f"slot must be positive, got {slot}")
+        self.slot = slot
+        self.clock = clock
+        self.stats = PacingStats()
+        # (예정 시각, 순번, 경기) 힙 (순번은 같은 시각의 경기 비교를 피하기 위함)
+        self._schedule: List[Tuple[float, int, LiveMatch]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def add_match(
+        self,
+        home_team: TeamState,
+        away_team: TeamState,
+        random_seed: Optional[int] = None,
+        duration: float = 60.0,
+        mode: str = "full",
+        events: Optional[Iterable[Type[MatchEvent]]] = None,
+    ) -> LiveMatch:
+        """경기 추가 (run 실행 중에도 추가 가능, 추가된 직후 시작)
+
+        러너는 진행 중인 경기만 참조하며, 끝난 경기는 반환된 LiveMatch를 가진 쪽만 참조한다.
+
+        Args:
+            home_team: 홈 팀 상태 (경기마다 별도 객체)
+            away_team: 원정 팀 상태 (경기마다 별도 객체)
+            random_seed: 랜덤 시드 (재현 가능성을 위해)
+            duration: 경기 진행 시간 (초 단위, 기본값: 60초)
+            mode: 실행 모드 ("full" 또는 "score_only")
+            events: 전달할 이벤트 타입 (None이면 전체)
+
+        Returns:
+            추가된 경기
+        """
+        simulator = MatchSimulator()
+        match = LiveMatch(
+            simulator,
+            simulator.simulate_match_iter(
+                home_team, away_team, random_seed, mode=mode, events=events
+            ),
+            duration,
+        )
+        # 시작 시각은 러너가 처음 꺼낼 때 정하므로 가장 앞에 배치
+        heapq.heappush(self._schedule, (float("-inf"), next(self._sequence), match))
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return match
+
+    async def run(self) -> PacingStats:
+        """추가된 모든 경기가 끝날 때까지 진행
+
+        Returns:
+            이벤트 전달 시각 통계
+        """
+        clock = self.clock or asyncio.get_running_loop().time
+        self._wakeup = asyncio.Event()
+        try:
+            while self._schedule:
+                now = clock()
+                horizon = now + self.slot
+                self.stats.wakeups += 1
+                # 이번 슬롯에 예정된 모든 경기의 이벤트를 한 번에 처리
+                yielded_at = now
+                while self._schedule and self._schedule[0][0] <= horizon:
+                    _, _, match = heapq.heappop(self._schedule)
+                    if match.start_time is None:
+                        match.start_time = now
+                    # 지연은 경기마다 실제 처리 시각으로 측정
+                    current = clock()
+                    self._advance(match, current, horizon)
+                    # 처리가 한 슬롯보다 길어지면 구독자가 이벤트를 받을 수 있도록 양보
+                    if current - yielded_at > self.slot:
+                        await asyncio.sleep(0)
+                        yielded_at = clock()
+                if self._schedule:
+                    await self._sleep(self._schedule[0][0] - clock())
+        finally:
+            self._wakeup = None
+        return self.stats
+
+    def _advance(self, match: LiveMatch, now: float, horizon: float):
+        """예정 시각이 horizon 이내인 경기 이벤트를 전달하고 다음 이벤트를 예약
+
+        Args:
+            match: 진행할 경기
+            now: 현재 시각 (지연 측정용)
+            horizon: 이번에 전달할 이벤트의 마지막 예정 시각
+        """
+        stats = self.stats
+        batch: List[MatchEvent] = []
+        event = match._pending
+        while True:
+            if event is None:
+                try:
+                    event = next(match._events)
+                except StopIteration as stop:
+                    match.result = stop.value
+                    match._pending = None
+                    self._deliver(match, batch)
+                    for subscription in match.subscribers:
+                        subscription.queue.put_nowait(None)
+                    return
+            due = match.due_time(event)
+            if due > horizon:
+                match._pending = event
+                heapq.heappush(self._schedule, (due, next(self._sequence), match))
+                self._deliver(match, batch)
+                return
+
+            lag = now - due
+            if lag > 0:
+                stats.total_lag += lag
+                if lag > stats.max_lag:
+                    stats.max_lag = lag
+                if lag > self.slot:
+                    stats.late_events += 1
+            stats.events += 1
+            batch.append(event)
+            event = None
+
+    @staticmethod
+    def _deliver(match: LiveMatch, batch: List[MatchEvent]):
+        """한 슬롯의 이벤트 목록을 모든 구독자에게 전달"""
+        if batch:
+            for subscription in match.subscribers:
+                subscription.queue.put_nowait(batch)
+
+    async def _sleep(self, delay: float):
+        """delay초 동안 또는 새 경기가 추가될 때까지 대기 (delay가 0 이하이면 양보만 함)"""
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
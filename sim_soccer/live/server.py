@@ -0,0 +1,451 @@
+"""로컬 실시간 경기 스트리밍 서버 (Server-Sent Events)
+
+표준 라이브러리 asyncio만으로 HTTP를 처리하며, LiveMatchRunner로 진행하는 경기를
+브라우저의 EventSource로 관전할 수 있게 한다.
+
+    GET  /                         관전 페이지
+    GET  /matches                  경기 목록 (JSON)
+    POST /matches                  경기 시작 {"home": 팀, "away": 팀, "seed": 1, "duration": 60}
+    GET  /matches/<id>/stream      경기 스트림 (SSE)
+
+잘못된 요청(JSON 객체가 아닌 본문, 없는 팀, 정수가 아닌 seed, 양수가 아닌 duration)에는
+400으로 응답한다. 끝난 경기의 채널은 목록에서 제거되므로, 이미 접속한 구독자만 종료 프레임까지
+받는다.
+
+스트림은 접속 직후 키프레임(전체 상태)을 보내고, 이후 슬롯마다 이벤트와 상태 델타를 담은
+업데이트를 보낸다(형식은 sim_soccer.live.encoding 참조). 프레임은 경기마다 한 번만 인코딩해
+모든 구독자가 공유한다. 구독자마다 보낼 프레임 큐의 길이가 제한되어 있어, 느린 클라이언트의
+큐가 가득 차면 밀린 델타를 모두 버리고 최신 키프레임 하나로 대체한다.
+
+사용법:
+    python -m sim_soccer.live.server --teams examples --port 8765
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import socket
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from loguru import logger
+
+from sim_soccer.io.team_loader import load_team
+from sim_soccer.live.encoding import StateDeltaEncoder, encode_sse
+from sim_soccer.live.runner import LiveMatch, LiveMatchRunner
+from sim_soccer.models.team import TeamState
+from sim_soccer.models.team_template import TeamTemplate
+
+# 스트림 종료 표시 (큐에 넣으면 전송 작업이 "end" 프레임을 보내고 연결을 닫음)
+_END_OF_STREAM = None
+
+VIEWER_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>sim-soccer live</title></head>
+<body>
+<h1>sim-soccer live</h1>
+<p>match <input id="match" size="4" value="1"> <button onclick="watch()">watch</button></p>
+<pre id="state"></pre>
+<ol id="events" reversed></ol>
+<script>
+let source = null;
+function watch() {
+  if (source) source.close();
+  let state = {};
+  const events = document.getElementById("events");
+  events.innerHTML = "";
+  const show = (message) => {
+    for (const e of message.events) {
+      if (e.type === "action" && !e.goal) continue;
+      const item = document.createElement("li");
+      item.textContent = JSON.stringify(e);
+      events.prepend(item);
+    }
+    document.getElementById("state").textContent = JSON.stringify(state, null, 1);
+  };
+  source = new EventSource("/matches/" + document.getElementById("match").value + "/stream");
+  source.addEventListener("keyframe", (m) => {
+    const message = JSON.parse(m.data);
+    state = message.state;
+    show(message);
+  });
+  source.addEventListener("update", (m) => {
+    const message = JSON.parse(m.data);
+    for (const [key, value] of Object.entries(message.delta)) {
+      if (key.startsWith("stamina_") && !Array.isArray(value)) {
+        for (const [i, v] of Object.entries(value)) state[key][i] = v;
+      } else {
+        state[key] = value;
+      }
+    }
+    show(message);
+  });
+  source.addEventListener("end", () => source.close());
+}
+</script>
+</body></html>
+"""
+
+
+class ChannelClient:
+    """경기 채널의 구독자 하나 (보낼 프레임 큐)"""
+
+    def __init__(self, max_pending: int):
+        """구독자 생성
+
+        Args:
+            max_pending: 보내지 못하고 쌓아 둘 수 있는 최대 프레임 수
+        """
+        self.queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=max_pending)
+        self.dropped = 0  # 버린 프레임 수
+
+    def offer(self, frame: Optional[bytes], keyframe) -> int:
+        """프레임을 큐에 넣고, 큐가 가득 차 있으면 밀린 프레임을 버리고 키프레임으로 대체
+
+        Args:
+            frame: 보낼 프레임 (None이면 스트림 종료)
+            keyframe: 현재 키프레임을 반환하는 함수 (큐가 가득 찼을 때만 호출)
+
+        Returns:
+            이번에 버린 프레임 수
+        """
+        queue = self.queue
+        if not queue.full():
+            queue.put_nowait(frame)
+            return 0
+        dropped = 0
+        while not queue.empty():
+            queue.get_nowait()
+            dropped += 1
+        # 키프레임이 이번 업데이트까지 포함하므로 프레임 대신 키프레임을 넣음
+        queue.put_nowait(keyframe())
+        if frame is _END_OF_STREAM:
+            queue.put_nowait(_END_OF_STREAM)
+        self.dropped += dropped
+        return dropped
+
+
+class MatchChannel:
+    """한 경기의 방송 채널
+
+    러너 구독에서 슬롯별 이벤트 목록을 받아 업데이트 프레임을 한 번 인코딩하고
+    모든 구독자 큐에 넣는다.
+    """
+
+    def __init__(
+        self,
+        channel_id: str,
+        match: LiveMatch,
+        home_name: str,
+        away_name: str,
+        max_pending: int = 8,
+    ):
+        """방송 채널 생성
+
+        Args:
+            channel_id: 채널 ID (URL에 사용)
+            match: 러너가 진행하는 경기
+            home_name: 홈 팀 이름
+            away_name: 원정 팀 이름
+            max_pending: 구독자마다 쌓아 둘 수 있는 최대 프레임 수
+        """
+        self.channel_id = channel_id
+        self.match = match
+        self.home_name = home_name
+        self.away_name = away_name
+        self.max_pending = max_pending
+        self.encoder = StateDeltaEncoder()
+        self.clients: Set[ChannelClient] = set()
+        self.finished = False
+        self.delivered_frames = 0  # 구독자 큐에 넣은 프레임 수 (공유 프레임 포함)
+        self.dropped_frames = 0
+        self._subscription = match.subscribe()
+
+    def add_client(self) -> ChannelClient:
+        """구독자 추가 (현재 키프레임부터 받음, 경기가 끝났으면 키프레임 후 종료)"""
+        client = ChannelClient(self.max_pending)
+        if self.encoder.seq:
+            client.queue.put_nowait(self.encoder.keyframe())
+        if self.finished:
+            client.queue.put_nowait(_END_OF_STREAM)
+        else:
+            self.clients.add(client)
+        return client
+
+    def remove_client(self, client: ChannelClient):
+        """구독자 제거"""
+        self.clients.discard(client)
+
+    async def pump(self):
+        """경기가 끝날 때까지 슬롯별 이벤트를 방송"""
+        async for events in self._subscription.batches():
+            frame = self.encoder.update(self.match.state, events)
+            self._broadcast(frame)
+        self.finished = True
+        self._broadcast(_END_OF_STREAM)
+        self.clients.clear()
+
+    @property
+    def end_frame(self) -> bytes:
+        """스트림 종료 프레임"""
+        return encode_sse("end", {"seq": self.encoder.seq})
+
+    def _broadcast(self, frame: Optional[bytes]):
+        """모든 구독자에게 같은 프레임 전달"""
+        keyframe = self.encoder.keyframe
+        for client in self.clients:
+            self.dropped_frames += client.offer(frame, keyframe)
+            self.delivered_frames += 1
+
+    def summary(self) -> Dict:
+        """경기 목록용 요약"""
+        state = self.match.state
+        return {
+            "id": self.channel_id,
+            "home": self.home_name,
+            "away": self.away_name,
+            "score": [state.home_team.score, state.away_team.score] if state else [0, 0],
+            "finished": self.finished,
+            "subscribers": len(self.clients),
+        }
+
+
+class LiveMatchServer:
+    """실시간 경기 SSE 스트리밍 서버"""
+
+    def __init__(
+        self,
+        teams: Dict[str, TeamState],
+        runner: Optional[LiveMatchRunner] = None,
+        max_pending: int = 8,
+        send_buffer: Optional[int] = 65536,
+    ):
+        """서버 초기화
+
+        Args:
+            teams: 이름 -> 팀 (생성 시 템플릿으로 고정하고 경기마다 새 팀을 만들어 사용)
+            runner: 경기를 진행할 러너 (None이면 새로 생성)
+            max_pending: 구독자마다 쌓아 둘 수 있는 최대 프레임 수 (2 이상)
+            send_buffer: 스트림 연결의 커널 송신 버퍼 크기 (바이트, None이면 OS 기본값).
+                버퍼가 크면 느린 클라이언트의 밀린 프레임이 커널에 쌓여 버려지지 않음
+        """
+        if max_pending < 2:
+            raise ValueError(f"max_pending must be at least 2, got {max_pending}")
+        self.teams = teams
+        self.templates: Dict[str, TeamTemplate] = {
+            name: TeamTemplate.from_team(team) for name, team in teams.items()
+        }
+        self.runner = runner or LiveMatchRunner()
+        self.max_pending = max_pending
+        self.send_buffer = send_buffer
+        self.channels: Dict[str, MatchChannel] = {}  # 진행 중인 경기의 채널
+        self._channel_ids = itertools.count(1)
+        self._tasks: Set[asyncio.Task] = set()
+        self._runner_task: Optional[asyncio.Task] = None
+
+    def start_match(
+        self,
+        home: str,
+        away: str,
+        random_seed: Optional[int] = None,
+        duration: float = 60.0,
+    ) -> MatchChannel:
+        """경기를 시작하고 방송 채널 반환 (이벤트 루프 안에서 호출)
+
+        Args:
+            home: 홈 팀 이름
+            away: 원정 팀 이름
+            random_seed: 랜덤 시드
+            duration: 경기 진행 시간 (초 단위)
+
+        Returns:
+            방송 채널
+
+        Raises:
+            KeyError: 팀 이름이 없을 때
+            ValueError: duration이 양의 유한한 값이 아닐 때
+        """
+        if not (math.isfinite(duration) and duration > 0):
+            raise ValueError(f"duration must be a positive number, got {duration}")
+        home_team = self.templates[home].instantiate()
+        away_team = self.templates[away].instantiate()
+        match = self.runner.add_match(
+            home_team, away_team, random_seed=random_seed, duration=duration
+        )
+        channel_id = str(next(self._channel_ids))
+        channel = MatchChannel(
+            channel_id, match, home_team.team_name, away_team.team_name, self.max_pending
+        )
+        self.channels[channel_id] = channel
+        self._spawn(self._pump(channel))
+        # 러너는 진행할 경기가 없으면 끝나므로 필요할 때 다시 시작
+        if self._runner_task is None or self._runner_task.done():
+            self._runner_task = self._spawn(self.runner.run())
+        logger.info(f"Live match {channel_id} started: {home} vs {away} (seed: {random_seed})")
+        return channel
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """HTTP 서버 시작 (port가 0이면 임의의 빈 포트)"""
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _pump(self, channel: MatchChannel):
+        """채널을 경기 끝까지 방송하고 목록에서 제거"""
+        try:
+            await channel.pump()
+        finally:
+            self.channels.pop(channel.channel_id, None)
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        """백그라운드 작업 시작 (완료될 때까지 참조 유지)"""
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """HTTP 요청 하나 처리 (연결당 요청 하나)"""
+        try:
+            try:
+                method, path, body = await _read_request(reader)
+                await self._route(writer, method, path, body)
+            except ValueError as e:
+                await _respond_json(writer, 400, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # 클라이언트가 연결을 끊음
+        finally:
+            writer.close()
+
+    async def _route(self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes):
+        """경로별 요청 처리"""
+        if method == "GET" and path == "/":
+            await _respond(writer, 200, VIEWER_PAGE.encode("utf-8"), "text/html; charset=utf-8")
+        elif method == "GET" and path == "/matches":
+            await _respond_json(writer, 200, [c.summary() for c in self.channels.values()])
+        elif method == "POST" and path == "/matches":
+            await self._handle_start(writer, body)
+        elif method == "GET" and path.startswith("/matches/") and path.endswith("/stream"):
+            channel = self.channels.get(path[len("/matches/") : -len("/stream")])
+            if channel is None:
+                await _respond_json(writer, 404, {"error": "unknown match"})
+            else:
+                await self._stream(channel, writer)
+        else:
+            await _respond_json(writer, 404, {"error": "not found"})
+
+    async def _handle_start(self, writer: asyncio.StreamWriter, body: bytes):
+        """경기 시작 요청 처리 (잘못된 요청은 400)"""
+        try:
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("request body must be a JSON object")
+            seed = request.get("seed")
+            if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+                raise ValueError(f"seed must be an integer, got {seed!r}")
+            duration = request.get("duration", 60.0)
+            if not isinstance(duration, (int, float)) or isinstance(duration, bool):
+                raise ValueError(f"duration must be a number, got {duration!r}")
+            channel = self.start_match(
+                request["home"], request["away"], random_seed=seed, duration=float(duration)
+            )
+        except KeyError as e:
+            await _respond_json(writer, 400, {"error": f"unknown or missing team: {e}"})
+            return
+        except ValueError as e:
+            await _respond_json(writer, 400, {"error": str(e)})
+            return
+        await _respond_json(writer, 201, channel.summary())
+
+    async def _stream(self, channel: MatchChannel, writer: asyncio.StreamWriter):
+        """구독자 큐의 프레임을 연결로 전송 (느린 연결은 drain에서 대기하고 큐가 참)"""
+        sock = writer.get_extra_info("socket")
+        if self.send_buffer is not None and sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        client = channel.add_client()
+        try:
+            while True:
+                frame = await client.queue.get()
+                if frame is _END_OF_STREAM:
+                    writer.write(channel.end_frame)
+                    await writer.drain()
+                    break
+                writer.write(frame)
+                await writer.drain()
+        finally:
+            channel.remove_client(client)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+    """요청 줄, 헤더, 본문 읽기 (쿼리 문자열은 무시)"""
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) < 2:
+        raise ValueError("malformed request line")
+    method, target = request_line[0], request_line[1]
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], body
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str):
+    """본문이 있는 응답 전송"""
+    reasons = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found"}
+    writer.write(
+        f"HTTP/1.1 {status} {reasons[status]}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+
+
+async def _respond_json(writer: asyncio.StreamWriter, status: int, payload):
+    """JSON 응답 전송"""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    await _respond(writer, status, body, "application/json; charset=utf-8")
+
+
+def load_teams(directory: str) -> Dict[str, TeamState]:
+    """디렉터리의 팀 JSON 파일을 모두 로드 (파일 이름(확장자 제외) -> 팀)"""
+    return {path.stem: load_team(str(path)) for path in sorted(Path(directory).glob("*.json"))}
+
+
+async def serve(teams: Dict[str, TeamState], host: str, port: int, slot: float):
+    """서버를 시작하고 종료될 때까지 실행"""
+    server = LiveMatchServer(teams, LiveMatchRunner(slot=slot))
+    http = await server.start(host, port)
+    logger.info(f"Serving live matches on http://{host}:{port}/ (teams: {', '.join(teams)})")
+    async with http:
+        await http.serve_forever()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="실시간 경기 스트리밍 서버")
+    parser.add_argument("--teams", type=str, default="examples", help="팀 JSON 파일 디렉터리")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--slot", type=float, default=0.25, help="스케줄링 슬롯 (초)")
+    args = parser.parse_args()
+
+    teams = load_teams(args.teams)
+    try:
+        asyncio.run(serve(teams, args.host, args.port, args.slot))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
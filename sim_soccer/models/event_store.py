@@ -0,0 +1,218 @@
+"""열 기반 이벤트 로그 저장소
+
+`MatchState.event_log`는 이벤트마다 EventLog 객체를 만들지 않고 필드별 타입 배열(열)에
+저장한다. 문자열 필드(Phase, 이벤트 타입, 팀, 행동, 결과)는 저장소마다 하나의 문자열
+테이블로 정수 ID를 부여해 저장하고, 선택 필드(설명, 사용된 스탯, 전술 영향)는 값이 있는 행만 따로 보관한다.
+설명을 생략한 행은 읽을 때 행동과 결과로 기본 설명("tackle success")을 만든다.
+
+이벤트 타입별 행 번호 인덱스를 유지하므로 타입별 조회(`by_type`)는 전체를 훑지 않는다.
+행을 읽으면 EventLog를 그때 만들어 반환하므로 기존 코드는 목록처럼 사용할 수 있다.
+"""
+
+from array import array
+from collections.abc import Sequence
+from heapq import merge
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sim_soccer.models.events import EventLog
+
+_NONE = -1  # 값 없음 (정수 ID/선수 ID 열)
+
+
+class _Interner:
+    """문자열 <-> 정수 ID 테이블 (처음 나온 순서대로 ID 부여)"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def id_of(self, value: Optional[str]) -> int:
+        """문자열의 ID (None이면 _NONE, 처음 보는 문자열이면 새 ID)"""
+        if value is None:
+            return _NONE
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def value_of(self, value_id: int) -> Optional[str]:
+        """ID의 문자열"""
+        return None if value_id == _NONE else self.values[value_id]
+
+
+class _EventSequence(Sequence):
+    """EventLog 목록처럼 비교/출력되는 읽기 전용 시퀀스"""
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, _EventSequence)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class EventView(_EventSequence):
+    """저장소 행 일부에 대한 읽기 전용 보기 (행을 읽을 때 EventLog 생성)"""
+
+    def __init__(self, store: "EventStore", rows):
+        """보기 생성
+
+        Args:
+            store: 이벤트 저장소
+            rows: 보기에 포함할 행 번호 (오름차순)
+        """
+        self._store = store
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._store.row(row) for row in self._rows[index]]
+        return self._store.row(self._rows[index])
+
+
+class EventStore(_EventSequence):
+    """열 기반 이벤트 로그 (EventLog 목록과 같은 방식으로 읽을 수 있음)"""
+
+    def __init__(self, events: Iterable[EventLog] = ()):
+        """저장소 생성
+
+        Args:
+            events: 처음에 넣을 이벤트
+        """
+        self.ticks = array("i")
+        self.phase_ids = array("h")
+        self.event_type_ids = array("h")
+        self.team_ids = array("h")
+        self.player_ids = array("i")
+        self.action_ids = array("h")
+        self.result_ids = array("h")
+        self._strings = _Interner()  # 모든 문자열 열이 공유
+        # 값을 지정한 행만 보관하는 선택 필드 (처음 필요할 때 생성)
+        self._descriptions: Optional[Dict[int, Optional[str]]] = None
+        self._stats_used: Optional[Dict[int, Dict[str, float]]] = None
+        self._tactics_impact: Optional[Dict[int, Dict[str, float]]] = None
+        self._type_rows: Dict[int, array] = {}  # 이벤트 타입 ID -> 행 번호
+        for event in events:
+            self.append(event)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(row) for row in range(len(self))[index]]
+        return self.row(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[EventLog]:
+        for row in range(len(self.ticks)):
+            yield self.row(row)
+
+    def record(
+        self,
+        tick: int,
+        phase: str,
+        event_type: str,
+        team: str,
+        player_id: Optional[int] = None,
+        action: Optional[str] = None,
+        result: Optional[str] = None,
+        description: Optional[str] = None,
+        stats_used: Optional[Dict[str, float]] = None,
+        tactics_impact: Optional[Dict[str, float]] = None,
+    ):
+        """이벤트 한 행 추가 (EventLog 객체를 만들지 않음)
+
+        인자는 EventLog 필드와 같다. description을 생략하면 저장하지 않고, 읽을 때
+        "{action} {result}"로 만든다.
+        """
+        row = len(self.ticks)
+        strings = self._strings
+        self.ticks.append(tick)
+        self.phase_ids.append(strings.id_of(phase))
+        type_id = strings.id_of(event_type)
+        self.event_type_ids.append(type_id)
+        self.team_ids.append(strings.id_of(team))
+        self.player_ids.append(_NONE if player_id is None else player_id)
+        self.action_ids.append(strings.id_of(action))
+        self.result_ids.append(strings.id_of(result))
+        if description is not None:
+            self._set_description(row, description)
+        if stats_used is not None:
+            if self._stats_used is None:
+                self._stats_used = {}
+            self._stats_used[row] = stats_used
+        if tactics_impact is not None:
+            if self._tactics_impact is None:
+                self._tactics_impact = {}
+            self._tactics_impact[row] = tactics_impact
+        rows = self._type_rows.get(type_id)
+        if rows is None:
+            rows = self._type_rows[type_id] = array("i")
+        rows.append(row)
+
+    def _set_description(self, row: int, description: Optional[str]):
+        """행의 설명 지정 (None이면 설명 없음)"""
+        if self._descriptions is None:
+            self._descriptions = {}
+        self._descriptions[row] = description
+
+    def append(self, event: EventLog):
+        """EventLog 하나 추가 (list.append 호환)"""
+        self.record(
+            event.tick,
+            event.phase,
+            event.event_type,
+            event.team,
+            event.player_id,
+            event.action,
+            event.result,
+            event.description,
+            event.stats_used,
+            event.tactics_impact,
+        )
+        if event.description is None:
+            # 설명이 없던 EventLog는 읽을 때도 설명 없이 반환
+            self._set_description(len(self.ticks) - 1, None)
+
+    def row(self, row: int) -> EventLog:
+        """행 하나를 EventLog로 만들어 반환"""
+        strings = self._strings
+        player_id = self.player_ids[row]
+        action = strings.value_of(self.action_ids[row])
+        result = strings.value_of(self.result_ids[row])
+        if self._descriptions is not None and row in self._descriptions:
+            description = self._descriptions[row]
+        elif action is not None and result is not None:
+            description = f"{action} {result}"
+        else:
+            description = None
+        return EventLog(
+            tick=self.ticks[row],
+            phase=strings.value_of(self.phase_ids[row]),
+            event_type=strings.value_of(self.event_type_ids[row]),
+            team=strings.value_of(self.team_ids[row]),
+            player_id=None if player_id == _NONE else player_id,
+            action=action,
+            result=result,
+            stats_used=self._stats_used.get(row) if self._stats_used else None,
+            tactics_impact=self._tactics_impact.get(row) if self._tactics_impact else None,
+            description=description,
+        )
+
+    def by_type(self, event_type: str) -> EventView:
+        """이벤트 타입의 행만 보는 보기 (전체를 훑지 않음)"""
+        rows = self._type_rows.get(self._strings.ids.get(event_type))
+        return EventView(self, rows if rows is not None else range(0))
+
+    def by_types(self, event_types: Iterable[str]) -> EventView:
+        """여러 이벤트 타입의 행을 발생 순서대로 보는 보기"""
+        type_ids = {self._strings.ids.get(event_type) for event_type in event_types}
+        rows = array(
+            "i", merge(*(self._type_rows[t] for t in sorted(type_ids & self._type_rows.keys())))
+        )
+        return EventView(self, rows)
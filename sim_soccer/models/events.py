@@ -1,8 +1,10 @@
-"""이벤트 로그 모델"""
+"""이벤트 로그 및 스트리밍 이벤트 모델"""
 
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from sim_soccer.models.player import PlayerState
+
 
 @dataclass
 class EventLog:
@@ -33,3 +35,92 @@ class EventLog:
             "tactics_impact": self.tactics_impact,
             "description": self.description,
         }
+
+
+@dataclass
+class MatchEvent:
+    """스트리밍 경기 이벤트의 기본 클래스 (simulate_match_iter가 발생 순서대로 yield)"""
+
+    tick: int  # 발생 시간 (Tick)
+
+
+@dataclass
+class KickOffEvent(MatchEvent):
+    """경기 시작"""
+
+    match_id: str
+
+
+@dataclass
+class ActionEvent(MatchEvent):
+    """판정이 끝난 행동 (Tick마다 하나)
+
+    선수 필드는 경기 중인 PlayerState를 그대로 참조하므로 복사 비용이 없다.
+    보관하려면 필요한 값(선수 ID 등)을 꺼내 두어야 한다.
+    """
+
+    phase: str  # 행동이 선택된 Phase
+    team: str  # 행동한 공격 팀 ("home" 또는 "away")
+    action_type: str
+    success: bool
+    success_rate: float
+    player: Optional[PlayerState] = None  # 행동 주체
+    defender: Optional[PlayerState] = None  # 컨테스트 수비자
+    target_player: Optional[PlayerState] = None  # 패스 대상 선수
+    is_goal: bool = False
+    roll: float = 0.0  # 성공 판정에 사용한 난수
+
+
+@dataclass
+class GoalEvent(MatchEvent):
+    """골 (골 이후 점수 포함)"""
+
+    team: str  # 득점 팀 ("home" 또는 "away")
+    player: Optional[PlayerState]
+    home_score: int
+    away_score: int
+
+
+@dataclass
+class PhaseChangeEvent(MatchEvent):
+    """Phase 전환 (Phase 판정 또는 행동 결과로 인한 전환)"""
+
+    old_phase: str
+    new_phase: str
+
+
+@dataclass
+class HalfTimeEvent(MatchEvent):
+    """전반 종료 (후반 첫 Tick에 발생)"""
+
+    home_score: int
+    away_score: int
+
+
+@dataclass
+class FullTimeEvent(MatchEvent):
+    """경기 종료"""
+
+    home_score: int
+    away_score: int
+    winner: str  # "home", "away", "draw"
+
+
+@dataclass
+class TickEndEvent(MatchEvent):
+    """Tick 종료 (요청했을 때만 발생, 행동이 없던 Tick 포함)
+
+    MATCH_EVENT_TYPES에 포함되지 않으므로 `events`에 명시해야 만들어진다. Tick마다 그 Tick이
+    끝난 뒤의 상태가 필요한 소비자(리플레이 기록기 등)용이다.
+    """
+
+
+# simulate_match_iter에서 기본으로 yield하는 이벤트 타입 (TickEndEvent는 명시해야 함)
+MATCH_EVENT_TYPES = (
+    KickOffEvent,
+    ActionEvent,
+    GoalEvent,
+    PhaseChangeEvent,
+    HalfTimeEvent,
+    FullTimeEvent,
+)
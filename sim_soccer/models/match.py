@@ -1,8 +1,9 @@
 """MatchState 모델"""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Optional
 
+from sim_soccer.models.event_store import EventStore, EventView
 from sim_soccer.models.events import EventLog
 from sim_soccer.models.team import TeamState
 
@@ -20,7 +21,7 @@ class MatchState:
     attacking_team: str = "home"  # 현재 공격 팀 ("home" 또는 "away")
     ball_zone: int = 2  # 볼이 있는 Zone (1-15)
     ball_holder: Optional[int] = None  # 공을 가진 선수 ID
-    event_log: List[EventLog] = field(default_factory=list)
+    event_log: EventStore = field(default_factory=EventStore)  # 열 기반 이벤트 로그
     is_finished: bool = False
     winner: Optional[str] = None  # "home", "away", "draw"
 
@@ -28,6 +29,8 @@ class MatchState:
         """초기화 후 기본 설정"""
         if self.home_team is None or self.away_team is None:
             raise ValueError("home_team and away_team must be provided")
+        if not isinstance(self.event_log, EventStore):
+            self.event_log = EventStore(self.event_log)
 
     def get_attacking_team(self) -> TeamState:
         """현재 공격 팀을 반환"""
@@ -45,11 +48,11 @@ class MatchState:
         """이벤트 로그 추가"""
         self.event_log.append(event)
 
-    def get_events_by_type(self, event_type: str) -> List[EventLog]:
-        """특정 타입의 이벤트만 필터링하여 반환"""
-        return [e for e in self.event_log if e.event_type == event_type]
+    def get_events_by_type(self, event_type: str) -> EventView:
+        """특정 타입의 이벤트만 반환 (타입별 인덱스 조회, 읽을 때 EventLog 생성)"""
+        return self.event_log.by_type(event_type)
 
-    def get_goals(self) -> List[EventLog]:
+    def get_goals(self) -> EventView:
         """골 이벤트만 반환"""
         return self.get_events_by_type("goal")
 
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from typing import Dict
 
+from sim_soccer.models.stat_block import PlayerStats
 
 # 포지션별 스탯 가중치 (설계 문서 참조)
 POSITION_WEIGHTS: Dict[str, Dict[str, float]] = {
@@ -45,22 +46,29 @@ POSITION_WEIGHTS: Dict[str, Dict[str, float]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
-    """선수 상태를 나타내는 클래스"""
+    """선수 상태를 나타내는 클래스
+
+    스탯은 고정 순서 배열(`PlayerStats`)로 저장한다. 딕셔너리로 전달한 스탯은 생성 시
+    변환되며, 지정하지 않은 스탯은 0이다.
+    """
 
     player_id: int
     name: str
     position: str  # "GK", "DF", "MF", "FW"
     zone: int = 2  # 현재 Zone (1-15), 기본값은 중앙 후방
-    stats: Dict[str, int] = field(default_factory=dict)
+    stats: PlayerStats = field(default_factory=PlayerStats)
     stamina: float = 100.0  # 현재 체력 (0-100)
     has_ball: bool = False  # 공을 가지고 있는지
+    position_weights: Dict[str, float] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """초기화 후 포지션 가중치 계산"""
+        """초기화 후 스탯 배열 변환 및 포지션 가중치 계산"""
         if self.position not in POSITION_WEIGHTS:
             raise ValueError(f"Invalid position: {self.position}")
+        if type(self.stats) is not PlayerStats:
+            self.stats = PlayerStats(self.stats)
         self.position_weights = POSITION_WEIGHTS[self.position]
 
     def get_weighted_stat(self, stat_name: str) -> float:
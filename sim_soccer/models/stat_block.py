@@ -0,0 +1,146 @@
+"""고정 순서 스탯 배열
+
+선수 스탯, 팀 전술, 팀 통계는 항목이 정해져 있으므로 객체마다 딕셔너리를 두지 않고
+`KEYS` 순서의 작은 타입 배열(`data`)에 저장한다. 배열 인덱스는 `sim_soccer.core.ids`의
+`Stat`/`Tactic`/`TeamStat` 값과 같아서 엔진은 `stats.data[Stat.STA]`처럼 바로 읽을 수 있고,
+기존 코드는 딕셔너리처럼(`stats["PAS"]`, `stats.get("STA", 5)`, `dict(stats)`) 사용할 수 있다.
+
+모든 항목이 항상 존재하며, 생성 시 지정하지 않은 항목은 `KEY_DEFAULTS`에 있으면 그 값을,
+없으면 `DEFAULT` 값을 가진다.
+항목을 삭제할 수 없고 정의되지 않은 키를 읽거나 쓰면 KeyError가 발생한다.
+
+매핑으로 값을 쓰면(`stats["PAS"] = 9`) 소유자가 연결한 `_on_change` 콜백을 호출한다
+(TeamState가 revision을 올리는 데 사용). `data` 배열에 직접 쓰면 호출하지 않으며, 복사하거나
+직렬화한 배열에는 콜백이 없다.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from sim_soccer.core.ids import STAT_NAMES, TACTIC_NAMES, TEAM_STAT_NAMES
+
+Key = Union[str, int]
+
+
+class StatBlock(MutableMapping):
+    """`KEYS` 순서의 타입 배열로 저장하는 고정 키 매핑
+
+    하위 클래스는 `KEYS`, `DEFAULT`, `TYPECODE`(필요하면 항목별 기본값 `KEY_DEFAULTS`)를
+    정의한다. 키는 이름 문자열이며,
+    ID 열거형(정수)으로도 조회할 수 있다.
+    """
+
+    __slots__ = ("data", "_on_change")
+
+    KEYS: Tuple[str, ...] = ()
+    DEFAULT: int = 0
+    KEY_DEFAULTS: Dict[str, int] = {}
+    TYPECODE: str = "i"
+    _INDEX: Dict[Key, int] = {}
+    _DEFAULTS: array = array("i")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._INDEX = {key: index for index, key in enumerate(cls.KEYS)}
+        cls._INDEX.update({index: index for index in range(len(cls.KEYS))})
+        cls._DEFAULTS = array(
+            cls.TYPECODE, [cls.KEY_DEFAULTS.get(key, cls.DEFAULT) for key in cls.KEYS]
+        )
+
+    def __init__(self, values: Optional[Mapping[Key, int]] = None):
+        """배열 생성
+
+        Args:
+            values: 초기값 (생략한 항목은 기본값)
+        """
+        data = self.data = array(self.TYPECODE, self._DEFAULTS)
+        self._on_change: Optional[Callable[[], None]] = None
+        if values:
+            index = self._INDEX
+            for key, value in values.items():
+                data[index[key]] = value
+
+    def __getitem__(self, key: Key) -> int:
+        return self.data[self._INDEX[key]]
+
+    def __setitem__(self, key: Key, value: int):
+        self.data[self._INDEX[key]] = value
+        if self._on_change is not None:
+            self._on_change()
+
+    def __delitem__(self, key: Key):
+        raise TypeError(f"{type(self).__name__} items cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __contains__(self, key) -> bool:
+        return key in self._INDEX
+
+    def __eq__(self, other) -> bool:
+        if type(other) is type(self):
+            return self.data == other.data
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return repr(dict(zip(self.KEYS, self.data)))
+
+    def __getstate__(self) -> array:
+        return self.data
+
+    def __setstate__(self, data: array):
+        self.data = data
+        self._on_change = None
+
+    def get(self, key: Key, default=None):
+        """항목 값 반환 (정의되지 않은 키면 default)"""
+        index = self._INDEX.get(key)
+        return default if index is None else self.data[index]
+
+    def copy(self) -> "StatBlock":
+        """같은 값을 가진 새 배열"""
+        return self.from_data(self.data)
+
+    @classmethod
+    def from_data(cls, data: Iterable[int]) -> "StatBlock":
+        """`KEYS` 순서의 값 목록을 복사해 생성 (키 변환 없음)"""
+        block = cls.__new__(cls)
+        block.data = array(cls.TYPECODE, data)
+        block._on_change = None
+        return block
+
+
+class PlayerStats(StatBlock):
+    """선수 스탯 (PAS, DRI, SHO, SPA, TAC, INT, STA)"""
+
+    __slots__ = ()
+
+    KEYS = STAT_NAMES
+    DEFAULT = 0
+    # 체력 소모는 STA가 없으면 보통(5)으로 계산해 왔으므로 STA만 기본값 5
+    KEY_DEFAULTS = {"STA": 5}
+    TYPECODE = "b"
+
+
+class Tactics(StatBlock):
+    """팀 전술 (attack, pass_style, pressing, defense_line, transition_speed, width)"""
+
+    __slots__ = ()
+
+    KEYS = TACTIC_NAMES
+    DEFAULT = 5
+    TYPECODE = "b"
+
+
+class TeamStats(StatBlock):
+    """팀 경기 통계 (슈팅, 패스, 태클, 드리블의 시도/성공 횟수)"""
+
+    __slots__ = ()
+
+    KEYS = TEAM_STAT_NAMES
+    DEFAULT = 0
+    TYPECODE = "i"
@@ -1,79 +1,234 @@
 """TeamState 모델"""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+from sim_soccer.field.zone import GEOMETRY, ZoneGeometry
 from sim_soccer.models.player import PlayerState
+from sim_soccer.models.stat_block import Tactics, TeamStats
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamState:
-    """팀 상태를 나타내는 클래스"""
+    """팀 상태를 나타내는 클래스
+
+    팀은 Zone별 선수, 포지션별 선수, 선수 ID, 볼 소유자 인덱스를 유지하므로 조회가
+    선수 수와 무관하게 상수 시간이다. 인덱스를 일관되게 유지하려면 선수의 Zone과 볼 소유는
+    `move_player`/`set_ball_holder`로만 변경해야 하며, 선수 속성이나 `players` 목록을
+    직접 수정했다면 `rebuild_index`를 호출해야 한다.
+
+    스탯 평균은 캐시되며, 스탯/전술 기반 테이블은 `revision`으로 무효화 여부를 판단한다.
+    전술이나 선수 스탯을 매핑으로 변경하면(`team.tactics["pressing"] = 9`,
+    `player.stats["PAS"] = 9`) `revision`이 증가하고 스탯 평균 캐시가 비워진다.
+    `data` 배열에 직접 쓰거나 전술/스탯 객체를 교체했다면 `rebuild_index`를 호출해야 한다.
+
+    전술과 통계는 고정 순서 배열(`Tactics`, `TeamStats`)로 저장한다. 딕셔너리로 전달한
+    값은 생성 시 변환되며, 지정하지 않은 전술은 5, 통계는 0이다.
+    """
 
     team_id: str
     team_name: str
     formation: str
     players: List[PlayerState] = field(default_factory=list)
-    tactics: Dict[str, int] = field(default_factory=dict)
+    tactics: Tactics = field(default_factory=Tactics)
     score: int = 0
     momentum: int = 0  # -10 ~ +10
     possession: float = 0.0  # 점유율 (0.0-1.0)
 
     # 통계
-    stats: Dict[str, int] = field(
-        default_factory=lambda: {
-            "shots": 0,
-            "shots_on_target": 0,
-            "passes_attempted": 0,
-            "passes_completed": 0,
-            "tackles_attempted": 0,
-            "tackles_successful": 0,
-            "dribbles_attempted": 0,
-            "dribbles_successful": 0,
-        }
-    )
+    stats: TeamStats = field(default_factory=TeamStats)
+
+    # 인덱스 (rebuild_index에서 생성)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    _average_stats: Dict[str, float] = field(init=False, repr=False, compare=False)
+    _roster_order: Dict[int, int] = field(init=False, repr=False, compare=False)
+    _players_by_id: Dict[int, PlayerState] = field(init=False, repr=False, compare=False)
+    _zone_players: Dict[int, List[PlayerState]] = field(init=False, repr=False, compare=False)
+    _position_players: Dict[str, List[PlayerState]] = field(init=False, repr=False, compare=False)
+    _occupied_zones: int = field(init=False, repr=False, compare=False)
+    _ball_holder: Optional[PlayerState] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """초기화 후 기본 전술 설정"""
-        if not self.tactics:
-            self.tactics = {
-                "attack": 5,
-                "pass_style": 5,
-                "pressing": 5,
-                "defense_line": 5,
-                "transition_speed": 5,
-                "width": 5,
-            }
+        """초기화 후 전술/통계 배열 변환 및 인덱스 생성"""
+        if type(self.tactics) is not Tactics:
+            self.tactics = Tactics(self.tactics)
+        if type(self.stats) is not TeamStats:
+            self.stats = TeamStats(self.stats)
+        self.rebuild_index()
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, object]):
+        """복사/역직렬화한 팀의 전술과 선수 스탯에 변경 콜백을 다시 연결
+
+        얕은 복사는 원본과 배열을 공유하므로 이미 연결된 배열은 원본 팀에 그대로 둔다.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        for block in (self.tactics, *(player.stats for player in self.players)):
+            if block._on_change is None:
+                block._on_change = self._stats_changed
+
+    def rebuild_index(self):
+        """선수 목록에서 Zone/포지션/ID/볼 소유자 인덱스를 다시 생성
+
+        각 인덱스의 선수 목록은 `players`(로스터) 순서를 유지한다. 선수 스탯이 바뀌었을 수
+        있으므로 스탯 평균 캐시도 비우고 `revision`을 증가시킨다. 전술과 선수 스탯의 변경
+        콜백도 이 팀에 다시 연결한다.
+        """
+        self._average_stats = {}
+        self._revision += 1
+        self._watch_stats()
+        self._roster_order = {}
+        self._players_by_id = {}
+        self._zone_players = {}
+        self._position_players = {}
+        self._occupied_zones = 0  # Zone 점유 비트마스크 (Zone z는 bit z-1, 격자 크기 무관)
+        self._ball_holder = None
+        for order, player in enumerate(self.players):
+            self._roster_order.setdefault(player.player_id, order)
+            self._players_by_id.setdefault(player.player_id, player)
+            self._zone_players.setdefault(player.zone, []).append(player)
+            self._occupied_zones |= 1 << (player.zone - 1)
+            self._position_players.setdefault(player.position, []).append(player)
+            if player.has_ball and self._ball_holder is None:
+                self._ball_holder = player
 
     def get_player_by_id(self, player_id: int) -> Optional[PlayerState]:
         """선수 ID로 선수를 찾아 반환"""
-        for player in self.players:
-            if player.player_id == player_id:
-                return player
-        return None
+        return self._players_by_id.get(player_id)
 
     def get_players_by_position(self, position: str) -> List[PlayerState]:
         """포지션으로 선수들을 찾아 반환"""
-        return [p for p in self.players if p.position == position]
+        return list(self._position_players.get(position, ()))
+
+    def get_players_in_zone(self, zone: int) -> List[PlayerState]:
+        """특정 Zone에 있는 선수들을 로스터 순서로 반환"""
+        return list(self._zone_players.get(zone, ()))
+
+    def get_first_player_in_zone(self, zone: int) -> Optional[PlayerState]:
+        """특정 Zone에 있는 로스터 순서상 첫 번째 선수 반환"""
+        players = self._zone_players.get(zone)
+        return players[0] if players else None
+
+    def get_players_in_zones(self, zones: Iterable[int]) -> List[PlayerState]:
+        """여러 Zone에 있는 선수들을 로스터 순서로 반환"""
+        players = []
+        for zone in set(zones):
+            players.extend(self._zone_players.get(zone, ()))
+        players.sort(key=lambda p: self._roster_order[p.player_id])
+        return players
+
+    def get_nearest_player(
+        self,
+        target_zone: int,
+        exclude_player_id: Optional[int] = None,
+        geometry: Optional[ZoneGeometry] = None,
+    ) -> Optional[PlayerState]:
+        """특정 Zone에 가장 가까운 선수 반환 (거리가 같으면 로스터 순서상 앞선 선수)
+
+        선수가 있는 Zone만 거리 테이블로 확인하므로 비용은 격자 크기와 무관하다.
+
+        Args:
+            target_zone: 대상 Zone
+            exclude_player_id: 제외할 선수 ID
+            geometry: Zone 기하 테이블 (None이면 기본 5x3 격자)
+        """
+        geometry = geometry or GEOMETRY
+        if not geometry.is_valid(target_zone):
+            raise ValueError(
+                f"Zone must be between 1 and {geometry.total_zones}, got {target_zone}"
+            )
+        distances = geometry.distance[target_zone]
+        nearest_player = None
+        nearest_key = None
+        for zone, players in self._zone_players.items():
+            distance = distances[zone]
+            if nearest_key is not None and distance > nearest_key[0]:
+                continue
+            for player in players:
+                if exclude_player_id and player.player_id == exclude_player_id:
+                    continue
+                key = (distance, self._roster_order[player.player_id])
+                if nearest_key is None or key < nearest_key:
+                    nearest_key = key
+                    nearest_player = player
+                break
+        return nearest_player
+
+    @property
+    def occupied_zones(self) -> int:
+        """선수가 있는 Zone의 비트마스크 (Zone z는 bit z-1)"""
+        return self._occupied_zones
+
+    def move_player(self, player: PlayerState, zone: int):
+        """선수를 다른 Zone으로 이동하고 Zone 인덱스 갱신"""
+        old_zone = player.zone
+        if old_zone == zone:
+            return
+        old_players = self._zone_players[old_zone]
+        old_players.remove(player)
+        if not old_players:
+            del self._zone_players[old_zone]
+            self._occupied_zones &= ~(1 << (old_zone - 1))
+
+        player.zone = zone
+        new_players = self._zone_players.setdefault(zone, [])
+        self._occupied_zones |= 1 << (zone - 1)
+        # 로스터 순서 유지
+        order = self._roster_order[player.player_id]
+        index = len(new_players)
+        while index > 0 and self._roster_order[new_players[index - 1].player_id] > order:
+            index -= 1
+        new_players.insert(index, player)
+
+    @property
+    def revision(self) -> int:
+        """스탯/전술 변경 횟수 (캐시된 테이블의 무효화 판단용)"""
+        return self._revision
+
+    def set_tactic(self, name: str, value: int):
+        """전술 값을 변경 (값이 바뀔 때만 `revision` 증가)"""
+        if self.tactics.get(name) == value:
+            return
+        self.tactics[name] = value
+
+    def _watch_stats(self):
+        """전술과 선수 스탯을 매핑으로 변경하면 `_stats_changed`가 호출되도록 연결"""
+        self.tactics._on_change = self._stats_changed
+        for player in self.players:
+            player.stats._on_change = self._stats_changed
+
+    def _stats_changed(self):
+        """전술/선수 스탯 변경 콜백: 스탯 평균 캐시를 비우고 `revision` 증가"""
+        self._average_stats = {}
+        self._revision += 1
 
     def get_average_stat(self, stat_name: str) -> float:
-        """팀의 평균 스탯을 반환"""
-        if not self.players:
-            return 0.0
-        total = sum(p.stats.get(stat_name, 0) for p in self.players)
-        return total / len(self.players)
+        """팀의 평균 스탯을 반환 (스탯별로 한 번만 계산)"""
+        average = self._average_stats.get(stat_name)
+        if average is None:
+            if not self.players:
+                average = 0.0
+            else:
+                total = sum(p.stats.get(stat_name, 0) for p in self.players)
+                average = total / len(self.players)
+            self._average_stats[stat_name] = average
+        return average
 
     def get_ball_holder(self) -> Optional[PlayerState]:
         """공을 가진 선수를 반환"""
-        for player in self.players:
-            if player.has_ball:
-                return player
-        return None
+        return self._ball_holder
 
     def set_ball_holder(self, player_id: Optional[int]):
-        """공을 가진 선수를 설정"""
-        for player in self.players:
-            player.has_ball = player.player_id == player_id
+        """공을 가진 선수를 설정 (None이면 팀에 볼 소유자 없음)"""
+        if self._ball_holder is not None:
+            self._ball_holder.has_ball = False
+        holder = self._players_by_id.get(player_id) if player_id is not None else None
+        if holder is not None:
+            holder.has_ball = True
+        self._ball_holder = holder
 
     def update_possession(self, total_ticks: int, team_ticks: int):
         """점유율 업데이트"""
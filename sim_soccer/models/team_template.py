@@ -0,0 +1,238 @@
+"""팀 템플릿 (반복 시뮬레이션용 불변 시작 상태)
+
+`simulate_match`는 전달받은 TeamState(점수, 모멘텀, 통계, 선수 Zone/체력/볼 소유)를
+변경한다. TeamTemplate은 팀의 시작 상태를 불변 객체로 보관하고, 경기마다 깊은 복사 없이
+새 TeamState를 만들거나(`instantiate`) 사용한 TeamState를 시작 상태로 되돌린다(`reset`).
+
+`from_team`은 팀 구성(선수, 스탯, 전술)만 가져오고 경기 상태는 경기 시작 상태(점수/모멘텀 0,
+빈 통계, 체력 100, 볼 없음, 선수 기본 Zone)로 만든다. 따라서 이미 경기를 치른 팀으로 만들어도
+지난 경기의 상태가 넘어오지 않는다. 현재 상태를 그대로 보관하려면 `snapshot`을 사용한다.
+
+`acquire`/`release`는 템플릿별 TeamState 풀을 사용하므로 반복 경기에서 선수/스탯 객체를
+다시 만들지 않는다. 템플릿 자체는 변경되지 않고 풀은 잠금으로 보호되므로 하나의 템플릿을
+여러 스레드에서 공유할 수 있다. 단, 꺼낸 TeamState는 반환할 때까지 한 경기에서만 사용해야
+한다.
+"""
+
+import threading
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import List, Tuple
+
+from sim_soccer.core.ids import TEAM_STAT_NAMES
+from sim_soccer.models.player import POSITION_WEIGHTS, PlayerState
+from sim_soccer.models.stat_block import PlayerStats, Tactics, TeamStats
+from sim_soccer.models.team import TeamState
+
+# 경기 시작 시 선수 상태 (PlayerState 기본값, 킥오프 배치는 시뮬레이터가 정함)
+_PLAYER_START = {f.name: f.default for f in fields(PlayerState)}
+START_ZONE: int = _PLAYER_START["zone"]
+START_STAMINA: float = _PLAYER_START["stamina"]
+
+
+@dataclass(frozen=True)
+class PlayerTemplate:
+    """선수 시작 상태"""
+
+    player_id: int
+    name: str
+    position: str
+    stats: Tuple[int, ...]  # Stat 순서
+    zone: int = START_ZONE
+    stamina: float = START_STAMINA
+    has_ball: bool = False
+    _stats: array = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """초기화 후 스탯 배열 생성 (reset에서 복사 원본으로 사용)"""
+        object.__setattr__(self, "_stats", array(PlayerStats.TYPECODE, self.stats))
+
+    @classmethod
+    def from_player(cls, player: PlayerState) -> "PlayerTemplate":
+        """선수 구성(ID, 이름, 포지션, 스탯)으로 경기 시작 상태의 템플릿 생성"""
+        return cls(
+            player_id=player.player_id,
+            name=player.name,
+            position=player.position,
+            stats=tuple(player.stats.data),
+        )
+
+    @classmethod
+    def snapshot(cls, player: PlayerState) -> "PlayerTemplate":
+        """선수의 현재 상태(Zone, 체력, 볼 소유 포함)로 템플릿 생성"""
+        return cls(
+            player_id=player.player_id,
+            name=player.name,
+            position=player.position,
+            zone=player.zone,
+            stamina=player.stamina,
+            has_ball=player.has_ball,
+            stats=tuple(player.stats.data),
+        )
+
+    def instantiate(self) -> PlayerState:
+        """시작 상태의 새 선수 생성"""
+        return PlayerState(
+            player_id=self.player_id,
+            name=self.name,
+            position=self.position,
+            zone=self.zone,
+            stats=PlayerStats.from_data(self._stats),
+            stamina=self.stamina,
+            has_ball=self.has_ball,
+        )
+
+    def reset(self, player: PlayerState):
+        """선수를 시작 상태로 되돌림 (스탯 배열은 제자리에서 덮어씀)"""
+        player.player_id = self.player_id
+        player.name = self.name
+        player.position = self.position
+        player.position_weights = POSITION_WEIGHTS[self.position]
+        player.zone = self.zone
+        player.stamina = self.stamina
+        player.has_ball = self.has_ball
+        player.stats.data[:] = self._stats
+
+
+@dataclass(frozen=True)
+class TeamTemplate:
+    """팀 시작 상태 (불변, 스레드 간 공유 가능)"""
+
+    team_id: str
+    team_name: str
+    formation: str
+    players: Tuple[PlayerTemplate, ...]
+    tactics: Tuple[int, ...]  # Tactic 순서
+    stats: Tuple[int, ...] = (0,) * len(TEAM_STAT_NAMES)  # TeamStat 순서
+    score: int = 0
+    momentum: int = 0
+    possession: float = 0.0
+    _tactics: array = field(init=False, repr=False, compare=False)
+    _stats: array = field(init=False, repr=False, compare=False)
+    _pool: List[TeamState] = field(init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """초기화 후 복사 원본 배열과 TeamState 풀 생성"""
+        object.__setattr__(self, "_tactics", array(Tactics.TYPECODE, self.tactics))
+        object.__setattr__(self, "_stats", array(TeamStats.TYPECODE, self.stats))
+        object.__setattr__(self, "_pool", [])
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def __reduce__(self):
+        # 풀과 잠금은 프로세스마다 새로 생성
+        return (
+            type(self),
+            (
+                self.team_id,
+                self.team_name,
+                self.formation,
+                self.players,
+                self.tactics,
+                self.stats,
+                self.score,
+                self.momentum,
+                self.possession,
+            ),
+        )
+
+    def __copy__(self) -> "TeamTemplate":
+        return self
+
+    def __deepcopy__(self, memo) -> "TeamTemplate":
+        return self
+
+    @classmethod
+    def from_team(cls, team: TeamState) -> "TeamTemplate":
+        """팀 구성으로 경기 시작 상태의 템플릿 생성 (팀은 변경되지 않음)
+
+        팀의 점수, 모멘텀, 점유율, 통계와 선수 Zone/체력/볼 소유는 가져오지 않는다.
+        `instantiate()`로 만든 팀은 같은 팀 파일을 새로 로드한 팀과 같다.
+        """
+        return cls(
+            team_id=team.team_id,
+            team_name=team.team_name,
+            formation=team.formation,
+            players=tuple(PlayerTemplate.from_player(p) for p in team.players),
+            tactics=tuple(team.tactics.data),
+        )
+
+    @classmethod
+    def snapshot(cls, team: TeamState) -> "TeamTemplate":
+        """팀의 현재 상태(경기 상태 포함)로 템플릿 생성 (팀은 변경되지 않음)
+
+        `instantiate()`로 만든 팀은 이 시점 팀의 깊은 복사본과 같다.
+        """
+        return cls(
+            team_id=team.team_id,
+            team_name=team.team_name,
+            formation=team.formation,
+            players=tuple(PlayerTemplate.snapshot(p) for p in team.players),
+            tactics=tuple(team.tactics.data),
+            stats=tuple(team.stats.data),
+            score=team.score,
+            momentum=team.momentum,
+            possession=team.possession,
+        )
+
+    def instantiate(self) -> TeamState:
+        """시작 상태의 새 팀 생성"""
+        return TeamState(
+            team_id=self.team_id,
+            team_name=self.team_name,
+            formation=self.formation,
+            players=[p.instantiate() for p in self.players],
+            tactics=Tactics.from_data(self._tactics),
+            score=self.score,
+            momentum=self.momentum,
+            possession=self.possession,
+            stats=TeamStats.from_data(self._stats),
+        )
+
+    def reset(self, team: TeamState) -> TeamState:
+        """팀을 시작 상태로 되돌림
+
+        선수 구성이 템플릿과 같으면(같은 순서의 선수 ID) 선수와 스탯 배열을 제자리에서
+        덮어쓰고, 다르면 선수 목록을 새로 만든다. 인덱스는 다시 생성된다.
+
+        Args:
+            team: 되돌릴 팀 (보통 이 템플릿에서 만든 팀)
+
+        Returns:
+            전달한 팀
+        """
+        players = team.players
+        if len(players) == len(self.players) and all(
+            player.player_id == template.player_id
+            for player, template in zip(players, self.players)
+        ):
+            for player, template in zip(players, self.players):
+                template.reset(player)
+        else:
+            team.players = [p.instantiate() for p in self.players]
+        team.team_id = self.team_id
+        team.team_name = self.team_name
+        team.formation = self.formation
+        team.tactics.data[:] = self._tactics
+        team.stats.data[:] = self._stats
+        team.score = self.score
+        team.momentum = self.momentum
+        team.possession = self.possession
+        team.rebuild_index()
+        return team
+
+    def acquire(self) -> TeamState:
+        """풀에서 시작 상태의 팀을 꺼냄 (풀이 비어 있으면 새로 생성)
+
+        사용이 끝난 팀은 `release`로 반환한다.
+        """
+        with self._lock:
+            team = self._pool.pop() if self._pool else None
+        if team is None:
+            return self.instantiate()
+        return self.reset(team)
+
+    def release(self, team: TeamState):
+        """`acquire`로 꺼낸 팀을 풀에 반환 (이후 호출자는 팀을 사용하면 안 됨)"""
+        with self._lock:
+            self._pool.append(team)
@@ -2,6 +2,13 @@
 
 from typing import Dict
 
+from sim_soccer.core.ids import Tactic
+from sim_soccer.models.stat_block import Tactics
+
+# 전술 배열 인덱스 (IntEnum 속성 조회를 피하기 위해 정수로 고정)
+_PRESSING = int(Tactic.PRESSING)
+_ATTACK = int(Tactic.ATTACK)
+_TRANSITION_SPEED = int(Tactic.TRANSITION_SPEED)
 
 # 행동별 기본 체력 소모량 (설계 문서 참조)
 ACTION_STAMINA_COST: Dict[str, float] = {
@@ -31,24 +38,21 @@ def calculate_stamina_cost(
     # 기본 소모량
     base_cost = ACTION_STAMINA_COST.get(action_type, ACTION_STAMINA_COST["default"])
     
-    # 전술 보정
-    pressing = tactics.get("pressing", 5)
-    attack = tactics.get("attack", 5)
-    transition_speed = tactics.get("transition_speed", 5)
-    
+    # 전술 보정 (행동에 관련된 전술만 조회)
     tactics_multiplier = 1.0
+    data = tactics.data if type(tactics) is Tactics else Tactics(tactics).data
     
     # 압박 강도에 따른 소모량 증가
     if action_type in ["tackle", "intercept", "dribble"]:
-        tactics_multiplier *= 1.0 + (pressing - 5) * 0.15
+        tactics_multiplier *= 1.0 + (data[_PRESSING] - 5) * 0.15
     
     # 공격성에 따른 공격 행동 소모량 증가
     if action_type in ["dribble", "shoot", "transition_dash"]:
-        tactics_multiplier *= 1.0 + (attack - 5) * 0.1
+        tactics_multiplier *= 1.0 + (data[_ATTACK] - 5) * 0.1
     
     # 전환 속도에 따른 전환 행동 소모량 증가
     if action_type == "transition_dash":
-        tactics_multiplier *= 1.0 + (transition_speed - 5) * 0.1
+        tactics_multiplier *= 1.0 + (data[_TRANSITION_SPEED] - 5) * 0.1
     
     # STA 스탯에 따른 소모량 감소
     sta_multiplier = 1.0 - (player_sta - 5) * 0.05
@@ -165,6 +165,16 @@ def calculate_tactics_bonus(
     return bonus
 
 
+# Phase별 기본 전환 확률
+PHASE_BASE_TRANSITION_PROBABILITIES: Dict[str, float] = {
+    "build_up": 0.3,
+    "midfield": 0.35,
+    "final_third": 0.4,
+    "transition": 0.5,
+    "defense": 0.3,
+}
+
+
 def get_phase_transition_probability(
     tactics: Dict[str, int], phase: str, relevant_stat_avg: float
 ) -> float:
@@ -178,16 +188,7 @@ def get_phase_transition_probability(
     Returns:
         전환 확률 (0.0-1.0)
     """
-    # Phase별 기본 전환 확률
-    base_probabilities = {
-        "build_up": 0.3,
-        "midfield": 0.35,
-        "final_third": 0.4,
-        "transition": 0.5,
-        "defense": 0.3,
-    }
-    
-    base_prob = base_probabilities.get(phase, 0.3)
+    base_prob = PHASE_BASE_TRANSITION_PROBABILITIES.get(phase, 0.3)
     
     # 전술 보정
     attack = tactics.get("attack", 5)
@@ -0,0 +1,24 @@
+"""공용 pytest 픽스처"""
+
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from sim_soccer.io.team_loader import load_team
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[1] / "examples"
+
+
+@pytest.fixture
+def teams():
+    """예제 팀 로드 (a, b)"""
+    return load_team(str(EXAMPLES_DIR / "a.json")), load_team(str(EXAMPLES_DIR / "b.json"))
+
+
+@pytest.fixture
+def quiet_logger():
+    """테스트 실행 동안 엔진 로깅 비활성화"""
+    logger.disable("sim_soccer")
+    yield
+    logger.enable("sim_soccer")
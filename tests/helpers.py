@@ -0,0 +1,19 @@
+"""테스트 공용 헬퍼"""
+
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.team import TeamState
+
+
+def create_test_team(team_id: str) -> TeamState:
+    """테스트용 11인 팀 생성 (4-4-2, 모든 스탯 5)"""
+    positions = ["GK", "DF", "DF", "DF", "DF", "MF", "MF", "MF", "MF", "FW", "FW"]
+    players = [
+        PlayerState(
+            player_id=i,
+            name=f"{team_id} {i}",
+            position=position,
+            stats={"PAS": 5, "DRI": 5, "SHO": 5, "SPA": 5, "TAC": 5, "INT": 5, "STA": 5},
+        )
+        for i, position in enumerate(positions, 1)
+    ]
+    return TeamState(team_id=team_id, team_name=team_id, formation="4-4-2", players=players)
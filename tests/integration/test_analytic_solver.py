@@ -0,0 +1,48 @@
+"""해석적 경기 결과 솔버 통합 테스트"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from sim_soccer.core.analytic import AnalyticMatchSolver, compare_with_monte_carlo
+
+
+def test_solver_distributions_are_consistent(teams, quiet_logger):
+    """결과 확률과 득점 분포가 서로 일치하는지 테스트"""
+    home_team, away_team = teams
+    result = AnalyticMatchSolver().solve(home_team, away_team)
+
+    assert result.home_win_prob + result.draw_prob + result.away_win_prob == pytest.approx(1.0)
+    assert sum(result.home_goals) == pytest.approx(1.0)
+    assert sum(result.away_goals) == pytest.approx(1.0)
+    assert sum(result.goal_difference.values()) == pytest.approx(1.0)
+    assert sum(g * p for g, p in enumerate(result.home_goals)) == pytest.approx(
+        result.expected_home_goals, rel=1e-3
+    )
+    assert result.draw_prob == pytest.approx(result.goal_difference[0])
+    # 입력 팀은 변경되지 않음
+    assert all(p.stamina == 100.0 for p in home_team.players)
+
+
+def test_solver_is_symmetric(teams, quiet_logger):
+    """홈/원정을 바꾸면 결과도 대칭으로 바뀌는지 테스트 (홈 어드밴티지는 킥오프뿐)"""
+    home_team, away_team = teams
+    solver = AnalyticMatchSolver()
+    forward = solver.solve(home_team, away_team)
+    reverse = solver.solve(away_team, home_team)
+
+    assert forward.home_win_prob == pytest.approx(reverse.away_win_prob, abs=0.02)
+    assert forward.expected_home_goals == pytest.approx(reverse.expected_away_goals, rel=0.05)
+
+
+def test_solver_matches_monte_carlo(teams, quiet_logger):
+    """몬테카를로 결과와 오차 범위 내에서 일치하는지 테스트"""
+    home_team, away_team = teams
+    comparison = compare_with_monte_carlo(home_team, away_team, seeds=range(40))
+
+    assert comparison.monte_carlo.matches == 40
+    for name, error in comparison.errors.items():
+        standard_error = comparison.standard_errors[name]
+        # 몬테카를로 표본 오차 + 평균장 근사 오차 허용
+        assert abs(error) <= 4 * standard_error + 0.05, name
+    assert comparison.max_abs_error == max(abs(e) for e in comparison.errors.values())
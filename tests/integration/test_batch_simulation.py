@@ -0,0 +1,91 @@
+"""배치 시뮬레이션 통합 테스트"""
+
+import pytest
+
+from sim_soccer.core.batch import simulate_many, simulate_pairings
+from sim_soccer.core.rng import MatchStreams
+from sim_soccer.core.simulator import MatchSimulator
+
+
+def test_simulate_many_aggregates(teams):
+    """배치 집계 결과 테스트"""
+    home_team, away_team = teams
+    result = simulate_many(home_team, away_team, seeds=range(3))
+
+    assert result.matches == 3
+    assert result.home_wins + result.draws + result.away_wins == 3
+    assert sum(result.home_goals.values()) == 3
+    assert sum(result.scorelines.values()) == 3
+    assert result.mean_home_stats["shots"] >= result.mean_home_stats["shots_on_target"]
+
+    # 원본 팀 상태는 변경되지 않음
+    assert home_team.score == 0
+    assert home_team.stats["shots"] == 0
+
+
+def test_simulate_many_matches_single_simulation(teams):
+    """배치 결과가 개별 시뮬레이션과 일치하는지 테스트"""
+    home_team, away_team = teams
+    result = simulate_many(home_team, away_team, seeds=[5])
+
+    match = MatchSimulator().simulate_match(home_team, away_team, random_seed=5)
+    assert result.scorelines == {(match.home_team.score, match.away_team.score): 1}
+
+
+def test_simulate_many_ignores_state_from_earlier_match(teams):
+    """이미 경기를 치른 팀으로 실행해도 결과가 같은지 테스트 (순차/워커 모두)"""
+    home_team, away_team = teams
+    before = simulate_many(home_team, away_team, seeds=range(3))
+    before_parallel = simulate_many(home_team, away_team, seeds=range(3), workers=2, chunksize=1)
+
+    MatchSimulator().simulate_match(home_team, away_team, random_seed=9)
+    assert home_team.stats["passes_attempted"] > 0
+
+    assert simulate_many(home_team, away_team, seeds=range(3)) == before
+    after_parallel = simulate_many(home_team, away_team, seeds=range(3), workers=2, chunksize=1)
+    assert after_parallel == before_parallel == before
+
+
+def test_simulate_pairings_identical_across_worker_counts(teams):
+    """워커 수와 무관하게 결과가 동일한지 테스트"""
+    home_team, away_team = teams
+    pairings = [(home_team, away_team), (away_team, home_team)]
+
+    sequential = simulate_pairings(pairings, seeds=range(2), workers=1)
+    parallel = simulate_pairings(pairings, seeds=range(2), workers=2, chunksize=1)
+
+    assert sequential == parallel
+    assert [r.home_team_name for r in parallel] == [home_team.team_name, away_team.team_name]
+
+
+def test_simulate_pairings_score_only(teams):
+    """점수 전용 모드의 배치 결과가 전체 모드와 같은 점수를 내는지 테스트"""
+    home_team, away_team = teams
+    pairings = [(home_team, away_team)]
+
+    full = simulate_pairings(pairings, seeds=range(3))[0]
+    score_only = simulate_pairings(pairings, seeds=range(3), workers=2, mode="score_only")[0]
+
+    assert score_only.scorelines == full.scorelines
+    assert score_only.mean_home_stats["shots"] == 0
+
+
+def test_simulate_pairings_master_seed(teams):
+    """마스터 시드의 경기별 스트림 결과가 워커 수, 시드 분할과 무관한지 테스트"""
+    home_team, away_team = teams
+    pairings = [(home_team, away_team), (away_team, home_team)]
+
+    sequential = simulate_pairings(pairings, seeds=range(2), mode="score_only", master_seed=7)
+    parallel = simulate_pairings(
+        pairings, seeds=range(2), workers=2, chunksize=1, mode="score_only", master_seed=7
+    )
+    assert sequential == parallel
+
+    # 시드를 나눠 실행한 결과(다른 노드)는 같은 경기의 결과와 같음
+    second = simulate_pairings(pairings, seeds=[1], mode="score_only", master_seed=7)[1]
+    streams = MatchStreams.for_match(7, 1, 1)
+    match = MatchSimulator().simulate_match(away_team, home_team, streams=streams)
+    assert second.scorelines == {(match.home_team.score, match.away_team.score): 1}
+
+    with pytest.raises(ValueError):
+        MatchSimulator().simulate_match(home_team, away_team, random_seed=1, streams=streams)
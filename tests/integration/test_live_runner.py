@@ -0,0 +1,119 @@
+"""실시간 경기 러너 통합 테스트"""
+
+import asyncio
+import copy
+import gc
+import time
+import weakref
+
+import pytest
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.live.runner import LiveMatchRunner
+from sim_soccer.models.events import FullTimeEvent, GoalEvent, KickOffEvent
+
+
+async def collect(subscription):
+    """구독한 이벤트를 모두 모아 반환"""
+    return [event async for event in subscription]
+
+
+def test_runner_paces_concurrent_matches(teams):
+    """여러 경기를 동시에 진행하며 속도를 맞추고 모든 이벤트를 전달하는지 테스트"""
+    home_team, away_team = teams
+    duration = 0.5
+
+    async def main():
+        runner = LiveMatchRunner(slot=0.02)
+        matches = [
+            runner.add_match(
+                copy.deepcopy(home_team),
+                copy.deepcopy(away_team),
+                random_seed=seed,
+                duration=duration,
+            )
+            for seed in range(3)
+        ]
+        watchers = [collect(match.subscribe()) for match in matches]
+        start = time.perf_counter()
+        stats, *received = await asyncio.gather(runner.run(), *watchers)
+        return matches, stats, received, time.perf_counter() - start
+
+    matches, stats, received, elapsed = asyncio.run(main())
+
+    # 마지막 이벤트는 최대 한 슬롯 일찍 전달될 수 있음
+    assert elapsed >= duration - 0.02
+    assert stats.events == sum(len(events) for events in received)
+
+    for seed, (match, events) in enumerate(zip(matches, received)):
+        assert match.finished
+        assert isinstance(events[0], KickOffEvent)
+        assert isinstance(events[-1], FullTimeEvent)
+        # 같은 시드의 simulate_match와 같은 결과
+        expected = MatchSimulator().simulate_match(
+            copy.deepcopy(home_team), copy.deepcopy(away_team), random_seed=seed
+        )
+        assert (match.result.home_team.score, match.result.away_team.score) == (
+            expected.home_team.score,
+            expected.away_team.score,
+        )
+
+
+def test_runner_accepts_matches_while_running(teams):
+    """실행 중에 추가된 경기도 진행하고 슬롯 단위 목록으로 구독할 수 있는지 테스트"""
+    home_team, away_team = teams
+
+    async def main():
+        runner = LiveMatchRunner(slot=0.01)
+        first = runner.add_match(
+            copy.deepcopy(home_team),
+            copy.deepcopy(away_team),
+            random_seed=1,
+            duration=0.3,
+        )
+        first_events = first.subscribe()
+        run = asyncio.ensure_future(runner.run())
+        # 첫 경기의 킥오프를 받은 뒤(러너 실행 중) 두 번째 경기 추가
+        assert isinstance(await first_events.__anext__(), KickOffEvent)
+        second = runner.add_match(
+            copy.deepcopy(home_team),
+            copy.deepcopy(away_team),
+            random_seed=2,
+            duration=0.1,
+            events={GoalEvent, FullTimeEvent},
+        )
+        batches = [batch async for batch in second.subscribe().batches()]
+        await run
+        return first, second, batches
+
+    first, second, batches = asyncio.run(main())
+
+    assert first.finished and second.finished
+    events = [event for batch in batches for event in batch]
+    assert all(isinstance(event, (GoalEvent, FullTimeEvent)) for event in events)
+    assert isinstance(events[-1], FullTimeEvent)
+    assert events[-1].home_score == second.result.home_team.score
+    # 경기가 끝난 뒤의 구독은 바로 종료
+    assert asyncio.run(collect(second.subscribe())) == []
+
+
+def test_runner_releases_finished_matches(teams):
+    """끝난 경기는 러너가 더 이상 참조하지 않는지 테스트"""
+    home_team, away_team = teams
+    runner = LiveMatchRunner(slot=0.01)
+    match = runner.add_match(
+        copy.deepcopy(home_team), copy.deepcopy(away_team), random_seed=1, duration=0.05
+    )
+    finished = weakref.ref(match)
+    del match
+
+    asyncio.run(runner.run())
+    gc.collect()
+
+    assert finished() is None
+
+
+def test_runner_rejects_invalid_slot():
+    """슬롯이 0 이하이면 예외가 발생하는지 테스트"""
+    with pytest.raises(ValueError):
+        LiveMatchRunner(slot=0)
@@ -0,0 +1,149 @@
+"""실시간 경기 스트리밍 서버 통합 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+from sim_soccer.live.encoding import apply_delta
+from sim_soccer.live.runner import LiveMatchRunner
+from sim_soccer.live.server import LiveMatchServer, load_teams
+from tests.conftest import EXAMPLES_DIR
+
+
+@pytest.fixture
+def team_registry():
+    """이름별 예제 팀 (a, b)"""
+    return load_teams(str(EXAMPLES_DIR))
+
+
+async def request(port: int, method: str, path: str, payload=None):
+    """HTTP 요청을 보내고 (상태 코드, 본문) 반환"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+async def read_stream(port: int, channel_id: str):
+    """SSE 스트림을 끝까지 읽어 (이벤트 이름, 데이터) 목록 반환"""
+    status, content = await request(port, "GET", f"/matches/{channel_id}/stream")
+    assert status == 200
+    return parse_frames(content)
+
+
+def parse_frames(content: bytes):
+    """SSE 프레임들을 (이벤트 이름, 데이터) 목록으로 분해"""
+    frames = []
+    for block in content.decode("utf-8").split("\n\n"):
+        if block:
+            name_line, data_line = block.split("\n")
+            frames.append((name_line[len("event: ") :], json.loads(data_line[len("data: ") :])))
+    return frames
+
+
+def rebuild(frames):
+    """키프레임과 델타로 관전자 쪽 상태를 복원"""
+    state = {}
+    for name, message in frames:
+        if name == "keyframe":
+            state = message["state"]
+        elif name == "update":
+            state = apply_delta(state, message["delta"])
+    return state
+
+
+def test_server_streams_match_to_clients(team_registry):
+    """경기를 시작하고 여러 클라이언트가 스트림으로 같은 최종 상태를 복원하는지 테스트"""
+
+    async def main():
+        server = LiveMatchServer(team_registry, LiveMatchRunner(slot=0.02))
+        http = await server.start(port=0)
+        port = http.sockets[0].getsockname()[1]
+
+        status, content = await request(
+            port, "POST", "/matches", {"home": "a", "away": "b", "seed": 42, "duration": 2.0}
+        )
+        assert status == 201
+        channel_id = json.loads(content)["id"]
+        channel = server.channels[channel_id]
+        streams = await asyncio.gather(*(read_stream(port, channel_id) for _ in range(3)))
+        # 끝난 경기는 목록에서 제거되어 새로 접속할 수 없음
+        late_status, _ = await request(port, "GET", f"/matches/{channel_id}/stream")
+        _, listing = await request(port, "GET", "/matches")
+        # 채널을 직접 구독하면 키프레임 하나와 종료 표시를 받음
+        late = channel.add_client()
+        late_frames = [late.queue.get_nowait() for _ in range(late.queue.qsize())]
+        assert late_frames[-1] is None  # 종료 표시
+        late_frames = parse_frames(b"".join(late_frames[:-1]))
+
+        http.close()
+        await http.wait_closed()
+        return channel, streams, late_status, late_frames, json.loads(listing)
+
+    channel, streams, late_status, late, listing = asyncio.run(main())
+
+    result = channel.match.result
+    score = [result.home_team.score, result.away_team.score]
+    for frames in streams:
+        assert frames[-1][0] == "end"
+        assert rebuild(frames)["score"] == score
+        # 접속 시점에 따라 키프레임부터 받으므로 킥오프는 못 받을 수 있음
+        events = [e for _, message in frames[:-1] for e in message["events"]]
+        ticks = [e["tick"] for e in events]
+        assert ticks == sorted(ticks)
+        assert events[-1] == {
+            "type": "full_time",
+            "tick": result.tick,
+            "score": score,
+            "winner": events[-1]["winner"],
+        }
+    # 업데이트와 키프레임은 구독자 수와 무관하게 seq마다 한 번씩만 인코딩
+    keyframe_seqs = {m["seq"] for frames in streams + [late] for n, m in frames if n == "keyframe"}
+    assert channel.encoder.encoded_frames == channel.encoder.seq + len(keyframe_seqs)
+    assert [name for name, _ in late] == ["keyframe"]
+    assert rebuild(late) == rebuild(streams[0])
+    assert late_status == 404 and listing == []
+    assert channel.summary()["finished"] and channel.summary()["score"] == score
+
+
+def test_server_error_responses(team_registry):
+    """알 수 없는 경로/경기와 잘못된 요청에 대한 응답 테스트"""
+
+    async def main():
+        server = LiveMatchServer(team_registry)
+        http = await server.start(port=0)
+        port = http.sockets[0].getsockname()[1]
+        statuses = [
+            (await request(port, "GET", "/nowhere"))[0],
+            (await request(port, "GET", "/matches/9/stream"))[0],
+        ]
+        for payload in (
+            {"home": "a", "away": "zzz"},
+            {"home": "a", "away": "b", "duration": "x"},
+            {"home": "a", "away": "b", "duration": 0},
+            {"home": "a", "away": "b", "duration": -5},
+            {"home": "a", "away": "b", "seed": "42"},
+            ["a", "b"],
+            "a",
+        ):
+            statuses.append((await request(port, "POST", "/matches", payload))[0])
+        http.close()
+        await http.wait_closed()
+        return server, statuses
+
+    server, statuses = asyncio.run(main())
+
+    assert statuses == [404, 404] + [400] * 7
+    assert server.channels == {}
+    with pytest.raises(ValueError):
+        server.start_match("a", "b", duration=float("inf"))
+    with pytest.raises(ValueError):
+        LiveMatchServer(team_registry, max_pending=1)
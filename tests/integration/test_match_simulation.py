@@ -1,9 +1,23 @@
 """경기 시뮬레이션 통합 테스트"""
 
+import random
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from loguru import logger
 
-from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.core.engine_log import EngineLog
+from sim_soccer.core.rng import MatchStreams
+from sim_soccer.core.simulator import MatchSimulator, run_to_completion
 from sim_soccer.io.team_loader import load_team
+from sim_soccer.models.events import (
+    ActionEvent,
+    FullTimeEvent,
+    GoalEvent,
+    HalfTimeEvent,
+    KickOffEvent,
+    PhaseChangeEvent,
+)
 from sim_soccer.models.match import MatchState
 from sim_soccer.models.player import PlayerState
 from sim_soccer.models.team import TeamState
@@ -117,6 +131,73 @@ def test_match_simulation_reproducibility():
     assert result1.winner == result2.winner
 
 
+def test_match_simulation_does_not_touch_global_random():
+    """시드 지정 실행이 전역 random 상태를 건드리지 않는지 테스트"""
+    random.seed(2024)
+    state_before = random.getstate()
+    
+    simulator = MatchSimulator(random_seed=7)
+    simulator.simulate_match(
+        create_simple_team("Home Team"), create_simple_team("Away Team"), random_seed=7
+    )
+    
+    assert random.getstate() == state_before
+
+
+def test_match_simulation_injected_rng():
+    """주입된 난수 생성기 사용 테스트"""
+    simulator1 = MatchSimulator(rng=random.Random(99))
+    result1 = simulator1.simulate_match(
+        create_simple_team("Home Team"), create_simple_team("Away Team")
+    )
+    
+    simulator2 = MatchSimulator(random_seed=99)
+    result2 = simulator2.simulate_match(
+        create_simple_team("Home Team"), create_simple_team("Away Team")
+    )
+    
+    assert simulator1.action_selector.rng is simulator1.rng
+    assert simulator1.resolver.rng is simulator1.rng
+    assert simulator1.phase_manager.rng is simulator1.rng
+    assert result1.home_team.score == result2.home_team.score
+    assert result1.away_team.score == result2.away_team.score
+    assert result1.home_team.stats == result2.home_team.stats
+
+
+def test_match_simulation_buffered_streams_replay():
+    """버퍼 스트림이 버퍼 없는 스트림과 같고, 기록한 난수로 경기를 재현하는지 테스트"""
+
+    def run(streams):
+        result = MatchSimulator().simulate_match(
+            create_simple_team("Home Team"), create_simple_team("Away Team"), streams=streams
+        )
+        return result.home_team.score, result.away_team.score, dict(result.home_team.stats)
+
+    recorded_streams = MatchStreams.for_match(3, 0, 8, record=True)
+    expected = run(MatchStreams.for_match(3, 0, 8, buffered=False))
+
+    assert run(MatchStreams.for_match(3, 0, 8)) == expected
+    assert run(recorded_streams) == expected
+    assert run(MatchStreams.replay(recorded_streams.recorded())) == expected
+
+
+def test_match_simulation_concurrent_threads():
+    """스레드별 시뮬레이터가 서로의 난수 스트림을 오염시키지 않는지 테스트"""
+    seeds = [1, 2, 3, 4]
+    
+    def run(seed: int):
+        result = MatchSimulator().simulate_match(
+            create_simple_team("Home Team"), create_simple_team("Away Team"), random_seed=seed
+        )
+        return result.home_team.score, result.away_team.score, result.home_team.stats
+    
+    sequential = [run(seed) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=len(seeds)) as executor:
+        concurrent = list(executor.map(run, seeds))
+    
+    assert concurrent == sequential
+
+
 def test_match_simulation_with_json_files():
     """JSON 파일을 사용한 경기 시뮬레이션 테스트"""
     try:
@@ -182,3 +263,149 @@ def test_match_simulation_stamina():
         assert player.stamina <= 100.0
         # 후반 회복이 적용되었으므로 모든 선수의 체력이 0보다는 커야 함
         assert player.stamina >= 0.0
+
+
+def test_match_simulation_fine_grid():
+    """10x6 격자에서도 경기가 끝까지 진행되고 Zone이 격자 범위 안에 있는지 테스트"""
+    from sim_soccer.field.grid import FieldGrid
+
+    grid = FieldGrid(10, 6)
+    home_team = create_simple_team("Home")
+    away_team = create_simple_team("Away")
+
+    simulator = MatchSimulator(grid=grid)
+    match_result = simulator.simulate_match(home_team, away_team, random_seed=42)
+
+    assert match_result.is_finished
+    assert len(match_result.event_log) > 0
+    assert grid.is_valid(match_result.ball_zone)
+    for team in (home_team, away_team):
+        assert all(grid.is_valid(player.zone) for player in team.players)
+
+
+def test_match_simulation_score_only_mode():
+    """점수 전용 모드가 같은 시드에서 전체 모드와 같은 점수를 내고 관찰용 작업을 건너뛰는지 테스트"""
+    simulator = MatchSimulator()
+    for seed in range(4):
+        full = simulator.simulate_match(
+            create_simple_team("Home"), create_simple_team("Away"), random_seed=seed
+        )
+        fast = simulator.simulate_match(
+            create_simple_team("Home"),
+            create_simple_team("Away"),
+            random_seed=seed,
+            mode="score_only",
+        )
+        assert (fast.home_team.score, fast.away_team.score) == (
+            full.home_team.score,
+            full.away_team.score,
+        )
+        assert fast.winner == full.winner
+        assert fast.event_log == []
+        assert all(value == 0 for value in fast.home_team.stats.values())
+        # 선수 상태(체력, 위치)도 같게 진행
+        assert [p.stamina for p in fast.home_team.players] == [
+            p.stamina for p in full.home_team.players
+        ]
+
+    with pytest.raises(ValueError):
+        simulator.simulate_match(
+            create_simple_team("Home"), create_simple_team("Away"), mode="fast"
+        )
+
+
+def test_match_simulation_sampled_contest_trace():
+    """컨테스트 상세 추적이 N번째 컨테스트마다 남고, 점수 전용 모드에서는 디버그 로그가 없는지 테스트"""
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(str(message)), level="DEBUG")
+    try:
+        simulator = MatchSimulator(log=EngineLog(contest_sample_every=500))
+        simulator.simulate_match(
+            create_simple_team("Home"), create_simple_team("Away"), random_seed=3
+        )
+        traces = [m for m in messages if "Contest trace" in m]
+        assert 1 <= len(traces) <= MatchSimulator.TOTAL_TICKS // 500
+        assert "success_rate=" in traces[0]
+
+        messages.clear()
+        simulator.simulate_match(
+            create_simple_team("Home"),
+            create_simple_team("Away"),
+            random_seed=3,
+            mode="score_only",
+        )
+        assert not any("| DEBUG" in m for m in messages)
+    finally:
+        logger.remove(handler_id)
+
+
+def test_simulate_match_iter_events():
+    """스트리밍 이벤트가 발생 순서대로 나오고 최종 경기 상태와 일치하는지 테스트"""
+    simulator = MatchSimulator()
+    events = simulator.simulate_match_iter(
+        create_simple_team("Home"), create_simple_team("Away"), random_seed=7
+    )
+    collected = []
+    while True:
+        try:
+            collected.append(next(events))
+        except StopIteration as stop:
+            match_result = stop.value
+            break
+
+    assert isinstance(collected[0], KickOffEvent)
+    assert isinstance(collected[-1], FullTimeEvent)
+    assert collected[-1].winner == match_result.winner
+    assert [e.tick for e in collected] == sorted(e.tick for e in collected)
+    assert sum(isinstance(e, HalfTimeEvent) for e in collected) == 1
+
+    goals = [e for e in collected if isinstance(e, GoalEvent)]
+    assert sum(e.team == "home" for e in goals) == match_result.home_team.score
+    assert sum(e.team == "away" for e in goals) == match_result.away_team.score
+    actions = [e for e in collected if isinstance(e, ActionEvent)]
+    assert sum(e.is_goal for e in actions) == len(goals)
+    assert len(actions) <= MatchSimulator.TOTAL_TICKS
+
+    # Phase 전환 이벤트는 끊김 없이 이어짐
+    phases = [e for e in collected if isinstance(e, PhaseChangeEvent)]
+    assert phases and phases[0].old_phase == "build_up"
+    for previous, current in zip(phases, phases[1:]):
+        assert current.old_phase == previous.new_phase
+
+    # 같은 시드의 simulate_match와 같은 결과
+    expected = simulator.simulate_match(
+        create_simple_team("Home"), create_simple_team("Away"), random_seed=7
+    )
+    assert (match_result.home_team.score, match_result.away_team.score) == (
+        expected.home_team.score,
+        expected.away_team.score,
+    )
+
+
+def test_simulate_match_iter_event_filter():
+    """선택한 이벤트 타입만 yield하고 결과는 바뀌지 않는지 테스트"""
+    simulator = MatchSimulator()
+    goals = list(
+        simulator.simulate_match_iter(
+            create_simple_team("Home"),
+            create_simple_team("Away"),
+            random_seed=7,
+            events={GoalEvent},
+        )
+    )
+    assert all(isinstance(e, GoalEvent) for e in goals)
+    match_result = simulator.match_state
+    assert match_result.is_finished
+    if goals:
+        assert (goals[-1].home_score, goals[-1].away_score) == (
+            match_result.home_team.score,
+            match_result.away_team.score,
+        )
+
+    silent = run_to_completion(
+        simulator.simulate_match_iter(
+            create_simple_team("Home"), create_simple_team("Away"), random_seed=7, events=()
+        )
+    )
+    assert silent.home_team.score == match_result.home_team.score
+    assert silent.away_team.score == match_result.away_team.score
@@ -0,0 +1,144 @@
+"""경기 리플레이 통합 테스트"""
+
+import copy
+
+import pytest
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.replay import Replay, record_match
+from sim_soccer.models.events import ActionEvent, TickEndEvent
+
+
+def snapshot(match_state):
+    """비교용 경기 상태 (선수별 Zone/체력/볼 소유, 팀 점수/모멘텀/통계 포함)"""
+    teams = []
+    for team in (match_state.home_team, match_state.away_team):
+        holder = team.get_ball_holder()
+        teams.append(
+            (
+                team.score,
+                team.momentum,
+                dict(team.stats),
+                holder.player_id if holder else None,
+                [(p.zone, p.stamina, p.has_ball) for p in team.players],
+                [p.player_id for p in team.get_players_in_zone(match_state.ball_zone)],
+            )
+        )
+    return (
+        match_state.tick,
+        match_state.half,
+        match_state.current_phase,
+        match_state.attacking_team,
+        match_state.ball_zone,
+        match_state.ball_holder,
+        teams,
+    )
+
+
+def test_replay_restores_state_at_any_tick(teams, tmp_path):
+    """리플레이로 복원한 Tick별 상태가 시뮬레이션 중의 상태와 같은지 테스트"""
+    home_team, away_team = teams
+    result, data = record_match(
+        MatchSimulator(),
+        copy.deepcopy(home_team),
+        copy.deepcopy(away_team),
+        random_seed=7,
+        keyframe_interval=250,
+    )
+
+    # 같은 시드로 다시 진행하며 Tick별 상태와 행동 기록
+    simulator = MatchSimulator()
+    expected, actions = {}, {}
+    for event in simulator.simulate_match_iter(
+        copy.deepcopy(home_team),
+        copy.deepcopy(away_team),
+        random_seed=7,
+        events={ActionEvent, TickEndEvent},
+    ):
+        if isinstance(event, ActionEvent):
+            actions[event.tick] = event
+        else:
+            expected[event.tick] = snapshot(simulator.match_state)
+
+    path = tmp_path / "match.ssrp"
+    path.write_bytes(data)
+    with Replay.open(str(path)) as replay:
+        assert len(replay) == MatchSimulator.TOTAL_TICKS
+        # 간격과 무관하게 전반 종료 Tick에는 키프레임이 있음
+        assert MatchSimulator.HALF_TIME_TICK in replay.keyframe_ticks
+        assert replay.header["result"]["home_score"] == result.home_team.score
+
+        ticks = list(range(0, MatchSimulator.TOTAL_TICKS, 37)) + [
+            249,
+            250,
+            251,
+            2699,
+            2700,
+            2701,
+            MatchSimulator.TOTAL_TICKS - 1,
+        ]
+        for tick in ticks:
+            assert snapshot(replay.state_at(tick)) == expected[tick], tick
+
+        final = replay.state_at(MatchSimulator.TOTAL_TICKS - 1)
+        assert final.is_finished and final.winner == result.winner
+
+        records = [replay.record(tick) for tick in range(len(replay))]
+        for record in records:
+            action = actions[record.tick]
+            # 판정 난수와 성공 확률은 엔진 값 그대로 (float64)
+            assert (record.roll, record.success_rate) == (action.roll, action.success_rate)
+            assert record.success == (record.roll < record.success_rate)
+        goals = [record for record in records if record.is_goal]
+        assert len(goals) == result.home_team.score + result.away_team.score
+        assert goals[-1].score == (result.home_team.score, result.away_team.score)
+
+
+def test_replay_keyframes_ticks_without_action(teams, monkeypatch):
+    """행동이 없던 Tick도 키프레임 Tick이면 키프레임을 남기는지 테스트 (첫 Tick, 전반 종료)"""
+    home_team, away_team = teams
+    idle_ticks = {0, 1, MatchSimulator.HALF_TIME_TICK}
+
+    def run(record):
+        simulator = MatchSimulator()
+        process_action = simulator._process_action
+
+        def skip_idle_ticks(match_state):
+            if match_state.tick in idle_ticks:
+                return None
+            return process_action(match_state)
+
+        monkeypatch.setattr(simulator, "_process_action", skip_idle_ticks)
+        home, away = copy.deepcopy(home_team), copy.deepcopy(away_team)
+        if record:
+            return record_match(simulator, home, away, random_seed=3)[1]
+        return {
+            event.tick: snapshot(simulator.match_state)
+            for event in simulator.simulate_match_iter(
+                home, away, random_seed=3, events={TickEndEvent}
+            )
+        }
+
+    expected = run(record=False)
+    replay = Replay(run(record=True))
+    assert {0, MatchSimulator.HALF_TIME_TICK} <= set(replay.keyframe_ticks)
+    for tick in sorted(idle_ticks) + [2, MatchSimulator.HALF_TIME_TICK + 1]:
+        assert snapshot(replay.state_at(tick)) == expected[tick], tick
+    for tick in idle_ticks:
+        assert replay.record(tick).action_type is None
+
+
+def test_replay_rejects_invalid_input(teams):
+    """잘못된 파일, Tick 범위, 키프레임 간격에 대한 예외 테스트"""
+    home_team, away_team = teams
+    with pytest.raises(ValueError):
+        Replay(b"NOPE" + bytes(16))
+    with pytest.raises(ValueError):
+        record_match(MatchSimulator(), home_team, away_team, random_seed=1, keyframe_interval=0)
+
+    _, data = record_match(MatchSimulator(), home_team, away_team, random_seed=1)
+    replay = Replay(data)
+    with pytest.raises(ValueError):
+        replay.state_at(MatchSimulator.TOTAL_TICKS)
+    with pytest.raises(ValueError):
+        replay.record(-1)
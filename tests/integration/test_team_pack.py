@@ -0,0 +1,70 @@
+"""팀 묶음 통합 테스트"""
+
+import copy
+
+import pytest
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_pack import TeamPack, pack_teams
+from sim_soccer.models.team_template import TeamTemplate
+
+
+@pytest.fixture
+def teams(teams):
+    """예제 팀과 경기를 마친 원정 팀 복사본"""
+    home_team, away_team = teams
+    played = copy.deepcopy(away_team)
+    MatchSimulator().simulate_match(copy.deepcopy(home_team), played, random_seed=5)
+    played.players.pop()  # 선수 수가 다른 팀
+    played.rebuild_index()
+    return [home_team, away_team, played]
+
+
+def test_team_pack_round_trip(teams, tmp_path):
+    """묶음에서 읽은 팀이 원본 팀 구성의 경기 시작 상태와 같은지 테스트 (bytes, mmap 파일)"""
+    fixtures = [(0, 1), (1, 2), (2, 0)]
+    data = pack_teams(teams, fixtures)
+
+    pack = TeamPack(data)
+    assert len(pack) == 3 and pack.fixture_count == 3
+    assert [pack.fixture(i) for i in range(3)] == fixtures
+    for index, team in enumerate(teams):
+        assert pack.template(index) == TeamTemplate.from_team(team)
+        assert pack.team(index) == TeamTemplate.from_team(team).instantiate()
+    assert pack.team(0) == teams[0]
+    # 경기를 마친 팀의 점수, 통계, 체력은 묶음에 들어가지 않음
+    played = pack.team(2)
+    assert teams[2].score or teams[2].stats["passes_attempted"]
+    assert played.score == 0 and played.stats["passes_attempted"] == 0
+    assert all(p.stamina == 100.0 and not p.has_ball for p in played.players)
+    assert pack.template(0) is pack.template(0)
+    assert pack.name is None
+
+    path = tmp_path / "league.sstp"
+    path.write_bytes(data)
+    with TeamPack.open(str(path)) as mapped:
+        assert mapped.team(2) == played
+    assert mapped.template(2) == pack.template(2)  # 닫은 뒤에도 만든 템플릿은 사용 가능
+
+    with pytest.raises(ValueError):
+        TeamPack(b"NOPE" + bytes(32))
+    with pytest.raises(ValueError):
+        pack_teams(teams, [(0, 3)])
+    with pytest.raises(IndexError):
+        pack.fixture(3)
+    with pytest.raises(IndexError):
+        pack.team(3)
+
+
+def test_team_pack_shared_memory(teams):
+    """공유 메모리로 공개한 묶음에 이름으로 연결할 수 있는지 테스트"""
+    publisher = TeamPack.publish(teams, [(0, 2)])
+    try:
+        attached = TeamPack.attach(publisher.name)
+        home, away = attached.fixture(0)
+        assert attached.team(home) == teams[0]
+        assert attached.team(away) == TeamTemplate.from_team(teams[2]).instantiate()
+        attached.close()
+    finally:
+        publisher.close()
+        publisher.unlink()
@@ -0,0 +1,90 @@
+"""팀 템플릿 통합 테스트"""
+
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.models.team_template import TeamTemplate
+
+
+def play(home_template: TeamTemplate, away_template: TeamTemplate, seed: int):
+    """템플릿 풀의 팀으로 한 경기를 진행하고 (점수, 통계) 반환"""
+    home = home_template.acquire()
+    away = away_template.acquire()
+    try:
+        MatchSimulator().simulate_match(home, away, random_seed=seed)
+        return home.score, away.score, dict(home.stats), dict(away.stats)
+    finally:
+        home_template.release(home)
+        away_template.release(away)
+
+
+def test_instantiate_and_reset_match_fresh_copy(teams):
+    """새로 만든 팀과 되돌린 팀이 원본 팀의 깊은 복사본과 같은지 테스트"""
+    home_team, away_team = teams
+    template = TeamTemplate.from_team(home_team)
+
+    fresh = template.instantiate()
+    assert fresh == copy.deepcopy(home_team)
+    assert fresh.players[0] is not template.instantiate().players[0]
+
+    MatchSimulator().simulate_match(fresh, copy.deepcopy(away_team), random_seed=3)
+    assert fresh != home_team
+
+    stats = fresh.players[0].stats
+    assert template.reset(fresh) is fresh
+    assert fresh == home_team
+    assert fresh.players[0].stats is stats  # 스탯 배열은 제자리에서 덮어씀
+    assert fresh.get_ball_holder() is None
+    assert [p.player_id for p in fresh.get_players_in_zone(2)] == [
+        p.player_id for p in home_team.get_players_in_zone(2)
+    ]
+
+    # 선수 구성이 바뀐 팀은 선수 목록을 새로 만듦
+    fresh.players.pop()
+    assert template.reset(fresh) == home_team
+
+    assert pickle.loads(pickle.dumps(template)) == template
+    assert copy.deepcopy(template) is template
+
+
+def test_template_from_played_team_starts_fresh(teams):
+    """경기를 치른 팀으로 만든 템플릿도 경기 시작 상태를 주는지 테스트 (snapshot은 현재 상태)"""
+    home_team, away_team = teams
+    played_home, played_away = copy.deepcopy(home_team), copy.deepcopy(away_team)
+    MatchSimulator().simulate_match(played_home, played_away, random_seed=3)
+    assert played_home.stats["passes_attempted"] > 0
+
+    template = TeamTemplate.from_team(played_home)
+    assert template == TeamTemplate.from_team(home_team)
+    fresh = template.instantiate()
+    assert fresh == home_team
+    assert fresh.score == 0 and fresh.momentum == 0 and fresh.stats["shots"] == 0
+    assert all(p.stamina == 100.0 and not p.has_ball for p in fresh.players)
+    assert play(template, TeamTemplate.from_team(played_away), 5) == play(
+        TeamTemplate.from_team(home_team), TeamTemplate.from_team(away_team), 5
+    )
+
+    snapshot = TeamTemplate.snapshot(played_home)
+    assert snapshot.instantiate() == played_home
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+
+
+def test_pooled_teams_give_same_results_across_threads(teams):
+    """스레드 간에 템플릿을 공유해도 경기 결과가 깊은 복사와 같은지 테스트"""
+    home_team, away_team = teams
+    seeds = range(6)
+    expected = []
+    for seed in seeds:
+        home, away = copy.deepcopy(home_team), copy.deepcopy(away_team)
+        MatchSimulator().simulate_match(home, away, random_seed=seed)
+        expected.append((home.score, away.score, dict(home.stats), dict(away.stats)))
+
+    home_template = TeamTemplate.from_team(home_team)
+    away_template = TeamTemplate.from_team(away_team)
+    assert [play(home_template, away_template, seed) for seed in seeds] == expected
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda seed: play(home_template, away_template, seed), seeds))
+    assert results == expected
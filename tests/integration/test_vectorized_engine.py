@@ -0,0 +1,172 @@
+"""벡터화 엔진 통합 테스트"""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sim_soccer.core.batch import simulate_many
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.core.vectorized import _STAMINA_PENALTY_EDGES, STAT_KEYS, VectorizedMatchEngine
+from sim_soccer.models.team_template import TeamTemplate
+from sim_soccer.systems.stamina import apply_stamina_penalty
+
+
+def test_stamina_penalty_edges_match_stamina_system():
+    """벡터화 엔진의 체력 페널티 구간이 체력 시스템과 같은지 테스트"""
+    stamina = np.linspace(0.0, 100.0, 4001)
+    vectorized = 4 - np.searchsorted(np.array(_STAMINA_PENALTY_EDGES), stamina, side="right")
+    assert vectorized.tolist() == [apply_stamina_penalty(s) for s in stamina]
+
+
+def test_vectorized_reproducible_and_pure(teams):
+    """같은 시드면 결과가 같고 입력 팀은 변경되지 않는지 테스트"""
+    home_team, away_team = teams
+    engine = VectorizedMatchEngine()
+
+    result1 = engine.simulate([(home_team, away_team)], matches_per_pairing=8, seed=3)
+    result2 = engine.simulate([(home_team, away_team)], matches_per_pairing=8, seed=3)
+
+    assert result1.matches == 8
+    assert np.array_equal(result1.home_score, result2.home_score)
+    assert np.array_equal(result1.away_stats, result2.away_stats)
+    assert home_team.score == 0
+    assert all(p.stamina == 100.0 for p in home_team.players)
+
+
+def test_vectorized_batch_results(teams):
+    """대진별 BatchResult 집계 테스트"""
+    home_team, away_team = teams
+    pairings = [(home_team, away_team), (away_team, home_team)]
+
+    result = VectorizedMatchEngine().simulate(pairings, matches_per_pairing=5, seed=0)
+    batch = result.to_batch_results(pairings)
+
+    assert [r.matches for r in batch] == [5, 5]
+    assert batch[1].home_team_name == away_team.team_name
+    assert batch[0].home_wins + batch[0].draws + batch[0].away_wins == 5
+    for r in batch:
+        assert r.mean_home_stats["shots"] >= r.mean_home_stats["shots_on_target"]
+
+
+def test_vectorized_master_seed_independent_of_batch(teams):
+    """마스터 시드 사용 시 경기 결과가 함께 실행한 경기, 배치 분할과 무관한지 테스트"""
+    home_team, away_team = teams
+    engine = VectorizedMatchEngine()
+    pairings = [(home_team, away_team), (away_team, home_team)]
+
+    whole = engine.simulate(pairings, matches_per_pairing=6, master_seed=4)
+    alone = engine.simulate(pairings[:1], matches_per_pairing=6, master_seed=4)
+    tail = engine.simulate(pairings, matches_per_pairing=2, master_seed=4, first_match=4)
+
+    assert np.array_equal(whole.home_score[:6], alone.home_score)
+    assert np.array_equal(whole.home_stats[:6], alone.home_stats)
+    assert np.array_equal(whole.away_score[[4, 5, 10, 11]], tail.away_score)
+    with pytest.raises(ValueError):
+        engine.simulate(pairings, seed=1, master_seed=4)
+
+
+def assert_same_mean(name, vec_values, scalar_values):
+    """두 표본의 평균 차이가 4 표준오차 이내인지 확인 (같은 분포로 판단)"""
+    vec_values = np.asarray(vec_values, dtype=float)
+    scalar_values = np.asarray(scalar_values, dtype=float)
+    standard_error = math.sqrt(
+        vec_values.var(ddof=1) / len(vec_values) + scalar_values.var(ddof=1) / len(scalar_values)
+    )
+    difference = abs(vec_values.mean() - scalar_values.mean())
+    assert difference <= 4 * standard_error + 1e-9, name
+
+
+def chi_square_survival(statistic, df):
+    """자유도 df인 카이제곱 분포의 상위 확률 P(X >= statistic)"""
+    half = statistic / 2
+    if df % 2 == 0:
+        return math.exp(-half) * sum(half**i / math.factorial(i) for i in range(df // 2))
+    return math.erfc(math.sqrt(half)) + math.exp(-half) * sum(
+        half ** (i - 0.5) / math.gamma(i + 0.5) for i in range(1, (df + 1) // 2)
+    )
+
+
+def assert_same_distribution(name, vec_counts, scalar_counts):
+    """두 표본의 범주별 빈도가 같은 분포에서 나왔는지 카이제곱 동질성 검정 (유의수준 0.001)
+
+    기대 빈도가 5 미만인 범주는 다음 범주와 합친다.
+    """
+    table = np.array([vec_counts, scalar_counts], dtype=float)
+    share = table.sum(axis=1) / table.sum()
+    merged = []
+    pending = np.zeros(2)
+    for column in table.T:
+        pending = pending + column
+        if pending.sum() * share.min() >= 5:
+            merged.append(pending)
+            pending = np.zeros(2)
+    if pending.any():
+        merged[-1] = merged[-1] + pending
+    table = np.array(merged).T
+
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / table.sum()
+    statistic = ((table - expected) ** 2 / expected).sum()
+    df = table.shape[1] - 1
+    assert df >= 1, name
+    p_value = chi_square_survival(statistic, df)
+    assert p_value > 0.001, f"{name}: chi2={statistic:.1f}, df={df}, p={p_value:.2g}"
+
+
+def test_chi_square_survival():
+    """카이제곱 상위 확률이 알려진 임계값과 일치하는지 테스트"""
+    for statistic, df in ((10.828, 1), (13.816, 2), (16.266, 3), (29.588, 10)):
+        assert chi_square_survival(statistic, df) == pytest.approx(0.001, rel=1e-3)
+
+
+def test_vectorized_statistically_equivalent_to_scalar(teams, quiet_logger):
+    """벡터화 엔진과 스칼라 엔진의 결과 분포가 통계적으로 일치하는지 테스트"""
+    home_team, away_team = teams
+    vectorized = VectorizedMatchEngine().simulate([(home_team, away_team)], 1000, seed=11)
+
+    # 득점: 점수 전용 모드로 스칼라 경기 수백 개
+    scalar = simulate_many(home_team, away_team, seeds=range(300), mode="score_only")
+    vec_batch = vectorized.to_batch_results([(home_team, away_team)])[0]
+    for name, vec_values, vec_distribution, distribution in (
+        ("home_goals", vectorized.home_score, vec_batch.home_goals, scalar.home_goals),
+        ("away_goals", vectorized.away_score, vec_batch.away_goals, scalar.away_goals),
+    ):
+        scalar_values = [goals for goals, count in distribution.items() for _ in range(count)]
+        assert_same_mean(name, vec_values, scalar_values)
+        # 평균뿐 아니라 득점 수 분포 전체 비교
+        goals = range(max(max(vec_distribution), max(distribution)) + 1)
+        assert_same_distribution(
+            name,
+            [vec_distribution.get(g, 0) for g in goals],
+            [distribution.get(g, 0) for g in goals],
+        )
+
+    # 승/무/패 비율
+    assert_same_distribution(
+        "home_win_draw_loss",
+        [vec_batch.home_wins, vec_batch.draws, vec_batch.away_wins],
+        [scalar.home_wins, scalar.draws, scalar.away_wins],
+    )
+
+    # 통계: 점수 전용 모드는 통계가 비어 있으므로 전체 모드 경기로 비교
+    simulator = MatchSimulator()
+    home_template = TeamTemplate.from_team(home_team)
+    away_template = TeamTemplate.from_team(away_team)
+    scalar_stats = {"home": [], "away": []}
+    for seed in range(60):
+        home, away = home_template.acquire(), away_template.acquire()
+        simulator.simulate_match(home, away, random_seed=seed)
+        scalar_stats["home"].append(dict(home.stats))
+        scalar_stats["away"].append(dict(away.stats))
+        home_template.release(home)
+        away_template.release(away)
+
+    for column in ("shots", "passes_attempted", "passes_completed", "dribbles_attempted"):
+        index = STAT_KEYS.index(column)
+        for side, vec_stats in (("home", vectorized.home_stats), ("away", vectorized.away_stats)):
+            assert_same_mean(
+                f"{side}_{column}",
+                vec_stats[:, index],
+                [stats[column] for stats in scalar_stats[side]],
+            )
@@ -0,0 +1,39 @@
+"""행동 결과 핸들러 레지스트리 단위 테스트"""
+
+from sim_soccer.core.action_handlers import (
+    DEFAULT_ACTION_HANDLERS,
+    ActionHandlerRegistry,
+    handle_no_effect,
+    handle_pass,
+)
+from sim_soccer.core.ids import PASS_ACTIONS, Action
+from sim_soccer.core.simulator import MatchSimulator
+from tests.helpers import create_test_team
+
+
+def test_default_registry_covers_every_action():
+    """모든 행동 ID에 핸들러가 있고 패스 계열은 같은 핸들러를 쓰는지 테스트"""
+    assert len(DEFAULT_ACTION_HANDLERS.handlers) == len(Action)
+    for action in PASS_ACTIONS:
+        assert DEFAULT_ACTION_HANDLERS.get(action) is handle_pass
+    for action in (Action.CROSS, Action.SHOOT_LONG, Action.QUICK_ATTACK, Action.POSITIONING):
+        assert DEFAULT_ACTION_HANDLERS.get(action) is handle_no_effect
+
+
+def test_custom_handler_is_dispatched():
+    """새 핸들러를 등록하면 시뮬레이터 수정 없이 호출되는지 테스트"""
+    registry = DEFAULT_ACTION_HANDLERS.copy()
+    calls = []
+
+    def handle_cross(sim, plan, attacking_team, defending_team, match_state):
+        calls.append((plan.action, plan.attacker.player_id, attacking_team.team_id))
+
+    registry.register(Action.CROSS, handle_cross)
+    assert DEFAULT_ACTION_HANDLERS.get(Action.CROSS) is handle_no_effect
+    assert isinstance(registry, ActionHandlerRegistry)
+
+    simulator = MatchSimulator(random_seed=3, action_handlers=registry)
+    simulator.simulate_match(create_test_team("home"), create_test_team("away"), random_seed=3)
+
+    assert calls
+    assert all(action == Action.CROSS for action, _, _ in calls)
@@ -0,0 +1,61 @@
+"""ActionSelector 단위 테스트"""
+
+import random
+
+from sim_soccer.core.action_selector import ActionSelector
+from sim_soccer.field.positioning import initialize_player_positions
+from sim_soccer.models.match import MatchState
+from tests.helpers import create_test_team
+
+
+def create_match_state() -> MatchState:
+    """킥오프 배치의 경기 상태 생성"""
+    home = create_test_team("home")
+    away = create_test_team("away")
+    initialize_player_positions(home, "build_up", True)
+    initialize_player_positions(away, "defense", False)
+    return MatchState(match_id="test", home_team=home, away_team=away, ball_zone=5)
+
+
+def test_plan_action_reuses_slot_and_fills_pass_target():
+    """행동 계획이 재사용 슬롯에 채워지고 패스 대상이 포함되는지 테스트"""
+    match_state = create_match_state()
+    match_state.current_phase = "midfield"
+    selector = ActionSelector(rng=random.Random(1))
+    situation = selector.plan.situation
+
+    seen_pass = False
+    for _ in range(200):
+        plan = selector.plan_action("midfield", match_state.home_team, match_state)
+        assert plan is selector.plan
+        assert plan.situation is situation
+        assert plan.attacker is not None
+        if plan.action_type in ("pass", "pass_to_forward"):
+            seen_pass = True
+            assert plan.target_zone == selector.get_pass_target_zone(plan.action_type, "midfield")
+            assert plan.target_player is not None
+            assert plan.target_player is not plan.attacker
+            assert "distance" in plan.situation
+        else:
+            assert plan.target_player is None
+            assert plan.target_zone is None
+            assert "distance" not in plan.situation
+        assert (plan.defender is not None) == (plan.action_type in selector.DEFENDED_ACTIONS)
+    assert seen_pass
+    assert not hasattr(match_state, "_pass_target")
+
+
+def test_plan_action_matches_select_action_and_players():
+    """plan_action이 select_action -> select_players와 같은 난수 순서로 선택하는지 테스트"""
+    match_state = create_match_state()
+    planner = ActionSelector(rng=random.Random(5))
+    legacy = ActionSelector(rng=random.Random(5))
+
+    for phase in ["build_up", "midfield", "final_third"] * 30:
+        plan = planner.plan_action(phase, match_state.home_team, match_state)
+        action_type, situation = legacy.select_action(phase, match_state.home_team, match_state)
+        attacker, defender = legacy.select_players(action_type, match_state.home_team, match_state)
+        assert plan.action_type == action_type
+        assert plan.situation == situation
+        assert plan.attacker is attacker
+        assert plan.defender is defender
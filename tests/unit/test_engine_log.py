@@ -0,0 +1,99 @@
+"""EngineLog 단위 테스트"""
+
+import sys
+
+import pytest
+from loguru import logger
+
+from sim_soccer.core.contest_resolver import ContestResolver
+from sim_soccer.core.engine_log import EngineLog, is_debug_enabled
+
+
+@pytest.fixture
+def bare_logger():
+    """loguru 핸들러를 모두 제거한 상태로 실행하고 기본 stderr 핸들러 복원"""
+    logger.remove()
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+class ExplodingScore(float):
+    """포맷팅되면 실패하는 점수 (디버그 메시지 생성 여부 확인용)"""
+
+    def __format__(self, spec):
+        raise AssertionError("debug message was formatted")
+
+
+def test_sample_contest_every_nth():
+    """N번째 컨테스트마다 한 번씩만 상세 추적하는지 테스트"""
+    log = EngineLog(contest_sample_every=3)
+    log.debug_enabled = True
+    assert [log.sample_contest() for _ in range(9)] == [False, False, True] * 3
+
+    # refresh는 카운터를 초기화
+    log.refresh()
+    log.debug_enabled = True
+    assert [log.sample_contest() for _ in range(3)] == [False, False, True]
+
+
+def test_contest_sampling_off_by_default():
+    """기본 설정에서는 디버그가 켜져 있어도 컨테스트 상세 추적을 하지 않는지 테스트"""
+    for log in (EngineLog(), EngineLog(contest_sample_every=0)):
+        log.debug_enabled = True
+        assert not any(log.sample_contest() for _ in range(10))
+
+
+def test_disabled_log_skips_formatting():
+    """디버그가 꺼져 있으면 메시지를 만들지 않고 샘플링도 하지 않는지 테스트"""
+    log = EngineLog(contest_sample_every=1, enabled=False)
+    assert not log.debug_enabled
+    assert not any(log.sample_contest() for _ in range(5))
+
+    resolver = ContestResolver(log=log)
+    # 포맷팅되면 AssertionError가 발생하는 점수로 판정
+    assert resolver.resolve_contest(ExplodingScore(100.0), random_value=0.0)
+
+
+def test_refresh_follows_loguru_level():
+    """DEBUG를 받는 핸들러가 있을 때만 활성화되는지 테스트"""
+    messages = []
+    handler_id = logger.add(messages.append, level="DEBUG")
+    try:
+        log = EngineLog()
+        assert is_debug_enabled()
+        assert log.debug_enabled
+        log.refresh(enabled=False)
+        assert not log.debug_enabled
+    finally:
+        logger.remove(handler_id)
+    # 확인용 메시지는 출력되지 않음
+    assert messages == []
+
+
+def test_debug_state_read_from_loguru(bare_logger):
+    """loguru를 직접 설정해도 핸들러 레벨과 disable 상태를 그대로 따르는지 테스트"""
+    assert not is_debug_enabled()
+
+    info_id = logger.add(lambda message: None, level="INFO")
+    assert not EngineLog().debug_enabled
+
+    debug_id = logger.add(lambda message: None, level=5)  # TRACE
+    assert is_debug_enabled()
+    logger.disable("sim_soccer")
+    try:
+        assert not is_debug_enabled()
+    finally:
+        logger.enable("sim_soccer")
+
+    logger.remove(debug_id)
+    assert not is_debug_enabled()
+    logger.remove(info_id)
+    logger.add(lambda message: None, level="DEBUG")
+    assert EngineLog().debug_enabled
+
+
+def test_invalid_sample_interval():
+    """샘플링 간격이 음수이면 예외가 발생하는지 테스트"""
+    with pytest.raises(ValueError):
+        EngineLog(contest_sample_every=-1)
@@ -0,0 +1,114 @@
+"""열 기반 이벤트 로그 저장소 테스트"""
+
+from sim_soccer.models.event_store import EventStore
+from sim_soccer.models.events import EventLog
+from sim_soccer.models.match import MatchState
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.team import TeamState
+
+
+def create_team(name: str) -> TeamState:
+    """테스트용 팀 생성"""
+    return TeamState(
+        team_id=name,
+        team_name=name,
+        formation="4-4-2",
+        players=[PlayerState(player_id=1, name="GK", position="GK", zone=2)],
+    )
+
+
+def test_event_store_rows_match_event_logs():
+    """추가한 EventLog와 같은 행을 읽을 수 있는지 테스트"""
+    events = [
+        EventLog(
+            tick=10,
+            phase="midfield",
+            event_type="tackle",
+            team="away",
+            player_id=3,
+            action="tackle",
+            result="failure",
+            description="tackle failure",
+        ),
+        EventLog(
+            tick=20,
+            phase="final_third",
+            event_type="goal",
+            team="home",
+            player_id=9,
+            action="shoot",
+            result="success",
+            description="Goal scored by FW",
+            stats_used={"SHO": 8.0},
+        ),
+        EventLog(tick=30, phase="transition", event_type="note", team="home"),
+    ]
+    store = EventStore(events)
+
+    assert len(store) == 3
+    assert store == events
+    assert list(store) == events
+    assert store[-1] == events[-1]
+    assert store[1:] == events[1:]
+    assert [e.to_dict() for e in store] == [e.to_dict() for e in events]
+    assert EventStore() == []
+
+
+def test_event_store_lazy_description_and_type_index():
+    """생략한 설명은 행동/결과로 만들어지고 타입별 보기가 발생 순서를 유지하는지 테스트"""
+    store = EventStore()
+    for tick, action, result in [
+        (1, "tackle", "success"),
+        (2, "intercept", "failure"),
+        (3, "tackle", "failure"),
+        (4, "shoot", "failure"),
+    ]:
+        store.record(tick, "midfield", action, "home", player_id=5, action=action, result=result)
+    store.record(
+        5,
+        "midfield",
+        "goal",
+        "away",
+        action="shoot",
+        result="success",
+        description="Goal scored by FW",
+    )
+
+    assert store[0].description == "tackle success"
+    assert store[0].player_id == 5 and store[4].player_id is None
+    assert store[4].description == "Goal scored by FW"
+
+    tackles = store.by_type("tackle")
+    assert [e.tick for e in tackles] == [1, 3]
+    assert len(store.by_type("unknown")) == 0
+    assert [e.tick for e in store.by_types(["goal", "intercept", "tackle", "unknown"])] == [
+        1,
+        2,
+        3,
+        5,
+    ]
+
+
+def test_match_state_event_log():
+    """MatchState의 이벤트 로그 API가 저장소를 사용하는지 테스트"""
+    goal = EventLog(
+        tick=100,
+        phase="final_third",
+        event_type="goal",
+        team="home",
+        action="shoot",
+        result="success",
+    )
+    match_state = MatchState(
+        match_id="m",
+        home_team=create_team("Home"),
+        away_team=create_team("Away"),
+        event_log=[goal],
+    )
+    assert isinstance(match_state.event_log, EventStore)
+
+    match_state.add_event(EventLog(tick=200, phase="midfield", event_type="tackle", team="away"))
+
+    assert match_state.get_goals() == [goal]
+    assert [e.tick for e in match_state.get_events_by_type("tackle")] == [200]
+    assert match_state.get_goals()[0].description is None
@@ -0,0 +1,94 @@
+"""실시간 스트리밍 인코딩 테스트"""
+
+import asyncio
+import json
+
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.live.encoding import (
+    StateDeltaEncoder,
+    apply_delta,
+    diff_state,
+    encode_sse,
+    event_to_dict,
+    snapshot_state,
+)
+from sim_soccer.live.server import ChannelClient
+from sim_soccer.models.events import MATCH_EVENT_TYPES
+
+
+def parse_frame(frame: bytes):
+    """SSE 프레임을 (이벤트 이름, 데이터)로 분해"""
+    name_line, data_line = frame.decode("utf-8").strip().split("\n")
+    return name_line[len("event: ") :], json.loads(data_line[len("data: ") :])
+
+
+def test_delta_roundtrip_and_event_types(teams):
+    """델타를 차례로 적용하면 전체 스냅샷과 같아지고 모든 이벤트 타입이 변환되는지 테스트"""
+    home_team, away_team = teams
+    simulator = MatchSimulator()
+    seen_types = set()
+    state = {}
+    for event in simulator.simulate_match_iter(home_team, away_team, random_seed=42):
+        converted = event_to_dict(event)
+        assert converted["tick"] == event.tick
+        json.dumps(converted)
+        seen_types.add(type(event))
+
+        current = snapshot_state(simulator.match_state)
+        state = apply_delta(state, diff_state(state, current))
+        assert state == current
+
+    assert seen_types == set(MATCH_EVENT_TYPES)
+    assert state["score"] == [home_team.score, away_team.score]
+
+
+def test_sparse_stamina_delta():
+    """체력 목록은 바뀐 선수만 델타에 포함되는지 테스트"""
+    previous = {"tick": 1, "stamina_home": [100, 90, 80]}
+    current = {"tick": 2, "stamina_home": [100, 89, 80]}
+
+    delta = diff_state(previous, current)
+
+    assert delta == {"tick": 2, "stamina_home": {"1": 89}}
+    assert apply_delta(previous, delta) == current
+
+
+def test_encoder_frames(teams):
+    """업데이트 프레임과 업데이트마다 한 번만 인코딩되는 키프레임 테스트"""
+    home_team, away_team = teams
+    simulator = MatchSimulator()
+    events = simulator.simulate_match_iter(home_team, away_team, random_seed=1)
+    encoder = StateDeltaEncoder()
+
+    kickoff = next(events)
+    name, message = parse_frame(encoder.update(simulator.match_state, [kickoff]))
+    assert name == "update"
+    assert message["seq"] == 1
+    assert message["events"][0]["type"] == "kickoff"
+    assert message["delta"] == snapshot_state(simulator.match_state)
+
+    keyframe = encoder.keyframe()
+    assert encoder.keyframe() is keyframe
+    assert encoder.encoded_frames == 2
+    name, message = parse_frame(keyframe)
+    assert name == "keyframe"
+    assert message["state"] == encoder.state
+
+    encoder.update(simulator.match_state, [next(events)])
+    assert encoder.keyframe() is not keyframe
+    assert encode_sse("end", {"seq": 2}) == b'event: end\ndata: {"seq":2}\n\n'
+
+
+def test_full_client_queue_replaced_by_keyframe():
+    """구독자 큐가 가득 차면 밀린 프레임을 버리고 키프레임으로 대체하는지 테스트"""
+
+    async def main():
+        client = ChannelClient(max_pending=2)
+        assert client.offer(b"a", lambda: b"key") == 0
+        assert client.offer(b"b", lambda: b"key") == 0
+        assert client.offer(b"c", lambda: b"key") == 2
+        assert client.offer(None, lambda: b"key2") == 0
+        assert client.offer(None, lambda: b"key3") == 2
+        return [client.queue.get_nowait() for _ in range(client.queue.qsize())]
+
+    assert asyncio.run(main()) == [b"key3", None]
@@ -0,0 +1,143 @@
+"""CompiledMatchup 단위 테스트"""
+
+import itertools
+
+from sim_soccer.core.action_selector import ActionSelector
+from sim_soccer.core.contest_resolver import ContestResolver
+from sim_soccer.core.ids import PASS_ACTIONS, Action
+from sim_soccer.core.matchup import CompiledMatchup
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.team import TeamState
+
+
+def create_test_team(team_id: str, tactics: dict, stat_offset: int) -> TeamState:
+    """테스트용 팀 생성 (포지션과 스탯이 선수마다 다름)"""
+    positions = ["GK", "DF", "MF", "FW"]
+    players = []
+    for i, position in enumerate(positions):
+        stats = {
+            stat: 1 + (i * 3 + j + stat_offset) % 10
+            for j, stat in enumerate(["PAS", "DRI", "SHO", "SPA", "TAC", "INT", "STA"])
+        }
+        players.append(
+            PlayerState(player_id=i + 1, name=f"{team_id} {i}", position=position, stats=stats)
+        )
+    return TeamState(
+        team_id=team_id,
+        team_name=team_id,
+        formation="1-1-1-1",
+        players=players,
+        tactics=tactics,
+    )
+
+
+def test_success_rate_matches_resolver():
+    """컴파일된 성공 확률이 ContestResolver와 비트 단위로 같은지 테스트"""
+    home = create_test_team(
+        "home",
+        {
+            "attack": 8,
+            "pass_style": 2,
+            "pressing": 9,
+            "defense_line": 5,
+            "transition_speed": 7,
+            "width": 3,
+        },
+        0,
+    )
+    away = create_test_team(
+        "away",
+        {
+            "attack": 3,
+            "pass_style": 9,
+            "pressing": 2,
+            "defense_line": 4,
+            "transition_speed": 5,
+            "width": 8,
+        },
+        4,
+    )
+    resolver = ContestResolver()
+    matchup = CompiledMatchup(home, away, resolver=resolver)
+    teams = {"home": home, "away": away}
+
+    staminas = [100.0, 55.0, 35.0, 15.0, 5.0]  # 체력 페널티 구간 0-4
+    for side, action, is_second_half, momentum in itertools.product(
+        ("home", "away"), Action, (False, True), (-10, -3, 0, 7, 10)
+    ):
+        attacking_team = teams[side]
+        defending_team = teams["away" if side == "home" else "home"]
+        distances = range(matchup.max_distance + 1) if action in PASS_ACTIONS else [0]
+        for attacker, defender, stamina, distance in itertools.product(
+            attacking_team.players, [None] + defending_team.players, staminas, distances
+        ):
+            attacker.stamina = stamina
+            if defender is not None:
+                defender.stamina = staminas[-1 - staminas.index(stamina)]
+
+            situation = {}
+            if action in PASS_ACTIONS:
+                situation["distance"] = distance
+            situation["pressing"] = defending_team.tactics["pressing"]
+            situation["positioning"] = ActionSelector.DEFAULT_POSITIONING
+
+            contest_score = resolver.calculate_contest_score(
+                attacker=attacker,
+                defender=defender,
+                action_type=action.label,
+                situation=situation,
+                attacker_team_tactics=attacking_team.tactics,
+                defender_team_tactics=defending_team.tactics,
+                attacker_momentum=momentum,
+                defender_momentum=-momentum,
+                is_second_half=is_second_half,
+            )
+            expected = resolver.calculate_success_rate(contest_score)
+
+            assert (
+                matchup.success_rate(
+                    side,
+                    attacker,
+                    defender,
+                    action.label,
+                    distance,
+                    momentum,
+                    -momentum,
+                    is_second_half,
+                )
+                == expected
+            )
+
+
+def test_success_rate_is_cached():
+    """같은 조합은 테이블에서 조회되는지 테스트"""
+    home = create_test_team("home", {}, 0)
+    away = create_test_team("away", {}, 2)
+    matchup = CompiledMatchup(home, away)
+
+    args = ("home", home.players[2], away.players[1], "dribble", 0, 2, -1, False)
+    first = matchup.success_rate(*args)
+    assert len(matchup._success_rates) == 1
+    assert matchup.success_rate(*args) == first
+    assert len(matchup._success_rates) == 1
+    assert 0.2 <= first <= 0.8
+
+
+def test_refresh_recompiles_on_tactic_change():
+    """전술이 바뀌면 refresh가 테이블을 다시 컴파일하는지 테스트"""
+    home = create_test_team("home", {}, 0)
+    away = create_test_team("away", {}, 2)
+    matchup = CompiledMatchup(home, away)
+    score_args = ("home", 2, Action.DRIBBLE, 0, 0, False, 0)
+    before = matchup.attacker_score(*score_args)
+    matchup.success_rate("home", home.players[1], None, "dribble", 0, 0, 0, False)
+
+    assert not matchup.refresh()
+    home.set_tactic("attack", 10)
+    assert matchup.refresh()
+    assert matchup.revisions == (home.revision, away.revision)
+    assert not matchup._success_rates
+    assert matchup.attacker_score(*score_args) > before
+    assert matchup.attacker_score(*score_args) == CompiledMatchup(home, away).attacker_score(
+        *score_args
+    )
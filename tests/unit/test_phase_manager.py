@@ -0,0 +1,134 @@
+"""PhaseManager 단위 테스트"""
+
+from sim_soccer.core.ids import ACTION_NAMES, PHASE_NAMES, Phase
+from sim_soccer.core.phase_manager import NO_ACTION, PhaseManager
+from sim_soccer.core.simulator import MatchSimulator
+from sim_soccer.io.team_loader import load_team
+from sim_soccer.models.match import MatchState
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.team import TeamState
+from sim_soccer.systems.tactics import get_phase_transition_probability
+from tests.conftest import EXAMPLES_DIR
+
+
+def create_test_team(team_id: str, pas: int) -> TeamState:
+    """테스트용 팀 생성"""
+    players = [
+        PlayerState(
+            player_id=i,
+            name=f"{team_id} {i}",
+            position="MF",
+            stats={"PAS": pas, "DRI": 4, "SHO": 6, "SPA": 5, "TAC": 5, "INT": 5, "STA": 5},
+        )
+        for i in range(1, 4)
+    ]
+    return TeamState(team_id=team_id, team_name=team_id, formation="1-1-1", players=players)
+
+
+def test_transition_table_matches_direct_calculation():
+    """캐시된 전환 확률이 스탯 평균으로 직접 계산한 값과 같은지 테스트"""
+    home = create_test_team("home", 8)
+    away = create_test_team("away", 3)
+    match_state = MatchState(match_id="test", home_team=home, away_team=away)
+    manager = PhaseManager()
+
+    for team in (home, away):
+        expected = {
+            "build_up": get_phase_transition_probability(
+                team.tactics, "build_up", team.get_average_stat("PAS")
+            ),
+            "midfield": get_phase_transition_probability(
+                team.tactics,
+                "midfield",
+                (team.get_average_stat("PAS") + team.get_average_stat("DRI")) / 2,
+            ),
+            "final_third": get_phase_transition_probability(
+                team.tactics, "final_third", team.get_average_stat("SHO")
+            ),
+            "transition": get_phase_transition_probability(team.tactics, "transition", 5.0),
+            "defense": get_phase_transition_probability(team.tactics, "defense", 5.0),
+        }
+        for phase, probability in expected.items():
+            assert manager.calculate_transition_probability(phase, team, match_state) == probability
+        assert manager.get_transition_table(team) is manager.get_transition_table(team)
+
+
+def test_transition_table_invalidated_on_tactic_change():
+    """전술을 변경하면 전환 확률 테이블이 다시 계산되는지 테스트"""
+    team = create_test_team("home", 5)
+    away = create_test_team("away", 5)
+    match_state = MatchState(match_id="test", home_team=team, away_team=away)
+    manager = PhaseManager()
+
+    before = manager.calculate_transition_probability("midfield", team, match_state)
+    team.set_tactic("attack", 10)
+    after = manager.calculate_transition_probability("midfield", team, match_state)
+
+    assert after == get_phase_transition_probability(
+        team.tactics, "midfield", (team.get_average_stat("PAS") + team.get_average_stat("DRI")) / 2
+    )
+    assert after > before
+
+
+def test_transition_table_invalidated_on_direct_writes():
+    """전술이나 선수 스탯을 매핑으로 직접 바꿔도 전환 확률 테이블이 다시 계산되는지 테스트"""
+    team = create_test_team("home", 5)
+    away = create_test_team("away", 5)
+    match_state = MatchState(match_id="test", home_team=team, away_team=away)
+    manager = PhaseManager()
+
+    before = manager.calculate_transition_probability("midfield", team, match_state)
+    team.tactics["attack"] = 10
+    after_tactic = manager.calculate_transition_probability("midfield", team, match_state)
+    team.players[0].stats["PAS"] = 10
+    after_stat = manager.calculate_transition_probability("midfield", team, match_state)
+
+    assert before < after_tactic < after_stat
+    assert after_stat == get_phase_transition_probability(
+        team.tactics, "midfield", (team.get_average_stat("PAS") + team.get_average_stat("DRI")) / 2
+    )
+
+
+def test_transition_cache_cleared_between_matches():
+    """재사용한 시뮬레이터가 지난 경기의 팀 테이블을 보관하지 않는지 테스트"""
+    simulator = MatchSimulator()
+    played = []
+    for seed in range(3):
+        home = load_team(str(EXAMPLES_DIR / "a.json"))
+        away = load_team(str(EXAMPLES_DIR / "b.json"))
+        simulator.simulate_match(home, away, random_seed=seed, mode="score_only")
+        played.append((home, away))
+
+    cached = [entry[0] for entry in simulator.phase_manager._transition_tables.values()]
+    assert len(cached) <= 2
+    assert all(team is played[-1][0] or team is played[-1][1] for team in cached)
+
+    simulator.phase_manager.clear_cache()
+    assert not simulator.phase_manager._transition_tables
+
+
+def test_compiled_next_phase_table_matches_rules():
+    """컴파일된 전환 테이블이 모든 입력에서 규칙 함수와 같은 결과를 내는지 테스트"""
+    manager = PhaseManager()
+    action_types = list(ACTION_NAMES) + [None, "unknown_action"]
+    for phase in list(PHASE_NAMES) + ["unknown_phase"]:
+        for action_type in action_types:
+            for action_result in (False, True, 0, 1):
+                expected = PhaseManager._apply_transition_rules(phase, action_result, action_type)
+                assert manager.determine_next_phase(phase, action_result, action_type) == expected
+
+    table = manager.next_phase_table
+    assert len(table) == len(Phase)
+    assert all(len(row) == NO_ACTION + 1 for row in table)
+
+
+def test_transition_targets():
+    """행동 없이 전환 판정이 성공했을 때의 다음 Phase 테스트"""
+    manager = PhaseManager()
+    assert [p.label for p in manager.transition_targets] == [
+        "midfield",  # build_up
+        "final_third",  # midfield
+        "transition",  # final_third
+        "midfield",  # transition
+        "transition",  # defense
+    ]
@@ -0,0 +1,93 @@
+"""카운터 기반 난수 스트림 테스트"""
+
+import pickle
+
+import pytest
+
+from sim_soccer.core.rng import (
+    STREAM_NAMES,
+    CounterRandom,
+    MatchStreams,
+    UniformBuffer,
+    counter_uniform,
+    derive_key,
+)
+
+
+def test_counter_random_is_counter_based():
+    """스트림 값이 (키, 카운터)만으로 정해지는지 테스트"""
+    rng = CounterRandom(7)
+    values = [rng.random() for _ in range(10)]
+
+    assert rng.counter == 10
+    assert values == [counter_uniform(rng.key, i) for i in range(10)]
+    assert all(0.0 <= v < 1.0 for v in values)
+    assert CounterRandom(7).block(10) == values  # 블록 생성은 순차 호출과 같음
+
+    resumed = CounterRandom(key=rng.key)
+    resumed.setstate((rng.key, 4))
+    assert [resumed.random() for _ in range(6)] == values[4:]
+
+    rng.seed(7)
+    assert rng.random() == values[0]
+    assert pickle.loads(pickle.dumps(rng)).random() == values[1]
+
+    # choice 같은 나머지 메서드도 같은 스트림만 사용
+    a, b = CounterRandom(3), CounterRandom(3)
+    assert [a.choice("abcde") for _ in range(20)] == [b.choice("abcde") for _ in range(20)]
+    assert a.getstate() == b.getstate()
+    assert 0 <= a.getrandbits(100) < 2**100
+
+
+def test_spawned_streams_are_independent_of_order():
+    """파생 스트림이 생성 순서, 부모 사용량과 무관한지 테스트"""
+    parent = CounterRandom(11)
+    first = parent.spawn("goal").random()
+    parent.block(100)
+    assert parent.spawn("goal").random() == first
+    assert parent.spawn("goal").key != parent.spawn("phase").key
+    assert derive_key(1, 2) != derive_key(2, 1)
+    assert derive_key(1) != derive_key("1")
+
+    streams = MatchStreams.for_match(5, 0, 3, buffered=False)
+    again = MatchStreams.for_match(5, 0, 3, buffered=False)
+    keys = [getattr(streams, name).key for name in STREAM_NAMES]
+    assert len(set(keys)) == len(STREAM_NAMES)
+    assert keys == [getattr(again, name).key for name in STREAM_NAMES]
+    assert MatchStreams.for_match(5, 1, 3, buffered=False).goal.key != streams.goal.key
+
+    shared = MatchStreams.shared(parent)
+    assert all(getattr(shared, name) is parent for name in STREAM_NAMES)
+
+
+def test_uniform_buffer_is_transparent():
+    """버퍼가 원본 스트림과 같은 값을 내고, 블록을 다 쓰면 다시 채우는지 테스트"""
+    expected = CounterRandom(5)
+    buffer = UniformBuffer(CounterRandom(5), size=4, record=True)
+
+    assert [buffer.random() for _ in range(10)] == [expected.random() for _ in range(10)]
+    assert buffer.choice("abc") == expected.choice("abc")
+    assert len(buffer.recorded) == 12  # 4개씩 세 블록
+
+    replay = UniformBuffer(values=buffer.recorded[:11])
+    assert [replay.random() for _ in range(11)] == buffer.recorded[:11]
+    with pytest.raises(ValueError):
+        replay.random()
+    with pytest.raises(IndexError):
+        buffer.choice([])
+    with pytest.raises(ValueError):
+        MatchStreams.for_match(1, 0).recorded()
+
+
+def test_counter_uniforms_matches_scalar():
+    """NumPy 블록 생성이 스칼라 계산과 비트 단위로 같은지 테스트"""
+    np = pytest.importorskip("numpy")
+    from sim_soccer.core.rng import counter_uniforms
+
+    keys = np.array([derive_key(9, m) for m in range(4)], dtype=np.uint64)
+    block = counter_uniforms(keys[None, :], np.arange(6, dtype=np.uint64)[:, None] + 100)
+
+    assert block.shape == (6, 4)
+    assert block.tolist() == [
+        [counter_uniform(int(key), 100 + i) for key in keys] for i in range(6)
+    ]
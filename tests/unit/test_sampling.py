@@ -0,0 +1,71 @@
+"""이산 분포 샘플러 단위 테스트"""
+
+import random
+
+import pytest
+
+from sim_soccer.core.action_selector import ActionSelector
+from sim_soccer.core.sampling import AliasTable, CumulativeDistribution
+
+WEIGHTED = [("pass", 0.45), ("dribble", 0.3), ("shoot", 0.15), ("cross", 0.1)]
+
+
+def _linear_scan(weighted, u):
+    """기존 선형 누적 탐색"""
+    cumulative = 0.0
+    for outcome, prob in weighted:
+        cumulative += prob
+        if u < cumulative:
+            return outcome
+    return weighted[-1][0]
+
+
+def test_cumulative_matches_linear_scan():
+    """이분 탐색이 선형 누적 탐색과 같은 결과를 내는지 테스트 (경계값 포함)"""
+    distribution = CumulativeDistribution.from_weights(WEIGHTED)
+    rng = random.Random(7)
+    samples = [rng.random() for _ in range(5000)] + list(distribution.cumulative) + [0.0]
+    for u in samples:
+        assert distribution.sample(u) == _linear_scan(WEIGHTED, u)
+
+
+def test_alias_table_preserves_probabilities():
+    """별칭 테이블의 칸별 확률을 합치면 원래 분포가 되는지 테스트"""
+    table = AliasTable.from_weights(WEIGHTED)
+    n = len(table.prob)
+    mass = [0.0] * n
+    for slot in range(n):
+        mass[slot] += table.prob[slot] / n
+        mass[table.alias[slot]] += (1.0 - table.prob[slot]) / n
+    for (_, prob), got in zip(WEIGHTED, mass):
+        assert got == pytest.approx(prob)
+
+    with pytest.raises(ValueError):
+        AliasTable.from_weights([])
+
+
+def test_alias_table_batched_matches_scalar():
+    """K개를 한 번에 뽑은 결과가 하나씩 뽑은 결과와 같은지 테스트"""
+    np = pytest.importorskip("numpy")
+    table = AliasTable.from_weights(WEIGHTED)
+    u = np.random.default_rng(3).random(2000)
+    indices = table.sample_indices(u)
+    assert list(indices) == [table.sample_index(float(x)) for x in u]
+
+    counts = np.bincount(indices, minlength=len(WEIGHTED)) / len(u)
+    for (_, prob), freq in zip(WEIGHTED, counts):
+        assert freq == pytest.approx(prob, abs=0.04)
+
+
+def test_action_selector_caches_distributions():
+    """행동 분포가 (Phase, 공격성, 패스 스타일)마다 한 번만 계산되는지 테스트"""
+    selector = ActionSelector()
+    tactics = {"attack": 8, "pass_style": 3, "pressing": 5}
+    first = selector.get_action_distribution("midfield", tactics)
+    assert selector.get_action_distribution("midfield", dict(tactics, pressing=9)) is first
+    assert selector.get_action_distribution("midfield", dict(tactics, attack=2)) is not first
+
+    adjusted = selector.get_adjusted_actions("midfield", tactics)
+    assert first.outcomes == tuple(a for a, _ in adjusted)
+    table = selector.get_action_alias_table("midfield", tactics)
+    assert table.outcomes == first.outcomes
@@ -0,0 +1,115 @@
+"""고정 순서 스탯 배열 단위 테스트"""
+
+import copy
+import pickle
+
+import pytest
+
+from sim_soccer.core.ids import Stat, Tactic, TeamStat
+from sim_soccer.models.player import PlayerState
+from sim_soccer.models.stat_block import PlayerStats, Tactics, TeamStats
+from sim_soccer.models.team import TeamState
+from sim_soccer.systems.stamina import calculate_stamina_cost
+
+
+def test_stat_block_dict_compatibility():
+    """딕셔너리처럼 읽고 쓰고 비교할 수 있는지 테스트"""
+    stats = PlayerStats({"PAS": 8, "STA": 3})
+
+    assert stats["PAS"] == 8
+    assert stats["DRI"] == 0  # 생략한 스탯은 기본값
+    assert stats.get("STA", 5) == 3
+    assert stats.get("speed", 5) == 5
+    assert stats[Stat.PAS] == stats.data[Stat.PAS] == 8
+    assert list(stats) == ["PAS", "DRI", "SHO", "SPA", "TAC", "INT", "STA"]
+    assert dict(stats) == {"PAS": 8, "DRI": 0, "SHO": 0, "SPA": 0, "TAC": 0, "INT": 0, "STA": 3}
+    assert stats == dict(stats)
+    assert repr(stats) == repr(dict(stats))
+    assert sum(stats.values()) == 11
+
+    stats["DRI"] += 2
+    assert stats.data[Stat.DRI] == 2
+
+    copied = stats.copy()
+    copied["PAS"] = 1
+    assert stats["PAS"] == 8 and copied != stats
+
+    with pytest.raises(KeyError):
+        stats["speed"] = 5
+    with pytest.raises(KeyError):
+        PlayerStats({"speed": 5})
+    with pytest.raises(TypeError):
+        del stats["PAS"]
+
+
+def test_tactics_and_team_stats_defaults():
+    """전술 기본값 5, 통계 기본값 0과 ID 순서 테스트"""
+    tactics = Tactics({"pressing": 9})
+    assert tactics.data[Tactic.PRESSING] == 9
+    assert tactics == {
+        "attack": 5,
+        "pass_style": 5,
+        "pressing": 9,
+        "defense_line": 5,
+        "transition_speed": 5,
+        "width": 5,
+    }
+
+    stats = TeamStats()
+    stats.data[TeamStat.SHOTS_ON_TARGET] += 1
+    assert stats["shots_on_target"] == 1
+    assert list(stats) == [s.name.lower() for s in TeamStat]
+
+
+def test_missing_sta_keeps_average_stamina_cost():
+    """STA를 생략하면 기존 `stats.get("STA", 5)`처럼 5로 체력 소모를 계산하는지 테스트"""
+    stats = PlayerStats({"PAS": 8})
+    assert stats["STA"] == stats.data[Stat.STA] == 5
+    assert stats["DRI"] == 0
+
+    tactics = Tactics()
+    assert calculate_stamina_cost("dribble", tactics, stats.data[Stat.STA]) == (
+        calculate_stamina_cost("dribble", dict(tactics), 5)
+    )
+
+
+def test_models_use_slots_and_stat_blocks():
+    """선수/팀 모델이 슬롯과 배열을 사용하고 복사/직렬화되는지 테스트"""
+    player = PlayerState(player_id=1, name="P", position="FW", stats={"SHO": 9, "STA": 7})
+    team = TeamState(
+        team_id="t",
+        team_name="T",
+        formation="4-4-2",
+        players=[player],
+        tactics={"attack": 8},
+    )
+
+    assert not hasattr(player, "__dict__") and not hasattr(team, "__dict__")
+    assert isinstance(player.stats, PlayerStats)
+    assert isinstance(team.tactics, Tactics) and isinstance(team.stats, TeamStats)
+    assert team.tactics["attack"] == 8 and team.tactics["width"] == 5
+    assert dict(team.stats) == dict.fromkeys(TeamStats.KEYS, 0)
+
+    revision = team.revision
+    team.set_tactic("pressing", 7)
+    assert team.tactics.data[Tactic.PRESSING] == 7 and team.revision == revision + 1
+
+    for restored in (copy.deepcopy(team), pickle.loads(pickle.dumps(team))):
+        assert restored == team
+        assert restored.tactics is not team.tactics
+        assert restored.players[0].stats == {
+            "PAS": 0,
+            "DRI": 0,
+            "SHO": 9,
+            "SPA": 0,
+            "TAC": 0,
+            "INT": 0,
+            "STA": 7,
+        }
+        assert restored.get_player_by_id(1) is restored.players[0]
+
+        # 복사본의 변경은 복사본의 revision만 올림
+        revision, original = restored.revision, team.revision
+        restored.tactics["width"] = 1
+        restored.players[0].stats["PAS"] = 4
+        assert restored.revision == revision + 2 and team.revision == original
@@ -2,6 +2,7 @@
 
 import pytest
 
+from sim_soccer.core.ids import Stat
 from sim_soccer.models.player import PlayerState
 from sim_soccer.models.team import TeamState
 
@@ -100,6 +101,40 @@ def test_get_average_stat():
     assert avg_pas == (8 + 6) / 2
 
 
+def test_average_stat_cache_and_revision():
+    """평균 스탯 캐시가 스탯 변경이나 rebuild_index로 무효화되고 revision이 증가하는지 테스트"""
+    players = [create_test_player(i, "MF") for i in range(1, 3)]
+    team = TeamState(
+        team_id="test_team",
+        team_name="Test Team",
+        formation="1-4-4-2",
+        players=players,
+    )
+    revision = team.revision
+    assert team.get_average_stat("PAS") == 5.0
+
+    # 스탯을 매핑으로 수정하면 바로 무효화
+    players[0].stats["PAS"] = 9
+    assert team.get_average_stat("PAS") == 7.0
+    assert team.revision == revision + 1
+
+    # data 배열에 직접 쓰면 rebuild_index 전까지는 캐시된 값 유지
+    players[1].stats.data[Stat.PAS] = 7
+    assert team.get_average_stat("PAS") == 7.0
+    team.rebuild_index()
+    assert team.get_average_stat("PAS") == 8.0
+    assert team.revision == revision + 2
+
+    # 같은 값으로 변경하면 revision 유지
+    team.set_tactic("attack", 5)
+    assert team.revision == revision + 2
+    team.set_tactic("attack", 9)
+    assert team.tactics["attack"] == 9
+    assert team.revision == revision + 3
+    team.tactics["pressing"] = 8
+    assert team.revision == revision + 4
+
+
 def test_get_ball_holder():
     """공을 가진 선수 찾기 테스트"""
     players = [create_test_player(i, "MF") for i in range(1, 12)]
@@ -147,3 +182,62 @@ def test_default_tactics():
     assert team.tactics["attack"] == 5
     assert team.tactics["pass_style"] == 5
     assert team.tactics["pressing"] == 5
+
+
+def _scan_players_in_zone(team: TeamState, zone: int):
+    """선형 탐색 기반 Zone 조회 (인덱스 검증용)"""
+    return [p for p in team.players if p.zone == zone]
+
+
+def _scan_nearest_player(team: TeamState, target_zone: int, exclude_player_id=None):
+    """선형 탐색 기반 최근접 선수 조회 (인덱스 검증용)"""
+    from sim_soccer.field.zone import calculate_distance
+
+    nearest_player = None
+    min_distance = float("inf")
+    for player in team.players:
+        if exclude_player_id and player.player_id == exclude_player_id:
+            continue
+        distance = calculate_distance(player.zone, target_zone)
+        if distance < min_distance:
+            min_distance = distance
+            nearest_player = player
+    return nearest_player
+
+
+def test_zone_index_matches_scan():
+    """Zone/볼 소유자 인덱스가 선형 탐색 결과와 항상 같은지 테스트"""
+    import random
+
+    rng = random.Random(0)
+    positions = ["GK", "DF", "DF", "DF", "DF", "MF", "MF", "MF", "MF", "FW", "FW"]
+    players = [create_test_player(i + 1, pos) for i, pos in enumerate(positions)]
+    team = TeamState(
+        team_id="test_team",
+        team_name="Test Team",
+        formation="1-4-4-2",
+        players=players,
+    )
+
+    for _ in range(2000):
+        if rng.random() < 0.7:
+            team.move_player(rng.choice(players), rng.randint(1, 15))
+        else:
+            team.set_ball_holder(rng.choice([None] + [p.player_id for p in players]))
+
+        zones = rng.sample(range(1, 16), 4)
+        assert team.get_players_in_zones(zones) == [p for p in players if p.zone in zones]
+        expected_mask = 0
+        for player in players:
+            expected_mask |= 1 << (player.zone - 1)
+        assert team.occupied_zones == expected_mask
+        for zone in range(1, 16):
+            assert team.get_players_in_zone(zone) == _scan_players_in_zone(team, zone)
+            exclude = rng.choice([None] + [p.player_id for p in players])
+            assert team.get_nearest_player(zone, exclude) is _scan_nearest_player(
+                team, zone, exclude
+            )
+        holders = [p for p in players if p.has_ball]
+        assert len(holders) <= 1
+        assert team.get_ball_holder() is (holders[0] if holders else None)
+        assert team.get_players_by_position("DF") == [p for p in players if p.position == "DF"]
@@ -123,3 +123,83 @@ def test_phase_zones():
     assert 11 in FINAL_THIRD_ZONES
     assert 14 in FINAL_THIRD_ZONES
     assert 8 not in FINAL_THIRD_ZONES
+
+
+def test_geometry_tables_match_functions():
+    """기하 테이블이 좌표 기반 계산과 일치하는지 테스트"""
+    from sim_soccer.field.zone import (
+        ADJACENT_ZONES,
+        ZONE_DISTANCE,
+        ZONES_BY_DISTANCE,
+        get_adjacent_zones,
+        get_zones_by_distance,
+    )
+
+    for z1 in range(1, 16):
+        row1, col1 = zone_to_coords(z1)
+        for z2 in range(1, 16):
+            row2, col2 = zone_to_coords(z2)
+            assert ZONE_DISTANCE[z1][z2] == abs(row1 - row2) + abs(col1 - col2)
+        assert get_adjacent_zones(z1) == ADJACENT_ZONES[z1]
+        assert all(calculate_distance(z1, z) == 1 for z in ADJACENT_ZONES[z1])
+        ordered = get_zones_by_distance(z1)
+        assert ordered == ZONES_BY_DISTANCE[z1]
+        assert ordered[0] == z1
+        assert sorted(ordered) == list(range(1, 16))
+        assert [calculate_distance(z1, z) for z in ordered] == sorted(
+            calculate_distance(z1, z) for z in ordered
+        )
+
+    with pytest.raises(ValueError):
+        get_zones_by_distance(16)
+
+
+def test_geometry_custom_grid():
+    """임의 격자 크기의 기하 테이블 테스트"""
+    from sim_soccer.field.zone import ZoneGeometry
+
+    geometry = ZoneGeometry(6, 4)
+    assert geometry.total_zones == 24
+    assert geometry.coords[24] == (5, 3)
+    assert geometry.distance[1][24] == 8
+    assert geometry.adjacent[6] == (2, 5, 7, 10)
+    assert geometry.zones_by_distance[1][:3] == (1, 2, 5)
+    assert not geometry.is_valid(25)
+
+
+def test_default_grid_matches_zone_constants():
+    """기본 격자의 Phase 밴드와 기준 Zone 변환이 기존 상수와 같은지 테스트"""
+    from sim_soccer.field.grid import DEFAULT_GRID
+
+    assert DEFAULT_GRID.is_default()
+    assert DEFAULT_GRID.zones_for_phase("build_up") == BUILD_UP_ZONES
+    assert DEFAULT_GRID.zones_for_phase("midfield") == MIDFIELD_ZONES
+    assert DEFAULT_GRID.zones_for_phase("final_third") == FINAL_THIRD_ZONES
+    assert DEFAULT_GRID.zones_for_phase("defense") == list(range(1, 16))
+    assert all(DEFAULT_GRID.map_base_zone(z) == z for z in range(1, 16))
+    assert DEFAULT_GRID.forward[2] == 5
+    assert DEFAULT_GRID.forward[14] == 14
+
+
+def test_fine_grid_tables():
+    """10x6 격자의 밴드, 전진 Zone, 기준 Zone 변환 테스트"""
+    from sim_soccer.field.grid import FieldGrid
+
+    grid = FieldGrid(10, 6)
+    assert grid.total_zones == 60
+    assert [grid.row[z] for z in grid.zones_for_phase("build_up")][::6] == [0, 1, 2, 3]
+    assert {grid.row[z] for z in grid.zones_for_phase("midfield")} == {4, 5}
+    assert {grid.row[z] for z in grid.zones_for_phase("final_third")} == {6, 7, 8, 9}
+    assert grid.forward[1] == 7
+    assert grid.forward[60] == 60
+
+    # 기준 Zone의 상대 위치 보존: 1 -> 왼쪽 뒤, 15 -> 오른쪽 앞, 8 -> 가운데
+    assert grid.map_base_zone(1) == 1
+    assert grid.map_base_zone(15) == 60
+    assert grid.coords[grid.map_base_zone(8)] == (5, 3)  # 반올림된 중앙
+    assert not grid.is_default()
+
+    with pytest.raises(ValueError):
+        FieldGrid(2, 3)
+    with pytest.raises(ValueError):
+        FieldGrid(5, 3, phase_rows={"build_up": [0], "midfield": [9], "final_third": [4]})